@@ -15,7 +15,9 @@ from kopf.on import (
     register,
     daemon,
     timer,
+    tick,
     index,
+    subscribe,
 )
 from kopf._cogs.configs.configuration import (
     OperatorSettings,
@@ -88,6 +90,9 @@ from kopf._cogs.structs.references import (
     Resource,
     EVERYTHING,
 )
+from kopf._cogs.structs.telemetry import (
+    OperatorMetrics,
+)
 from kopf._cogs.structs.reviews import (
     WebhookClientConfigService,
     WebhookClientConfig,
@@ -107,6 +112,7 @@ from kopf._core.actions.execution import (
     PermanentError,
     HandlerTimeoutError,
     HandlerRetriesError,
+    Hibernation,
 )
 from kopf._core.actions.lifecycles import (
     get_default_lifecycle,
@@ -187,6 +193,7 @@ from kopf._kits.webhooks import (
 
 __all__ = [
     'on', 'lifecycles', 'subhandler', 'register', 'execute', 'daemon', 'timer', 'index',
+    'subscribe', 'tick',
     'configure', 'LogFormat',
     'login_via_pykube',
     'login_via_client',
@@ -227,6 +234,7 @@ __all__ = [
     'TemporaryError',
     'HandlerTimeoutError',
     'HandlerRetriesError',
+    'Hibernation',
     'OperatorRegistry',
     'get_default_registry',
     'set_default_registry',
@@ -272,4 +280,5 @@ __all__ = [
     'SyncDaemonStopperChecker',  # deprecated
     'AsyncDaemonStopperChecker',  # deprecated
     'Resource', 'EVERYTHING',
+    'OperatorMetrics',
 ]
@@ -1,7 +1,7 @@
 import asyncio
 import enum
 import threading
-from collections.abc import Awaitable, Generator
+from collections.abc import Awaitable, Callable, Generator
 from typing import Generic, TypeVar
 
 FlagReasonT = TypeVar('FlagReasonT', bound=enum.Flag)
@@ -38,6 +38,7 @@ class FlagSetter(Generic[FlagReasonT]):
         self.async_event = asyncio.Event()
         self.sync_waiter: SyncFlagWaiter[FlagReasonT] = SyncFlagWaiter(self)
         self.async_waiter: AsyncFlagWaiter[FlagReasonT] = AsyncFlagWaiter(self)
+        self.callbacks: list[Callable[[], None]] = []
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {self.is_set()}, reason={self.reason}>'
@@ -55,6 +56,8 @@ class FlagSetter(Generic[FlagReasonT]):
         self.reason = reason if self.reason is None or reason is None else self.reason | reason
         self.sync_event.set()
         self.async_event.set()  # it is thread-safe: always called in operator's event loop.
+        for callback in list(self.callbacks):  # e.g. for the timers with no own tasks to wake up.
+            callback()
 
 
 class FlagWaiter(Generic[FlagReasonT]):
@@ -0,0 +1,262 @@
+"""
+Concurrency limiting with fair dispatch across the groups of the waiters.
+
+A regular :class:`asyncio.Semaphore` wakes up its waiters in FIFO order.
+When one group of waiters is much bigger than others (e.g. a timer handler
+for 10'000 objects vs. a timer handler for 10 objects), the small groups
+wait behind the whole backlog of the big group. The fair limiter serves
+the groups (keys) round-robin instead, and FIFO only within every group.
+
+The adaptive limiter adjusts its limit to the observed load instead (AIMD):
+it grows slowly while the acquirers succeed, and halves on overloads.
+On explicit requests to back off, all acquirers wait, not only the failed one.
+"""
+import asyncio
+import collections
+from collections.abc import Hashable
+from typing import Any, Generic, NamedTuple, TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+
+
+class _Waiter(NamedTuple):
+    future: asyncio.Future[None]
+    limit: int | None
+    per_key_limit: int | None
+
+
+class FairLimiter(Generic[_K]):
+    """
+    A semaphore-like limiter which grants its slots fairly across the keys.
+
+    Besides the overall limit, every key can be limited individually.
+    The limits are given on every acquisition, so that they can be changed
+    at runtime (e.g. in the settings); ``None`` means "no limit".
+    """
+    __slots__ = ('_running', '_running_per_key', '_waiters')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._running = 0
+        self._running_per_key: dict[_K, int] = {}
+        self._waiters: dict[_K, collections.deque[_Waiter]] = {}  # in the round-robin order
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return sum(not waiter.future.done() for waiters in self._waiters.values() for waiter in waiters)
+
+    async def acquire(
+            self,
+            key: _K,
+            *,
+            limit: int | None = None,
+            per_key_limit: int | None = None,
+            wakeup: asyncio.Event | None = None,
+    ) -> bool:
+        """
+        Wait for a free slot and occupy it; it must be released afterwards.
+
+        Returns ``True`` if the slot is acquired, or ``False`` if the wakeup
+        event is set before or while waiting (then, there is nothing to release).
+        """
+        if wakeup is not None and wakeup.is_set():
+            return False
+        if key not in self._waiters and self._fits(key, limit, per_key_limit):
+            self._occupy(key)
+            return True
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, collections.deque()).append(_Waiter(future, limit, per_key_limit))
+        try:
+            if wakeup is None:
+                await future
+            else:
+                awakening: asyncio.Future[Any] = asyncio.create_task(wakeup.wait())
+                try:
+                    await asyncio.wait([future, awakening], return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    awakening.cancel()
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(key)  # granted at the same moment as cancelled
+            future.cancel()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._forget(key)
+        if wakeup is not None and wakeup.is_set() and not future.cancelled():
+            self.release(key)  # granted at the same moment as woken up
+            return False
+        return not future.cancelled()
+
+    def release(self, key: _K) -> None:
+        self._running -= 1
+        self._running_per_key[key] -= 1
+        if not self._running_per_key[key]:
+            del self._running_per_key[key]
+        self._grant()
+
+    def _fits(self, key: _K, limit: int | None, per_key_limit: int | None) -> bool:
+        return ((limit is None or self._running < limit) and
+                (per_key_limit is None or self._running_per_key.get(key, 0) < per_key_limit))
+
+    def _occupy(self, key: _K) -> None:
+        self._running += 1
+        self._running_per_key[key] = self._running_per_key.get(key, 0) + 1
+
+    def _forget(self, key: _K) -> None:
+        # Remove the abandoned (cancelled) waiters from the head; the rest are skipped when granting.
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            while waiters and waiters[0].future.done():
+                waiters.popleft()
+            if not waiters:
+                del self._waiters[key]
+
+    def _grant(self) -> None:
+        # Serve one waiter per key per round, and move the served keys to the end of the queue.
+        granted = True
+        while granted:
+            granted = False
+            for key in list(self._waiters):
+                waiters = self._waiters[key]
+                while waiters and waiters[0].future.done():
+                    waiters.popleft()
+                if waiters and self._fits(key, waiters[0].limit, waiters[0].per_key_limit):
+                    self._occupy(key)
+                    waiters.popleft().future.set_result(None)
+                    granted = True
+                    del self._waiters[key]
+                    if waiters:
+                        self._waiters[key] = waiters
+                elif not waiters:
+                    del self._waiters[key]
+
+
+class AdaptiveLimiter:
+    """
+    A semaphore-like limiter with the limit adapted to the load (AIMD).
+
+    The limit increases additively by 1 per the whole limit of the successes,
+    and decreases multiplicatively by half on every overload, but only once
+    per the acquisitions made before the previous decrease --- so that a burst
+    of simultaneous failures of the same overload decreases it only once.
+
+    The bounds are given on every call, so that they can be changed at runtime
+    (e.g. in the settings); ``None`` as the maximum means "no limit" (and no
+    adaptation). Initially, the limit is at its maximum.
+    """
+    __slots__ = ('_limit', '_running', '_waiters', '_decreased', '_paused_until', '_timer')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._limit: float | None = None
+        self._running = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        self._decreased: float | None = None
+        self._paused_until: float | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def limit(self) -> int | None:
+        return None if self._limit is None else int(self._limit)
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return sum(not future.done() for future in self._waiters)
+
+    async def acquire(self, *, limit: int | None, floor: int = 1) -> float | None:
+        """
+        Wait for a free slot and occupy it; it must be released afterwards.
+
+        Returns the time of the acquisition (to be reported back with the outcome),
+        or ``None`` if the limiter is disabled (then, there is nothing to release).
+        """
+        if limit is None:
+            self._limit = None
+            self._grant()  # the waiters from before it was disabled
+            return None
+
+        self._adjust(limit=limit, floor=floor, delta=0)
+        if self._waiters or not self._fits():
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            self._grant()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release()  # granted at the same moment as cancelled
+                future.cancel()
+                raise
+        else:
+            self._running += 1
+        return asyncio.get_running_loop().time()
+
+    def release(self) -> None:
+        self._running -= 1
+        self._grant()
+
+    def succeed(self, *, limit: int | None, floor: int = 1) -> None:
+        """ Increase the limit slowly: by 1 when the whole limit succeeds. """
+        if limit is not None and self._limit is not None:
+            self._adjust(limit=limit, floor=floor, delta=1 / self._limit)
+            self._grant()
+
+    def overload(
+            self,
+            *,
+            limit: int | None,
+            floor: int = 1,
+            acquired: float | None = None,
+            retry_after: float | None = None,
+    ) -> None:
+        """ Halve the limit, unless already halved since the acquisition; pause if asked. """
+        if limit is None or self._limit is None:
+            return
+        now = asyncio.get_running_loop().time()
+        if acquired is None or self._decreased is None or acquired >= self._decreased:
+            self._decreased = now
+            self._adjust(limit=limit, floor=floor, delta=-self._limit / 2)
+        if retry_after is not None and retry_after > 0:
+            self._paused_until = max(self._paused_until or now, now + retry_after)
+        self._grant()
+
+    def _adjust(self, *, limit: int, floor: int, delta: float) -> None:
+        floor = max(1, min(floor, limit))
+        current = float(limit) if self._limit is None else self._limit + delta
+        self._limit = max(float(floor), min(float(limit), current))
+
+    def _fits(self) -> bool:
+        now = asyncio.get_running_loop().time()
+        if self._paused_until is not None and now < self._paused_until:
+            return False
+        return self._limit is None or self._running < int(self._limit)
+
+    def _grant(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters and self._fits():
+            future = self._waiters.popleft()
+            if not future.done():  # i.e. not cancelled while waiting
+                self._running += 1
+                future.set_result(None)
+
+        # If paused, wake up when the pause is over, if there is anyone to serve.
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._waiters and self._paused_until is not None:
+            loop = asyncio.get_running_loop()
+            delay = self._paused_until - loop.time()
+            if delay > 0:
+                self._timer = loop.call_later(delay, self._grant)
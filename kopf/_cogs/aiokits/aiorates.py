@@ -0,0 +1,96 @@
+"""
+Rate limiting with priority lanes: a token bucket, as in client-go.
+
+The bucket holds up to ``burst`` tokens and is refilled at ``rate`` tokens
+per second. Every acquisition takes one token, or waits until one is refilled.
+
+The waiters are served by their lanes: the higher lanes first, FIFO within
+a lane. This way, the important acquirers never wait behind a backlog
+of the bulk ones, only for the next refilled token. The lower lanes can be
+starved if the higher lanes consume the whole rate --- by design.
+"""
+import asyncio
+import collections
+import functools
+
+
+class RateLimiter:
+    """
+    A token bucket with the waiters served by their priority lanes.
+
+    The rate & burst are given on every acquisition, so that they can be
+    changed at runtime (e.g. in the settings); ``None`` means "no limit".
+    """
+    __slots__ = ('_tokens', '_updated', '_waiters', '_timer')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tokens: float | None = None  # the bucket is full on the first use
+        self._updated: float = 0
+        self._waiters: dict[int, collections.deque[asyncio.Future[None]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def waiting(self) -> int:
+        return sum(not future.done() for futures in self._waiters.values() for future in futures)
+
+    async def acquire(
+            self,
+            lane: int = 0,
+            *,
+            rate: float | None = None,
+            burst: int = 1,
+    ) -> None:
+        """ Take one token, or wait until it is refilled and the higher lanes are served. """
+        if rate is None or rate <= 0:
+            return
+
+        burst = max(1, burst)
+        tokens = self._refill(rate=rate, burst=burst)
+        if tokens >= 1 and not any(futures for key, futures in self._waiters.items() if key >= lane):
+            self._tokens = tokens - 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(lane, collections.deque()).append(future)
+        self._dispatch(rate=rate, burst=burst)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # If the token was granted but not taken, give it to the next waiter.
+            if future.done() and not future.cancelled():
+                self._tokens = (self._tokens or 0) + 1
+                self._dispatch(rate=rate, burst=burst)
+            raise
+
+    def _refill(self, *, rate: float, burst: int) -> float:
+        now = asyncio.get_running_loop().time()
+        if self._tokens is None:
+            self._tokens = float(burst)
+        else:
+            self._tokens = min(float(burst), self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        return self._tokens
+
+    def _dispatch(self, *, rate: float, burst: int) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        tokens = self._refill(rate=rate, burst=burst)
+        for lane in sorted(self._waiters, reverse=True):
+            futures = self._waiters[lane]
+            while futures and tokens >= 1:
+                future = futures.popleft()
+                if not future.done():  # i.e. not cancelled while waiting
+                    future.set_result(None)
+                    tokens -= 1
+            if not futures:
+                del self._waiters[lane]
+        self._tokens = tokens
+
+        # Wake up when the next token is refilled, if there is anyone to serve.
+        if self._waiters:
+            delay = (1 - tokens) / rate
+            callback = functools.partial(self._dispatch, rate=rate, burst=burst)
+            self._timer = asyncio.get_running_loop().call_later(delay, callback)
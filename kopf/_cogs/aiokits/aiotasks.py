@@ -26,6 +26,8 @@ else:
     Future = asyncio.Future
     Task = asyncio.Task
 
+_FutureT = TypeVar('_FutureT', bound=Future)
+
 
 async def cancel_coro(
         coro: Coroutine[Any, Any, Any],
@@ -133,11 +135,11 @@ def create_guarded_task(
 
 
 async def wait(
-        tasks: Collection[Task],
+        tasks: Collection[_FutureT],
         *,
         timeout: float | None = None,
         return_when: Any = asyncio.ALL_COMPLETED,
-) -> tuple[set[Task], set[Task]]:
+) -> tuple[set[_FutureT], set[_FutureT]]:
     """
     A safer version of :func:`asyncio.wait` --- does not fail on an empty list.
     """
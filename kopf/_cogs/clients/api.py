@@ -1,5 +1,6 @@
 import asyncio
 import collections.abc
+import enum
 import itertools
 import json
 import ssl
@@ -13,6 +14,14 @@ from kopf._cogs.aiokits import aiotasks
 from kopf._cogs.clients import auth, errors
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import typedefs
+from kopf._cogs.structs import telemetry
+
+
+class Lane(enum.IntEnum):
+    """ The priority lanes of the API requests for client-side rate limiting. """
+    BULK = 0  # e.g. K8s events
+    REGULAR = 1  # e.g. handling, watching, listing
+    CRITICAL = 2  # e.g. peering, finalizers
 
 
 @auth.authenticated
@@ -50,6 +59,7 @@ async def request(
         payload: object | None = None,
         headers: dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout | None = None,
+        lane: Lane = Lane.REGULAR,
         context: auth.APIContext | None = None,  # injected by the decorator
         logger: typedefs.Logger,
 ) -> aiohttp.ClientResponse:
@@ -72,18 +82,29 @@ async def request(
     for retry, backoff in enumerate(itertools.chain(backoffs, itertools.repeat(None)), start=1):
         idx = f"#{retry}/{count}" if count is not None else f"#{retry}"
         what = f"{method.upper()} {url}"
+        acquired: float | None = None
+        retry_after: int | None = None
         try:
             if retry > 1:
                 logger.debug(f"Request attempt {idx}: {what}")
 
-            response = await context.session.request(
-                method=method,
-                url=url,
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            await errors.check_response(response)  # but do not parse it!
+            await context.limiter.acquire(lane,
+                                          rate=settings.networking.qps,
+                                          burst=settings.networking.burst)
+            acquired = await context.concurrency.acquire(limit=settings.networking.max_concurrency,
+                                                         floor=settings.networking.min_concurrency)
+            try:
+                response = await context.session.request(
+                    method=method,
+                    url=url,
+                    json=payload,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                await errors.check_response(response)  # but do not parse it!
+            finally:
+                if acquired is not None:
+                    context.concurrency.release()
 
         # aiohttp raises a generic error if the session/transport is closed, so we try to guess.
         # NB: "session closed" will reset the retry counter and do the full cycle with the new creds.
@@ -105,8 +126,6 @@ async def request(
                     retry_after = int(float(e.headers["Retry-After"]))  # the new style
                 elif e.details and e.details.get("retryAfterSeconds"):
                     retry_after = int(e.details["retryAfterSeconds"])  # the old style
-                else:
-                    retry_after = None
 
                 if retry_after is not None and backoff is not None:
                     if settings.networking.enforce_retry_after or retry_after > backoff:
@@ -114,6 +133,12 @@ async def request(
                                      f"with the retry-after {retry_after}s from the server: {what}")
                         backoff = retry_after
 
+            # Slow down all requests of the operator, not only this one (if enabled).
+            if acquired is not None and isinstance(e, (errors.APIServerError, asyncio.TimeoutError,
+                                                       errors.APITooManyRequestsError)):
+                _adapt_concurrency(context=context, settings=settings, acquired=acquired,
+                                   overloaded=True, retry_after=retry_after)
+
             if '[SSL: APPLICATION_DATA_AFTER_CLOSE_NOTIFY]' in str(e):  # for ClientOSError
                 logger.error(f"Request attempt {idx} failed; SSL closed; will re-authenticate: {what}")
                 raise errors.APISessionClosed("SSL data stream is closed.") from e
@@ -126,11 +151,38 @@ async def request(
         else:
             if retry > 1:
                 logger.debug(f"Request attempt {idx} succeeded: {what}")
+            if acquired is not None:
+                latency = asyncio.get_running_loop().time() - acquired
+                threshold = settings.networking.latency_threshold
+                _adapt_concurrency(context=context, settings=settings, acquired=acquired,
+                                   overloaded=threshold is not None and latency > threshold)
             return response
 
     raise RuntimeError("Broken retryable routine.")  # impossible, but needed for type-checking.
 
 
+def _adapt_concurrency(
+        *,
+        context: auth.APIContext,
+        settings: configuration.OperatorSettings,
+        acquired: float,
+        overloaded: bool,
+        retry_after: float | None = None,
+) -> None:
+    limit = settings.networking.max_concurrency
+    floor = settings.networking.min_concurrency
+    if overloaded:
+        context.concurrency.overload(limit=limit, floor=floor,
+                                     acquired=acquired, retry_after=retry_after)
+    else:
+        context.concurrency.succeed(limit=limit, floor=floor)
+
+    operator_metrics = telemetry.metrics_var.get(None)
+    if operator_metrics is not None:
+        operator_metrics.api_overloads += int(overloaded)
+        operator_metrics.api_concurrency = context.concurrency.limit
+
+
 async def get(
         url: str,  # relative to the server/api root.
         *,
@@ -138,6 +190,7 @@ async def get(
         payload: object | None = None,
         headers: dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout | None = None,
+        lane: Lane = Lane.REGULAR,
         logger: typedefs.Logger,
 ) -> Any:
     response = await request(
@@ -146,6 +199,7 @@ async def get(
         payload=payload,
         headers=headers,
         timeout=timeout,
+        lane=lane,
         settings=settings,
         logger=logger,
     )
@@ -160,6 +214,7 @@ async def post(
         payload: object | None = None,
         headers: dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout | None = None,
+        lane: Lane = Lane.REGULAR,
         logger: typedefs.Logger,
 ) -> Any:
     response = await request(
@@ -168,6 +223,7 @@ async def post(
         payload=payload,
         headers=headers,
         timeout=timeout,
+        lane=lane,
         settings=settings,
         logger=logger,
     )
@@ -182,6 +238,7 @@ async def patch(
         payload: object | None = None,
         headers: dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout | None = None,
+        lane: Lane = Lane.REGULAR,
         logger: typedefs.Logger,
 ) -> Any:
     response = await request(
@@ -190,6 +247,7 @@ async def patch(
         payload=payload,
         headers=headers,
         timeout=timeout,
+        lane=lane,
         settings=settings,
         logger=logger,
     )
@@ -204,6 +262,7 @@ async def delete(
         payload: object | None = None,
         headers: dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout | None = None,
+        lane: Lane = Lane.REGULAR,
         logger: typedefs.Logger,
 ) -> Any:
     response = await request(
@@ -212,6 +271,7 @@ async def delete(
         payload=payload,
         headers=headers,
         timeout=timeout,
+        lane=lane,
         settings=settings,
         logger=logger,
     )
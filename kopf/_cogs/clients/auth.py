@@ -5,6 +5,7 @@ from typing import Any, TypeVar, cast
 
 import aiohttp
 
+from kopf._cogs.aiokits import aiolimits, aiorates
 from kopf._cogs.clients import errors
 from kopf._cogs.helpers import versions
 from kopf._cogs.structs import credentials
@@ -83,6 +84,12 @@ class APIContext:
     # List of open responses.
     responses: list[aiohttp.ClientResponse]
 
+    # The client-side rate limiter shared by all requests (see ``settings.networking.qps``).
+    limiter: aiorates.RateLimiter
+
+    # The adaptive concurrency limiter shared by all requests (see ``max_concurrency``).
+    concurrency: aiolimits.AdaptiveLimiter
+
     def __init__(
             self,
             info: credentials.KubeContext,
@@ -116,6 +123,8 @@ class APIContext:
         self.default_namespace = info.default_namespace
 
         self.responses = []
+        self.limiter = aiorates.RateLimiter()
+        self.concurrency = aiolimits.AdaptiveLimiter()
 
     def flush_closed_responses(self) -> None:
         # There's no point keeping references to already closed responses.
@@ -13,6 +13,7 @@ async def create_obj(
         namespace: references.Namespace = None,
         name: str | None = None,
         body: bodies.RawBody | None = None,
+        lane: api.Lane = api.Lane.REGULAR,
         logger: typedefs.Logger,
 ) -> bodies.RawBody | None:
     """
@@ -28,6 +29,7 @@ async def create_obj(
     created_body: bodies.RawBody = await api.post(
         url=resource.get_url(namespace=namespace),
         payload=body,
+        lane=lane,
         logger=logger,
         settings=settings,
     )
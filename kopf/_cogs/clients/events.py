@@ -21,23 +21,26 @@ async def post_event(
         resource: references.Resource,
         settings: configuration.OperatorSettings,
         logger: typedefs.Logger,
-) -> None:
+        default_namespace: str | None = None,
+) -> bodies.RawBody | None:
     """
     Issue an event for the object.
 
-    This is where they can also be accumulated, aggregated, grouped,
-    and where the rate-limits should be maintained. It can (and should)
-    be done by the client library, as it is done in the Go client.
+    The posted event is returned, so that it can be updated later when
+    the same event repeats (see the aggregation in the posting engine).
+    ``None`` is returned if nothing is posted, e.g. due to errors.
     """
 
     # Prevent "event explosion", when core v1 events are handled and create other core v1 events.
     # This can happen with `EVERYTHING` without additional filters, or by explicitly serving them.
     if ref.get('apiVersion') == 'v1' and ref.get('kind') == 'Event':
-        return
+        return None
 
     # See #164. For cluster-scoped objects, use the current namespace from the current context.
     # It could be "default", but in some systems, we are limited to one specific namespace only.
-    namespace_name: str = ref.get('namespace') or (await api.get_default_namespace()) or 'default'
+    # The callers can resolve it once and pass it here to avoid the repeated resolution.
+    namespace_name: str = (ref.get('namespace') or default_namespace or
+                           (await api.get_default_namespace()) or 'default')
     namespace = references.NamespaceName(namespace_name)
     full_ref: bodies.ObjectReference = copy.copy(ref)
     full_ref['namespace'] = namespace
@@ -70,16 +73,19 @@ async def post_event(
         'firstTimestamp': now.isoformat(),  # seen in `kubectl describe ...`
         'lastTimestamp': now.isoformat(),  # seen in `kubectl get events`
         'eventTime': now.isoformat(),
+        'count': 1,
     }
 
     try:
-        await api.post(
+        posted: bodies.RawBody = await api.post(
             url=resource.get_url(namespace=namespace),
             headers={'Content-Type': 'application/json'},
             payload=body,
+            lane=api.Lane.BULK,
             logger=logger,
             settings=settings,
         )
+        return posted
 
     # Events are helpful but auxiliary, they should not fail the handling cycle.
     # Yet we want to notice that something went wrong (in logs).
@@ -98,3 +104,38 @@ async def post_event(
     except aiohttp.ClientOSError:
         logger.warning(f"Failed to post an event. Ignoring and continuing. "
                        f"Event: type={type!r}, reason={reason!r}, message={message!r}.")
+    return None
+
+
+async def update_event(
+        *,
+        name: str,
+        namespace: references.NamespaceName,
+        count: int,
+        resource: references.Resource,
+        settings: configuration.OperatorSettings,
+        logger: typedefs.Logger,
+) -> bool:
+    """
+    Update the count & the last timestamp of an already posted event.
+
+    Returns ``False`` if the event does not exist anymore (e.g. expired),
+    so that a new one should be posted instead. Other errors are ignored,
+    same as when posting: the events are auxiliary, so they can be lost.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        await api.patch(
+            url=resource.get_url(namespace=namespace, name=name),
+            headers={'Content-Type': 'application/merge-patch+json'},
+            payload={'count': count, 'lastTimestamp': now.isoformat()},
+            lane=api.Lane.BULK,
+            logger=logger,
+            settings=settings,
+        )
+    except errors.APINotFoundError:
+        return False
+    except (errors.APIError, aiohttp.ClientError) as e:
+        logger.warning(f"Failed to update an event. Ignoring and continuing. "
+                       f"Event: {namespace}/{name}, count={count}. Error: {e!r}")
+    return True
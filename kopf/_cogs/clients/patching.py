@@ -1,7 +1,153 @@
+import copy
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple
+
 from kopf._cogs.clients import api, errors
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import typedefs
-from kopf._cogs.structs import bodies, patches, references
+from kopf._cogs.structs import bodies, patches, references, telemetry
+
+
+class PatchRequest(NamedTuple):
+    """ A single merge-patch API call as planned by :func:`plan_patch`. """
+    subresource: str | None
+    payload: dict[str, Any]
+    guarded: bool = False  # by the resource version of the original body or the preceding request.
+
+
+def plan_patch(
+        *,
+        resource: references.Resource,
+        patch: patches.Patch,
+) -> Sequence[PatchRequest] | None:
+    """
+    Plan the minimal set of API calls for the patch with transformations.
+
+    Normally, the patch is applied in up to 4 API calls: a merge-patch
+    of the main body, a merge-patch of the status (if it is a subresource),
+    and then the JSON-patches for the main body & the status --- to apply
+    the transformation functions (e.g. the finalizers' addition or removal).
+
+    If the effects of the transformations are representable as merge-patches,
+    they can be folded into the merge-patches of the same targets, and
+    the JSON-patches are not needed. If the effects depend on the consistent
+    read of the original body (e.g. the lists, which are replaced as a whole),
+    the merge-patch requests are then guarded by the resource version of the
+    original body (and of the previous request's response for the subsequent
+    requests) --- the same way as the JSON-patches are guarded by the "test"
+    operation. Otherwise, the merge-patches are sent unconditionally as usual.
+
+    Returns ``None`` if the folding is impossible or does not reduce
+    the number of API calls. The caller then uses the usual way of patching.
+    """
+    original = patch._original
+    resource_version = None if original is None else original.metadata.get('resourceVersion')
+    if not patch.fns or resource_version is None:
+        return None
+
+    folded = patch.as_merge_patch()
+    effects = patches.Patch(fns=patch.fns).as_merge_patch(patch._original)
+    if folded is None or effects is None:
+        return None
+
+    # Compare the API calls in both ways of patching, and fold only if it is actually beneficial.
+    as_subresource = 'status' in resource.subresources
+    body_merge, status_merge = _split_status(dict(patch), as_subresource=as_subresource)
+    body_fns, status_fns = _split_status(effects, as_subresource=as_subresource)
+    body_folded, status_folded = _split_status(folded, as_subresource=as_subresource)
+    separate_count = sum(map(bool, [body_merge, status_merge, body_fns, status_fns]))
+    folded_count = sum(map(bool, [body_folded, status_folded]))
+    if folded_count >= separate_count:
+        return None
+
+    guarded = _needs_consistency(effects, original or {})
+    requests: list[PatchRequest] = []
+    if body_folded:
+        requests.append(PatchRequest(subresource=None, payload=body_folded, guarded=guarded))
+    if status_folded:
+        requests.append(PatchRequest(subresource='status', payload=status_folded, guarded=guarded))
+    if guarded:
+        requests[0].payload.setdefault('metadata', {})['resourceVersion'] = resource_version
+    return requests
+
+
+def _needs_consistency(merge_patch: Mapping[str, Any], body: Mapping[str, Any]) -> bool:
+    """
+    Check if the merge-patch overwrites the lists read from the original body.
+
+    The lists are replaced or removed as a whole in merge-patches, so the
+    concurrent changes to them (e.g. other finalizers added by other parties)
+    are lost unless the patch is guarded by the resource version of the body.
+    The scalar fields are set to the same values regardless of the body.
+    """
+    for key, value in merge_patch.items():
+        current = body.get(key)
+        if isinstance(value, list) or isinstance(current, list):
+            return True
+        if isinstance(value, Mapping):
+            if _needs_consistency(value, current if isinstance(current, Mapping) else {}):
+                return True
+    return False
+
+
+def plan_apply(
+        *,
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        patch: patches.Patch,
+) -> bool | None:
+    """
+    Check if the finalizer can be added or removed via the server-side apply.
+
+    It is possible only if the transformation functions of the patch change
+    nothing but the framework's own finalizer --- which is usually the case,
+    since the finalizer is added or removed in the cycles dedicated to it.
+
+    Returns whether the finalizer must be present after the patching,
+    or ``None`` if the server-side apply is not configured or not possible.
+    The caller then uses the usual way of patching (e.g. the JSON-patches).
+    """
+    original = patch._original
+    if settings.persistence.patch_strategy != 'apply' or not patch.fns or original is None:
+        return None
+    if not original.get('kind') and not resource.kind:  # required by the server-side apply.
+        return None
+
+    finalizer = settings.persistence.finalizer
+    body_as_is: dict[str, Any] = copy.deepcopy(dict(original))
+    body_to_be: dict[str, Any] = copy.deepcopy(body_as_is)
+    for fn in patch.fns:
+        fn(body_to_be)  # type: ignore[arg-type]
+
+    old_finalizers = list(body_as_is.get('metadata', {}).get('finalizers', []))
+    new_finalizers = list(body_to_be.get('metadata', {}).get('finalizers', []))
+    old_others = [item for item in old_finalizers if item != finalizer]
+    new_others = [item for item in new_finalizers if item != finalizer]
+    if old_others != new_others or (finalizer in old_finalizers) == (finalizer in new_finalizers):
+        return None
+    if _without_finalizers(body_as_is) != _without_finalizers(body_to_be):
+        return None
+    return finalizer in new_finalizers
+
+
+def _without_finalizers(body: dict[str, Any]) -> dict[str, Any]:
+    metadata = {key: val for key, val in body.get('metadata', {}).items() if key != 'finalizers'}
+    return dict(body, metadata=metadata)
+
+
+def _get_api_version(resource: references.Resource) -> str:
+    return f'{resource.group}/{resource.version}' if resource.group else resource.version
+
+
+def _split_status(
+        merge_patch: dict[str, Any],
+        *,
+        as_subresource: bool,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """ Split a merge-patch into the main body & status parts, if the latter is a subresource. """
+    body_patch = dict(merge_patch)  # shallow: for mutation of the top-level keys below.
+    status_patch = body_patch.pop('status', None) if as_subresource else None
+    return body_patch, ({'status': status_patch} if status_patch else {})
 
 
 async def patch_obj(
@@ -12,6 +158,7 @@ async def patch_obj(
         name: str,
         patch: patches.Patch,
         logger: typedefs.Logger,
+        lane: api.Lane | None = None,
         silent: bool = False,
 ) -> tuple[bodies.RawBody | None, patches.Patch | None]:
     """
@@ -21,35 +168,85 @@ async def patch_obj(
     used for the namespaced resources, even if the operator serves
     the whole cluster (i.e. is not namespace-restricted).
 
-    Returns the patched body. The patched body can be partial (status-only,
-    no-status, or empty) --- depending on whether there were fields in the body
-    or in the status to patch; if neither had fields for patching, the result
-    is an empty body. The result should only be used to check against the patch:
-    if there was nothing to patch, it does not matter if the fields are absent.
+    Returns the patched body. The patched body can be partial (status-only
+    or no-status) --- depending on whether there were fields in the body
+    or in the status to patch. The result should only be used to check against
+    the patch: if there was nothing to patch, it does not matter if the fields
+    are absent.
+
+    The changes that are already in the original body are not sent. If nothing
+    is left to patch (including the transformations with no effect), no API
+    calls are made at all, and the result is ``None``: the object is unchanged,
+    so no watch-events should be expected from this patching.
 
     Returns ``None`` if the underlying object is absent, as detected by trying
     to patch it and failing with HTTP 404. This can happen if the object was
     deleted in the operator's handlers or externally during the processing,
     so that the framework was unaware of these changes until the last moment.
     """
+    # Exclude the changes that are already in the body, e.g. the same values set again by handlers.
+    # The no-op transformations are excluded later, when their JSON-patches turn out to be empty.
+    requested_patch, patch = patch, patch.as_effective_patch()
+
+    # The finalizers are critical for the objects' deletion, so they go first under rate-limiting.
+    lane = lane if lane is not None else api.Lane.CRITICAL if patch.fns else api.Lane.REGULAR
+
     as_subresource = 'status' in resource.subresources
-    body_patch = dict(patch)  # shallow: for mutation of the top-level keys below.
-    status_patch = body_patch.pop('status', None) if as_subresource else None
-    status_patch = {'status': status_patch} if status_patch is not None else None
+    body_patch, status_patch = _split_status(dict(patch), as_subresource=as_subresource)
+    finalizer_applied = plan_apply(settings=settings, resource=resource, patch=patch)
+    folded_requests = plan_patch(resource=resource, patch=patch) if finalizer_applied is None else None
+    api_calls = 0
 
     # Patch & reconstruct the actual body as reported by the server. The reconstructed body can be
     # partial or empty -- if the body/status patches are empty. This is fine: it is only used
     # to verify that the patched fields are matching the patch. No patch? No mismatch!
     try:
         patched_body: bodies.RawBody | None = None
+        if requested_patch and not patch:
+            if not silent:
+                logger.debug(f"Patching was skipped: all the changes are already in the object.")
+            return None, None
+
+        # Try the fewer merge-patches with the transformations folded in, if they were planned.
+        # If anything changes since the original body, fall back to the usual way of patching:
+        # it re-applies the already applied merge-patches, which is harmless (the same values).
+        if folded_requests is not None:
+            try:
+                for request in folded_requests:
+                    payload = request.payload
+                    if request.guarded and patched_body is not None:
+                        resource_version = patched_body.get('metadata', {}).get('resourceVersion')
+                        payload = dict(payload, metadata=dict(payload.get('metadata') or {},
+                                                              resourceVersion=resource_version))
+                    if not silent:
+                        what = 'the status' if request.subresource else 'the resource'
+                        logger.debug(f"Merge-patching {what} with: {payload!r}")
+                    api_calls += 1
+                    patched_body = await api.patch(
+                        url=resource.get_url(namespace=namespace, name=name,
+                                             subresource=request.subresource),
+                        headers={'Content-Type': 'application/merge-patch+json'},
+                        payload=payload,
+                        lane=lane,
+                        settings=settings,
+                        logger=logger,
+                    )
+                return patched_body, None
+            except errors.APIConflictError:
+                if not silent:
+                    logger.debug("Could not apply the folded patch due to conflicts with newer "
+                                 "changes. Falling back to the separate merge- & JSON-patches.")
+                patched_body = None
 
         if body_patch:
             if not silent:
                 logger.debug(f"Merge-patching the resource with: {body_patch!r}")
+            api_calls += 1
             patched_body = await api.patch(
                 url=resource.get_url(namespace=namespace, name=name),
                 headers={'Content-Type': 'application/merge-patch+json'},
                 payload=body_patch,
+                lane=lane,
                 settings=settings,
                 logger=logger,
             )
@@ -58,14 +255,46 @@ async def patch_obj(
             # NB: we need the new resourceVersion, so we take the whole new patched body.
             if not silent:
                 logger.debug(f"Merge-patching the status with: {status_patch!r}")
+            api_calls += 1
             patched_body = await api.patch(
                 url=resource.get_url(namespace=namespace, name=name, subresource='status'),
                 headers={'Content-Type': 'application/merge-patch+json'},
                 payload=status_patch,
+                lane=lane,
                 settings=settings,
                 logger=logger,
             )
 
+        # Add or remove the framework's own finalizer via the server-side apply without retries:
+        # the finalizer is owned by our field manager, other finalizers are owned by other managers.
+        # If the finalizer remains (e.g. co-owned by other managers, as it happens after switching
+        # from the JSON-patches), remove it via the usual JSON-patch with the freshest body below.
+        if finalizer_applied is not None:
+            finalizer = settings.persistence.finalizer
+            field_manager = settings.persistence.field_manager or finalizer
+            original: Mapping[str, Any] = patch._original or {}
+            metadata = {'name': name} if namespace is None else {'name': name, 'namespace': namespace}
+            payload = {
+                'apiVersion': original.get('apiVersion') or _get_api_version(resource),
+                'kind': original.get('kind') or resource.kind,
+                'metadata': dict(metadata, finalizers=[finalizer] if finalizer_applied else []),
+            }
+            if not silent:
+                logger.debug(f"Applying the finalizer server-side with: {payload!r}")
+            api_calls += 1
+            patched_body = await api.patch(
+                url=resource.get_url(namespace=namespace, name=name,
+                                     params={'fieldManager': field_manager, 'force': 'true'}),
+                headers={'Content-Type': 'application/apply-patch+yaml'},
+                payload=payload,
+                lane=lane,
+                settings=settings,
+                logger=logger,
+            )
+            actual_finalizers = (patched_body or {}).get('metadata', {}).get('finalizers', [])
+            if (finalizer in actual_finalizers) == finalizer_applied:
+                return patched_body, None
+
         # Only the callable transformations are left now, no dict-merge components left.
         # If we fail at any stage below, we re-apply this whole patch. We cannot distinguish
         # the "status" functions from the "main body" functions; some of them can be mixed.
@@ -99,10 +328,12 @@ async def patch_obj(
             if not silent:
                 logger.debug(f"JSON-patching the resource with: {ops!r}")
             try:
+                api_calls += 1
                 patched_body = await api.patch(
                     url=resource.get_url(namespace=namespace, name=name),
                     headers={'Content-Type': 'application/json-patch+json'},
                     payload=ops,
+                    lane=lane,
                     settings=settings,
                     logger=logger,
                 )
@@ -128,10 +359,12 @@ async def patch_obj(
             if not silent:
                 logger.debug(f"JSON-patching the status with: {ops!r}")
             try:
+                api_calls += 1
                 patched_body = await api.patch(
                     url=resource.get_url(namespace=namespace, name=name, subresource='status'),
                     headers={'Content-Type': 'application/json-patch+json'},
                     payload=ops,
+                    lane=lane,
                     settings=settings,
                     logger=logger,
                 )
@@ -149,3 +382,10 @@ async def patch_obj(
     except errors.APINotFoundError:
         logger.debug(f"Patching was skipped: the object does not exist anymore.")
         return None, None
+
+    finally:
+        operator_metrics = telemetry.metrics_var.get(None)
+        if operator_metrics is not None:
+            operator_metrics.count_patching(api_calls)
+            if requested_patch and not api_calls:
+                operator_metrics.count_skipping()
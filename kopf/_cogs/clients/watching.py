@@ -55,6 +55,7 @@ async def infinite_watch(
         resource: references.Resource,
         namespace: references.Namespace,
         operator_paused: aiotoggles.ToggleSet | None = None,  # None for tests & observation
+        relisting: asyncio.Condition | None = None,  # None for tests & observation
         _iterations: int | None = None,  # used in tests/mocks/fixtures
 ) -> AsyncIterator[Bookmark | bodies.RawEvent]:
     """
@@ -66,6 +67,9 @@ async def infinite_watch(
     This routine never ends gracefully. If a watcher's stream fails,
     a new one is recreated, and the stream continues.
     It only exits with unrecoverable exceptions.
+
+    The stream is also recreated (with the objects re-listed) every time
+    the ``relisting`` condition is notified, e.g. on the operator's re-sharding.
     """
     how = ' (paused)' if operator_paused is not None and operator_paused.is_on() else ''
     where = f'in {namespace!r}' if namespace is not None else 'cluster-wide'
@@ -77,6 +81,7 @@ async def infinite_watch(
                 namespace=namespace,
                 resource=resource,
                 operator_paused=operator_paused,
+                relisting=relisting,
             ) as operator_pause_waiter:
                 stream = continuous_watch(
                     settings=settings,
@@ -102,6 +107,7 @@ async def streaming_block(
         resource: references.Resource,
         namespace: references.Namespace,
         operator_paused: aiotoggles.ToggleSet | None = None,  # None for tests & observation
+        relisting: asyncio.Condition | None = None,  # None for tests & observation
 ) -> AsyncIterator[aiotasks.Future]:
     """
     Block the execution until un-paused; signal when it is active again.
@@ -112,7 +118,8 @@ async def streaming_block(
     and the streaming coroutine is started again by ``infinite_stream()``
     (the watcher timeout is swallowed by the pause time).
 
-    Returns a future (or a task) that is set (or finished) when paused again.
+    Returns a future (or a task) that is set (or finished) when paused again,
+    or when the re-listing is requested (the stream is closed the same way).
 
     A stop-future is a client-specific way of terminating the streaming HTTPS
     connections when paused again. The low-level streaming API call attaches
@@ -137,11 +144,11 @@ async def streaming_block(
         resuming_reason = f" (resolved: {', '.join(names)})" if names else ""
         logger.debug(f"Resuming the watch-stream for {resource} {where}{resuming_reason}.")
 
-    # Create the signalling future for when paused again.
+    # Create the signalling future for when paused again (or when re-listing is requested).
     operator_pause_waiter: aiotasks.Future
-    if operator_paused is not None:
+    if operator_paused is not None or relisting is not None:
         operator_pause_waiter = asyncio.create_task(
-            operator_paused.wait_for(True),
+            _wait_for_interruption(operator_paused=operator_paused, relisting=relisting),
             name=f"pause-waiter for {resource}")
     else:
         operator_pause_waiter = asyncio.Future()  # a dummy just to have it
@@ -155,6 +162,29 @@ async def streaming_block(
             await operator_pause_waiter
 
 
+async def _wait_for_interruption(
+        *,
+        operator_paused: aiotoggles.ToggleSet | None,
+        relisting: asyncio.Condition | None,
+) -> None:
+    waiters: list[aiotasks.Future] = []
+    if operator_paused is not None:
+        waiters.append(asyncio.create_task(operator_paused.wait_for(True)))
+    if relisting is not None:
+        waiters.append(asyncio.create_task(_wait_for_notification(relisting)))
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.wait(waiters)
+
+
+async def _wait_for_notification(condition: asyncio.Condition) -> None:
+    async with condition:
+        await condition.wait()
+
+
 async def continuous_watch(
         *,
         settings: configuration.OperatorSettings,
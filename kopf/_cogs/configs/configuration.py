@@ -30,6 +30,7 @@ import dataclasses
 import logging
 import warnings
 from collections.abc import Iterable
+from typing import Literal
 
 from kopf._cogs.configs import diffbase, progress
 from kopf._cogs.structs import reviews
@@ -59,6 +60,26 @@ class ProcessSettings:
     to let K8s kill the operator's pod instead, if it can.
     """
 
+    processes: int = 1
+    """
+    How many operator processes share the objects (``kopf run --processes=N``).
+
+    All processes watch and index all objects, but every object is handled
+    by one and only one of them, as chosen by a consistent hash of its uid
+    (or of its namespace, if ``settings.peering.sharding`` is ``'namespace'``).
+
+    This is set by the supervising process of ``kopf run`` for every process
+    it starts. Changing it in the startup handlers has no effect.
+    """
+
+    process_index: int = 0
+    """
+    The index of the current process among all ``processes`` (starting from 0).
+
+    This is set by the supervising process of ``kopf run`` for every process
+    it starts. Changing it in the startup handlers has no effect.
+    """
+
 
 @dataclasses.dataclass
 class PostingSettings:
@@ -94,6 +115,61 @@ class PostingSettings:
     reporting_instance: str = 'dev'
     event_name_prefix: str = 'kopf-event-'
 
+    aggregation_window: float | None = None
+    """
+    For how long (seconds) the repeated K8s Events are aggregated.
+
+    The same events (by the object, type, reason, and message) are not posted
+    as new K8s Events, but increase the ``count`` of the first one instead,
+    for this long since the first one was posted.
+
+    ``None`` (the default) disables the aggregation. E.g., ``600`` is
+    the same 10 minutes as in the Go client.
+    """
+
+    spam_burst: int | None = None
+    """
+    How many K8s Events can be posted for a single object at once.
+
+    Beyond this, the events are posted only as the posting budget is
+    restored at ``spam_rate``; the excessive events are dropped.
+
+    ``None`` (the default) disables the spam filter. E.g., ``25`` is
+    the same burst as in the Go client.
+    """
+
+    spam_rate: float = 1 / 300
+    """
+    How fast (events per second) the posting budget of an object is restored.
+
+    The default is one event per 5 minutes, the same as in the Go client.
+    """
+
+    workers: int = 4
+    """
+    How many K8s Events can be posted concurrently.
+
+    The events of the same object are posted one after another anyway.
+    """
+
+    queue_limit: int | None = None
+    """
+    How many K8s Events can be queued for posting (``None`` for no limit).
+
+    Beyond this, the queued events are dropped according to ``drop_policy``,
+    counted in :attr:`kopf.OperatorMetrics.events_dropped`, and a warning
+    is logged. By default, the queue is not limited.
+    """
+
+    drop_policy: Literal['oldest', 'severity'] = 'oldest'
+    """
+    Which K8s Events are dropped first when the posting queue is full.
+
+    ``'oldest'`` drops the oldest queued events. ``'severity'`` drops
+    the events of the lowest severity (the oldest of them): e.g. "Normal"
+    before "Warning", and "Warning" before "Error".
+    """
+
 
 @dataclasses.dataclass
 class PeeringSettings:
@@ -166,6 +242,52 @@ class PeeringSettings:
     e.g. using the cluster-wide peering while the operator is namespaced.
     """
 
+    backend: Literal['peerings', 'leases'] = 'peerings'
+    """
+    Which objects are used to exchange the keep-alives among the operators.
+
+    ``'peerings'`` (the default) uses the framework's own custom resources
+    ``ClusterKopfPeering`` or ``KopfPeering``, with the records of all operators
+    in one object's status. The CRDs must be installed in the cluster.
+
+    ``'leases'`` uses the built-in ``coordination.k8s.io/v1`` leases:
+    one lease per operator, renewed by its holder only, so that the operators
+    do not re-write the records of each other; no CRDs are needed.
+    For the cluster-wide peering, the leases are kept in the operator's
+    default namespace (of its pod or kubeconfig context), or in ``default``.
+    """
+
+    sharding: Literal['uid', 'namespace'] | None = None
+    """
+    Should the same-priority operators share the objects instead of pausing?
+
+    By default (``None``), the operators with the same priority are considered
+    conflicting, and all of them pause. In the sharded mode, they are members
+    of one deployment instead, and split the objects among themselves:
+    every object is handled only by one live member, as chosen by a consistent
+    hash of the object's ``'uid'`` or ``'namespace'`` (so that all objects
+    of one namespace are handled by the same member).
+
+    When the members come and go, the objects are re-listed and re-distributed.
+    The operators with higher priorities still pause all the members.
+    """
+
+    standby: bool = False
+    """
+    Should the paused operators stay in the hot-standby mode?
+
+    By default, the paused operators (e.g. in favour of a higher priority one)
+    close all their watch-streams and re-list everything when resumed.
+
+    In the hot-standby mode, the paused operators keep watching the resources,
+    indexing the objects, and remembering the latest objects' states,
+    but they call no handlers, spawn no daemons & timers, and patch nothing.
+    When resumed (e.g. when taking over from a higher priority operator),
+    they immediately re-process the remembered objects without re-listing.
+
+    This costs the memory for keeping the latest states of all served objects.
+    """
+
     @property
     def namespaced(self) -> bool:
         """ An inverse of ``clusterwide``, for code readability. """
@@ -257,6 +379,57 @@ class QueueingSettings:
         self._batch_window = value
 
 
+@dataclasses.dataclass
+class IndexingSettings:
+    """
+    Settings for the in-memory indices of the ``@kopf.index`` handlers.
+    """
+
+    snapshot_path: str | None = None
+    """
+    A local file to keep the snapshots of the indices in between restarts.
+
+    If set, the indices are restored from this file on the operator startup.
+    The objects that have not changed since the snapshot (as per their
+    ``resourceVersion``) are not re-indexed, so the operator becomes ready
+    sooner. The objects that were deleted meanwhile are forgotten on readiness.
+
+    The file is written periodically and on the operator exit.
+    It contains pickled Python objects: keep it in a trusted location,
+    e.g. a pod's ``emptyDir`` volume or a persistent volume.
+
+    If not set (the default), the indices are populated from scratch.
+    """
+
+    snapshot_interval: float = 60
+    """
+    How often (in seconds) to write the snapshots of the indices to the file.
+    """
+
+    snapshot_fingerprint: str | None = None
+    """
+    An arbitrary version of the indexing logic, to invalidate the snapshots.
+
+    The snapshots are ignored if the code of the indexing functions changes,
+    but not if the helpers they call or the data they depend on change.
+    Change this value in such cases to ignore the snapshots of older versions.
+    """
+
+    lean_processing: bool = False
+    """
+    Whether to process the resources with only the indexing handlers lightly.
+
+    Such resources do not need the per-object memories, patches, loggers,
+    and cause detection of the regular handling: the watch-events go directly
+    to the indexing functions and then to the indices.
+
+    The downside is that the ``memo`` kwarg of the indexing functions is then
+    a fresh shallow copy of the operator's memo on every call, not a per-object
+    memo persisted between the calls. This is why it is disabled by default:
+    enable it only if the indexing functions keep no per-object state in memos.
+    """
+
+
 @dataclasses.dataclass
 class ScanningSettings:
     """
@@ -348,6 +521,14 @@ class ExecutionSettings:
     handlers (specific invocations) will continue with their original executors.
     """
 
+    max_concurrent_handlers: int | None = None
+    """
+    How many handlers of one cause can run at the same time (``None`` for all).
+
+    It is used only with the concurrent lifecycle (:func:`kopf.lifecycles.concurrent`).
+    The synchronous handlers are additionally limited by the executor's workers.
+    """
+
     _max_workers: int | None = None
 
     @property
@@ -408,6 +589,60 @@ class NetworkingSettings:
     (the request attempt never awaits shorter than what the server asked for).
     """
 
+    qps: float | None = None
+    """
+    The maximum rate of the API requests per second, or ``None`` for no limit.
+
+    The rate is shared by all API requests of the operator (as in client-go).
+    When exceeded, the requests wait for their turn on the client side
+    instead of being rejected by the server with HTTP 429 Too Many Requests.
+    The requests of peering and finalizers are served first, then the regular
+    requests of handling and watching, and the K8s events are the last.
+
+    With ``kopf run --processes=N``, the rate is per process (N times in total).
+    """
+
+    burst: int = 10
+    """
+    How many API requests can be sent at once above the rate (``qps``).
+
+    The unused rate accumulates up to this number of requests, and then
+    allows short bursts of requests without waiting for the rate limiter.
+    """
+
+    max_concurrency: int | None = None
+    """
+    The maximum number of simultaneous API requests, or ``None`` for no limit.
+
+    If set, the actual limit adapts to the server's load (AIMD): it halves
+    on overloads (HTTP 429, 5xx, timeouts, or slow responses; see below)
+    and then grows back by 1 per every ``limit`` successful requests.
+    The excessive requests wait for their turn on the client side.
+
+    Besides, the retry-after of HTTP 429 Too Many Requests pauses all API
+    requests of the operator, not only the one that was rejected.
+
+    The current limit is exposed in :class:`kopf.OperatorMetrics`.
+
+    With ``kopf run --processes=N``, the limit is per process (N times in total).
+    """
+
+    min_concurrency: int = 1
+    """
+    The minimum number of simultaneous API requests for the adaptive limit.
+
+    The limit never decreases below this number regardless of the overloads.
+    Only used if ``max_concurrency`` is set.
+    """
+
+    latency_threshold: float | None = None
+    """
+    How slow a successful API request must be to count as an overload (seconds).
+
+    ``None`` means that only the failures count as overloads, not the latency.
+    Only used if ``max_concurrency`` is set.
+    """
+
     trust_env: bool = False
     """
     Whether to respect the proxy-related environment variables and ``~/.netrc``.
@@ -448,6 +683,31 @@ class PersistenceSettings:
     See :ref:`consistency` for detailed explanation.
     """
 
+    patch_strategy: Literal['merge', 'apply'] = 'merge'
+    """
+    How the framework's own finalizer is added to and removed from resources.
+
+    With ``"merge"`` (the default), it is done via JSON-patches with an optimistic
+    concurrency check on the resource version (or folded into the merge-patches).
+    Under contention, these patches fail and are retried in the next cycles.
+
+    With ``"apply"``, the server-side apply (``application/apply-patch+yaml``)
+    is used with :attr:`field_manager` as the owner of the finalizer.
+    The conflicts are then resolved by the server without retries.
+
+    The dict-based changes (e.g. the progress & diff-base annotations)
+    and other transformation functions are merge- & JSON-patched as usual.
+    """
+
+    field_manager: str | None = None
+    """
+    The field manager for the server-side apply (see :attr:`patch_strategy`).
+
+    If not set, the finalizer is used as the field manager's name, so that
+    several operators with different finalizers do not remove each other's ones.
+    It must be stable across the operator's restarts.
+    """
+
 
 @dataclasses.dataclass
 class BackgroundSettings:
@@ -507,6 +767,58 @@ class BackgroundSettings:
     PS: The default value is a rough guess on a typical code complexity.
     """
 
+    max_concurrent_timers: int | None = None
+    """
+    How many timer invocations can run at the same time in the whole operator.
+
+    The timers have no tasks while they wait for their time, only while running.
+    The due timers beyond this limit wait until the running ones are finished.
+    ``None`` (the default) means no limit, as if every timer had its own task.
+    """
+
+    max_timer_rate: float | None = None
+    """
+    How many timer invocations per second can start in the whole operator.
+
+    The due timers beyond this rate are postponed to evenly spaced time slots,
+    so that the bursts (e.g. after the operator restarts) are spread over time.
+    ``None`` (the default) means no limit.
+    """
+
+    max_concurrent_invocations: int | None = None
+    """
+    How many daemon & timer invocations can run at the same time in total.
+
+    The invocations beyond this limit wait for their turn before executing
+    the handler (i.e. not in the executor's queue), and the free slots
+    are given to the waiting handlers in turns, one handler after another,
+    regardless of how many objects each handler serves.
+
+    The daemons occupy their slots for as long as they run, so the limit
+    must be higher than the number of the daemons expected to run at once.
+    ``None`` (the default) means no limit.
+    """
+
+    max_concurrent_invocations_per_handler: int | None = None
+    """
+    How many invocations of each daemon/timer handler can run at the same time.
+
+    It works the same way as ``max_concurrent_invocations``, but individually
+    for every handler (for all objects served by this handler).
+    ``None`` (the default) means no limit.
+    """
+
+    reserved_workers: int | None = None
+    """
+    How many executor's workers are reserved for the regular handlers.
+
+    The synchronous daemons & timers can occupy all workers of the executor
+    except these ones (but at least one); the regular synchronous handlers
+    can use all of them. This prevents the starvation of the regular handlers
+    when there are many synchronous daemons & timers running or due.
+    ``None`` (the default) means no reservation.
+    """
+
 
 @dataclasses.dataclass
 class OperatorSettings:
@@ -515,6 +827,7 @@ class OperatorSettings:
     peering: PeeringSettings = dataclasses.field(default_factory=PeeringSettings)
     watching: WatchingSettings = dataclasses.field(default_factory=WatchingSettings)
     queueing: QueueingSettings = dataclasses.field(default_factory=QueueingSettings)
+    indexing: IndexingSettings = dataclasses.field(default_factory=IndexingSettings)
     scanning: ScanningSettings = dataclasses.field(default_factory=ScanningSettings)
     admission: AdmissionSettings =dataclasses.field(default_factory=AdmissionSettings)
     execution: ExecutionSettings = dataclasses.field(default_factory=ExecutionSettings)
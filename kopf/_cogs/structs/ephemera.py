@@ -1,4 +1,5 @@
-from collections.abc import Collection, Mapping
+import abc
+from collections.abc import Collection, Iterator, Mapping
 from typing import Any, Generic, NewType, TypeVar
 
 # For users, memos are exposed as `Any`, though usually used with `kopf.Memo`.
@@ -73,6 +74,12 @@ class Store(Collection[_V], Generic[_V]):
     .. seealso:
         :doc:`/indexing`.
     """
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def count(self, obj: object) -> int:
+        """ Count the occurrences of the value without iterating the store. """
+        raise NotImplementedError
 
 
 class Index(Mapping[_K, Store[_V]], Generic[_K, _V]):
@@ -89,6 +96,42 @@ class Index(Mapping[_K, Store[_V]], Generic[_K, _V]):
     .. seealso:
         :doc:`/indexing`.
     """
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def select(
+            self,
+            *,
+            prefix: Any = None,
+            start: Any = None,
+            stop: Any = None,
+    ) -> Iterator[tuple[_K, Store[_V]]]:
+        """
+        Iterate over the keys & stores that match all the criteria given.
+
+        The ``prefix`` selects the tuple keys starting with the items of
+        the prefix tuple (e.g. ``(namespace,)`` of ``(namespace, name)``),
+        or the string keys starting with the prefix string.
+        The ``start`` & ``stop`` select the keys in the half-open range
+        ``start <= key < stop``; either end can be omitted.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def count(
+            self,
+            *,
+            prefix: Any = None,
+            start: Any = None,
+            stop: Any = None,
+    ) -> int:
+        """
+        Count the values under the selected keys without iterating the values.
+
+        The criteria are the same as in :meth:`select`. Without criteria,
+        it is the total number of values in the index (not of its keys).
+        """
+        raise NotImplementedError
 
 
 # Only an abstract interface. Implemented in `~indexing.Indices`.
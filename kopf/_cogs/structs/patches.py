@@ -15,7 +15,7 @@ from typing import Any, Literal, TypedDict, cast
 
 import jsonpatch
 
-from kopf._cogs.structs import bodies, dicts
+from kopf._cogs.structs import bodies, dicts, diffs
 
 JSONPatchOp = Literal["add", "replace", "remove", "test", "move", "copy"]
 
@@ -77,6 +77,7 @@ class Patch(dict[str, Any]):
         self._status = StatusPatch(self)
         self._original = body
         self._fns = (src.fns if isinstance(src, Patch) else []) + list(fns)
+        self._seed: dict[str, Any] = {}
 
     def __repr__(self) -> str:
         texts: list[str] = []
@@ -94,6 +95,31 @@ class Patch(dict[str, Any]):
         super().clear()
         self._fns.clear()
 
+    def merge(self, other: "Patch") -> None:
+        """
+        Merge another patch on top of this one, as if it is applied after this one.
+
+        The nested dicts are merged recursively, other values are overwritten.
+        The transformation functions of the other patch go after the existing ones.
+        If the other patch is a fork, only the changes made in the fork are merged.
+        """
+        _merge_changes(self, _get_forked_changes(dict(other), other._seed))
+        self._fns.extend(other.fns)
+
+    def fork(self) -> "Patch":
+        """
+        Make an isolated patch that starts with the changes of this patch.
+
+        The fork sees the changes accumulated so far, but does not affect them.
+        When merged back via :meth:`merge`, only the fork's own changes
+        are merged, so the forks do not revert each other's changes
+        to the values they have seen. The transformation functions
+        are not forked: they are only applied to the resource body.
+        """
+        fork = Patch(copy.deepcopy(dict(self)), body=self._original)
+        fork._seed = copy.deepcopy(dict(self))
+        return fork
+
     @property
     def fns(self) -> list[PatchFn]:
         return self._fns
@@ -146,6 +172,61 @@ class Patch(dict[str, Any]):
         ops: JSONPatch = jsonpatch.JsonPatch.from_diff(dict(body_as_is), dict(body_to_be)).patch
         return ops
 
+    def as_effective_patch(self, body: bodies.Body | bodies.RawBody | None = None) -> "Patch":
+        """
+        Build a patch without the dict-based changes that are already in the body.
+
+        As a reference resource body, either the argument is used (if provided),
+        or the original resource body. Without the reference body, the patch
+        is copied as is, since nothing is known about the actual values.
+
+        The values that are equal to those in the body are excluded, as well as
+        the removals (``None``) of the fields that are absent in the body,
+        and the nested dicts that become empty after such exclusion.
+        The transformation functions are kept as is: their effects
+        are calculated later, against the freshest body at that moment.
+        """
+        base: bodies.Body | bodies.RawBody | None = body if body is not None else self._original
+        changes = dict(self) if base is None else _get_effective_changes(dict(self), base)
+        return Patch(changes, body=self._original, fns=self.fns)
+
+    def as_merge_patch(self, body: bodies.Body | bodies.RawBody | None = None) -> dict[str, Any] | None:
+        """
+        Build a merge-patch for the changes & transformations, if possible.
+
+        The transformations are applied to the reference body (either
+        the argument or the original body) on top of the dict-based changes,
+        and their effects are added to the merge-patch as field overrides.
+
+        Returns ``None`` if there is no reference body, or if the effects
+        of the transformations cannot be expressed as a merge-patch: e.g.,
+        if they set some fields to ``None`` (which means a field's removal
+        in merge-patches). In that case, a JSON-patch must be used instead.
+        """
+        base: bodies.Body | bodies.RawBody | None = body if body is not None else self._original
+        if base is None:
+            return None
+
+        # Apply the changes in the same order as for JSON-patches: merge-patches first, then fns.
+        body_as_is: bodies.RawBody = cast(bodies.RawBody, copy.deepcopy(dict(base)))
+        body_merged: bodies.RawBody = copy.deepcopy(body_as_is)
+        self._apply_patch(body_merged, (), dict(self))
+        body_to_be: bodies.RawBody = copy.deepcopy(body_merged)
+        for fn in self.fns:
+            fn(body_to_be)
+
+        # Lists are diffed as a whole, same as they are overwritten as a whole by merge-patches.
+        merge_patch: dict[str, Any] = copy.deepcopy(dict(self))
+        try:
+            for _, field, _, new in diffs.diff(body_merged, body_to_be):
+                dicts.ensure(merge_patch, field, copy.deepcopy(new))
+        except (TypeError, ValueError):  # non-dict parents in the patch, or the root is replaced.
+            return None
+
+        # Verify that the merge-patch leads to the same result as the transformations did.
+        self._apply_patch(body_as_is, (), merge_patch)
+        return merge_patch if body_as_is == body_to_be else None
+
     def _apply_patch(self, body: bodies.RawBody, path: dicts.FieldPath, value: object) -> None:
         """Apply the merge-patch instructions to the mutable raw body."""
         # TODO: LATER: optimize: we now dive into the dict for every key in dicts.ensure(),
@@ -160,3 +241,55 @@ class Patch(dict[str, Any]):
             case _:
                 # NB: lists overwrite the whole value, as the merge-patch does; no strategic merges.
                 dicts.ensure(cast(dict[Any, Any], body), path, value)
+
+
+def _get_effective_changes(
+        changes: collections.abc.Mapping[str, Any],
+        body: collections.abc.Mapping[str, Any],
+) -> dict[str, Any]:
+    """Exclude the no-op changes of a merge-patch, as interpreted by RFC 7386."""
+    result: dict[str, Any] = {}
+    for key, value in changes.items():
+        current = body.get(key)
+        if value is None:
+            if key in body:
+                result[key] = None
+        elif isinstance(value, collections.abc.Mapping) and isinstance(current, collections.abc.Mapping):
+            nested = _get_effective_changes(value, current)
+            if nested:
+                result[key] = nested
+        elif isinstance(value, collections.abc.Mapping) and key not in body and value:
+            nested = _get_effective_changes(value, {})
+            if nested:
+                result[key] = nested
+        elif key not in body or current != value:
+            result[key] = value
+    return result
+
+
+def _get_forked_changes(
+        changes: collections.abc.Mapping[str, Any],
+        seed: collections.abc.Mapping[str, Any],
+) -> dict[str, Any]:
+    """Exclude the changes of a forked patch that are the same as it was seeded with."""
+    result: dict[str, Any] = {}
+    for key, value in changes.items():
+        current = seed.get(key)
+        if isinstance(value, collections.abc.Mapping) and isinstance(current, collections.abc.Mapping):
+            nested = _get_forked_changes(value, current)
+            if nested:
+                result[key] = nested
+        elif key not in seed or current != value:
+            result[key] = value
+    return result
+
+
+def _merge_changes(target: dict[str, Any], changes: collections.abc.Mapping[str, Any]) -> None:
+    for key, value in changes.items():
+        current = target.get(key)
+        if isinstance(value, collections.abc.Mapping) and isinstance(current, collections.abc.Mapping):
+            merged = dict(current)  # never mutate the other patches' nested dicts, if shared.
+            _merge_changes(merged, value)
+            target[key] = merged
+        else:
+            target[key] = copy.deepcopy(value)
@@ -410,6 +410,7 @@ CRDS = Selector('apiextensions.k8s.io', 'customresourcedefinitions')
 EVENTS = Selector('v1', 'events')
 EVENTS_K8S = Selector('events.k8s.io', 'events')  # only for exclusion from EVERYTHING
 NAMESPACES = Selector('v1', 'namespaces')
+LEASES = Selector('coordination.k8s.io', 'leases')
 CLUSTER_PEERINGS_K = Selector('kopf.dev/v1', 'clusterkopfpeerings')
 CLUSTER_PEERINGS_Z = Selector('zalando.org/v1', 'clusterkopfpeerings')
 NAMESPACED_PEERINGS_K = Selector('kopf.dev/v1', 'kopfpeerings')
@@ -446,6 +447,7 @@ class Backbone(Mapping[Selector, Resource]):
             MUTATING_WEBHOOK, VALIDATING_WEBHOOK,
             CLUSTER_PEERINGS_K, NAMESPACED_PEERINGS_K,
             CLUSTER_PEERINGS_Z, NAMESPACED_PEERINGS_Z,
+            LEASES,
         ]
 
     def __len__(self) -> int:
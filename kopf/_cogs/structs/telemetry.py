@@ -0,0 +1,89 @@
+"""
+Operator-wide counters of the framework's own activities.
+
+The metrics are accumulated in memory only. Kopf neither exposes nor exports
+them on its own: it is up to the operator developers to report them in any
+way they like, e.g. in the probing handlers (see :doc:`/probing`), or to push
+them to a monitoring system of their choice.
+"""
+import collections
+import dataclasses
+from contextvars import ContextVar
+
+# Per-operator storage of the metrics, for the low-level routines deep in the call stack.
+# Set by `spawn_tasks`, so that every operator's task has the same metrics container.
+# If not set (e.g. in tests or in the direct calls), nothing is measured.
+metrics_var: ContextVar["OperatorMetrics"] = ContextVar('metrics_var')
+
+
+@dataclasses.dataclass
+class OperatorMetrics:
+    """
+    A container for the operator-wide metrics of the framework's activities.
+
+    An instance can be passed to :func:`kopf.run`/:func:`kopf.operator`
+    to be populated by the operator, and then read from the probing handlers
+    or from other tasks and threads at any time.
+
+    The metrics are never reset by the framework. Reset them manually
+    if only the recent activities are of interest.
+    """
+
+    patch_cycles: int = 0
+    """
+    How many times the objects were patched (each in one or more API calls).
+    """
+
+    patch_requests: int = 0
+    """
+    How many API calls were made for patching the objects in total.
+    """
+
+    patch_requests_per_cycle: collections.Counter[int] = dataclasses.field(
+        default_factory=collections.Counter)
+    """
+    A histogram of how many API calls were made per one patching cycle.
+
+    The keys are the numbers of API calls, the values are the number of cycles
+    with that exact number of API calls. Cycles with no API calls are ignored.
+    """
+
+    patch_skips: int = 0
+    """
+    How many times the patching was skipped entirely, since all the changes
+    were already in the object (e.g. the same values were re-set by handlers).
+    """
+
+    events_dropped: int = 0
+    """
+    How many K8s Events were dropped since the posting queue was full.
+    """
+
+    events_throttled: int = 0
+    """
+    How many K8s Events were dropped by the spam filter (too many per object).
+    """
+
+    api_overloads: int = 0
+    """
+    How many API requests indicated the server's overload (HTTP 429, 5xx, etc).
+
+    Only counted if the adaptive concurrency is enabled
+    (``settings.networking.max_concurrency``).
+    """
+
+    api_concurrency: int | None = None
+    """
+    The current adaptive limit of simultaneous API requests.
+
+    ``None`` if the adaptive concurrency is disabled or no requests were made.
+    """
+
+    def count_patching(self, requests: int) -> None:
+        if requests:
+            self.patch_cycles += 1
+            self.patch_requests += requests
+            self.patch_requests_per_cycle[requests] += 1
+
+    def count_skipping(self) -> None:
+        self.patch_skips += 1
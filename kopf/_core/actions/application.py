@@ -57,7 +57,7 @@ async def apply(
         settings.persistence.progress_storage.touch(body=body, patch=patch, value=None)
 
     # Actually patch if it was not empty originally or after the dummies removal.
-    resource_version, remaining_patch = await patch_and_check(
+    patched, resource_version, remaining_patch = await patch_and_check(
         settings=settings,
         resource=resource,
         logger=logger,
@@ -67,9 +67,10 @@ async def apply(
 
     # Sleep strictly after patching, never before -- to keep the status proper.
     # The patching above, if done, interrupts the sleep instantly, so we skip it at all.
+    # But if nothing was sent (e.g. the same values again), no watch-event will interrupt it.
     # Note: a zero-second or negative sleep is still a sleep, it will trigger a dummy patch.
     applied = False
-    if delay and patch:
+    if delay and patched:
         logger.debug(f"Sleeping was skipped because of the patch, {delay} seconds left.")
     elif delay is not None:
         if delay > WAITING_KEEPALIVE_INTERVAL:
@@ -83,7 +84,7 @@ async def apply(
             unslept_delay = None  # no need to sleep? means: slept in full.
 
         # Exclude cases when touching immediately after patching (including: ``delay == 0``).
-        if patch and not delay:
+        if patched and not delay:
             pass
         elif unslept_delay is not None:
             logger.debug(f"Sleeping was interrupted by new changes, {unslept_delay} seconds left.")
@@ -92,14 +93,14 @@ async def apply(
             value = datetime.datetime.now(datetime.timezone.utc).isoformat()
             touch = patches.Patch()
             settings.persistence.progress_storage.touch(body=body, patch=touch, value=value)
-            resource_version, _ = await patch_and_check(
+            _, resource_version, _ = await patch_and_check(
                 settings=settings,
                 resource=resource,
                 logger=logger,
                 patch=touch,  # NB: a minimal structure, nothing to remain
                 body=body,
             )
-    elif not patch:  # no patch/touch and no delay
+    elif not patched:  # no patch/touch and no delay
         applied = True
     return applied, resource_version, remaining_patch
 
@@ -111,10 +112,13 @@ async def patch_and_check(
         body: bodies.Body,
         patch: patches.Patch,
         logger: typedefs.Logger,
-) -> tuple[str | None, patches.Patch | None]:  # (patched resource version, remaining patch)
+) -> tuple[bool, str | None, patches.Patch | None]:  # (patched?, resource version, remaining)
     """
     Apply a patch and verify that it is applied correctly.
 
+    Report if anything was actually patched: the patches with only the changes
+    that are already in the object are not sent, so no watch-events follow.
+
     The inconsistencies are checked only against what was in the merge-patch.
     Other unexpected changes in the body are ignored, including the system
     fields, such as generations, resource versions, and other unrelated fields,
@@ -162,5 +166,5 @@ async def patch_and_check(
         if deletion_ongoing and not deletion_blocked:
             resource_version = f"{resource_version}~which~never~arrives"
 
-        return resource_version, remaining_patch
-    return None, None
+        return resulting_body is not None, resource_version, remaining_patch
+    return False, None, None
@@ -18,7 +18,7 @@ from typing import Any, AsyncContextManager, NewType, Protocol, TypeVar
 
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import typedefs
-from kopf._cogs.structs import ids
+from kopf._cogs.structs import ids, patches
 from kopf._core.actions import invocation
 
 
@@ -49,6 +49,23 @@ class HandlerChildrenRetry(TemporaryError):
     """ An internal pseudo-error to retry for the next sub-handlers attempt. """
 
 
+class Hibernation(Exception):
+    """
+    A request of a daemon to be parked until the object changes or the delay.
+
+    The daemon exits, but is restarted later as if it is continued: either when
+    the object's essence changes (not its status), or in ``delay`` seconds.
+    For other handlers, it is a silent retry after the delay or the backoff.
+    """
+    def __init__(
+            self,
+            __msg: str | None = None,
+            delay: float | None = None,
+    ) -> None:
+        super().__init__(__msg)
+        self.delay = delay
+
+
 class ErrorsMode(enum.Enum):
     """ How arbitrary (non-temporary/non-permanent) exceptions are treated. """
     IGNORED = enum.auto()
@@ -114,6 +131,12 @@ class Cause(invocation.Kwargable):
         return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
 
 
+@dataclasses.dataclass
+class PatchingCause(Cause):
+    """ A cause with a patch, which accumulates the handlers' changes of the object. """
+    patch: patches.Patch
+
+
 CauseT = TypeVar('CauseT', bound=Cause)
 
 
@@ -148,6 +171,17 @@ class LifeCycleFn(Protocol):
     ) -> Sequence[Handler]: ...
 
 
+class ConcurrentHandlers(list[Handler]):
+    """
+    A plan of handlers to be executed concurrently rather than one by one.
+
+    The lifecycles return it instead of the regular sequences of handlers
+    if the selected handlers are independent of each other (see
+    :func:`kopf.lifecycles.concurrent`). The outcomes and the patches
+    of the handlers are merged in the planned order, not in order of completion.
+    """
+
+
 # The task-local context; propagated down the stack instead of multiple kwargs.
 # Used in `@kopf.subhandler` and `kopf.execute()` to add/get the sub-handlers.
 sublifecycle_var: ContextVar[LifeCycleFn | None] = ContextVar('sublifecycle_var')
@@ -189,6 +223,17 @@ async def execute_handlers_once(
     handlers_plan = lifecycle(handlers_todo, state=state, **cause.kwargs)
 
     # Execute all planned (selected) handlers in one event reaction cycle, even if there are a few.
+    if isinstance(handlers_plan, ConcurrentHandlers):
+        return await execute_handlers_concurrently(
+            settings=settings,
+            handlers=handlers_plan,
+            cause=cause,
+            state=state,
+            lifecycle=lifecycle,  # just a default for the sub-handlers, not used directly.
+            extra_context=extra_context,
+            default_errors=default_errors,
+        )
+
     outcomes: dict[ids.HandlerId, Outcome] = {}
     for handler in handlers_plan:
         outcome = await execute_handler_once(
@@ -205,6 +250,58 @@ async def execute_handlers_once(
     return outcomes
 
 
+async def execute_handlers_concurrently(
+        settings: configuration.OperatorSettings,
+        handlers: Sequence[Handler],
+        cause: Cause,
+        state: State,
+        lifecycle: LifeCycleFn | None = None,
+        extra_context: ExtraContext = no_extra_context,
+        default_errors: ErrorsMode = ErrorsMode.TEMPORARY,
+) -> dict[ids.HandlerId, Outcome]:
+    """
+    Execute the handlers concurrently, limited by the configured concurrency.
+
+    Every handler gets its own fork of the cause's patch, which is merged back
+    after all the handlers are finished --- in the order of the handlers,
+    not in order of their completion, so that the result is deterministic
+    if several handlers patch the same fields. The same is for the outcomes.
+    """
+    limit = settings.execution.max_concurrent_handlers
+    semaphore = asyncio.Semaphore(limit) if limit is not None else None
+
+    # Only the causes with the patches (i.e. of the resource-related handlers) need the isolation.
+    handler_causes: list[Cause] = [
+        dataclasses.replace(cause, patch=cause.patch.fork()) if isinstance(cause, PatchingCause) else
+        cause
+        for _ in handlers
+    ]
+
+    async def execute(handler: Handler, handler_cause: Cause) -> Outcome:
+        async with semaphore if semaphore is not None else contextlib.nullcontext():
+            return await execute_handler_once(
+                settings=settings,
+                handler=handler,
+                state=state[handler.id],
+                cause=handler_cause,
+                lifecycle=lifecycle,
+                extra_context=extra_context,
+                default_errors=default_errors,
+            )
+
+    handler_outcomes = await asyncio.gather(*[
+        execute(handler, handler_cause)
+        for handler, handler_cause in zip(handlers, handler_causes)
+    ])
+
+    if isinstance(cause, PatchingCause):
+        for handler_cause in handler_causes:
+            if isinstance(handler_cause, PatchingCause):
+                cause.patch.merge(handler_cause.patch)
+
+    return {handler.id: outcome for handler, outcome in zip(handlers, handler_outcomes)}
+
+
 async def execute_handler_once(
         settings: configuration.OperatorSettings,
         handler: Handler,
@@ -269,6 +366,12 @@ async def execute_handler_once(
         logger.debug(f"{handler} has unfinished sub-handlers. Will retry soon.")
         return Outcome(final=False, exception=e, delay=e.delay, subrefs=subrefs)
 
+    # The hibernating daemons exit and are resumed later; see the daemons for details.
+    except Hibernation as e:
+        logger.debug(f"{handler} hibernates: {str(e) or repr(e)}")
+        delay = e.delay if e.delay is not None else backoff
+        return Outcome(final=False, exception=e, delay=delay, subrefs=subrefs)
+
     # Definitely a temporary error, regardless of the error strictness.
     except TemporaryError as e:
         # Maybe false-negative but never false-positive checks to save extra cycles & time wasted.
@@ -40,6 +40,11 @@ def shuffled(handlers: Handlers, **_: Any) -> Handlers:
     return random.sample(handlers, k=len(handlers)) if handlers else []
 
 
+def concurrent(handlers: Handlers, **_: Any) -> Handlers:
+    """ Execute all handlers at once, concurrently, up to the configured limit at a time. """
+    return execution.ConcurrentHandlers(handlers)
+
+
 def asap(handlers: Handlers, *, state: execution.State, **_: Any) -> Handlers:
     """ Execute one handler at a time, skip on failure, try the next one, retry after the full cycle. """
 
@@ -1,11 +1,21 @@
 """
 Daemons are background tasks accompanying the individual resource objects.
 
-Every ``@kopf.daemon`` and ``@kopf.timer`` handler produces a separate
-asyncio task to either directly execute the daemon, or to trigger one-shot
-handlers by schedule. The wrapping tasks are always async; the sync functions
+Every ``@kopf.daemon`` handler produces a separate asyncio task to directly
+execute the daemon. The wrapping tasks are always async; the sync functions
 are called in thread executors as part of a regular handler invocation.
 
+The ``@kopf.timer`` handlers trigger one-shot handlers by schedule. In the
+operator, they have no tasks of their own: a single per-operator timer engine
+keeps the schedule of all timers of all objects and spawns short-lived tasks
+only for the actual invocations. Without the engine (e.g. in tests),
+every timer gets its own mostly-sleeping asyncio task, same as the daemons.
+
+The daemons can hibernate by raising :class:`kopf.Hibernation`: their tasks
+(and threads, for sync daemons) exit, and only a lightweight record remains
+in memory until the object changes or the hibernation deadline comes.
+The daemons are then resumed with new tasks, same as if they were sleeping.
+
 These tasks are remembered in the per-resources *memories* (arbitrary data
 containers) throughout the lifecycle of the operator.
 
@@ -23,15 +33,22 @@ since we are aware of the daemons, and they are not actually "hung".
 import abc
 import asyncio
 import dataclasses
+import hashlib
+import heapq
+import itertools
+import json
+import random
 import sys
 import warnings
-from collections.abc import Collection, Iterable, MutableMapping, Sequence
+import zlib
+from collections.abc import Callable, Collection, Iterable, MutableMapping, Sequence
+from contextvars import ContextVar
 
-from kopf._cogs.aiokits import aiotasks, aiotime, aiotoggles
+from kopf._cogs.aiokits import aiolimits, aiotasks, aiotime, aiotoggles
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import typedefs
 from kopf._cogs.structs import bodies, ids, patches
-from kopf._core.actions import application, execution, lifecycles, loggers, progression
+from kopf._core.actions import application, execution, invocation, lifecycles, loggers, progression
 from kopf._core.intents import causes, handlers as handlers_, stoppers
 
 
@@ -39,9 +56,24 @@ def _loop_time() -> float:
     return asyncio.get_running_loop().time()
 
 
+@dataclasses.dataclass(frozen=True)
+class InvocationLimiters:
+    """
+    Operator-wide limiters of the daemon & timer invocations (all & sync-only).
+    """
+    invocations: aiolimits.FairLimiter[ids.HandlerId] = dataclasses.field(
+        default_factory=aiolimits.FairLimiter)
+    sync_invocations: aiolimits.FairLimiter[ids.HandlerId] = dataclasses.field(
+        default_factory=aiolimits.FairLimiter)
+
+
+# The limiters are shared by all daemons & timers of an operator, but are absent without it (tests).
+limiters_var: ContextVar[InvocationLimiters] = ContextVar('limiters_var')
+
+
 @dataclasses.dataclass(frozen=True)
 class Daemon:
-    task: aiotasks.Task  # a guarding task of the daemon.
+    task: aiotasks.Future  # a guarding task of the daemon, or a future of the scheduled timer.
     logger: typedefs.Logger
     handler: handlers_.SpawningHandler
     stopper: stoppers.DaemonStopper  # a signaller for the termination and its reason.
@@ -54,6 +86,7 @@ class DaemonsMemory:
     idle_reset_time: float = dataclasses.field(default_factory=_loop_time)
     forever_stopped: set[ids.HandlerId] = dataclasses.field(default_factory=set)
     running_daemons: dict[ids.HandlerId, Daemon] = dataclasses.field(default_factory=dict)
+    hibernated_daemons: dict[ids.HandlerId, "_HibernatedDaemon"] = dataclasses.field(default_factory=dict)
 
 
 class DaemonsMemoriesIterator(metaclass=abc.ABCMeta):
@@ -76,6 +109,7 @@ async def spawn_daemons(
         daemons: dict[ids.HandlerId, Daemon],
         cause: causes.SpawningCause,
         memory: DaemonsMemory,
+        timers: "TimerEngine | None" = None,  # None for tests
 ) -> Collection[float]:
     """
     Ensure that all daemons are spawned for this individual resource.
@@ -86,7 +120,13 @@ async def spawn_daemons(
     """
     if memory.live_fresh_body is None:  # for type-checking; "not None" is ensured in processing.
         raise RuntimeError("A daemon is spawned with None as body. This is a bug. Please report.")
+
+    # The digest is the same for all daemons of the object, so it is calculated once per event.
+    digest = _get_digest(settings, memory.live_fresh_body) if memory.hibernated_daemons else None
     for handler in handlers:
+        hibernated = memory.hibernated_daemons.get(handler.id)
+        if hibernated is not None and hibernated.digest != digest:
+            _resume(hibernated)
         if handler.id not in daemons:
             stopper = stoppers.DaemonStopper()
             live_body = memory.live_fresh_body
@@ -99,17 +139,28 @@ async def spawn_daemons(
                 patch=patches.Patch(body=live_body),  # not the same as the one-shot spawning patch!
                 stopper=stopper,  # for checking (passed to kwargs)
             )
-            daemon = Daemon(
-                stopper=stopper,  # for stopping (outside of causes)
-                handler=handler,
-                logger=loggers.LocalObjectLogger(body=cause.body, settings=settings),
-                task=asyncio.create_task(_runner(
+            task: aiotasks.Future
+            if timers is not None and isinstance(handler, handlers_.TimerHandler):
+                task = timers.schedule(
                     settings=settings,
                     daemons=daemons,  # for self-garbage-collection
                     handler=handler,
                     cause=daemon_cause,
                     memory=memory,
-                ), name=f'runner of {handler.id}'),  # sometimes, daemons; sometimes, timers.
+                )
+            else:
+                task = asyncio.create_task(_runner(
+                    settings=settings,
+                    daemons=daemons,  # for self-garbage-collection
+                    handler=handler,
+                    cause=daemon_cause,
+                    memory=memory,
+                ), name=f'runner of {handler.id}')  # sometimes, daemons; sometimes, timers.
+            daemon = Daemon(
+                stopper=stopper,  # for stopping (outside of causes)
+                handler=handler,
+                logger=loggers.LocalObjectLogger(body=cause.body, settings=settings),
+                task=task,
             )
             daemons[handler.id] = daemon
     return []
@@ -452,6 +503,7 @@ async def _runner(
         handler: handlers_.SpawningHandler,
         memory: DaemonsMemory,
         cause: causes.DaemonCause,
+        resumed: bool = False,
 ) -> None:
     """
     Guard a running daemon during its life cycle.
@@ -460,43 +512,59 @@ async def _runner(
     The runner will not exit until the thread exits. See ``invoke`` for details.
     """
     stopper = cause.stopper
+    hibernation: execution.Hibernation | None = None
 
     try:
         if isinstance(handler, handlers_.DaemonHandler):
-            await _daemon(settings=settings, handler=handler, cause=cause)
+            hibernation = await _daemon(settings=settings, handler=handler, cause=cause, resumed=resumed)
         elif isinstance(handler, handlers_.TimerHandler):
             await _timer(settings=settings, handler=handler, cause=cause, memory=memory)
         else:
             raise RuntimeError("Cannot determine which task wrapper to use. This is a bug.")
 
     finally:
+        if hibernation is not None and isinstance(handler, handlers_.DaemonHandler) and not stopper.is_set():
+            _hibernate(settings=settings, daemons=daemons, handler=handler, memory=memory,
+                       cause=cause, delay=hibernation.delay)
+        else:
+            _release(daemons=daemons, handler=handler, memory=memory, stopper=stopper)
+
+
+def _release(
+        *,
+        daemons: dict[ids.HandlerId, Daemon],
+        handler: handlers_.SpawningHandler,
+        memory: DaemonsMemory,
+        stopper: stoppers.DaemonStopper,
+) -> None:
+    """ Forget the exited daemon/timer and release the resources it no longer needs. """
+
+    # Prevent future re-spawns for those exited on their own, for no reason.
+    # Only the filter-mismatching or peering-pausing daemons can be re-spawned.
+    if stopper.reason is None:
+        memory.forever_stopped.add(handler.id)
+
+    # If this daemon is never going to be called again, we can release the
+    # live_fresh_body to save some memory.
+    if handler.id in memory.forever_stopped:
+        # If any other running daemon is referencing this Kubernetes
+        # resource, we can't free it
+        can_free = True
+        this_daemon = daemons[handler.id]
+        for running_daemon in memory.running_daemons.values():
+            if running_daemon is not this_daemon:
+                can_free = False
+                break
+        if can_free:
+            memory.live_fresh_body = None
+
+    # Save the memory by not remembering the exited daemons (they may be never re-spawned).
+    del daemons[handler.id]
 
-        # Prevent future re-spawns for those exited on their own, for no reason.
-        # Only the filter-mismatching or peering-pausing daemons can be re-spawned.
-        if stopper.reason is None:
-            memory.forever_stopped.add(handler.id)
-
-        # If this daemon is never going to be called again, we can release the
-        # live_fresh_body to save some memory.
-        if handler.id in memory.forever_stopped:
-            # If any other running daemon is referencing this Kubernetes
-            # resource, we can't free it
-            can_free = True
-            this_daemon = daemons[handler.id]
-            for running_daemon in memory.running_daemons.values():
-                if running_daemon is not this_daemon:
-                    can_free = False
-                    break
-            if can_free:
-                memory.live_fresh_body = None
-
-        # Save the memory by not remembering the exited daemons (they may be never re-spawned).
-        del daemons[handler.id]
-
-        # Whatever happened, make sure the sync threads of asyncio threaded executor are notified:
-        # in a hope that they will exit maybe some time later to free the OS/asyncio resources.
-        # A possible case: operator is exiting and cancelling all "hung" non-root tasks, etc.
-        stopper.set(reason=stoppers.DaemonStoppingReason.DONE)
+    # Whatever happened, make sure the sync threads of asyncio threaded executor are notified:
+    # in a hope that they will exit maybe some time later to free the OS/asyncio resources.
+    # A possible case: operator is exiting and cancelling all "hung" non-root tasks, etc.
+    stopper.set(reason=stoppers.DaemonStoppingReason.DONE)
 
 
 async def _daemon(
@@ -504,7 +572,8 @@ async def _daemon(
         settings: configuration.OperatorSettings,
         handler: handlers_.DaemonHandler,
         cause: causes.DaemonCause,
-) -> None:
+        resumed: bool = False,
+) -> execution.Hibernation | None:
     """
     A long-running guarding task for a resource daemon handler.
 
@@ -513,6 +582,9 @@ async def _daemon(
 
     A few kinds of errors are suppressed, those expected from the daemons when
     they are cancelled due to the resource deletion.
+
+    If the daemon requests hibernation, it is returned for the runner to park
+    the daemon. The resumed daemons are not delayed initially once again.
     """
     resource = cause.resource
     stopper = cause.stopper
@@ -520,24 +592,18 @@ async def _daemon(
     patch = cause.patch
     body = cause.body
 
-    if handler.initial_delay is not None:
-        delay = handler.initial_delay(**cause.kwargs) if callable(handler.initial_delay) else handler.initial_delay
+    delay = None if resumed else _get_initial_delay(handler=handler, cause=cause)
+    if delay is not None:
         await aiotime.sleep(delay, wakeup=cause.stopper.async_event)
 
     # Similar to activities (in-memory execution), but applies patches on every attempt.
     state = progression.State.from_scratch().with_handlers([handler])
     while not stopper.is_set() and not state.done:
 
-        outcomes = await execution.execute_handlers_once(
-            lifecycle=lifecycles.all_at_once,  # there is only one anyway
-            settings=settings,
-            handlers=[handler],
-            cause=cause,
-            state=state,
-        )
+        outcomes = await _execute(settings=settings, handler=handler, cause=cause, state=state)
         state = state.with_outcomes(outcomes)
         progression.deliver_results(outcomes=outcomes, patch=patch)
-        _, remaining_patch = await application.patch_and_check(
+        _, _, remaining_patch = await application.patch_and_check(
             settings=settings,
             resource=resource,
             logger=logger,
@@ -546,6 +612,11 @@ async def _daemon(
         )
         patch = cause.patch = patches.Patch(remaining_patch, body=body)
 
+        # The hibernation is not a retry: the daemon exits, and it is resumed later by the runner.
+        outcome = outcomes.get(handler.id)
+        if outcome is not None and isinstance(outcome.exception, execution.Hibernation):
+            return outcome.exception
+
         # The in-memory sleep does not react to resource changes, but only to stopping.
         if state.delay:
             await aiotime.sleep(state.delay, wakeup=cause.stopper.async_event)
@@ -554,6 +625,112 @@ async def _daemon(
         logger.debug(f"{handler} has exited on request and will not be retried or restarted.")
     else:
         logger.debug(f"{handler} has exited on its own and will not be retried or restarted.")
+    return None
+
+
+@dataclasses.dataclass(eq=False)
+class _HibernatedDaemon:
+    """ A daemon parked without a task till the object changes or the deadline. """
+    __slots__ = ('settings', 'daemons', 'handler', 'memory', 'cause', 'future',
+                 'digest', 'deadline', 'callback')
+    settings: configuration.OperatorSettings
+    daemons: dict[ids.HandlerId, Daemon]
+    handler: handlers_.DaemonHandler
+    memory: DaemonsMemory
+    cause: causes.DaemonCause
+    future: aiotasks.Future  # done when the daemon is resumed or stopped; exposed as its task.
+    digest: bytes  # of the object's essence at the moment of hibernation.
+    deadline: asyncio.TimerHandle | None
+    callback: Callable[[], None]  # for the stopper, to be removed on resuming.
+
+
+def _hibernate(
+        *,
+        settings: configuration.OperatorSettings,
+        daemons: dict[ids.HandlerId, Daemon],
+        handler: handlers_.DaemonHandler,
+        memory: DaemonsMemory,
+        cause: causes.DaemonCause,
+        delay: float | None,
+) -> None:
+    """
+    Park an exited daemon till the object changes or the delay, if any.
+
+    The daemon remains "running" as seen from outside, with a future in place
+    of its task, so the daemon stopping & killing routines work for it as usual:
+    stopping it releases it instantly, since there is nothing to wait for.
+    """
+    loop = asyncio.get_running_loop()
+    hibernated = _HibernatedDaemon(
+        settings=settings,
+        daemons=daemons,
+        handler=handler,
+        memory=memory,
+        cause=cause,
+        future=loop.create_future(),
+        digest=_get_digest(settings, cause.body),
+        deadline=None,
+        callback=lambda: _stopped(hibernated),
+    )
+    if delay is not None:
+        hibernated.deadline = loop.call_later(delay, _resume, hibernated)
+    hibernated.future.add_done_callback(lambda _: _cancelled(hibernated))
+    cause.stopper.callbacks.append(hibernated.callback)
+    memory.hibernated_daemons[handler.id] = hibernated
+    daemons[handler.id] = dataclasses.replace(daemons[handler.id], task=hibernated.future)
+    cause.logger.debug(f"{handler} is hibernated till the object changes"
+                       f"{'' if delay is None else f' or for {delay} seconds'}.")
+
+
+def _resume(hibernated: _HibernatedDaemon) -> None:
+    """ Restart a hibernated daemon with a new task, as if it continues. """
+    if hibernated.future.done():
+        return
+    _forget(hibernated)
+    task = asyncio.create_task(_runner(
+        settings=hibernated.settings,
+        daemons=hibernated.daemons,
+        handler=hibernated.handler,
+        memory=hibernated.memory,
+        cause=hibernated.cause,
+        resumed=True,
+    ), name=f'runner of {hibernated.handler.id}')
+    daemons = hibernated.daemons
+    daemons[hibernated.handler.id] = dataclasses.replace(daemons[hibernated.handler.id], task=task)
+    hibernated.future.set_result(None)
+    hibernated.cause.logger.debug(f"{hibernated.handler} is resumed from hibernation.")
+
+
+def _stopped(hibernated: _HibernatedDaemon) -> None:
+    # The hibernated daemons have nothing to wait for, so they exit instantly.
+    if not hibernated.future.done():
+        _forget(hibernated)
+        hibernated.future.set_result(None)
+        _release(daemons=hibernated.daemons, handler=hibernated.handler,
+                 memory=hibernated.memory, stopper=hibernated.cause.stopper)
+
+
+def _cancelled(hibernated: _HibernatedDaemon) -> None:
+    # Only if cancelled from outside: the normal exits are fully handled in `_stopped()`.
+    if hibernated.future.cancelled():
+        _forget(hibernated)
+        _release(daemons=hibernated.daemons, handler=hibernated.handler,
+                 memory=hibernated.memory, stopper=hibernated.cause.stopper)
+
+
+def _forget(hibernated: _HibernatedDaemon) -> None:
+    if hibernated.deadline is not None:
+        hibernated.deadline.cancel()
+    if hibernated.callback in hibernated.cause.stopper.callbacks:
+        hibernated.cause.stopper.callbacks.remove(hibernated.callback)
+    if hibernated.memory.hibernated_daemons.get(hibernated.handler.id) is hibernated:
+        del hibernated.memory.hibernated_daemons[hibernated.handler.id]
+
+
+def _get_digest(settings: configuration.OperatorSettings, body: bodies.Body) -> bytes:
+    # Only the digest is kept, not the essence itself: to not double the memory for the bodies.
+    essence = settings.persistence.diffbase_storage.build(body=body)
+    return hashlib.sha256(json.dumps(essence, sort_keys=True, default=str).encode()).digest()
 
 
 async def _timer(
@@ -566,6 +743,7 @@ async def _timer(
     """
     A long-running guarding task for resource timer handlers.
 
+    This is used only when there is no :class:`TimerEngine` (e.g. in tests).
     Each individual handler for each individual k8s-object gets its own task.
     Even though asyncio can schedule the delayed execution of the callbacks
     with ``loop.call_later()`` and ``loop.call_at()``, we do not use them:
@@ -590,8 +768,8 @@ async def _timer(
     patch = cause.patch
     body = cause.body
 
-    if handler.initial_delay is not None:
-        delay = handler.initial_delay(**cause.kwargs) if callable(handler.initial_delay) else handler.initial_delay
+    delay = _get_initial_delay(handler=handler, cause=cause)
+    if delay is not None:
         await aiotime.sleep(delay, wakeup=stopper.async_event)
 
     # Similar to activities (in-memory execution), but applies patches on every attempt.
@@ -617,16 +795,10 @@ async def _timer(
         started = clock()
 
         # Execute the handler as usually, in-memory, but handle its outcome on every attempt.
-        outcomes = await execution.execute_handlers_once(
-            lifecycle=lifecycles.all_at_once,  # there is only one anyway
-            settings=settings,
-            handlers=[handler],
-            cause=cause,
-            state=state,
-        )
+        outcomes = await _execute(settings=settings, handler=handler, cause=cause, state=state)
         state = state.with_outcomes(outcomes)
         progression.deliver_results(outcomes=outcomes, patch=patch)
-        _, remaining_patch = await application.patch_and_check(
+        _, _, remaining_patch = await application.patch_and_check(
             settings=settings,
             resource=resource,
             logger=logger,
@@ -646,13 +818,13 @@ async def _timer(
         elif handler.interval is not None and handler.sharp:
             passed_duration = clock() - started
             remaining_delay = handler.interval - (passed_duration % handler.interval)
-            await aiotime.sleep(remaining_delay, wakeup=stopper.async_event)
+            await aiotime.sleep(remaining_delay + _get_jitter(handler), wakeup=stopper.async_event)
 
         # For regular (non-sharp) timers, simply sleep from last exit to the next call:
         #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=False)
         #       [slow_handler].....[slow_handler].....[slow...
         elif handler.interval is not None:
-            await aiotime.sleep(handler.interval, wakeup=stopper.async_event)
+            await aiotime.sleep(handler.interval + _get_jitter(handler), wakeup=stopper.async_event)
 
         # For idle-only no-interval timers, wait till the next change (i.e. idling reset).
         # NB: This will skip the handler in the same tact (1/64th of a second) even if changed.
@@ -664,3 +836,347 @@ async def _timer(
         # This makes the handler practically meaningless, but technically possible.
         else:
             break
+
+
+@dataclasses.dataclass(eq=False)
+class _ScheduledTimer:
+    """ The state of a single timer of a single object as kept in :class:`TimerEngine`. """
+    __slots__ = ('settings', 'daemons', 'handler', 'memory', 'cause', 'future', 'state',
+                 'due', 'generation', 'scheduled', 'started', 'admitted', 'running', 'task')
+    settings: configuration.OperatorSettings
+    daemons: dict[ids.HandlerId, Daemon]
+    handler: handlers_.TimerHandler
+    memory: DaemonsMemory
+    cause: causes.DaemonCause
+    future: aiotasks.Future  # done when the timer exits; exposed as the daemon's task.
+    state: progression.State
+    due: float  # the next time to re-check the timer.
+    generation: int  # of the latest heap entry; the outdated heap entries are skipped.
+    scheduled: bool  # if the latest heap entry is still in the heap.
+    started: float | None  # of the last invocation; for idle-only timers.
+    admitted: bool  # if the timer has got its slot in the operator-wide rate limit.
+    running: bool  # if an invocation is dispatched to the pool (maybe not started yet).
+    task: aiotasks.Task | None  # if an invocation is actually running.
+
+
+class TimerEngine:
+    """
+    A single scheduler of all timers of all objects in the operator.
+
+    Instead of an asyncio task per timer per object, which mostly sleeps,
+    the timers are kept in a heap ordered by their due time. A single root task
+    (:meth:`run`) sleeps until the earliest due time, and dispatches the due
+    invocations to a pool of short-lived tasks, optionally limited by
+    ``settings.background.max_concurrent_timers``, and evenly spaced in time
+    by ``settings.background.max_timer_rate`` (if set). The invocations wait
+    for their slots in their own tasks, so the root task is never blocked.
+
+    The stopped or rescheduled timers leave their outdated entries in the heap.
+    Such entries are recognised by their generations and skipped when due,
+    and the heap is compacted when the outdated entries make half of it.
+
+    The idle, interval, and sharp timing semantics are the same as in
+    :func:`_timer`, which remains as the per-task implementation for the cases
+    without the engine (e.g. for the processing routines in tests):
+
+    * The idle timers re-check the idle time when due, and are re-scheduled
+      if the object has changed since then (the idle time is reset).
+    * The errors reschedule the timers by their delays/backoffs.
+    * The sharp timers are scheduled to the interval grid from the last start.
+    * The regular timers are scheduled for the interval after the last exit.
+
+    The timers do not sleep, so they are stopped via the stoppers' callbacks:
+    if a timer is not running at the moment, it exits instantly;
+    if it is running, it exits when the current invocation is over.
+    Each timer is exposed as a daemon with a future in place of the task,
+    so the daemon stopping & killing routines work for them as usual.
+    """
+    _heap: list[tuple[float, int, int, _ScheduledTimer]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._heap = []
+        self._stale = 0  # the outdated entries in the heap
+        self._counter = itertools.count()  # to never compare the timers themselves in the heap
+        self._wakeup = asyncio.Event()
+        self._next_slot = 0.0  # for the operator-wide rate limit
+        self._slots: aiolimits.FairLimiter[ids.HandlerId] = aiolimits.FairLimiter()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(
+            self,
+            *,
+            settings: configuration.OperatorSettings,
+            daemons: dict[ids.HandlerId, Daemon],
+            handler: handlers_.TimerHandler,
+            memory: DaemonsMemory,
+            cause: causes.DaemonCause,
+    ) -> aiotasks.Future:
+        """ Start a timer for an individual object. Return the future of its exit. """
+        loop = asyncio.get_running_loop()
+        timer = _ScheduledTimer(
+            settings=settings,
+            daemons=daemons,
+            handler=handler,
+            memory=memory,
+            cause=cause,
+            future=loop.create_future(),
+            state=progression.State.from_scratch().with_handlers([handler]),
+            due=loop.time(),
+            generation=0,
+            scheduled=False,
+            started=None,
+            admitted=False,
+            running=False,
+            task=None,
+        )
+        timer.future.add_done_callback(lambda _: self._cancelled(timer))
+        cause.stopper.callbacks.append(lambda: self._stopped(timer))
+
+        delay = _get_initial_delay(handler=handler, cause=cause)
+        self._reschedule(timer, loop.time() + (delay or 0))
+        return timer.future
+
+    async def run(self, *, settings: configuration.OperatorSettings) -> None:
+        """ The operator's root task to trigger the due timers. """
+        loop = asyncio.get_running_loop()
+        pool = aiotasks.Scheduler()  # unlimited: the invocations are limited in their own tasks.
+        try:
+            while True:
+                self._wakeup.clear()
+                now = loop.time()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, generation, timer = heapq.heappop(self._heap)
+                    if generation != timer.generation:
+                        self._stale -= 1
+                        continue
+                    timer.scheduled = False
+                    if not timer.running and not timer.future.done():
+                        await self._trigger(timer, pool=pool, now=now)
+                if self._heap:
+                    await aiotime.sleep(self._heap[0][0] - now, wakeup=self._wakeup)
+                else:
+                    await self._wakeup.wait()
+        finally:
+            await pool.close()
+
+    def _reschedule(self, timer: _ScheduledTimer, due: float) -> None:
+        self._invalidate(timer)
+        timer.due = due
+        timer.scheduled = True
+        if not self._heap or due < self._heap[0][0]:
+            self._wakeup.set()
+        heapq.heappush(self._heap, (due, next(self._counter), timer.generation, timer))
+
+    def _invalidate(self, timer: _ScheduledTimer) -> None:
+        if timer.scheduled:
+            timer.scheduled = False
+            timer.generation += 1
+            self._stale += 1
+            if self._stale > len(self._heap) // 2:
+                self._heap = [entry for entry in self._heap if entry[2] == entry[3].generation]
+                heapq.heapify(self._heap)
+                self._stale = 0
+
+    async def _trigger(self, timer: _ScheduledTimer, *, pool: aiotasks.Scheduler, now: float) -> None:
+        handler = timer.handler
+        memory = timer.memory
+
+        # For idle-only no-interval timers, wait till the next change (i.e. idling reset).
+        if timer.started is not None and handler.interval is None and handler.idle is not None:
+            if memory.idle_reset_time <= timer.started:
+                self._reschedule(timer, now + handler.idle)
+                return
+
+        # The last seen time is updated on every watch-event received, and prolongs the waiting.
+        if handler.idle is not None and now - memory.idle_reset_time < handler.idle:
+            self._reschedule(timer, memory.idle_reset_time + handler.idle)
+            return
+
+        # Spread the invocations evenly over time if they are limited operator-wide.
+        # The postponed timers get their slots reserved, so they are not postponed again.
+        rate = timer.settings.background.max_timer_rate
+        if rate and not timer.admitted:
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1 / rate
+            if slot > now:
+                timer.admitted = True
+                self._reschedule(timer, slot)
+                return
+
+        timer.admitted = False
+        timer.running = True
+        await pool.spawn(self._invoke(timer), name=f'timer of {handler.id}')
+
+    async def _invoke(self, timer: _ScheduledTimer) -> None:
+        handler = timer.handler
+        cause = timer.cause
+        clock = asyncio.get_running_loop().time
+        due: float | None = None
+        acquired = False
+        try:
+            if timer.future.done() or cause.stopper.is_set():
+                return
+            timer.task = asyncio.current_task()
+
+            # Wait for a slot here, not in the engine's loop, so that other timers are not blocked.
+            acquired = await self._slots.acquire(
+                handler.id,
+                limit=timer.settings.background.max_concurrent_timers,
+                wakeup=cause.stopper.async_event,
+            )
+            if not acquired:
+                return
+
+            # Reset success/failure retry counters & timers if it has succeeded. Keep it if failed.
+            if timer.state.done:
+                timer.state = progression.State.from_scratch().with_handlers([handler])
+
+            # Execute the handler as usually, in-memory, but handle its outcome on every attempt.
+            started = timer.started = clock()
+            outcomes = await _execute(settings=timer.settings, handler=handler,
+                                      cause=cause, state=timer.state)
+            timer.state = timer.state.with_outcomes(outcomes)
+            progression.deliver_results(outcomes=outcomes, patch=cause.patch)
+            _, _, remaining_patch = await application.patch_and_check(
+                settings=timer.settings,
+                resource=cause.resource,
+                logger=cause.logger,
+                patch=cause.patch,
+                body=cause.body,
+            )
+            cause.patch = patches.Patch(remaining_patch, body=cause.body)
+
+            # The same schedule as in the per-task timers; see the diagrams in `_timer()`.
+            if not timer.state.done:
+                delays = [delay for delay in timer.state.delays if delay is not None]
+                due = clock() + (min(delays) if delays else 0)
+            elif handler.interval is not None and handler.sharp:
+                passed_duration = clock() - started
+                due = clock() + handler.interval - (passed_duration % handler.interval)
+                due += _get_jitter(handler)
+            elif handler.interval is not None:
+                due = clock() + handler.interval + _get_jitter(handler)
+            elif handler.idle is not None:
+                due = clock() + handler.idle
+        except Exception as e:
+            cause.logger.exception(f"{handler} has failed unexpectedly and will not be retried: {e!r}")
+        finally:
+            if acquired:
+                self._slots.release(handler.id)
+            timer.task = None
+            timer.running = False
+            if due is None or cause.stopper.is_set():
+                self._exit(timer)
+            else:
+                self._reschedule(timer, due)
+
+    def _stopped(self, timer: _ScheduledTimer) -> None:
+        # The running timers will exit after the invocation; the idle ones exit instantly.
+        if not timer.running:
+            self._exit(timer)
+
+    def _cancelled(self, timer: _ScheduledTimer) -> None:
+        # Only if cancelled from outside: the normal exits are fully handled in `_exit()`.
+        if timer.future.cancelled():
+            self._invalidate(timer)
+            if timer.task is not None:
+                timer.task.cancel()
+            _release(daemons=timer.daemons, handler=timer.handler,
+                     memory=timer.memory, stopper=timer.cause.stopper)
+
+    def _exit(self, timer: _ScheduledTimer) -> None:
+        self._invalidate(timer)
+        if not timer.future.done():
+            timer.future.set_result(None)
+            _release(daemons=timer.daemons, handler=timer.handler,
+                     memory=timer.memory, stopper=timer.cause.stopper)
+
+
+async def _execute(
+        *,
+        settings: configuration.OperatorSettings,
+        handler: handlers_.SpawningHandler,
+        cause: causes.DaemonCause,
+        state: progression.State,
+) -> dict[ids.HandlerId, execution.Outcome]:
+    """
+    Execute a daemon/timer handler once, within the operator-wide limits.
+
+    The invocations wait for their slot here rather than in the executor's
+    queue, the slots are granted to the handlers in turns (round-robin),
+    and the synchronous handlers leave a few executor's workers for
+    the regular handlers. If the daemon/timer is stopped while waiting,
+    nothing is executed and no outcomes are returned.
+    """
+    limiters = limiters_var.get(None)
+    acquired: list[aiolimits.FairLimiter[ids.HandlerId]] = []
+    try:
+        if limiters is not None:
+            if not await limiters.invocations.acquire(
+                handler.id,
+                limit=settings.background.max_concurrent_invocations,
+                per_key_limit=settings.background.max_concurrent_invocations_per_handler,
+                wakeup=cause.stopper.async_event,
+            ):
+                return {}
+            acquired.append(limiters.invocations)
+
+            if not invocation.is_async_fn(handler.fn):
+                if not await limiters.sync_invocations.acquire(
+                    handler.id,
+                    limit=_get_sync_limit(settings),
+                    wakeup=cause.stopper.async_event,
+                ):
+                    return {}
+                acquired.append(limiters.sync_invocations)
+
+        return await execution.execute_handlers_once(
+            lifecycle=lifecycles.all_at_once,  # there is only one anyway
+            settings=settings,
+            handlers=[handler],
+            cause=cause,
+            state=state,
+        )
+    finally:
+        for limiter in reversed(acquired):
+            limiter.release(handler.id)
+
+
+def _get_sync_limit(settings: configuration.OperatorSettings) -> int | None:
+    reserved = settings.background.reserved_workers
+    workers = settings.execution.max_workers
+    if workers is None:
+        workers = getattr(settings.execution.executor, '_max_workers', None)
+    if reserved is None or workers is None:
+        return None
+    return max(1, workers - reserved)  # at least one, so that they are not stuck forever
+
+
+def _get_initial_delay(
+        *,
+        handler: handlers_.SpawningHandler,
+        cause: causes.DaemonCause,
+) -> float | None:
+    """
+    Calculate the initial delay of a daemon/timer, including its spread (if any).
+
+    The spread is not random: it is derived from the object's uid & handler's id,
+    so that the objects are spread evenly and keep their phase after restarts
+    (instead of all firing at once, which the spreading is supposed to prevent).
+    """
+    delay: float | None = None
+    if handler.initial_delay is not None:
+        delay = handler.initial_delay(**cause.kwargs) if callable(handler.initial_delay) else handler.initial_delay
+    if handler.initial_delay_spread:
+        meta = cause.body.get('metadata', {})
+        seed = f"{meta.get('uid') or meta.get('name')}/{handler.id}"
+        phase = zlib.crc32(seed.encode()) / 2**32  # [0..1)
+        delay = (delay or 0) + handler.initial_delay_spread * phase
+    return delay
+
+
+def _get_jitter(handler: handlers_.TimerHandler) -> float:
+    return random.uniform(0, handler.jitter) if handler.jitter else 0
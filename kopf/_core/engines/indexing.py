@@ -1,7 +1,16 @@
+import asyncio
+import bisect
 import collections.abc
 import dataclasses
-from collections.abc import Iterable, Iterator, Mapping
-from typing import Any, Generic, TypeVar
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import types
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from typing import Any, Generic, Protocol, TypeVar, cast
 
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import typedefs
@@ -9,8 +18,22 @@ from kopf._cogs.structs import bodies, ephemera, ids, patches, references
 from kopf._core.actions import execution, lifecycles, progression
 from kopf._core.intents import causes, handlers, registries
 
+logger = logging.getLogger(__name__)
+
 Key = tuple[references.Namespace, str | None, str | None]
-_K = TypeVar('_K')
+
+# Increase on every incompatible change of the snapshots' structure; the old ones will be ignored.
+SNAPSHOT_FORMAT = 2
+
+# Stores of up to this size are scanned for membership instead of keeping the value counts.
+COUNTED_SIZE = 8
+
+
+class _SortableKey(Protocol):
+    def __lt__(self, other: Any, /) -> bool: ...
+
+
+_K = TypeVar('_K', bound=_SortableKey)
 _V = TypeVar('_V')
 
 
@@ -24,12 +47,26 @@ class Store(ephemera.Store[_V], Generic[_V]):
     but the implementation can later change without notice.
 
     The store is O(1) for updates/deletions due to ``dict`` used internally.
+
+    The membership checks and value counts are O(1) due to a value-to-count
+    map for hashable values. Unhashable values (e.g. dicts) are only counted,
+    so the checks fall back to O(n) scanning only if such values are present.
+
+    Most stores hold only one or few values (e.g. when indexed by names),
+    so the value counts are only kept for the stores that have ever grown
+    beyond ``COUNTED_SIZE`` --- the small ones are scanned at a similar cost.
+    With ``__slots__``, the small stores cost only their ``dict`` of items.
     """
+    __slots__ = ('__items', '__counts', '__unhashable')
     __items: dict[Key, _V]
+    __counts: dict[Any, int] | None
+    __unhashable: int
 
     def __init__(self) -> None:
         super().__init__()
         self.__items = {}
+        self.__counts = None
+        self.__unhashable = 0
 
     def __repr__(self) -> str:
         return repr(list(self.__items.values()))
@@ -44,20 +81,64 @@ class Store(ephemera.Store[_V], Generic[_V]):
         return iter(self.__items.values())
 
     def __contains__(self, obj: object) -> bool:
-        return any(val == obj for val in self.__items.values())
+        return self.count(obj) > 0
+
+    def count(self, obj: object) -> int:
+        if self.__counts is None:
+            return sum(1 for val in self.__items.values() if val == obj)
+        try:
+            count = self.__counts.get(obj, 0)
+        except TypeError:  # unhashable
+            return sum(1 for val in self.__items.values() if val == obj)
+        if self.__unhashable:  # rare: e.g. a hashable subclass equal to a dict
+            count += sum(1 for val in self.__items.values() if val == obj and not _is_hashable(val))
+        return count
+
+    # Indexers' internal protocol. Must not be used by handlers & operators.
+    def _get(self, acckey: Key) -> _V:
+        return self.__items[acckey]
 
     # Indexers' internal protocol. Must not be used by handlers & operators.
-    def _discard(self, acckey: Key) -> None:
+    def _discard(self, acckey: Key) -> bool:
         try:
-            del self.__items[acckey]
+            val = self.__items.pop(acckey)
         except KeyError:
-            pass  # already absent
+            return False  # already absent
+        else:
+            self.__recount(val, -1)
+            return True
 
     # Indexers' internal protocol. Must not be used by handlers & operators.
-    def _replace(self, acckey: Key, obj: _V) -> None:
+    def _replace(self, acckey: Key, obj: _V) -> bool:
         # Minimise the dict updates and rehashes for no need: only update if really changed.
-        if acckey not in self.__items or self.__items[acckey] != obj:
+        if acckey not in self.__items:
             self.__items[acckey] = obj
+            self.__recount(obj, +1)
+            if self.__counts is None and len(self.__items) > COUNTED_SIZE:
+                self.__counts = {}
+                self.__unhashable = 0
+                for val in self.__items.values():
+                    self.__recount(val, +1)
+            return True
+        elif self.__items[acckey] != obj:
+            self.__recount(self.__items[acckey], -1)
+            self.__items[acckey] = obj
+            self.__recount(obj, +1)
+            return True
+        return False
+
+    def __recount(self, val: _V, delta: int) -> None:
+        if self.__counts is None:
+            return
+        try:
+            count = self.__counts.get(val, 0) + delta
+        except TypeError:  # unhashable
+            self.__unhashable += delta
+        else:
+            if count:
+                self.__counts[val] = count
+            else:
+                del self.__counts[val]
 
 
 class Index(ephemera.Index[_K, _V], Generic[_K, _V]):
@@ -75,14 +156,30 @@ class Index(ephemera.Index[_K, _V], Generic[_K, _V]):
     is stored, thus reducing the updates/deletions from O(K) to O(k), where
     "K" is the number of all keys, "k" is the number of keys per object.
     Assuming the amount of keys per object is usually fixed, it is O(1).
+    The keys per object are kept as tuples rather than sets: they are small,
+    rarely change, and a tuple of 1-2 keys is several times smaller than a set.
+
+    The sorted keys for the prefix & range selections are built lazily
+    on the first selection, and are then kept sorted on every new or removed
+    key in O(log K) for the lookup (plus the memory move of the list's tail),
+    so that the selections are O(log K + m), "m" being the number of matches.
+    If the keys are not mutually comparable (e.g. ``None`` & strings),
+    the selections fall back to O(K) scanning of all keys.
     """
+    __slots__ = ('__items', '__reverse', '__sorted', '__sortable', '__size')
     __items: dict[_K, Store[_V]]
-    __reverse: dict[Key, set[_K]]
+    __reverse: dict[Key, tuple[_K, ...]]
+    __sorted: list[_K] | None
+    __sortable: bool
+    __size: int
 
     def __init__(self) -> None:
         super().__init__()
         self.__items = {}
         self.__reverse = {}
+        self.__sorted = None
+        self.__sortable = True
+        self.__size = 0
 
     def __repr__(self) -> str:
         return repr(self.__items)
@@ -102,33 +199,111 @@ class Index(ephemera.Index[_K, _V], Generic[_K, _V]):
     def __contains__(self, item: object) -> bool:  # for performant lookups!
         return item in self.__items
 
+    def select(
+            self,
+            *,
+            prefix: Any = None,
+            start: Any = None,
+            stop: Any = None,
+    ) -> Iterator[tuple[_K, Store[_V]]]:
+        for key in self.__select_keys(prefix=prefix, start=start, stop=stop):
+            store = self.__items.get(key)
+            if store is not None:  # if removed while the caller was iterating
+                yield key, store
+
+    def count(
+            self,
+            *,
+            prefix: Any = None,
+            start: Any = None,
+            stop: Any = None,
+    ) -> int:
+        if prefix is None and start is None and stop is None:
+            return self.__size
+        return sum(len(store) for _, store in self.select(prefix=prefix, start=start, stop=stop))
+
+    def __select_keys(self, *, prefix: Any, start: Any, stop: Any) -> list[_K]:
+        keys = self.__get_sorted_keys()
+        if keys is not None:
+            try:
+                lo = 0 if start is None else bisect.bisect_left(keys, start)
+                hi = len(keys) if stop is None else bisect.bisect_left(keys, stop, lo)
+                lo = lo if prefix is None else bisect.bisect_left(keys, prefix, lo, hi)
+            except TypeError:  # the criteria are not comparable to the keys: e.g. str vs. tuple
+                pass
+            else:
+                if prefix is None:
+                    return keys[lo:hi]
+                selected: list[_K] = []
+                for key in keys[lo:hi]:  # the prefixed keys go contiguously in the sorted order
+                    if not _has_prefix(key, prefix):
+                        break
+                    selected.append(key)
+                return selected
+        return [key for key in self.__items if _is_selected(key, prefix=prefix, start=start, stop=stop)]
+
+    def __get_sorted_keys(self) -> list[_K] | None:
+        if self.__sorted is None and self.__sortable:
+            try:
+                self.__sorted = sorted(self.__items)
+            except TypeError:
+                self.__sortable = False
+        return self.__sorted
+
+    def __insert_sorted_key(self, key: _K) -> None:
+        if self.__sorted is not None:
+            try:
+                bisect.insort(self.__sorted, key)
+            except TypeError:  # not comparable to the existing keys; nothing is inserted yet.
+                self.__sorted = None
+                self.__sortable = False
+
+    def __remove_sorted_key(self, key: _K) -> None:
+        if self.__sorted is not None:
+            idx = bisect.bisect_left(self.__sorted, key)
+            if idx < len(self.__sorted) and self.__sorted[idx] == key:
+                del self.__sorted[idx]
+        elif not self.__sortable:
+            self.__sortable = True  # maybe the incomparable key is gone; re-sort on the next use.
+
+    # Indexers' internal protocol. Must not be used by handlers & operators.
+    def _dump(self) -> dict[Key, dict[_K, _V]]:
+        # The same per-object structure as in `_replace()`, so that it can be restored later.
+        return {acckey: {obj_key: self.__items[obj_key]._get(acckey) for obj_key in obj_keys}
+                for acckey, obj_keys in self.__reverse.items()}
+
     # Indexers' internal protocol. Must not be used by handlers & operators.
-    def _discard(self, acckey: Key, obj_keys: Iterable[_K] | None = None) -> None:
+    def _discard(self, acckey: Key, obj_keys: Iterable[_K] | None = None) -> set[_K]:
         # We know all the keys where that object is indexed, so we delete only from there.
         # Assume that the reverse/forward indices are consistent. If not, fix it, not "fall back".
+        changed: set[_K] = set()
         if acckey in self.__reverse:
-            obj_keys = obj_keys if obj_keys is not None else self.__reverse[acckey].copy()
+            obj_keys = obj_keys if obj_keys is not None else self.__reverse[acckey]
             for obj_key in obj_keys:
 
                 # Discard from that store and remove all freshly emptied stores.
                 store = self.__items[obj_key]
-                store._discard(acckey)
+                size = len(store)
+                if store._discard(acckey):
+                    changed.add(obj_key)
+                self.__size += len(store) - size
                 if not store:
                     del self.__items[obj_key]
+                    self.__remove_sorted_key(obj_key)
 
                 # One by one -- so that the reverse index is consistent even in case of errors.
-                self.__reverse[acckey].discard(obj_key)
-
-            if not self.__reverse[acckey]:
-                del self.__reverse[acckey]
+                remaining = tuple(key for key in self.__reverse[acckey] if key != obj_key)
+                if remaining:
+                    self.__reverse[acckey] = remaining
+                else:
+                    del self.__reverse[acckey]
+        return changed
 
     # Indexers' internal protocol. Must not be used by handlers & operators.
-    def _replace(self, acckey: Key, obj: Mapping[_K, _V]) -> None:
+    def _replace(self, acckey: Key, obj: Mapping[_K, _V]) -> set[_K]:
         # Remember where the object is stored, so that the updates/deletions are O(1) later.
-        try:
-            reverse = self.__reverse[acckey]
-        except KeyError:
-            reverse = self.__reverse[acckey] = set()
+        changed: set[_K] = set()
+        reverse = self.__reverse.get(acckey, ())
 
         # Update (append or replace) all stores that are still related to `obj`.
         for obj_key, obj_val in obj.items():
@@ -136,11 +311,42 @@ class Index(ephemera.Index[_K, _V], Generic[_K, _V]):
                 store = self.__items[obj_key]
             except KeyError:
                 store = self.__items[obj_key] = Store()
-            store._replace(acckey, obj_val)
-            reverse.add(obj_key)
+                self.__insert_sorted_key(obj_key)
+            size = len(store)
+            if store._replace(acckey, obj_val):
+                changed.add(obj_key)
+            self.__size += len(store) - size
+            if obj_key not in reverse:
+                reverse = self.__reverse[acckey] = reverse + (obj_key,)
 
         # Discard from all stores that surely do not contain `obj` anymore.
-        self._discard(acckey, reverse - set(obj.keys()))
+        changed |= self._discard(acckey, [key for key in reverse if key not in obj])
+        return changed
+
+
+def _is_hashable(val: object) -> bool:
+    try:
+        hash(val)
+    except TypeError:
+        return False
+    return True
+
+
+def _has_prefix(key: object, prefix: object) -> bool:
+    if isinstance(key, tuple) and isinstance(prefix, tuple):
+        return key[:len(prefix)] == prefix
+    if isinstance(key, str) and isinstance(prefix, str):
+        return key.startswith(prefix)
+    return False
+
+
+def _is_selected(key: Any, *, prefix: Any, start: Any, stop: Any) -> bool:
+    try:
+        return ((prefix is None or _has_prefix(key, prefix)) and
+                (start is None or start <= key) and
+                (stop is None or key < stop))
+    except TypeError:  # not comparable, so not in the range
+        return False
 
 
 class OperatorIndexer:
@@ -152,29 +358,57 @@ class OperatorIndexer:
         to the operator developers (except for embedded operators).
     """
     index: Index[Any, Any]
+    fingerprint: str | None
 
-    def __init__(self) -> None:
+    def __init__(self, fingerprint: str | None = None) -> None:
         super().__init__()
         self.index = Index()
+        self.fingerprint = fingerprint
 
     def __repr__(self) -> str:
         return repr(self.index)
 
-    def discard(self, key: Key) -> None:
+    def discard(self, key: Key) -> Collection[Any]:
         """ Remove all values of the object, and keep ready for re-indexing. """
-        self.index._discard(key)
+        return self.index._discard(key)
 
-    def replace(self, key: Key, obj: object) -> None:
-        """ Store/merge the object's indexing results. """
+    def replace(self, key: Key, obj: object) -> Collection[Any]:
+        """ Store/merge the object's indexing results. Return the changed index keys. """
         obj = obj if isinstance(obj, collections.abc.Mapping) else {None: obj}
-        self.index._replace(key, obj)
+        return self.index._replace(key, obj)
 
 
 class OperatorIndexers(dict[ids.HandlerId, OperatorIndexer]):
+    """
+    All indexers of the operator, keyed by the ids of the indexing handlers.
+
+    Besides the indices, the indexers remember the versions of the objects
+    as they were fully & successfully indexed (``versions``). This is used
+    to take the snapshots of the indices and to restore them later
+    without re-indexing the objects that did not change meanwhile.
+
+    The restored objects are considered unverified (``restored``) until
+    they are seen in the cluster again, or purged if never seen on readiness.
+
+    For the resources with only the indexing handlers (i.e. with no per-object
+    memories of the regular processing), the indexers keep the indexing
+    memories themselves (``memories``), but only for the failed objects.
+
+    All changes of the index keys are notified to the objects subscribed
+    to those keys (``subscriptions``), so that they are processed again.
+    """
+    versions: dict[Key, str | None]
+    restored: dict[Key, str | None]
+    memories: dict[Key, "IndexingMemory"]
+    subscriptions: "OperatorSubscriptions"
 
     def __init__(self) -> None:
         super().__init__()
         self.indices = OperatorIndices(self)
+        self.versions = {}
+        self.restored = {}
+        self.memories = {}
+        self.subscriptions = OperatorSubscriptions()
 
     def ensure(self, __handlers: Iterable[handlers.IndexingHandler]) -> None:
         """
@@ -184,7 +418,7 @@ class OperatorIndexers(dict[ids.HandlerId, OperatorIndexer]):
         This is done to control the consistency of in-memory structures.
         """
         for handler in __handlers:
-            self[handler.id] = OperatorIndexer()
+            self[handler.id] = OperatorIndexer(fingerprint=get_fingerprint(handler.fn))
 
     def discard(
             self,
@@ -193,7 +427,10 @@ class OperatorIndexers(dict[ids.HandlerId, OperatorIndexer]):
         """ Remove all values of this object from all indexers. Forget it! """
         key = self.make_key(body)
         for id, indexer in self.items():
-            indexer.discard(key)
+            self.subscriptions.notify(id, indexer.discard(key))
+        self.versions.pop(key, None)
+        self.restored.pop(key, None)
+        self.memories.pop(key, None)
 
     def replace(
             self,
@@ -206,14 +443,88 @@ class OperatorIndexers(dict[ids.HandlerId, OperatorIndexer]):
         # Store the values: either for new objects or those re-matching the filters.
         for id, outcome in outcomes.items():
             if outcome.exception is not None:
-                self[id].discard(key)
+                self.subscriptions.notify(id, self[id].discard(key))
             elif outcome.result is not None:
-                self[id].replace(key, outcome.result)
+                self.subscriptions.notify(id, self[id].replace(key, outcome.result))
 
         # Purge the values: for those stopped matching the filters.
         for id, indexer in self.items():
             if id not in outcomes:
-                indexer.discard(key)
+                self.subscriptions.notify(id, indexer.discard(key))
+
+        # Remember the version only if fully indexed. The failed ones must be retried after restarts.
+        self.restored.pop(key, None)
+        if any(outcome.exception is not None for outcome in outcomes.values()):
+            self.versions.pop(key, None)
+        else:
+            self.versions[key] = body.get('metadata', {}).get('resourceVersion')
+
+    def verify(self, body: bodies.Body) -> bool:
+        """
+        Check if the object is restored from a snapshot and is unchanged since then.
+
+        Either way, the object is not considered as restored anymore:
+        if unchanged, it is already in the indices; if changed, it is re-indexed.
+        """
+        key = self.make_key(body)
+        try:
+            version = self.restored.pop(key)
+        except KeyError:
+            return False
+        return version is not None and version == body.get('metadata', {}).get('resourceVersion')
+
+    def purge(self) -> None:
+        """ Forget the restored objects that were never seen since restored, e.g. deleted. """
+        for key in self.restored:
+            for id, indexer in self.items():
+                self.subscriptions.notify(id, indexer.discard(key))
+            self.versions.pop(key, None)
+            self.memories.pop(key, None)
+        self.restored.clear()
+
+    def dump(self, fingerprint: str | None = None) -> dict[str, Any]:
+        """
+        Take a snapshot of the fully indexed objects as plain Python structures.
+
+        The containers are new, so the snapshot can be serialized in a thread
+        while the indices change. The indexed values are not copied: they are
+        never modified by the framework once returned by the indexing functions.
+        """
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'fingerprint': fingerprint,
+            'fingerprints': {str(id): indexer.fingerprint for id, indexer in self.items()},
+            'versions': dict(self.versions),
+            'indices': {
+                str(id): {acckey: obj for acckey, obj in indexer.index._dump().items()
+                          if acckey in self.versions}
+                for id, indexer in self.items()
+            },
+        }
+
+    def load(self, snapshot: Mapping[str, Any], fingerprint: str | None = None) -> bool:
+        """
+        Restore the indices from a snapshot, if it matches the current indexers.
+
+        If the indexing handlers have changed since the snapshot was taken
+        (their ids or the code of their functions), or if the operator-provided
+        fingerprint differs, the snapshot is ignored and the indices are
+        populated from scratch.
+        """
+        if snapshot.get('format') != SNAPSHOT_FORMAT:
+            return False
+        if set(snapshot.get('indices', {})) != set(self):
+            return False
+        if snapshot.get('fingerprint') != fingerprint:
+            return False
+        if snapshot.get('fingerprints') != {str(id): indexer.fingerprint for id, indexer in self.items()}:
+            return False
+        for id, objs in snapshot['indices'].items():
+            for acckey, obj in objs.items():
+                self[id].index._replace(acckey, obj)
+        self.versions.update(snapshot['versions'])
+        self.restored.update(snapshot['versions'])
+        return True
 
     def make_key(self, body: bodies.Body) -> Key:
         """
@@ -229,9 +540,17 @@ class OperatorIndexers(dict[ids.HandlerId, OperatorIndexer]):
         They are here for debugging and for those rare objects
         that have no uid but are still exposed via the K8s API
         (highly unlikely to be indexed though).
+
+        The namespaces and names are interned: the namespaces are shared
+        by many objects, and both are repeated in many internal containers,
+        while every watch-event brings its own fresh copies of the strings.
         """
         meta = body.get('metadata', {})
-        return (meta.get('namespace'), meta.get('name'), meta.get('uid'))
+        namespace = meta.get('namespace')
+        name = meta.get('name')
+        namespace = references.NamespaceName(sys.intern(namespace)) if namespace else namespace
+        name = sys.intern(name) if name else name
+        return (namespace, name, meta.get('uid'))
 
 
 class OperatorIndices(ephemera.Indices):
@@ -271,6 +590,75 @@ class OperatorIndices(ephemera.Indices):
         return id in self.__indexers
 
 
+class OperatorSubscriptions:
+    """
+    The objects with handlers depending on the index keys (``@kopf.subscribe``).
+
+    When the values under a subscribed index key change, all subscribed objects
+    are replayed into their watch-streams with their last seen bodies ---
+    as if they were listed again --- so that their handlers react to the new
+    state of the indices without waiting for the objects' own changes.
+
+    The watchers provide their replay queues in ``queues``, keyed by resource
+    and namespace (``None`` for the cluster-wide watchers). The subscriptions
+    of the objects with no watcher (e.g. in tests) are not replayed.
+
+    Similar to the indices, the forward map points from the index keys
+    to the subscribed objects, and the reverse map points from the objects
+    to their index keys, so that the updates/deletions are O(k), not O(K).
+    """
+    queues: dict[tuple[references.Resource, references.Namespace], asyncio.Queue[bodies.RawEvent]]
+    __subscribers: dict[tuple[ids.HandlerId, Any], dict[Key, tuple[references.Resource, bodies.RawBody]]]
+    __reverse: dict[Key, set[tuple[ids.HandlerId, Any]]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queues = {}
+        self.__subscribers = {}
+        self.__reverse = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.__reverse)
+
+    def __len__(self) -> int:
+        return len(self.__reverse)
+
+    def discard(self, acckey: Key) -> None:
+        """ Forget all subscriptions of the object, e.g. when it is deleted. """
+        for subkey in self.__reverse.pop(acckey, set()):
+            subscribers = self.__subscribers[subkey]
+            del subscribers[acckey]
+            if not subscribers:
+                del self.__subscribers[subkey]
+
+    def replace(
+            self,
+            acckey: Key,
+            *,
+            resource: references.Resource,
+            raw_body: bodies.RawBody,
+            subkeys: Collection[tuple[ids.HandlerId, Any]],
+    ) -> None:
+        """ Subscribe the object to the specified keys of indices, and only to them. """
+        self.discard(acckey)
+        for subkey in subkeys:
+            self.__subscribers.setdefault(subkey, {})[acckey] = (resource, raw_body)
+        if subkeys:
+            self.__reverse[acckey] = set(subkeys)
+
+    def notify(self, id: ids.HandlerId, keys: Collection[Any]) -> None:
+        """ Replay all objects subscribed to the changed keys of an index (each only once). """
+        replayed: dict[Key, tuple[references.Resource, bodies.RawBody]] = {}
+        for key in keys:
+            replayed.update(self.__subscribers.get((id, key), {}))
+        for resource, raw_body in replayed.values():
+            namespace = cast(references.Namespace, raw_body.get('metadata', {}).get('namespace'))
+            queue = self.queues.get((resource, namespace))
+            queue = queue if queue is not None else self.queues.get((resource, None))
+            if queue is not None:
+                queue.put_nowait({'type': None, 'object': raw_body})
+
+
 @dataclasses.dataclass(frozen=False)
 class IndexingMemory:
     # For indexing errors backoffs/retries/timeouts. It is None when successfully indexed.
@@ -304,6 +692,9 @@ async def index_resource(
     elif raw_event['type'] == 'DELETED':
         # Do not index it if it is deleted. Just discard quickly (ASAP!).
         indexers.discard(body=body)
+    elif indexers.verify(body=body):
+        # Restored from a snapshot and unchanged since then, so already in the indices. Skip it.
+        pass
     else:
         # Otherwise, go for full indexing with handlers invocation with all kwargs.
         cause = causes.IndexingCause(
@@ -333,3 +724,150 @@ async def index_resource(
         # Remember only failures & retries. Omit successes -- let them be re-executed every time.
         state = state.with_outcomes(outcomes).without_successes()
         memory.indexing_state = state if state else None
+
+
+async def subscribe_resource(
+        *,
+        indexers: OperatorIndexers,
+        registry: registries.OperatorRegistry,
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        raw_event: bodies.RawEvent,
+        logger: typedefs.Logger,
+        memo: ephemera.AnyMemo,
+        body: bodies.Body,
+) -> None:
+    """
+    Remember the index keys the object depends on, to replay it when they change.
+
+    Same as for the indexing, it is a lightweight process with all errors
+    logged but ignored. A failed subscription function does not subscribe
+    the object to anything until the next successful call.
+    """
+    key = indexers.make_key(body)
+    if not registry._subscribing.has_handlers(resource=resource):
+        pass
+    elif raw_event['type'] == 'DELETED':
+        indexers.subscriptions.discard(key)
+    else:
+        cause = causes.IndexingCause(
+            resource=resource,
+            indices=indexers.indices,
+            logger=logger,
+            patch=patches.Patch(),  # NB: not applied.
+            memo=memo,
+            body=body,
+        )
+        subscribing_handlers = registry._subscribing.get_handlers(cause=cause)
+        outcomes = await execution.execute_handlers_once(
+            lifecycle=lifecycles.all_at_once,
+            settings=settings,
+            handlers=subscribing_handlers,
+            cause=cause,
+            state=progression.State.from_scratch().with_handlers(subscribing_handlers),
+            default_errors=execution.ErrorsMode.IGNORED,
+        )
+
+        # A single key or a list/set of keys; tuples are keys themselves (compound keys).
+        subkeys: set[tuple[ids.HandlerId, Any]] = set()
+        for handler in subscribing_handlers:
+            result = outcomes[handler.id].result if handler.id in outcomes else None
+            results = result if isinstance(result, (list, set, frozenset)) else [result]
+            subkeys.update((handler.index, result) for result in results if result is not None)
+        indexers.subscriptions.replace(key, resource=resource, raw_body=raw_event['object'],
+                                       subkeys=subkeys)
+
+
+async def snapshotter(
+        *,
+        indexers: OperatorIndexers,
+        settings: configuration.OperatorSettings,
+) -> None:
+    """
+    Restore the indices from a snapshot, and keep the snapshot fresh.
+
+    The snapshot is loaded synchronously, with no ``await`` before it,
+    so that it is done before the watchers start and the objects are indexed.
+    It is also written on exit, so that the next startup begins with the freshest state.
+    """
+    path = settings.indexing.snapshot_path
+    if path is None:
+        return
+
+    fingerprint = settings.indexing.snapshot_fingerprint
+    load_snapshot(indexers=indexers, path=path, fingerprint=fingerprint)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            await asyncio.sleep(settings.indexing.snapshot_interval)
+            try:
+                # Take the snapshot in the event loop for consistency (no changes while copying).
+                # The slow pickling of the large indices and the disk i/o go to a thread.
+                snapshot = indexers.dump(fingerprint=fingerprint)
+                await loop.run_in_executor(None, _write_snapshot, path, snapshot)
+            except Exception as e:
+                logger.warning(f"Failed to write the index snapshot to {path!r}: {e!r}")
+    finally:
+        save_snapshot(indexers=indexers, path=path, fingerprint=fingerprint)
+
+
+def load_snapshot(*, indexers: OperatorIndexers, path: str, fingerprint: str | None = None) -> None:
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        logger.debug(f"No index snapshot at {path!r}; indexing from scratch.")
+    except Exception as e:
+        logger.warning(f"Failed to read the index snapshot from {path!r}: {e!r}")
+    else:
+        if not isinstance(snapshot, Mapping) or not indexers.load(snapshot, fingerprint=fingerprint):
+            logger.info(f"Ignoring an outdated index snapshot at {path!r}; indexing from scratch.")
+        else:
+            logger.info(f"Restored the indices from {path!r} with {len(indexers.restored)} objects.")
+
+
+def save_snapshot(*, indexers: OperatorIndexers, path: str, fingerprint: str | None = None) -> None:
+    try:
+        _write_snapshot(path, indexers.dump(fingerprint=fingerprint))
+    except Exception as e:
+        logger.warning(f"Failed to write the index snapshot to {path!r}: {e!r}")
+
+
+def _write_snapshot(path: str, snapshot: Mapping[str, Any]) -> None:
+    # Never leave a half-written file, e.g. if killed while writing: replace it atomically.
+    # Several processes of one operator can write it at the same time: each to its own temp file.
+    data = pickle.dumps(snapshot)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def get_fingerprint(fn: object) -> str | None:
+    """
+    Derive a fingerprint of an indexing function from its code.
+
+    Only the function's own code is considered (including the nested functions
+    and lambdas), not the helpers it calls or the values it depends on.
+    The line numbers and file names are ignored, so that the unrelated edits
+    elsewhere in the same file do not invalidate the snapshots.
+    ``None`` means that the function has no code to inspect.
+    """
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    code = getattr(fn, '__code__', None) or getattr(getattr(fn, '__call__', None), '__code__', None)
+    if not isinstance(code, types.CodeType):
+        return None
+    digest = hashlib.sha256()
+    _digest_code(digest, code)
+    return digest.hexdigest()
+
+
+def _digest_code(digest: "hashlib._Hash", code: types.CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _digest_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
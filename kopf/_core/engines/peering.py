@@ -36,24 +36,31 @@ To disable the peers monitoring, use the ``--standalone`` CLI option.
 import asyncio
 import datetime
 import getpass
+import hashlib
 import logging
 import os
 import random
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from typing import Any, NewType, NoReturn, cast
 
 import iso8601
 
 from kopf._cogs.aiokits import aiotasks, aiotime, aiotoggles
-from kopf._cogs.clients import patching
+from kopf._cogs.clients import api, creating, errors, patching
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import hostnames
 from kopf._cogs.structs import bodies, patches, references
+from kopf._core.engines import sharding
 
 logger = logging.getLogger(__name__)
 
 Identity = NewType('Identity', str)
 
+# The leases of the peering are recognised by the label, and the priority is kept in the annotation.
+LEASE_LABEL = 'kopf.dev/peering'
+LEASE_PRIORITY_ANNOTATION = 'kopf.dev/priority'
+LEASE_NAMESPACES_ANNOTATION = 'kopf.dev/namespaces'
+
 
 # The class used to represent a peer in the parsed peers list (for convenience).
 # The extra fields are for easier calculation when and if the peer is dead to the moment.
@@ -66,11 +73,13 @@ class Peer:
             priority: int = 0,
             lifetime: int = 60,
             lastseen: str | None = None,
+            namespaces: Iterable[str] | None = None,  # None for cluster-wide operators
             **_: Any,  # for the forward-compatibility with the new fields
     ):
         super().__init__()
         self.identity = identity
         self.priority = priority
+        self.namespaces = None if namespaces is None else frozenset(namespaces)
         self.lifetime = datetime.timedelta(seconds=int(lifetime))
         self.lastseen = (iso8601.parse_date(lastseen) if lastseen is not None else
                          datetime.datetime.now(datetime.timezone.utc))
@@ -88,8 +97,20 @@ class Peer:
             'priority': int(self.priority),
             'lifetime': int(self.lifetime.total_seconds()),
             'lastseen': str(self.lastseen.isoformat()),
+            **({} if self.namespaces is None else {'namespaces': sorted(self.namespaces)}),
         }
 
+    def serves(self, namespaces: Collection[references.Namespace] | None) -> bool:
+        """
+        Check if the peer serves any of the namespaces (``None`` means all).
+
+        The peers with no namespaces reported are cluster-wide (or older ones),
+        so they conflict with everyone -- same as before the namespaces were reported.
+        """
+        if self.namespaces is None or namespaces is None or None in namespaces:
+            return True
+        return not self.namespaces.isdisjoint(namespaces)
+
 
 async def process_peering_event(
         *,
@@ -101,6 +122,8 @@ async def process_peering_event(
         autoclean: bool = True,
         stream_pressure: asyncio.Event | None = None,  # None for tests
         conflicts_found: aiotoggles.Toggle | None = None,  # None for tests & observation
+        shards: sharding.Shards | None = None,  # None for tests & unsharded operators
+        namespaces: Collection[references.Namespace] | None = None,  # None for per-namespace peerings
         # Must be accepted whether used or not -- as passed by watcher()/worker().
         resource_indexed: aiotoggles.Toggle | None = None,  # None for tests & observation
         operator_indexed: aiotoggles.ToggleSet | None = None,  # None for tests & observation
@@ -112,6 +135,13 @@ async def process_peering_event(
     When an operator with a higher priority appears, pause this operator.
     When conflicting operators disappear or become presumably dead,
     resume the event handling in the current operator (un-pause it).
+
+    In the sharded mode, the same-priority operators are not conflicting,
+    but are the members sharing the objects (see :mod:`.sharding`).
+
+    For the cluster-level peering of a multi-namespace operator, ``namespaces``
+    are the namespaces served by this operator: only the peers serving any of
+    them are taken into account -- as if there were a peering per namespace.
     """
     body: bodies.RawBody = raw_event['object']
     meta: bodies.RawMeta = raw_event['object']['metadata']
@@ -124,12 +154,106 @@ async def process_peering_event(
     pairs = cast(dict[str, dict[str, Any]], body.get('status', {}))
     peers = [Peer(identity=Identity(opid), **opinfo) for opid, opinfo in pairs.items()]
     dead_peers = [peer for peer in peers if peer.is_dead]
+
+    if autoclean and dead_peers:
+        await clean(peers=dead_peers, settings=settings, resource=resource, namespace=namespace)
+
+    await _resolve_conflicts(
+        peers=peers,
+        identity=identity,
+        settings=settings,
+        resource=resource,
+        namespace=namespace,
+        stream_pressure=stream_pressure,
+        conflicts_found=conflicts_found,
+        shards=shards,
+        namespaces=namespaces,
+    )
+
+
+async def process_lease_event(
+        *,
+        raw_event: bodies.RawEvent,
+        namespace: references.Namespace,
+        resource: references.Resource,
+        identity: Identity,
+        settings: configuration.OperatorSettings,
+        leases: dict[str, bodies.RawBody],
+        autoclean: bool = True,
+        stream_pressure: asyncio.Event | None = None,  # None for tests
+        conflicts_found: aiotoggles.Toggle | None = None,  # None for tests & observation
+        shards: sharding.Shards | None = None,  # None for tests & unsharded operators
+        namespaces: Collection[references.Namespace] | None = None,  # None for per-namespace peerings
+        # Must be accepted whether used or not -- as passed by watcher()/worker().
+        resource_indexed: aiotoggles.Toggle | None = None,  # None for tests & observation
+        operator_indexed: aiotoggles.ToggleSet | None = None,  # None for tests & observation
+        consistency_time: float | None = None,  # None for tests & observation
+) -> None:
+    """
+    Handle a single update of a peer's lease by us or by other operators.
+
+    Unlike the peering objects, every lease contains only one peer. All leases
+    of the peering are remembered in ``leases`` (shared by the lease workers)
+    and are evaluated together, same as the peers of one peering object.
+    """
+    body: bodies.RawBody = raw_event['object']
+    meta: bodies.RawMeta = raw_event['object']['metadata']
+
+    # Silently ignore the leases which are not ours to worry (e.g. of other controllers).
+    if meta.get('labels', {}).get(LEASE_LABEL) != settings.peering.name:
+        return
+
+    # Remember or forget the lease, and re-evaluate all the known leases together.
+    if raw_event['type'] == 'DELETED':
+        leases.pop(meta['name'], None)
+    else:
+        leases[meta['name']] = body
+    peers = {name: _parse_lease(lease) for name, lease in leases.items()}
+    dead_leases = [lease for name, lease in leases.items() if peers[name].is_dead]
+
+    if autoclean and dead_leases:
+        await clean_leases(leases=dead_leases, settings=settings, resource=resource, namespace=namespace)
+
+    await _resolve_conflicts(
+        peers=list(peers.values()),
+        identity=identity,
+        settings=settings,
+        resource=resource,
+        namespace=namespace,
+        stream_pressure=stream_pressure,
+        conflicts_found=conflicts_found,
+        shards=shards,
+        namespaces=namespaces,
+    )
+
+
+async def _resolve_conflicts(
+        *,
+        peers: Collection[Peer],
+        identity: Identity,
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        namespace: references.Namespace,
+        stream_pressure: asyncio.Event | None,
+        conflicts_found: aiotoggles.Toggle | None,
+        shards: sharding.Shards | None,
+        namespaces: Collection[references.Namespace] | None,
+) -> None:
     live_peers = [peer for peer in peers if not peer.is_dead and peer.identity != identity]
+    live_peers = [peer for peer in live_peers if peer.serves(namespaces)]
     prio_peers = [peer for peer in live_peers if peer.priority > settings.peering.priority]
     same_peers = [peer for peer in live_peers if peer.priority == settings.peering.priority]
 
-    if autoclean and dead_peers:
-        await clean(peers=dead_peers, settings=settings, resource=resource, namespace=namespace)
+    if shards is not None:
+        scope = None if settings.peering.clusterwide else namespace
+        await shards.update(scope, [peer.identity for peer in same_peers])
+
+        # For the cluster-level peering, split every served namespace among its own members only.
+        if scope is None and namespaces is not None:
+            for served_namespace in namespaces:
+                if served_namespace is not None:
+                    members = [peer.identity for peer in same_peers if peer.serves([served_namespace])]
+                    await shards.update(served_namespace, members)
 
     if conflicts_found is None:
         pass
@@ -139,10 +263,10 @@ async def process_peering_event(
             logger.info(f"Pausing operations in favour of {prio_peers}.")
             await conflicts_found.turn_to(True)
 
-    elif same_peers:
+    elif same_peers and (shards is None or settings.peering.sharding is None):
         logger.warning(f"Possibly conflicting operators with the same priority: {same_peers}.")
         if conflicts_found.is_off():
-            logger.warning(f"Pausing all operators, including self: {peers}")
+            logger.warning(f"Pausing all operators, including self: {list(peers)}")
             await conflicts_found.turn_to(True)
 
     else:
@@ -154,10 +278,11 @@ async def process_peering_event(
     # are expected to expire, and force the immediate re-evaluation by a certain change of self.
     # This incurs an extra PATCH request besides usual keepalives, but in the complete silence
     # from other peers that existed a moment earlier, this should not be a problem.
+    # In `kopf run --processes=N`, only the 1st process touches the shared peer for all processes.
     now = datetime.datetime.now(datetime.timezone.utc)
     delays = [(peer.deadline - now).total_seconds() for peer in same_peers + prio_peers]
     unslept = await aiotime.sleep(delays, wakeup=stream_pressure)
-    if unslept is None and delays:
+    if unslept is None and delays and settings.process.process_index == 0:
         await touch(
             identity=identity,
             settings=settings,
@@ -172,17 +297,24 @@ async def keepalive(
         resource: references.Resource,
         identity: Identity,
         settings: configuration.OperatorSettings,
+        namespaces: Collection[references.Namespace] | None = None,  # None for per-namespace peerings
 ) -> NoReturn:
     """
     An ever-running coroutine to regularly send our own keep-alive status for the peers.
+
+    The served ``namespaces`` (if given) are re-read and reported on every keep-alive,
+    so the newly added or removed namespaces are reported with the next one.
     """
     try:
+        rsp: bodies.RawBody | None = None
         while True:
-            await touch(
+            rsp = await touch(
                 identity=identity,
                 settings=settings,
                 resource=resource,
                 namespace=namespace,
+                namespaces=namespaces,
+                previous=rsp,
             )
 
             # How often do we update. Keep limited to avoid k8s api flooding.
@@ -213,30 +345,48 @@ async def touch(
         resource: references.Resource,
         namespace: references.Namespace,
         lifetime: int | None = None,
-) -> None:
-    name = settings.peering.name
-    peer = Peer(
-        identity=identity,
-        priority=settings.peering.priority,
-        lifetime=settings.peering.lifetime if lifetime is None else lifetime,
-    )
+        namespaces: Collection[references.Namespace] | None = None,  # None for per-namespace peerings
+        previous: bodies.RawBody | None = None,  # only for leases, to renew them optimistically
+) -> bodies.RawBody | None:
+    served = _get_served_namespaces(namespaces)
+    if references.LEASES.check(resource):
+        name = get_lease_name(settings=settings, identity=identity)
+        rsp = await renew_lease(
+            identity=identity,
+            settings=settings,
+            resource=resource,
+            namespace=namespace,
+            lifetime=lifetime,
+            namespaces=served,
+            lease=previous,
+        )
+    else:
+        name = settings.peering.name
+        peer = Peer(
+            identity=identity,
+            priority=settings.peering.priority,
+            lifetime=settings.peering.lifetime if lifetime is None else lifetime,
+            namespaces=served,
+        )
 
-    patch = patches.Patch()
-    patch |= {'status': {identity: None if peer.is_dead else peer.as_dict()}}
-    rsp, remaining_patch = await patching.patch_obj(
-        settings=settings,
-        resource=resource,
-        namespace=namespace,
-        name=name,
-        patch=patch,
-        logger=logger,
-        silent=True,
-    )
+        patch = patches.Patch()
+        patch |= {'status': {identity: None if peer.is_dead else peer.as_dict()}}
+        rsp, remaining_patch = await patching.patch_obj(
+            settings=settings,
+            resource=resource,
+            namespace=namespace,
+            name=name,
+            patch=patch,
+            lane=api.Lane.CRITICAL,
+            logger=logger,
+            silent=True,
+        )
 
     if not settings.peering.stealth or rsp is None:
         where = f"in {namespace!r}" if namespace else "cluster-wide"
         result = "not found" if rsp is None else "ok"
         logger.debug(f"Keep-alive in {name!r} {where}: {result}.")
+    return rsp
 
 
 async def clean(
@@ -255,11 +405,183 @@ async def clean(
         namespace=namespace,
         name=name,
         patch=patch,
+        lane=api.Lane.CRITICAL,
         logger=logger,
         silent=True,
     )
 
 
+def _get_served_namespaces(
+        namespaces: Collection[references.Namespace] | None,
+) -> Collection[str] | None:
+    """ The specific namespaces to report, or ``None`` for all (or if unknown). """
+    if namespaces is None or None in namespaces:
+        return None
+    return {namespace for namespace in namespaces if namespace is not None}
+
+
+def get_lease_name(
+        *,
+        settings: configuration.OperatorSettings,
+        identity: Identity,
+) -> str:
+    """ The operator's own lease name; the identities are not always valid for names. """
+    digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    return f'{settings.peering.name}.{digest[:16]}'
+
+
+async def renew_lease(
+        *,
+        identity: Identity,
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        namespace: references.Namespace,
+        lifetime: int | None = None,
+        namespaces: Collection[str] | None = None,
+        lease: bodies.RawBody | None = None,
+) -> bodies.RawBody | None:
+    """
+    Acquire or renew the operator's own lease, or release it if the lifetime is zero.
+
+    The renewal is guarded by the resource version of the last seen lease
+    (if known). If the lease was changed since then by anyone else
+    (e.g. deleted and re-created), it is re-read and taken over only if it is
+    still held by us or has expired; otherwise, it is retried on the next cycle.
+
+    Returns the lease as it is stored, or ``None`` if there is none (anymore).
+    """
+    name = get_lease_name(settings=settings, identity=identity)
+    url = resource.get_url(namespace=namespace, name=name)
+    lifetime = settings.peering.lifetime if lifetime is None else lifetime
+    if lifetime <= 0:
+        try:
+            await api.delete(url=url, lane=api.Lane.CRITICAL, settings=settings, logger=logger)
+        except errors.APINotFoundError:
+            pass
+        return None
+
+    now = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    metadata: dict[str, Any] = {
+        'labels': {LEASE_LABEL: settings.peering.name},
+        'annotations': {
+            LEASE_PRIORITY_ANNOTATION: str(settings.peering.priority),
+            LEASE_NAMESPACES_ANNOTATION: None if namespaces is None else ','.join(sorted(namespaces)),
+        },
+    }
+    spec: dict[str, Any] = {
+        'holderIdentity': identity,
+        'leaseDurationSeconds': lifetime,
+        'renewTime': now,
+    }
+    resource_version = None if lease is None else lease.get('metadata', {}).get('resourceVersion')
+    try:
+        if resource_version is None:
+            return await _patch_lease(url=url, settings=settings, metadata=metadata, spec=spec)
+
+        try:
+            return await _patch_lease(url=url, settings=settings, spec=spec,
+                                      metadata=dict(metadata, resourceVersion=resource_version))
+        except errors.APIConflictError:
+            pass  # changed by someone else since last seen; see below if it is still ours.
+
+        # Take the lease over only if it is still ours or has expired, and only as it is now.
+        # Otherwise, keep its fresh version to retry on the next cycle (if not renewed again).
+        fresh: bodies.RawBody = await api.get(url=url, lane=api.Lane.CRITICAL,
+                                              settings=settings, logger=logger)
+        holder = _parse_lease(fresh)
+        if holder.identity != identity and not holder.is_dead:
+            logger.warning(f"The lease {name!r} is held by {holder.identity!r}. Retrying later.")
+            return fresh
+        try:
+            resource_version = fresh.get('metadata', {}).get('resourceVersion')
+            return await _patch_lease(url=url, settings=settings, spec=spec,
+                                      metadata=dict(metadata, resourceVersion=resource_version))
+        except errors.APIConflictError:
+            return fresh  # changed again meanwhile; retry on the next cycle.
+    except errors.APINotFoundError:
+        pass
+
+    try:
+        return await creating.create_obj(
+            settings=settings,
+            resource=resource,
+            namespace=namespace,
+            name=name,
+            body=cast(bodies.RawBody, {
+                'apiVersion': f'{resource.group}/{resource.version}',
+                'kind': 'Lease',
+                'metadata': dict(metadata, annotations={
+                    key: val for key, val in metadata['annotations'].items() if val is not None
+                }),
+                'spec': dict(spec, acquireTime=now),
+            }),
+            lane=api.Lane.CRITICAL,
+            logger=logger,
+        )
+    except errors.APIConflictError:
+        return None  # created in parallel, e.g. by the peering's re-evaluation.
+
+
+async def _patch_lease(
+        *,
+        url: str,
+        settings: configuration.OperatorSettings,
+        metadata: dict[str, Any],
+        spec: dict[str, Any],
+) -> bodies.RawBody:
+    rsp: bodies.RawBody = await api.patch(
+        url=url,
+        headers={'Content-Type': 'application/merge-patch+json'},
+        payload={'metadata': metadata, 'spec': spec},
+        lane=api.Lane.CRITICAL,
+        settings=settings,
+        logger=logger,
+    )
+    return rsp
+
+
+async def clean_leases(
+        *,
+        leases: Iterable[bodies.RawBody],
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        namespace: references.Namespace,
+) -> None:
+    """
+    Delete the expired leases of other operators, unless renewed meanwhile.
+
+    The deletion is guarded by the resource version of the expired lease,
+    so that a lease renewed right before the deletion is not deleted.
+    Other operators can delete the same leases at the same time; that is fine.
+    """
+    for lease in leases:
+        metadata = lease.get('metadata', {})
+        try:
+            await api.delete(
+                url=resource.get_url(namespace=namespace, name=metadata['name']),
+                payload={'preconditions': {'resourceVersion': metadata.get('resourceVersion')}},
+                lane=api.Lane.CRITICAL,
+                settings=settings,
+                logger=logger,
+            )
+        except (errors.APINotFoundError, errors.APIConflictError):
+            pass  # already deleted or renewed.
+
+
+def _parse_lease(lease: bodies.RawBody) -> Peer:
+    metadata = lease.get('metadata', {})
+    annotations = metadata.get('annotations', {})
+    namespaces = annotations.get(LEASE_NAMESPACES_ANNOTATION)
+    spec = lease.get('spec', {})
+    return Peer(
+        identity=Identity(spec.get('holderIdentity') or metadata.get('name', '')),
+        priority=int(annotations.get(LEASE_PRIORITY_ANNOTATION, 0)),
+        namespaces=None if namespaces is None else [ns for ns in namespaces.split(',') if ns],
+        lifetime=spec.get('leaseDurationSeconds', 60),
+        lastseen=spec.get('renewTime') or spec.get('acquireTime') or metadata.get('creationTimestamp'),
+    )
+
+
 def detect_own_id(*, manual: bool) -> Identity:
     """
     Detect or generate the id for ourselves, i.e. the executing operator.
@@ -296,6 +618,8 @@ def detect_own_id(*, manual: bool) -> Identity:
 def guess_selectors(settings: configuration.OperatorSettings) -> Iterable[references.Selector]:
     if settings.peering.standalone:
         return []
+    elif settings.peering.backend == 'leases':
+        return [references.LEASES]
     elif settings.peering.clusterwide:
         return [references.CLUSTER_PEERINGS_K, references.CLUSTER_PEERINGS_Z]
     elif settings.peering.namespaced:
@@ -304,6 +628,29 @@ def guess_selectors(settings: configuration.OperatorSettings) -> Iterable[refere
         raise TypeError("Unidentified peering mode (none of standalone/cluster/namespaced).")
 
 
+async def locate(
+        *,
+        settings: configuration.OperatorSettings,
+        resource: references.Resource,
+        namespace: references.Namespace,
+) -> references.Namespace:
+    """
+    Find the actual namespace of the peering objects for a served namespace.
+
+    The peering objects are either cluster-scoped or in the served namespaces.
+    The leases are always namespaced, so for the cluster-wide peering,
+    they are kept in the operator's default namespace (of its pod or of its
+    kubeconfig context), or in the ``default`` namespace if unknown.
+    """
+    if not resource.namespaced:
+        return None
+    elif settings.peering.clusterwide:
+        default_namespace = await api.get_default_namespace()
+        return references.NamespaceName(default_namespace or 'default')
+    else:
+        return namespace
+
+
 async def touch_command(
         *,
         lifetime: int | None,
@@ -322,6 +669,11 @@ async def touch_command(
     if not resources:
         raise RuntimeError(f"Cannot find the peering resource for {selectors}.")
 
+    targets = {
+        (resource, await locate(settings=settings, resource=resource, namespace=namespace))
+        for namespace in insights.namespaces
+        for resource in resources
+    }
     await aiotasks.wait({
         aiotasks.create_guarded_task(
             name="peering command", finishable=True, logger=logger,
@@ -332,6 +684,5 @@ async def touch_command(
                 settings=settings,
                 lifetime=lifetime),
         )
-        for namespace in insights.namespaces
-        for resource in resources
+        for resource, namespace in targets
     })
@@ -14,25 +14,94 @@ The k8s-events are queued in two ways:
 * Logging messages made on the object logger (above the INFO level by default).
 
 This also includes all logging messages posted by the framework itself.
+
+The repeated k8s-events are aggregated into one k8s-event with a ``count``,
+and the objects that post too many k8s-events are throttled (the excessive
+k8s-events are dropped), similar to the event recorder of the Go client.
+
+The k8s-events are posted by a few concurrent workers. The queue is limited,
+and the least important k8s-events are dropped if the posting cannot keep up
+(e.g. with logging-heavy operators), so that the memory does not grow forever.
 """
 import asyncio
+import collections
+import dataclasses
 import logging
 import sys
 from collections.abc import Iterable, Iterator
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, NamedTuple, NoReturn, cast
+from typing import Any, NamedTuple, NoReturn, cast
 
-from kopf._cogs.clients import events
+from kopf._cogs.aiokits import aiotasks
+from kopf._cogs.clients import api, events
 from kopf._cogs.configs import configuration
-from kopf._cogs.structs import bodies, dicts, references
+from kopf._cogs.structs import bodies, dicts, references, telemetry
 from kopf._core.actions import loggers
 
 logger = logging.getLogger(__name__)
 
-if TYPE_CHECKING:
-    K8sEventQueue = asyncio.Queue["K8sEvent"]
-else:
-    K8sEventQueue = asyncio.Queue
+# For dropping the least important k8s-events first; the unknown types are treated as "Normal".
+SEVERITIES = {'Debug': 0, 'Normal': 1, 'Warning': 2, 'Error': 3, 'Fatal': 4}
+
+
+class K8sEventQueue(asyncio.Queue["K8sEvent"]):
+    """
+    A queue of k8s-events, which drops the least important ones when full.
+
+    Unlike the regular queue's limit, the putting never blocks or fails:
+    the events are posted from the logging and from the sync threads,
+    where waiting or failing is not an option. Instead, either the oldest
+    event or the oldest event of the lowest severity is dropped and counted.
+    A warning is logged once when the dropping starts, not on every event.
+
+    The limit & policy are taken from the settings on every put,
+    so that they can be changed at runtime (e.g. in the startup handlers).
+    """
+
+    def __init__(
+            self,
+            *,
+            settings: configuration.OperatorSettings,
+            metrics: telemetry.OperatorMetrics | None = None,
+    ) -> None:
+        super().__init__()
+        self._settings = settings
+        self._metrics = metrics
+        self._overflowing = False
+
+    def put_nowait(self, item: "K8sEvent") -> None:
+        limit = self._settings.posting.queue_limit
+        if limit is not None and self.qsize() >= limit:
+            if not self._overflowing:
+                self._overflowing = True
+                logger.warning(f"The queue of k8s-events is full ({limit}); the events are dropped"
+                               f" according to the {self._settings.posting.drop_policy!r} policy.")
+            if not self._drop(item):
+                return  # the new item is the least important one
+        else:
+            self._overflowing = False
+        super().put_nowait(item)
+
+    def _drop(self, item: "K8sEvent") -> bool:
+        if self._metrics is not None:
+            self._metrics.events_dropped += 1
+
+        # There is no public API to remove arbitrary items, but the internal deque is well-known.
+        queued: collections.deque[K8sEvent] = getattr(self, '_queue')
+        if self._settings.posting.drop_policy == 'severity':
+            lowest = min(queued, key=_get_severity)
+            if _get_severity(item) < _get_severity(lowest):
+                return False
+            queued.remove(lowest)
+        else:
+            queued.popleft()
+        self.task_done()  # as if it was processed, for `join()` to work properly
+        return True
+
+
+def _get_severity(event: "K8sEvent") -> int:
+    return SEVERITIES.get(event.type, SEVERITIES['Normal'])
+
 
 # Logging and event-posting can happen cross-thread: e.g. in sync-executors.
 # We have to remember our main event-loop with the queue consumer, to make
@@ -46,6 +115,13 @@ event_queue_var: ContextVar[K8sEventQueue] = ContextVar('event_queue_var')
 settings_var: ContextVar[configuration.OperatorSettings] = ContextVar('settings_var')
 
 
+# How many aggregated k8s-events & throttled objects to remember (the least recent are forgotten).
+MAX_RECORDED_KEYS = 4096
+
+ObjectKey = tuple[str | None, ...]  # apiVersion, kind, namespace, name, uid
+EventKey = tuple[ObjectKey, str, str, str]  # object, type, reason, message
+
+
 class K8sEvent(NamedTuple):
     """
     A single k8s-event to be posted, with all reference information preserved.
@@ -161,24 +237,190 @@ async def poster(
     When the events are explicitly defined via :func:`kopf.event` and similar
     calls, they have these special fields defined already.
 
-    In either case, we pass the queued events directly to the K8s client
-    (or a client wrapper/adapter), with no extra processing.
+    In either case, we pass the queued events to the K8s client (or a client
+    wrapper/adapter) via the aggregating recorder, with no extra processing.
+    A few workers post the events concurrently (see ``settings.posting``).
 
     This task is defined in this module only because all other tasks are here,
     so we keep all forever-running tasks together.
     """
     resource = await backbone.wait_for(references.EVENTS)
+    recorder = K8sEventRecorder()
+    workers = [
+        asyncio.create_task(_post_events(
+            event_queue=event_queue,
+            recorder=recorder,
+            resource=resource,
+            settings=settings,
+        ), name=f"poster of events #{index}")
+        for index in range(max(1, settings.posting.workers))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        await aiotasks.stop(workers, title="event posting", quiet=True, logger=logger)
+    raise RuntimeError("Event posting has exited unexpectedly. This is a bug.")
+
+
+async def _post_events(
+        *,
+        event_queue: K8sEventQueue,
+        recorder: "K8sEventRecorder",
+        resource: references.Resource,
+        settings: configuration.OperatorSettings,
+) -> NoReturn:
     while True:
         posted_event = await event_queue.get()
-        await events.post_event(
-            ref=posted_event.ref,
-            type=posted_event.type,
-            reason=posted_event.reason,
-            message=posted_event.message,
+        await recorder.record(posted_event, resource=resource, settings=settings)
+
+
+@dataclasses.dataclass
+class _RecordedEvent:
+    __slots__ = ('name', 'namespace', 'count', 'since')
+    name: str
+    namespace: references.NamespaceName
+    count: int
+    since: float
+
+
+@dataclasses.dataclass
+class _TokenBucket:
+    __slots__ = ('tokens', 'updated')
+    tokens: float
+    updated: float
+
+
+class K8sEventRecorder:
+    """
+    Aggregate the repeated k8s-events and filter out the spam from the objects.
+
+    The same k8s-events (by the object, type, reason, and message) within
+    the aggregation window increase the count of the first posted k8s-event
+    instead of posting a new one every time --- e.g. for a flapping handler
+    logging the same error on every retry.
+
+    Every object has a budget of k8s-events (a token bucket): a burst
+    of them can be posted at once, then the budget is restored slowly.
+    Without a budget, the k8s-events are dropped (both new and repeated).
+
+    Only the most recent objects & k8s-events are remembered to limit the memory.
+
+    The recorder can be used by concurrent workers: the k8s-events of the same
+    object are recorded one by one, so that they are aggregated consistently.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._events: collections.OrderedDict[EventKey, _RecordedEvent] = collections.OrderedDict()
+        self._buckets: collections.OrderedDict[ObjectKey, _TokenBucket] = collections.OrderedDict()
+        self._locks: dict[ObjectKey, tuple[asyncio.Lock, int]] = {}  # with the number of users
+        self._default_namespace: str | None = None  # resolved once on the first need
+
+    async def record(
+            self,
+            event: K8sEvent,
+            *,
+            resource: references.Resource,
+            settings: configuration.OperatorSettings,
+    ) -> None:
+        now = asyncio.get_running_loop().time()
+        ref = event.ref
+        object_key: ObjectKey = (ref.get('apiVersion'), ref.get('kind'), ref.get('namespace'),
+                                 ref.get('name'), ref.get('uid'))
+        event_key: EventKey = (object_key, event.type, event.reason, event.message)
+
+        if not self._consume(object_key, now=now, settings=settings):
+            operator_metrics = telemetry.metrics_var.get(None)
+            if operator_metrics is not None:
+                operator_metrics.events_throttled += 1
+            logger.debug(f"Too many k8s-events for {ref.get('kind')} {ref.get('name')!r}. "
+                         f"Dropping: type={event.type!r}, reason={event.reason!r}, "
+                         f"message={event.message!r}.")
+            return
+
+        # For cluster-scoped objects, the events go to the default namespace of the credentials.
+        if not ref.get('namespace') and self._default_namespace is None:
+            self._default_namespace = (await api.get_default_namespace()) or 'default'
+
+        lock, users = self._locks.get(object_key, (asyncio.Lock(), 0))
+        self._locks[object_key] = (lock, users + 1)
+        try:
+            async with lock:
+                await self._record(event, event_key, now=now, resource=resource, settings=settings)
+        finally:
+            lock, users = self._locks[object_key]
+            if users > 1:
+                self._locks[object_key] = (lock, users - 1)
+            else:
+                del self._locks[object_key]
+
+    async def _record(
+            self,
+            event: K8sEvent,
+            event_key: EventKey,
+            *,
+            now: float,
+            resource: references.Resource,
+            settings: configuration.OperatorSettings,
+    ) -> None:
+        # Increase the count of the same k8s-event if it still exists; post a new one otherwise.
+        window = settings.posting.aggregation_window
+        recorded = self._events.pop(event_key, None)
+        if recorded is not None and window is not None and now - recorded.since < window:
+            recorded.count += 1
+            updated = await events.update_event(
+                name=recorded.name,
+                namespace=recorded.namespace,
+                count=recorded.count,
+                resource=resource,
+                settings=settings,
+                logger=logger,
+            )
+            if updated:
+                self._remember(self._events, event_key, recorded)
+                return
+
+        posted = await events.post_event(
+            ref=event.ref,
+            type=event.type,
+            reason=event.reason,
+            message=event.message,
             resource=resource,
             settings=settings,
             logger=logger,
+            default_namespace=self._default_namespace,
         )
+        name = posted.get('metadata', {}).get('name') if posted is not None else None
+        namespace = posted.get('metadata', {}).get('namespace') if posted is not None else None
+        if window is not None and name and namespace:
+            recorded = _RecordedEvent(name=name, namespace=references.NamespaceName(namespace),
+                                      count=1, since=now)
+            self._remember(self._events, event_key, recorded)
+
+    def _consume(
+            self,
+            key: ObjectKey,
+            *,
+            now: float,
+            settings: configuration.OperatorSettings,
+    ) -> bool:
+        burst = settings.posting.spam_burst
+        if burst is None:
+            return True
+        bucket = self._buckets.pop(key, None) or _TokenBucket(tokens=burst, updated=now)
+        bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * settings.posting.spam_rate)
+        bucket.updated = now
+        self._remember(self._buckets, key, bucket)
+        if bucket.tokens < 1:
+            return False
+        bucket.tokens -= 1
+        return True
+
+    @staticmethod
+    def _remember(cache: "collections.OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+        cache[key] = value  # as the most recent one, since it was popped before
+        while len(cache) > MAX_RECORDED_KEYS:
+            cache.popitem(last=False)
 
 
 class K8sPoster(logging.Handler):
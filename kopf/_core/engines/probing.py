@@ -2,6 +2,8 @@ import asyncio
 import datetime
 import logging
 import urllib.parse
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
 import aiohttp.web
 
@@ -65,6 +67,59 @@ async def health_reporter(
 
         return aiohttp.web.json_response(probing_container)
 
+    await _serve(endpoint, get_health, ready_flag=ready_flag)
+
+
+async def health_aggregator(
+        endpoint: str,
+        *,
+        endpoints: Mapping[str, str],
+        ready_flag: asyncio.Event | None = None,
+) -> None:
+    """
+    Simple HTTP(S)/TCP server to report the health of several operator processes.
+
+    Every request is proxied to the health reporters of all the processes
+    (see :func:`health_reporter`), and their reports are merged into one,
+    keyed by the processes' names. If any of the processes does not respond
+    or responds with an error, the whole operator is reported as unhealthy.
+    """
+
+    async def get_health(
+            request: aiohttp.web.Request,
+    ) -> aiohttp.web.Response:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10.0)) as session:
+            results = await asyncio.gather(*[
+                _probe(session, url) for url in endpoints.values()
+            ], return_exceptions=True)
+
+        healthy = True
+        reports: dict[str, Any] = {}
+        for name, result in zip(endpoints, results):
+            if isinstance(result, Exception):
+                healthy = False
+                reports[name] = {'error': repr(result)}
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                reports[name] = result
+        return aiohttp.web.json_response(reports, status=200 if healthy else 500)
+
+    await _serve(endpoint, get_health, ready_flag=ready_flag)
+
+
+async def _probe(session: aiohttp.ClientSession, url: str) -> Any:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def _serve(
+        endpoint: str,
+        get_health: Callable[[aiohttp.web.Request], Awaitable[aiohttp.web.Response]],
+        *,
+        ready_flag: asyncio.Event | None,
+) -> None:
     parts = urllib.parse.urlsplit(endpoint)
     if parts.scheme == 'http':
         host = parts.hostname or LOCALHOST
@@ -78,17 +133,16 @@ async def health_reporter(
 
     runner = aiohttp.web.AppRunner(app, handle_signals=False, shutdown_timeout=1.0)
     await runner.setup()
+    try:
+        site = aiohttp.web.TCPSite(runner, host, port)
+        await site.start()
 
-    site = aiohttp.web.TCPSite(runner, host, port)
-    await site.start()
-
-    # Log with the actual URL: normalised, with hostname/port set.
-    url = urllib.parse.urlunsplit([parts.scheme, f'{host}:{port}', path, '', ''])
-    logger.debug(f"Serving health status at {url}")
-    if ready_flag is not None:
-        ready_flag.set()
+        # Log with the actual URL: normalised, with hostname/port set.
+        url = urllib.parse.urlunsplit([parts.scheme, f'{host}:{port}', path, '', ''])
+        logger.debug(f"Serving health status at {url}")
+        if ready_flag is not None:
+            ready_flag.set()
 
-    try:
         # Sleep forever. No activity is needed.
         await asyncio.Event().wait()
     finally:
@@ -0,0 +1,125 @@
+"""
+Sharding: splitting the objects among the same-priority operators (members).
+
+Normally, the operators with the same priority are conflicting: all of them
+pause to avoid double-processing (see :mod:`.peering`). In the sharded mode,
+they are members of one deployment instead: every object is handled by one
+and only one live member, as chosen by the rendezvous (highest random weight)
+hashing of the object's uid or namespace against the members' identities.
+
+Every member calculates the same distribution independently, with no extra
+communication besides the regular peering keep-alives. When a member comes
+or goes, only the objects of that member are re-distributed, not all of them.
+
+The objects of other members are still watched and indexed (the indices are
+operator-wide and can be used by the handlers of any objects), but they are
+not handled: no handlers, no daemons or timers, no finalizers, no patches.
+
+When the membership changes, the watch-streams are re-listed, so that
+the members start handling their newly acquired objects, and stop the daemons
+& timers of the objects that are handed over to other members.
+
+WARNING: There are **NO** per-object locks between the members. During
+the re-distribution, the daemons of the handed over objects can overlap
+with the daemons on their new members until they exit on the old members.
+
+The objects of one member (or of a standalone operator) can be further split
+among the operator's processes (``kopf run --processes=N``) the same way,
+but statically: the processes neither come nor go while the operator runs.
+"""
+import asyncio
+import hashlib
+import logging
+from collections.abc import Collection, Mapping
+
+from kopf._cogs.configs import configuration
+from kopf._cogs.structs import bodies, references
+
+logger = logging.getLogger(__name__)
+
+
+class Shards:
+    """
+    The live members of the operator's deployment, as seen in the peerings.
+
+    The members are kept per peering object, i.e. per namespace for
+    the namespaced peering, or under ``None`` for the cluster-wide peering.
+    The objects in namespaces without their own peering (e.g. cluster-scoped
+    objects) are distributed among the members of all known peerings.
+
+    Until the peers are known (or without peering at all), the operator
+    is the only member, and all objects belong to it.
+
+    The ``changed`` condition is notified every time the membership changes,
+    so that the watch-streams could re-list the objects.
+
+    The settings are checked on every call, not on creation, since they can be
+    changed in the startup handlers after the operator's tasks are spawned.
+    """
+
+    def __init__(
+            self,
+            *,
+            identity: str,
+            settings: configuration.OperatorSettings,
+    ) -> None:
+        super().__init__()
+        self.identity = identity
+        self.settings = settings
+        self.changed = asyncio.Condition()
+        self._members: dict[references.Namespace, frozenset[str]] = {}
+
+    @property
+    def members(self) -> Mapping[references.Namespace, Collection[str]]:
+        return dict(self._members)
+
+    async def update(
+            self,
+            namespace: references.Namespace,
+            members: Collection[str],
+    ) -> None:
+        """ Remember the live members of one peering; re-list if changed. """
+        new_members = frozenset(members) | {self.identity}
+        if self._members.get(namespace) != new_members:
+            async with self.changed:
+                self._members[namespace] = new_members
+                if self.settings.peering.sharding is not None:
+                    where = f"in {namespace!r}" if namespace is not None else "cluster-wide"
+                    logger.info(f"Re-sharding {where} among {len(new_members)} members: "
+                                f"{', '.join(sorted(new_members))}.")
+                    self.changed.notify_all()
+
+    def owns(self, body: bodies.Body) -> bool:
+        """ Check if the object belongs to this operator & process among all the members. """
+        namespace = body.metadata.namespace
+        match self.settings.peering.sharding:
+            case 'namespace':
+                key = namespace or ''
+            case _:
+                key = body.metadata.uid or ''
+
+        if self.settings.peering.sharding is not None:
+            members = (self._members[namespace] if namespace in self._members else
+                       self._members[None] if None in self._members else
+                       frozenset().union(*self._members.values()) | {self.identity})
+            if get_owner(key, members) != self.identity:
+                return False
+
+        processes = self.settings.process.processes
+        if processes > 1:
+            process_index = self.settings.process.process_index
+            return get_owner(key, [str(idx) for idx in range(processes)]) == str(process_index)
+
+        return True
+
+
+def get_owner(key: str, members: Collection[str]) -> str:
+    """
+    Choose the member for a key by the rendezvous (highest random weight) hashing.
+
+    Unlike the modulo-hashing, only the keys of the leaving or joining members
+    are re-distributed when the membership changes; the rest stay in place.
+    """
+    def weight(member: str) -> bytes:
+        return hashlib.sha256(f'{member}\0{key}'.encode()).digest()
+    return max(sorted(members), key=weight)
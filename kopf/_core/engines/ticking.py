@@ -0,0 +1,239 @@
+"""
+Batch timers: one invocation of a handler for all its matching objects.
+
+The regular timers are invoked for every individual object. For the periodic
+work, which is cheaper in bulk (e.g. one API call to an external system
+for hundreds of objects), a batch timer is invoked once per interval
+with the last-seen bodies of all the matching objects, as kept in memory.
+
+The bodies are remembered from the watch-events as part of the objects'
+processing (same as indexing), and forgotten when the objects are deleted
+or marked for deletion, or when they stop matching the handler's filters.
+
+The handler returns the results per object (keyed by the objects' uids),
+and/or modifies the per-object patches. Both are delivered to the individual
+objects as with the regular handlers: the results go to ``.status``,
+and the patches are applied --- only to the objects with changes.
+"""
+import asyncio
+import logging
+from collections.abc import Collection, Mapping
+
+from kopf._cogs.aiokits import aiotime, aiotoggles
+from kopf._cogs.configs import configuration
+from kopf._cogs.helpers import typedefs
+from kopf._cogs.structs import bodies, ephemera, ids, patches, references
+from kopf._core.actions import application, execution, lifecycles, loggers, progression
+from kopf._core.intents import causes, handlers, registries
+
+logger = logging.getLogger(__name__)
+
+Key = tuple[references.Resource, str | None, str | None]  # resource, namespace, name
+
+# How many objects are patched at once after a batch invocation (the rest wait for their turn).
+MAX_CONCURRENT_DELIVERIES = 10
+
+
+class OperatorTickers(dict[ids.HandlerId, dict[Key, bodies.RawBody]]):
+    """
+    The last-seen bodies of the matching objects for every batch timer.
+    """
+
+    def ensure(self, __handlers: Collection[handlers.TickingHandler]) -> None:
+        for handler in __handlers:
+            self.setdefault(handler.id, {})
+
+    def replace(self, key: Key, raw_body: bodies.RawBody, handler_ids: Collection[ids.HandlerId]) -> None:
+        for handler_id in handler_ids:
+            self.setdefault(handler_id, {})
+        for handler_id, raw_bodies in self.items():
+            if handler_id in handler_ids:
+                raw_bodies[key] = raw_body
+            else:
+                raw_bodies.pop(key, None)
+
+    def discard(self, key: Key) -> None:
+        for raw_bodies in self.values():
+            raw_bodies.pop(key, None)
+
+
+def tick_resource(
+        *,
+        tickers: OperatorTickers,
+        registry: registries.OperatorRegistry,
+        resource: references.Resource,
+        raw_event: bodies.RawEvent,
+        indices: ephemera.Indices,
+        logger: typedefs.Logger,
+        memo: ephemera.AnyMemo,
+        body: bodies.Body,
+        owned: bool = True,  # False for the objects of other operators (if sharded)
+) -> None:
+    """
+    Remember or forget the object's body for the batch timers.
+
+    Nothing is invoked here except the filters: the batch timers are invoked
+    by their own schedule in :func:`ticker`, not by the objects' events.
+    """
+    key: Key = (resource, body.metadata.namespace, body.metadata.name)
+    if not registry._ticking.has_handlers(resource=resource):
+        pass
+    elif not owned or raw_event['type'] == 'DELETED' or body.metadata.deletion_timestamp is not None:
+        tickers.discard(key)
+    else:
+        cause = causes.IndexingCause(
+            resource=resource,
+            indices=indices,
+            logger=logger,
+            patch=patches.Patch(),  # NB: not applied.
+            memo=memo,
+            body=body,
+        )
+        ticking_handlers = registry._ticking.get_handlers(cause=cause)
+        tickers.replace(key, raw_body=raw_event['object'],
+                        handler_ids={handler.id for handler in ticking_handlers})
+
+
+async def ticker(
+        *,
+        registry: registries.OperatorRegistry,
+        settings: configuration.OperatorSettings,
+        tickers: OperatorTickers,
+        indices: ephemera.Indices,
+        memo: ephemera.AnyMemo,
+        operator_paused: aiotoggles.ToggleSet | None = None,  # None for tests
+) -> None:
+    """
+    Invoke all batch timers of the operator, each by its own schedule.
+    """
+    ticking_handlers = registry._ticking.get_all_handlers()
+    tickers.ensure(ticking_handlers)
+    await asyncio.gather(*[
+        _tick(
+            handler=handler,
+            settings=settings,
+            tickers=tickers,
+            indices=indices,
+            memo=memo,
+            operator_paused=operator_paused,
+        )
+        for handler in ticking_handlers
+    ])
+
+
+async def _tick(
+        *,
+        handler: handlers.TickingHandler,
+        settings: configuration.OperatorSettings,
+        tickers: OperatorTickers,
+        indices: ephemera.Indices,
+        memo: ephemera.AnyMemo,
+        operator_paused: aiotoggles.ToggleSet | None,
+) -> None:
+    """
+    A long-running guarding task for one batch timer (of all matching objects).
+
+    The first invocation happens after the first interval (and the initial
+    delay, if any), so that the objects are listed and remembered by then.
+    The objects are taken as they are at the moment of every invocation;
+    if there are none, the invocation is skipped till the next interval.
+    """
+    state = progression.State.from_scratch().with_handlers([handler])
+    delay = (handler.initial_delay or 0) + handler.interval
+    while True:
+        await aiotime.sleep(delay)
+        delay = handler.interval
+
+        # Do not invoke while the operator is paused (e.g. by the peering) -- as for other handlers.
+        if operator_paused is not None:
+            await operator_paused.wait_for(False)
+
+        # Reset success/failure retry counters & timers if it has succeeded. Keep it if failed.
+        if state.done:
+            state = progression.State.from_scratch().with_handlers([handler])
+
+        raw_bodies = dict(tickers.get(handler.id, {}))
+        if not raw_bodies:
+            continue
+
+        try:
+            outcomes = await _invoke(
+                handler=handler,
+                settings=settings,
+                raw_bodies=raw_bodies,
+                indices=indices,
+                memo=memo,
+                state=state,
+            )
+        except Exception as e:
+            logger.exception(f"{handler} has failed unexpectedly and will be retried: {e!r}")
+        else:
+            state = state.with_outcomes(outcomes)
+
+        # For temporary errors, override the schedule by the one provided by errors themselves.
+        if not state.done:
+            delays = [delay for delay in state.delays if delay is not None]
+            delay = min(delays) if delays else handler.interval
+
+
+async def _invoke(
+        *,
+        handler: handlers.TickingHandler,
+        settings: configuration.OperatorSettings,
+        raw_bodies: Mapping[Key, bodies.RawBody],
+        indices: ephemera.Indices,
+        memo: ephemera.AnyMemo,
+        state: progression.State,
+) -> dict[ids.HandlerId, execution.Outcome]:
+    objects = [(resource, bodies.Body(raw_body)) for (resource, _, _), raw_body in raw_bodies.items()]
+    resources = {resource for resource, _ in objects}
+    patches_ = {body.metadata.uid: patches.Patch(body=body) for _, body in objects}
+    cause = causes.TickingCause(
+        logger=logging.getLogger(f'kopf.ticks.{handler.id}'),
+        indices=indices,
+        memo=memo,
+        resource=next(iter(resources)) if len(resources) == 1 else None,
+        bodies=[body for _, body in objects],
+        patches=patches_,
+    )
+    outcomes = await execution.execute_handlers_once(
+        lifecycle=lifecycles.all_at_once,  # there is only one anyway
+        settings=settings,
+        handlers=[handler],
+        cause=cause,
+        state=state,
+    )
+
+    # The results are per object; anything else is an error of the handler (but not retried).
+    outcome = outcomes.get(handler.id)
+    results: object = outcome.result if outcome is not None and outcome.result is not None else {}
+    if not isinstance(results, Mapping):
+        logger.warning(f"{handler} returned a non-mapping result, which is ignored: {results!r}")
+        results = {}
+
+    # Apply the accumulated changes to every object individually, but only if there are changes.
+    # The failures of some objects (e.g. conflicts) neither affect other objects nor the handler,
+    # which has succeeded anyway, so it is not re-invoked for all objects again.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELIVERIES)
+
+    async def deliver(resource: references.Resource, body: bodies.Body) -> None:
+        object_logger = loggers.LocalObjectLogger(body=body, settings=settings)
+        patch = patches_[body.metadata.uid]
+        result = results.get(body.metadata.uid)
+        if result is not None:
+            outcome = execution.Outcome(final=True, result=result)
+            progression.deliver_results(outcomes={handler.id: outcome}, patch=patch)
+        async with semaphore:
+            try:
+                await application.patch_and_check(
+                    settings=settings,
+                    resource=resource,
+                    logger=object_logger,
+                    patch=patch,
+                    body=body,
+                )
+            except Exception as e:
+                object_logger.exception(f"{handler} could not patch the object: {e!r}")
+
+    await asyncio.gather(*[deliver(resource, body) for resource, body in objects])
+    return outcomes
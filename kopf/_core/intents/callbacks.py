@@ -9,7 +9,7 @@ a corresponding type or class ``kopf.Whatever`` with all the typing tricks
 (unions, optionals, partial ``Any`` values, etc) included.
 """
 import datetime
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from typing import Any, Protocol, TypeVar
 
 from kopf._cogs.configs import configuration
@@ -186,6 +186,19 @@ class TimerFn(Protocol):
     ) -> invocation.SyncOrAsync[object | None]: ...
 
 
+class TickingFn(Protocol):
+    def __call__(
+        self,
+        *,
+        bodies: Collection[bodies.Body],
+        patches: Mapping[str, patches.Patch],
+        logger: typedefs.Logger,
+        memo: Any,
+        param: Any = ...,
+        **kwargs: Any,
+    ) -> invocation.SyncOrAsync[Mapping[str, object] | None]: ...
+
+
 class DelayFn(Protocol):
     def __call__(
         self,
@@ -21,6 +21,7 @@ could execute on the yet-existing object (and its children, if created).
 """
 import dataclasses
 import enum
+from collections.abc import Collection, Mapping
 from typing import Any
 
 from kopf._cogs.configs import configuration
@@ -122,7 +123,7 @@ class ActivityCause(BaseCause):
 
 
 @dataclasses.dataclass
-class ResourceCause(BaseCause):
+class ResourceCause(BaseCause, execution.PatchingCause):
     resource: references.Resource
     patch: patches.Patch
     body: bodies.Body
@@ -170,6 +171,18 @@ class IndexingCause(ResourceCause):
     pass
 
 
+@dataclasses.dataclass
+class TickingCause(BaseCause):
+    """
+    A batch timer is due: all matching objects at once, with a patch for each.
+
+    The patches are keyed by the objects' uids, same as the handlers' results.
+    """
+    resource: references.Resource | None  # None if the objects are of several resources
+    bodies: Collection[bodies.Body]
+    patches: Mapping[str, patches.Patch]
+
+
 @dataclasses.dataclass
 class WatchingCause(ResourceCause):
     """
@@ -2,7 +2,7 @@ import dataclasses
 import warnings
 from collections.abc import Collection
 
-from kopf._cogs.structs import dicts, diffs, references
+from kopf._cogs.structs import dicts, diffs, ids, references
 from kopf._core.actions import execution
 from kopf._core.intents import callbacks, causes, filters
 
@@ -70,6 +70,15 @@ class IndexingHandler(ResourceHandler):
         return f"Indexer {self.id!r}"
 
 
+@dataclasses.dataclass(frozen=True)
+class SubscribingHandler(ResourceHandler):
+    fn: callbacks.IndexingFn  # typing clarification
+    index: ids.HandlerId
+
+    def __str__(self) -> str:
+        return f"Subscription {self.id!r}"
+
+
 @dataclasses.dataclass(frozen=True)
 class WatchingHandler(ResourceHandler):
     fn: callbacks.WatchingFn  # typing clarification
@@ -91,6 +100,7 @@ class ChangingHandler(ResourceHandler):
 class SpawningHandler(ResourceHandler):
     requires_finalizer: bool | None
     initial_delay: float | callbacks.DelayFn | None
+    initial_delay_spread: float | None  # extra per-object delay, evenly spread within this range.
 
 
 @dataclasses.dataclass(frozen=True)
@@ -110,6 +120,17 @@ class TimerHandler(SpawningHandler):
     sharp: bool | None
     idle: float | None
     interval: float | None
+    jitter: float | None  # a random extra delay (up to this) for every interval.
 
     def __str__(self) -> str:
         return f"Timer {self.id!r}"
+
+
+@dataclasses.dataclass(frozen=True)
+class TickingHandler(ResourceHandler):
+    fn: callbacks.TickingFn  # typing clarification
+    interval: float
+    initial_delay: float | None
+
+    def __str__(self) -> str:
+        return f"Batch timer {self.id!r}"
@@ -12,6 +12,7 @@ Both are used in the :mod:`kopf._core.actions.execution` to retrieve the list
 of the handlers to be executed on each reaction cycle.
 """
 import abc
+import dataclasses
 import enum
 import functools
 from collections.abc import Callable, Collection, Container, Iterable, Iterator, Mapping, Sequence
@@ -70,7 +71,51 @@ class ActivityRegistry(GenericRegistry[handlers.ActivityHandler]):
                     yield handler
 
 
+@dataclasses.dataclass(frozen=True)
+class DispatchPlan(Generic[ResourceHandlerT]):
+    """
+    The handlers of a specific resource, pre-filtered by their static criteria.
+
+    The plans are compiled on the first use for every resource and are cached
+    until a new handler is registered. The resource selectors are checked only
+    once when compiled. The dynamic criteria (labels, annotations, field values,
+    callbacks, etc.) are still checked for every cause with the actual bodies.
+    """
+    handlers: Sequence[ResourceHandlerT]
+    extra_fields: frozenset[dicts.FieldPath]
+    finalizing: Sequence[ResourceHandlerT]  # the handlers which might require the finalizer
+
+
 class ResourceRegistry(GenericRegistry[ResourceHandlerT], Generic[ResourceHandlerT, CauseT]):
+    _plans: dict[references.Resource, DispatchPlan[ResourceHandlerT]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._plans = {}
+
+    def append(self, handler: ResourceHandlerT) -> None:
+        super().append(handler)
+        self._plans.clear()
+
+    def get_plan(
+            self,
+            resource: references.Resource,
+    ) -> DispatchPlan[ResourceHandlerT]:
+        try:
+            return self._plans[resource]
+        except KeyError:
+            pass
+        matching_handlers = [handler for handler in self._handlers
+                             if _matches_resource(handler, resource)]
+        plan = DispatchPlan(
+            handlers=matching_handlers,
+            extra_fields=frozenset(handler.field for handler in matching_handlers if handler.field),
+            finalizing=[handler for handler in matching_handlers
+                        if isinstance(handler, (handlers.ChangingHandler, handlers.SpawningHandler))
+                        and handler.requires_finalizer],
+        )
+        self._plans[resource] = plan
+        return plan
 
     def get_all_selectors(self) -> frozenset[references.Selector]:
         return frozenset(
@@ -83,10 +128,7 @@ class ResourceRegistry(GenericRegistry[ResourceHandlerT], Generic[ResourceHandle
             self,
             resource: references.Resource,
     ) -> bool:
-        for handler in self._handlers:
-            if _matches_resource(handler, resource):
-                return True
-        return False
+        return bool(self.get_plan(resource).handlers)
 
     def get_handlers(
             self,
@@ -107,16 +149,15 @@ class ResourceRegistry(GenericRegistry[ResourceHandlerT], Generic[ResourceHandle
             self,
             resource: references.Resource,
     ) -> set[dicts.FieldPath]:
-        return set(self.iter_extra_fields(resource=resource))
+        return set(self.get_plan(resource).extra_fields)
 
     def iter_extra_fields(
             self,
             resource: references.Resource,
     ) -> Iterator[dicts.FieldPath]:
-        for handler in self._handlers:
-            if _matches_resource(handler, resource):
-                if handler.field:
-                    yield handler.field
+        for handler in self.get_plan(resource).handlers:
+            if handler.field:
+                yield handler.field
 
 
 class IndexingRegistry(ResourceRegistry[handlers.IndexingHandler, causes.IndexingCause]):
@@ -126,9 +167,35 @@ class IndexingRegistry(ResourceRegistry[handlers.IndexingHandler, causes.Indexin
             cause: causes.IndexingCause,
             excluded: Container[ids.HandlerId] = frozenset(),
     ) -> Iterator[handlers.IndexingHandler]:
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).handlers:
+            if handler.id not in excluded:
+                if match_planned(handler=handler, cause=cause):
+                    yield handler
+
+
+class SubscribingRegistry(ResourceRegistry[handlers.SubscribingHandler, causes.IndexingCause]):
+
+    def iter_handlers(
+            self,
+            cause: causes.IndexingCause,
+            excluded: Container[ids.HandlerId] = frozenset(),
+    ) -> Iterator[handlers.SubscribingHandler]:
+        for handler in self.get_plan(cause.resource).handlers:
+            if handler.id not in excluded:
+                if match_planned(handler=handler, cause=cause):
+                    yield handler
+
+
+class TickingRegistry(ResourceRegistry[handlers.TickingHandler, causes.IndexingCause]):
+
+    def iter_handlers(
+            self,
+            cause: causes.IndexingCause,
+            excluded: Container[ids.HandlerId] = frozenset(),
+    ) -> Iterator[handlers.TickingHandler]:
+        for handler in self.get_plan(cause.resource).handlers:
             if handler.id not in excluded:
-                if match(handler=handler, cause=cause):
+                if match_planned(handler=handler, cause=cause):
                     yield handler
 
 
@@ -139,9 +206,9 @@ class WatchingRegistry(ResourceRegistry[handlers.WatchingHandler, causes.Watchin
             cause: causes.WatchingCause,
             excluded: Container[ids.HandlerId] = frozenset(),
     ) -> Iterator[handlers.WatchingHandler]:
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).handlers:
             if handler.id not in excluded:
-                if match(handler=handler, cause=cause):
+                if match_planned(handler=handler, cause=cause):
                     yield handler
 
 
@@ -152,9 +219,9 @@ class SpawningRegistry(ResourceRegistry[handlers.SpawningHandler, causes.Spawnin
             cause: causes.SpawningCause,
             excluded: Container[ids.HandlerId] = frozenset(),
     ) -> Iterator[handlers.SpawningHandler]:
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).handlers:
             if handler.id not in excluded:
-                if match(handler=handler, cause=cause):
+                if match_planned(handler=handler, cause=cause):
                     yield handler
 
     def requires_finalizer(
@@ -166,29 +233,52 @@ class SpawningRegistry(ResourceRegistry[handlers.SpawningHandler, causes.Spawnin
         Check whether a finalizer should be added to the given resource or not.
         """
         # check whether the body matches a deletion handler
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).finalizing:
             if handler.id not in excluded:
-                if handler.requires_finalizer and match(handler=handler, cause=cause):
+                if match_planned(handler=handler, cause=cause):
                     return True
         return False
 
 
 class ChangingRegistry(ResourceRegistry[handlers.ChangingHandler, causes.ChangingCause]):
+    _reasoned: dict[tuple[references.Resource, causes.Reason], Sequence[handlers.ChangingHandler]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._reasoned = {}
+
+    def append(self, handler: handlers.ChangingHandler) -> None:
+        super().append(handler)
+        self._reasoned.clear()
+
+    def get_reason_handlers(
+            self,
+            resource: references.Resource,
+            reason: causes.Reason,
+    ) -> Sequence[handlers.ChangingHandler]:
+        """ The handlers of the resource for a specific reason, pre-filtered once and cached. """
+        try:
+            return self._reasoned[resource, reason]
+        except KeyError:
+            pass
+        reason_handlers = [handler for handler in self.get_plan(resource).handlers
+                           if handler.reason is None or handler.reason == reason]
+        self._reasoned[resource, reason] = reason_handlers
+        return reason_handlers
 
     def iter_handlers(
             self,
             cause: causes.ChangingCause,
             excluded: Container[ids.HandlerId] = frozenset(),
     ) -> Iterator[handlers.ChangingHandler]:
-        for handler in self._handlers:
+        for handler in self.get_reason_handlers(cause.resource, cause.reason):
             if handler.id not in excluded:
-                if handler.reason is None or handler.reason == cause.reason:
-                    if handler.initial and not cause.initial:
-                        pass  # skip initial handlers in non-initial causes.
-                    elif handler.initial and cause.deleted and not handler.deleted:
-                        pass  # skip initial handlers on deletion, unless explicitly marked as used.
-                    elif match(handler=handler, cause=cause):
-                        yield handler
+                if handler.initial and not cause.initial:
+                    pass  # skip initial handlers in non-initial causes.
+                elif handler.initial and cause.deleted and not handler.deleted:
+                    pass  # skip initial handlers on deletion, unless explicitly marked as used.
+                elif match_planned(handler=handler, cause=cause):
+                    yield handler
 
     def requires_finalizer(
             self,
@@ -199,9 +289,9 @@ class ChangingRegistry(ResourceRegistry[handlers.ChangingHandler, causes.Changin
         Check whether a finalizer should be added to the given resource or not.
         """
         # check whether the body matches a deletion handler
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).finalizing:
             if handler.id not in excluded:
-                if handler.requires_finalizer and prematch(handler=handler, cause=cause):
+                if prematch_planned(handler=handler, cause=cause):
                     return True
         return False
 
@@ -209,8 +299,8 @@ class ChangingRegistry(ResourceRegistry[handlers.ChangingHandler, causes.Changin
             self,
             cause: causes.ChangingCause,
     ) -> bool:
-        for handler in self._handlers:
-            if prematch(handler=handler, cause=cause):
+        for handler in self.get_plan(cause.resource).handlers:
+            if prematch_planned(handler=handler, cause=cause):
                 return True
         return False
 
@@ -218,11 +308,7 @@ class ChangingRegistry(ResourceRegistry[handlers.ChangingHandler, causes.Changin
             self,
             resource: references.Resource,
     ) -> Sequence[handlers.ChangingHandler]:
-        found_handlers: list[handlers.ChangingHandler] = []
-        for handler in self._handlers:
-            if _matches_resource(handler, resource):
-                found_handlers.append(handler)
-        return list(_deduplicated(found_handlers))
+        return list(_deduplicated(self.get_plan(resource).handlers))
 
 
 class WebhooksRegistry(ResourceRegistry[handlers.WebhookHandler, causes.WebhookCause]):
@@ -232,7 +318,7 @@ class WebhooksRegistry(ResourceRegistry[handlers.WebhookHandler, causes.WebhookC
             cause: causes.WebhookCause,
             excluded: Container[ids.HandlerId] = frozenset(),
     ) -> Iterator[handlers.WebhookHandler]:
-        for handler in self._handlers:
+        for handler in self.get_plan(cause.resource).handlers:
             if handler.id not in excluded:
                 # Only the handlers for the hinted webhook, if possible; if not hinted, then all.
                 matching_reason = cause.reason is None or cause.reason == handler.reason
@@ -244,7 +330,7 @@ class WebhooksRegistry(ResourceRegistry[handlers.WebhookHandler, causes.WebhookC
                     explicitly_for_deletion = set(handler.operations or []) == {'DELETE'}
                     if non_mutating or non_deletion or explicitly_for_deletion:
                         # Filter by usual criteria: labels, annotations, fields, callbacks.
-                        if match(handler=handler, cause=cause):
+                        if match_planned(handler=handler, cause=cause):
                             yield handler
 
 
@@ -259,6 +345,8 @@ class OperatorRegistry:
         super().__init__()
         self._activities = ActivityRegistry()
         self._indexing = IndexingRegistry()
+        self._subscribing = SubscribingRegistry()
+        self._ticking = TickingRegistry()
         self._watching = WatchingRegistry()
         self._spawning = SpawningRegistry()
         self._changing = ChangingRegistry()
@@ -395,10 +483,20 @@ def prematch(
         handler: handlers.ResourceHandler,
         cause: causes.ResourceCause,
 ) -> bool:
+    return (
+        _matches_resource(handler, cause.resource) and
+        prematch_planned(handler, cause)
+    )
+
+
+def prematch_planned(
+        handler: handlers.ResourceHandler,
+        cause: causes.ResourceCause,
+) -> bool:
+    """ Same as :func:`prematch`, but for the handlers already filtered by resource. """
     # Kwargs are lazily evaluated on the first _actual_ use, and shared for all filters since then.
     kwargs: dict[str, Any] = {}
     return (
-        _matches_resource(handler, cause.resource) and
         _matches_subresource(handler, cause) and
         _matches_labels(handler, cause, kwargs) and
         _matches_annotations(handler, cause, kwargs) and
@@ -411,10 +509,20 @@ def match(
         handler: handlers.ResourceHandler,
         cause: causes.ResourceCause,
 ) -> bool:
+    return (
+        _matches_resource(handler, cause.resource) and
+        match_planned(handler, cause)
+    )
+
+
+def match_planned(
+        handler: handlers.ResourceHandler,
+        cause: causes.ResourceCause,
+) -> bool:
+    """ Same as :func:`match`, but for the handlers already filtered by resource. """
     # Kwargs are lazily evaluated on the first _actual_ use, and shared for all filters since then.
     kwargs: dict[str, Any] = {}
     return (
-        _matches_resource(handler, cause.resource) and
         _matches_subresource(handler, cause) and
         _matches_labels(handler, cause, kwargs) and
         _matches_annotations(handler, cause, kwargs) and
@@ -21,6 +21,7 @@ class DaemonStoppingReason(enum.Flag):
     RESOURCE_DELETED = enum.auto()  # the resource was deleted, the asyncio task is still awaited.
     OPERATOR_PAUSING = enum.auto()  # the operator is pausing, the asyncio task is still awaited.
     OPERATOR_EXITING = enum.auto()  # the operator is exiting, the asyncio task is still awaited.
+    OPERATOR_RESHARDING = enum.auto()  # the resource is handed over to another operator (sharding).
     DAEMON_SIGNALLED = enum.auto()  # the stopper flag was set, the asyncio task is still awaited.
     DAEMON_CANCELLED = enum.auto()  # the asyncio task was cancelled, the thread can be running.
     DAEMON_ABANDONED = enum.auto()  # we gave up on the asyncio task, the thread can be running.
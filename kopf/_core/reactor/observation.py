@@ -101,6 +101,7 @@ async def resource_observer(
     all_handlers: list[handlers.ResourceHandler] = []
     all_handlers.extend(registry._webhooks.get_all_handlers())
     all_handlers.extend(registry._indexing.get_all_handlers())
+    all_handlers.extend(registry._ticking.get_all_handlers())
     all_handlers.extend(registry._watching.get_all_handlers())
     all_handlers.extend(registry._spawning.get_all_handlers())
     all_handlers.extend(registry._changing.get_all_handlers())
@@ -224,11 +225,13 @@ def revise_resources(
     indexed_selectors = registry._indexing.get_all_selectors()
     watched_selectors = (
         registry._indexing.get_all_selectors() |
+        registry._ticking.get_all_selectors() |
         registry._watching.get_all_selectors() |
         registry._spawning.get_all_selectors() |
         registry._changing.get_all_selectors()
     )
     patched_selectors = (
+        registry._ticking.get_all_selectors() |
         registry._spawning.get_all_selectors() |
         registry._changing.get_all_selectors()
     )
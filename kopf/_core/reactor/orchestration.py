@@ -27,13 +27,13 @@ import dataclasses
 import functools
 import itertools
 import logging
-from collections.abc import Collection, Container, Iterable
+from collections.abc import Awaitable, Callable, Collection, Container, Iterable
 from typing import Any, NamedTuple, Protocol
 
 from kopf._cogs.aiokits import aiotasks, aiotoggles
 from kopf._cogs.configs import configuration
 from kopf._cogs.structs import bodies, references
-from kopf._core.engines import peering
+from kopf._core.engines import indexing, peering, sharding
 from kopf._core.reactor import queueing
 
 logger = logging.getLogger(__name__)
@@ -71,6 +71,12 @@ class Ensemble:
     peering_missing: aiotoggles.Toggle
     conflicts_found: dict[EnsembleKey, aiotoggles.Toggle] = dataclasses.field(default_factory=dict)
 
+    # Replaying the objects on index changes (if any are subscribed); the queues are per-watcher.
+    subscriptions: indexing.OperatorSubscriptions | None = None
+
+    # Splitting the objects among the same-priority operators (if sharded); re-listing on changes.
+    shards: sharding.Shards | None = None
+
     # Multidimensional tasks -- one for every combination of relevant dimensions.
     watcher_tasks: dict[EnsembleKey, aiotasks.Task] = dataclasses.field(default_factory=dict)
     peering_tasks: dict[EnsembleKey, aiotasks.Task] = dataclasses.field(default_factory=dict)
@@ -100,6 +106,10 @@ class Ensemble:
             for key in set(d):
                 if key in keys:
                     del d[key]
+        if self.subscriptions is not None:
+            for dkey in set(self.subscriptions.queues):
+                if dkey in keys:
+                    del self.subscriptions.queues[dkey]
 
 
 async def orchestrator(
@@ -109,12 +119,16 @@ async def orchestrator(
         identity: peering.Identity,
         insights: references.Insights,
         operator_paused: aiotoggles.ToggleSet,
+        subscriptions: indexing.OperatorSubscriptions | None = None,
+        shards: sharding.Shards | None = None,
 ) -> None:
     peering_missing = await operator_paused.make_toggle(name='peering CRD is missing')
     ensemble = Ensemble(
         peering_missing=peering_missing,
         operator_paused=operator_paused,
         operator_indexed=aiotoggles.ToggleSet(all),
+        subscriptions=subscriptions,
+        shards=shards,
     )
     try:
         async with insights.revised:
@@ -195,29 +209,50 @@ async def spawn_missing_peerings(
         ensemble: Ensemble,
 ) -> None:
     for resource, namespace in itertools.product(resources, namespaces):
-        namespace = namespace if resource.namespaced else None
+        namespace = namespace if resource.namespaced and settings.peering.namespaced else None
         dkey = EnsembleKey(resource=resource, namespace=namespace)
         if dkey not in ensemble.peering_tasks:
+
+            # One cluster-level peering governs all served namespaces, which are then reported
+            # to and compared with other operators (the live set: to see the namespaces changing).
+            served_namespaces = namespaces if namespace is None else None
             what = f"{settings.peering.name}@{namespace}"
             is_preactivated = settings.peering.mandatory
             conflicts_found = await ensemble.operator_paused.make_toggle(is_preactivated, name=what)
             ensemble.conflicts_found[dkey] = conflicts_found
-            ensemble.pinging_tasks[dkey] = aiotasks.create_guarded_task(
-                name=f"peering keep-alive for {what}", logger=logger, cancellable=True,
-                coro=peering.keepalive(
-                    namespace=namespace,
-                    resource=resource,
-                    settings=settings,
-                    identity=identity))
+
+            # The leases are always namespaced, even for the cluster-wide peering (unlike the CRDs).
+            location = await peering.locate(settings=settings, resource=resource, namespace=namespace)
+            processor: Callable[..., Awaitable[None]]
+            if references.LEASES.check(resource):
+                processor = functools.partial(peering.process_lease_event, leases={})
+            else:
+                processor = peering.process_peering_event
+
+            # All processes of `kopf run --processes=N` are one peer with one identity (and lease),
+            # so only the 1st process reports it; other processes only observe the peers.
+            pinging = settings.process.process_index == 0
+            if pinging:
+                ensemble.pinging_tasks[dkey] = aiotasks.create_guarded_task(
+                    name=f"peering keep-alive for {what}", logger=logger, cancellable=True,
+                    coro=peering.keepalive(
+                        namespace=location,
+                        resource=resource,
+                        settings=settings,
+                        identity=identity,
+                        namespaces=served_namespaces))
             ensemble.peering_tasks[dkey] = aiotasks.create_guarded_task(
                 name=f"peering observer for {what}", logger=logger, cancellable=True,
                 coro=queueing.watcher(
                     settings=settings,
                     resource=resource,
-                    namespace=namespace,
-                    processor=functools.partial(peering.process_peering_event,
+                    namespace=location,
+                    processor=functools.partial(processor,
+                                                autoclean=pinging,
                                                 conflicts_found=conflicts_found,
-                                                namespace=namespace,
+                                                shards=ensemble.shards,
+                                                namespaces=served_namespaces,
+                                                namespace=location,
                                                 resource=resource,
                                                 settings=settings,
                                                 identity=identity)))
@@ -249,12 +284,17 @@ async def spawn_missing_watchers(
             resource_indexed: aiotoggles.Toggle | None = None
             if resource in indexed_resources:
                 resource_indexed = await ensemble.operator_indexed.make_toggle(name=what)
+            replays: queueing.ReplayQueue | None = None
+            if ensemble.subscriptions is not None:
+                replays = ensemble.subscriptions.queues[dkey] = asyncio.Queue()
             ensemble.watcher_tasks[dkey] = aiotasks.create_guarded_task(
                 name=f"watcher for {what}", logger=logger, cancellable=True,
                 coro=queueing.watcher(
                     operator_paused=ensemble.operator_paused,
                     operator_indexed=ensemble.operator_indexed,
                     resource_indexed=resource_indexed,
+                    replays=replays,
+                    relisting=ensemble.shards.changed if ensemble.shards is not None else None,
                     settings=settings,
                     resource=resource,
                     namespace=namespace,
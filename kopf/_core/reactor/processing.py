@@ -15,6 +15,7 @@ and therefore do not trigger the user-defined handlers.
 """
 import asyncio
 import contextlib
+import copy
 import functools
 from collections.abc import Collection
 from typing import NamedTuple
@@ -23,8 +24,8 @@ from kopf._cogs.aiokits import aiotime, aiotoggles
 from kopf._cogs.configs import configuration
 from kopf._cogs.structs import bodies, diffs, ephemera, finalizers, patches, references
 from kopf._core.actions import application, execution, lifecycles, loggers, progression, throttlers
-from kopf._core.engines import daemons, indexing, posting
-from kopf._core.intents import causes, registries
+from kopf._core.engines import daemons, indexing, posting, sharding, ticking
+from kopf._core.intents import causes, registries, stoppers
 from kopf._core.reactor import inventory, subhandling
 
 
@@ -40,6 +41,9 @@ async def process_resource_event(
         event_queue: posting.K8sEventQueue,
         stream_pressure: asyncio.Event | None = None,  # None for tests
         operator_paused: aiotoggles.ToggleSet | None = None,  # None for tests & observation
+        timers: daemons.TimerEngine | None = None,  # None for tests & observation
+        tickers: ticking.OperatorTickers | None = None,  # None for tests & observation
+        shards: sharding.Shards | None = None,  # None for tests & unsharded operators
         resource_indexed: aiotoggles.Toggle | None = None,  # None for tests & observation
         operator_indexed: aiotoggles.ToggleSet | None = None,  # None for tests & observation
         consistency_time: float | None = None,  # None for tests
@@ -52,6 +56,20 @@ async def process_resource_event(
     to the high-level causes, and then call the cause-handling logic.
     """
 
+    # Index-only resources need none of the heavy machinery below: memories, patches, causes.
+    if settings.indexing.lean_processing and _is_index_only(registry=registry, resource=resource):
+        await process_indexing_event(
+            registry=registry,
+            settings=settings,
+            indexers=indexers,
+            memobase=memobase,
+            resource=resource,
+            raw_event=raw_event,
+            resource_indexed=resource_indexed,
+            operator_indexed=operator_indexed,
+        )
+        return None
+
     # Recall what is stored about that object. Share it in little portions with the consumers.
     # And immediately forget it if the object is deleted from the cluster (but keep in memory).
     raw_type, raw_body = raw_event['type'], raw_event['object']
@@ -104,12 +122,59 @@ async def process_resource_event(
                 memory=memory.indexing_memory,
                 logger=terse_logger,
             )
+            await indexing.subscribe_resource(
+                registry=registry,
+                indexers=indexers,
+                settings=settings,
+                resource=resource,
+                raw_event=raw_event,
+                body=body,
+                memo=memory.memo,
+                logger=terse_logger,
+            )
+
+            # The objects of other operators (if sharded) are indexed as usual, but never handled.
+            owned = shards is None or shards.owns(body)
+            if tickers is not None:
+                ticking.tick_resource(
+                    registry=registry,
+                    tickers=tickers,
+                    resource=resource,
+                    raw_event=raw_event,
+                    indices=indexers.indices,
+                    body=body,
+                    memo=memory.memo,
+                    logger=terse_logger,
+                    owned=owned,
+                )
 
             # Wait for all other individual resources and all other resource kinds' lists to finish.
             if operator_indexed is not None and resource_indexed is not None:
                 await operator_indexed.drop_toggle(resource_indexed)
             if operator_indexed is not None:
                 await operator_indexed.wait_for(True)  # other resource kinds & objects.
+                indexers.purge()  # the objects restored from a snapshot but not listed anymore.
+
+            # In the hot-standby mode, only keep the indices warm; handle it later when resumed.
+            if settings.peering.standby and operator_paused is not None and operator_paused.is_on():
+                return None
+
+            # Hand the object over to its new owner (if re-sharded) without touching it:
+            # the old owner's patches would only interfere with the new owner's handling.
+            # The stopping daemons are re-checked locally, or on the next event if it comes earlier.
+            if not owned:
+                delays = await daemons.stop_daemons(
+                    settings=settings,
+                    daemons=memory.daemons_memory.running_daemons,
+                    reason=stoppers.DaemonStoppingReason.OPERATOR_RESHARDING,
+                )
+                while delays and await aiotime.sleep(delays, wakeup=stream_pressure) is None:
+                    delays = await daemons.stop_daemons(
+                        settings=settings,
+                        daemons=memory.daemons_memory.running_daemons,
+                        reason=stoppers.DaemonStoppingReason.OPERATOR_RESHARDING,
+                    )
+                return None
 
             # Do the magic -- do the job.
             delays, matched = await process_resource_causes(
@@ -126,6 +191,7 @@ async def process_resource_event(
                 event_logger=event_logger,
                 stream_pressure=stream_pressure,
                 operator_paused=operator_paused,
+                timers=timers,
                 consistency_time=consistency_time,
             )
 
@@ -149,6 +215,59 @@ async def process_resource_event(
     return None
 
 
+async def process_indexing_event(
+        indexers: indexing.OperatorIndexers,
+        registry: registries.OperatorRegistry,
+        settings: configuration.OperatorSettings,
+        memobase: ephemera.AnyMemo,
+        resource: references.Resource,
+        raw_event: bodies.RawEvent,
+        resource_indexed: aiotoggles.Toggle | None = None,  # None for tests & observation
+        operator_indexed: aiotoggles.ToggleSet | None = None,  # None for tests & observation
+) -> None:
+    """
+    Handle a single low-level watch-event of a resource with only indexing handlers.
+
+    Only the indices are populated, nothing else is done: there are no causes
+    to detect, no handlers to call, and no patches to apply. So, no per-object
+    memories are kept either, except for the indexing failures (for retries).
+    """
+    body = bodies.Body(raw_event['object'])
+    key = indexers.make_key(body)
+    memory = indexers.memories.pop(key, None) or indexing.IndexingMemory()
+    await indexing.index_resource(
+        registry=registry,
+        indexers=indexers,
+        settings=settings,
+        resource=resource,
+        raw_event=raw_event,
+        body=body,
+        memo=copy.copy(memobase),
+        memory=memory,
+        logger=loggers.TerseObjectLogger(body=body, settings=settings),
+    )
+    if memory.indexing_state is not None and raw_event['type'] != 'DELETED':
+        indexers.memories[key] = memory
+
+    # Unblock the operator's readiness, but do not wait for it: nothing else to do here.
+    if operator_indexed is not None and resource_indexed is not None:
+        await operator_indexed.drop_toggle(resource_indexed)
+    if operator_indexed is not None and operator_indexed.is_on():
+        indexers.purge()  # the objects restored from a snapshot but not listed anymore.
+
+
+def _is_index_only(
+        registry: registries.OperatorRegistry,
+        resource: references.Resource,
+) -> bool:
+    return (registry._indexing.has_handlers(resource=resource) and
+            not registry._subscribing.has_handlers(resource=resource) and
+            not registry._ticking.has_handlers(resource=resource) and
+            not registry._watching.has_handlers(resource=resource) and
+            not registry._spawning.has_handlers(resource=resource) and
+            not registry._changing.has_handlers(resource=resource))
+
+
 class _Causes(NamedTuple):
     watching_cause: causes.WatchingCause | None
     spawning_cause: causes.SpawningCause | None
@@ -233,6 +352,7 @@ async def process_resource_causes(
         event_logger: loggers.ObjectLogger,
         stream_pressure: asyncio.Event | None,  # None for tests
         operator_paused: aiotoggles.ToggleSet | None,  # None for tests
+        timers: daemons.TimerEngine | None,  # None for tests
         consistency_time: float | None,
 ) -> tuple[Collection[float], bool]:
     patch_initially_empty = not patch  # before we add new things in low-level handlers
@@ -270,6 +390,7 @@ async def process_resource_causes(
             memory=memory,
             cause=spawning_cause,
             operator_paused=operator_paused,
+            timers=timers,
         )
 
     # If there are any handlers for this resource kind in general, but not for this specific object
@@ -383,6 +504,7 @@ async def process_spawning_cause(
         memory: inventory.ResourceMemory,
         cause: causes.SpawningCause,
         operator_paused: aiotoggles.ToggleSet | None,  # None for tests
+        timers: daemons.TimerEngine | None = None,  # None for tests
 ) -> Collection[float]:
     """
     Spawn/kill all the background tasks of a resource.
@@ -422,6 +544,7 @@ async def process_spawning_cause(
             cause=cause,
             memory=memory.daemons_memory,
             handlers=handlers,
+            timers=timers,
         )
         matching_delays = await daemons.match_daemons(
             settings=settings,
@@ -57,8 +57,10 @@ class EOS(enum.Enum):
 
 if TYPE_CHECKING:
     WatchEventQueue = asyncio.Queue[bodies.RawEvent | EOS]
+    ReplayQueue = asyncio.Queue[bodies.RawEvent]
 else:
     WatchEventQueue = asyncio.Queue
+    ReplayQueue = asyncio.Queue
 
 
 class Stream(NamedTuple):
@@ -134,6 +136,8 @@ async def watcher(
         operator_paused: aiotoggles.ToggleSet | None = None,  # None for tests & observation
         operator_indexed: aiotoggles.ToggleSet | None = None,  # None for tests & observation
         resource_indexed: aiotoggles.Toggle | None = None,  # None for tests & non-indexable
+        replays: ReplayQueue | None = None,  # None for tests & non-subscribable
+        relisting: asyncio.Condition | None = None,  # None for tests & unsharded operators
 ) -> None:
     """
     Watch for the resource events via the API, and spawn the workers per object.
@@ -153,6 +157,10 @@ async def watcher(
     The only valid way for a worker to wake up the watcher is to cancel it:
     this will terminate any i/o operation with ``asyncio.CancelledError``, where
     we can make a decision on whether it was a real cancellation, or our own.
+
+    In the hot-standby mode (``settings.peering.standby``), the watch-stream
+    is not closed when the operator is paused. Instead, the latest states
+    of the objects are remembered and re-processed when the operator resumes.
     """
 
     # In case of a failed worker, stop the watcher, and escalate to the operator to stop it.
@@ -172,13 +180,85 @@ async def watcher(
                                    exception_handler=exception_handler)
     streams: dict[ObjectRef, Stream] = {}
 
+    # Either use the existing object's queue, or create a new one together with the per-object job.
+    # "Fire-and-forget": we do not wait for the result; the job destroys itself when it is fully done.
+    async def multiplex(raw_event: bodies.RawEvent) -> None:
+        nonlocal operator_indexed
+
+        # Multiplex the raw events to per-resource workers/queues. Start the new ones if needed.
+        key: ObjectRef = (resource, get_uid(raw_event))
+        try:
+            # Feed the worker, as fast as possible, no extra activities.
+            streams[key].pressure.set()  # interrupt current sleeps, if any.
+            await streams[key].backlog.put(raw_event)
+        except KeyError:
+
+            # Block the operator's readiness for individual resource's index handlers.
+            # But NOT when the readiness is already achieved once! After that, ignore it.
+            # NB: Strictly before the worker starts -- the processor can be too slow, too late.
+            resource_object_indexed: aiotoggles.Toggle | None = None
+            if operator_indexed is not None and operator_indexed.is_on():
+                operator_indexed = None
+            if operator_indexed is not None and resource_indexed is not None:
+                resource_object_indexed = await operator_indexed.make_toggle(name=f"{key!r}")
+
+            # Start the worker, and feed it initially. Starting can be moderately slow.
+            streams[key] = Stream(backlog=asyncio.Queue(), pressure=asyncio.Event())
+            streams[key].pressure.set()  # interrupt current sleeps, if any.
+            await streams[key].backlog.put(raw_event)
+            await scheduler.spawn(
+                name=f'worker for {key}',
+                coro=worker(
+                    signaller=signaller,
+                    resource_indexed=resource_object_indexed,
+                    operator_indexed=operator_indexed,
+                    processor=processor,
+                    settings=settings,
+                    streams=streams,
+                    key=key,
+                ))
+
+    # The replayed objects go to the same queues/workers as the watch-events, so they are serialised.
+    # An object with other events already queued is not replayed: it will be processed anyway.
+    async def replay(replays: ReplayQueue) -> None:
+        try:
+            while True:
+                raw_event = await replays.get()
+                key: ObjectRef = (resource, get_uid(raw_event))
+                async with multiplexing:
+                    if key not in streams or streams[key].backlog.empty():
+                        await multiplex(raw_event)
+        except Exception as e:
+            exception_handler(e)
+
+    # In the hot-standby mode, re-process all the latest known objects when resumed (taking over).
+    # The objects with other events already queued are not re-processed: they will be anyway.
+    async def resume(operator_paused: aiotoggles.ToggleSet) -> None:
+        try:
+            while True:
+                await operator_paused.wait_for(True)
+                await operator_paused.wait_for(False)
+                async with multiplexing:
+                    for uid, raw_body in list(latest.items()):
+                        key: ObjectRef = (resource, uid)
+                        if key not in streams or streams[key].backlog.empty():
+                            await multiplex({'type': None, 'object': raw_body})
+        except Exception as e:
+            exception_handler(e)
+
+    standby = settings.peering.standby and operator_paused is not None
+    latest: dict[ObjectUid, bodies.RawBody] = {}  # only in the hot-standby mode
+    listed: set[ObjectUid] = set()  # only in the hot-standby mode
+
+    multiplexing = asyncio.Lock()
+    replayer = asyncio.create_task(replay(replays)) if replays is not None else None
+    resumer = asyncio.create_task(resume(operator_paused)) if standby and operator_paused is not None else None
     try:
-        # Either use the existing object's queue, or create a new one together with the per-object job.
-        # "Fire-and-forget": we do not wait for the result; the job destroys itself when it is fully done.
         stream = watching.infinite_watch(
             settings=settings,
             resource=resource, namespace=namespace,
-            operator_paused=operator_paused,
+            operator_paused=None if standby else operator_paused,
+            relisting=relisting,
         )
         async for raw_event in stream:
 
@@ -188,6 +268,12 @@ async def watcher(
                 if operator_indexed is not None and resource_indexed is not None:
                     await operator_indexed.drop_toggle(resource_indexed)
 
+                # Forget the objects deleted while the watch-stream was disconnected (not re-listed).
+                if standby:
+                    for uid in set(latest) - listed:
+                        del latest[uid]
+                    listed.clear()
+
             # Whatever is bookmarked there, don't let it go to the multiplexer. Handle it above.
             if isinstance(raw_event, watching.Bookmark):
                 continue
@@ -197,38 +283,18 @@ async def watcher(
             if raw_event.get('type') == 'BOOKMARK':
                 continue
 
-            # Multiplex the raw events to per-resource workers/queues. Start the new ones if needed.
-            key: ObjectRef = (resource, get_uid(raw_event))
-            try:
-                # Feed the worker, as fast as possible, no extra activities.
-                streams[key].pressure.set()  # interrupt current sleeps, if any.
-                await streams[key].backlog.put(raw_event)
-            except KeyError:
-
-                # Block the operator's readiness for individual resource's index handlers.
-                # But NOT when the readiness is already achieved once! After that, ignore it.
-                # NB: Strictly before the worker starts -- the processor can be too slow, too late.
-                resource_object_indexed: aiotoggles.Toggle | None = None
-                if operator_indexed is not None and operator_indexed.is_on():
-                    operator_indexed = None
-                if operator_indexed is not None and resource_indexed is not None:
-                    resource_object_indexed = await operator_indexed.make_toggle(name=f"{key!r}")
-
-                # Start the worker, and feed it initially. Starting can be moderately slow.
-                streams[key] = Stream(backlog=asyncio.Queue(), pressure=asyncio.Event())
-                streams[key].pressure.set()  # interrupt current sleeps, if any.
-                await streams[key].backlog.put(raw_event)
-                await scheduler.spawn(
-                    name=f'worker for {key}',
-                    coro=worker(
-                        signaller=signaller,
-                        resource_indexed=resource_object_indexed,
-                        operator_indexed=operator_indexed,
-                        processor=processor,
-                        settings=settings,
-                        streams=streams,
-                        key=key,
-                    ))
+            # Remember the latest states of the objects to re-process them on resuming (if standby).
+            if standby:
+                uid = get_uid(raw_event)
+                if raw_event['type'] == 'DELETED':
+                    latest.pop(uid, None)
+                else:
+                    latest[uid] = raw_event['object']
+                if raw_event['type'] is None:
+                    listed.add(uid)
+
+            async with multiplexing:
+                await multiplex(raw_event)
 
     except asyncio.CancelledError:
         if worker_error is None:
@@ -238,6 +304,13 @@ async def watcher(
                                "This seems to be a framework bug. "
                                "The operator will stop to prevent damage.") from worker_error
     finally:
+        # Stop replaying the objects first, so that no new workers are spawned while depleting.
+        for replaying_task in [replayer, resumer]:
+            if replaying_task is not None:
+                replaying_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await asyncio.shield(replaying_task)
+
         # Allow the existing workers to finish gracefully before killing them.
         # Ensure the depletion is done even if the watcher is double-cancelled (e.g. in tests).
         depletion_task = asyncio.create_task(_wait_for_depletion(
@@ -2,17 +2,19 @@ import asyncio
 import functools
 import logging
 import signal
+import sys
 import threading
 import warnings
-from collections.abc import Collection, Coroutine, MutableSequence, Sequence
+from collections.abc import Callable, Collection, Coroutine, MutableSequence, Sequence
 
 from kopf._cogs.aiokits import aioadapters, aiobindings, aiotasks, aiotoggles, aiovalues
 from kopf._cogs.clients import auth
 from kopf._cogs.configs import configuration
 from kopf._cogs.helpers import versions
-from kopf._cogs.structs import credentials, ephemera, references, reviews
+from kopf._cogs.structs import credentials, ephemera, references, reviews, telemetry
 from kopf._core.actions import execution, lifecycles
-from kopf._core.engines import activities, admission, daemons, indexing, peering, posting, probing
+from kopf._core.engines import activities, admission, daemons, indexing, \
+                               peering, posting, probing, sharding, ticking
 from kopf._core.intents import causes, registries
 from kopf._core.reactor import inventory, observation, orchestration, processing
 
@@ -22,12 +24,14 @@ logger = logging.getLogger(__name__)
 def run(
         *,
         loop: asyncio.AbstractEventLoop | None = None,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
         lifecycle: execution.LifeCycleFn | None = None,
         indexers: indexing.OperatorIndexers | None = None,
         registry: registries.OperatorRegistry | None = None,
         settings: configuration.OperatorSettings | None = None,
         memories: inventory.ResourceMemories | None = None,
         insights: references.Insights | None = None,
+        metrics: telemetry.OperatorMetrics | None = None,
         identity: peering.Identity | None = None,
         standalone: bool | None = None,
         priority: int | None = None,
@@ -49,10 +53,16 @@ def run(
     of the current _context_ (by asyncio's default, the current thread).
     See: https://docs.python.org/3/library/asyncio-policy.html for details.
 
+    If the loop factory is specified (e.g. ``uvloop.new_event_loop``),
+    the operator runs in a new event loop made by it, which is closed after.
+
     Alternatively, use ``asyncio.run(kopf.operator(...))`` with the same args.
     It will take care of a new event loop's creation and finalization for this
     call. See: :func:`asyncio.run`.
     """
+    if loop is not None and loop_factory is not None:
+        raise TypeError("Either the loop or the loop factory can be passed, not both.")
+
     coro = operator(
         lifecycle=lifecycle,
         indexers=indexers,
@@ -60,6 +70,7 @@ def run(
         settings=settings,
         memories=memories,
         insights=insights,
+        metrics=metrics,
         identity=identity,
         standalone=standalone,
         clusterwide=clusterwide,
@@ -77,8 +88,18 @@ def run(
     try:
         if loop is not None:
             loop.run_until_complete(coro)
-        else:
+        elif loop_factory is None:
             asyncio.run(coro)
+        elif sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(coro)
+        else:  # Python 3.10 has no runners, so do the same manually.
+            own_loop = loop_factory()
+            try:
+                own_loop.run_until_complete(coro)
+            finally:
+                own_loop.run_until_complete(own_loop.shutdown_asyncgens())
+                own_loop.close()
     except asyncio.CancelledError:
         pass
 
@@ -91,6 +112,7 @@ async def operator(
         settings: configuration.OperatorSettings | None = None,
         memories: inventory.ResourceMemories | None = None,
         insights: references.Insights | None = None,
+        metrics: telemetry.OperatorMetrics | None = None,
         identity: peering.Identity | None = None,
         standalone: bool | None = None,
         priority: int | None = None,
@@ -121,6 +143,7 @@ async def operator(
         settings=settings,
         memories=memories,
         insights=insights,
+        metrics=metrics,
         identity=identity,
         standalone=standalone,
         clusterwide=clusterwide,
@@ -146,6 +169,7 @@ async def spawn_tasks(
         settings: configuration.OperatorSettings | None = None,
         memories: inventory.ResourceMemories | None = None,
         insights: references.Insights | None = None,
+        metrics: telemetry.OperatorMetrics | None = None,
         identity: peering.Identity | None = None,
         standalone: bool | None = None,
         priority: int | None = None,
@@ -187,12 +211,15 @@ async def spawn_tasks(
     settings = settings if settings is not None else configuration.OperatorSettings()
     memories = memories if memories is not None else inventory.ResourceMemories()
     indexers = indexers if indexers is not None else indexing.OperatorIndexers()
+    timers = daemons.TimerEngine()
+    tickers = ticking.OperatorTickers()
     insights = insights if insights is not None else references.Insights()
+    metrics = metrics if metrics is not None else telemetry.OperatorMetrics()
     identity = identity if identity is not None else peering.detect_own_id(manual=False)
     vault = vault if vault is not None else credentials.Vault()
     memo = memo if memo is not None else ephemera.Memo()
     memo = ephemera.AnyMemo(memo)
-    event_queue: posting.K8sEventQueue = asyncio.Queue()
+    event_queue = posting.K8sEventQueue(settings=settings, metrics=metrics)
     signal_flag: aiotasks.Future = asyncio.Future()
     started_flag: asyncio.Event = asyncio.Event()
     operator_paused = aiotoggles.ToggleSet(any)
@@ -209,12 +236,21 @@ async def spawn_tasks(
     if priority is not None:
         settings.peering.priority = priority
 
+    # Split the objects among the same-priority operators and/or processes (if sharded).
+    shards = sharding.Shards(identity=identity, settings=settings)
+
     # Prepopulate indexers with empty indices -- to be available startup handlers.
     indexers.ensure(registry._indexing.get_all_handlers())
 
     # Global credentials store for this operator, also for CRD-reading & peering mode detection.
     auth.vault_var.set(vault)
 
+    # Operator-wide metrics for the low-level routines, which have no access to the operator's state.
+    telemetry.metrics_var.set(metrics)
+
+    # Operator-wide limits for the daemons & timers of all resources (no limits without an operator).
+    daemons.limiters_var.set(daemons.InvocationLimiters())
+
     # Special case: pass the settings container through the user-side handlers (no explicit args).
     # Toolkits have to keep the original operator context somehow, and the only way is contextvars.
     posting.settings_var.set(settings)
@@ -243,6 +279,31 @@ async def spawn_tasks(
             vault=vault,
             memo=memo)))  # to purge & finalize the caches in the end.
 
+    # Restore the indices from a snapshot before the watchers start; keep the snapshots fresh.
+    tasks.append(aiotasks.create_guarded_task(
+        name="index snapshotter", flag=started_flag, logger=logger, finishable=True,
+        coro=indexing.snapshotter(
+            indexers=indexers,
+            settings=settings)))
+
+    # Trigger all the timers of all the objects by their schedule (the timers have no own tasks).
+    tasks.append(aiotasks.create_guarded_task(
+        name="timer engine", flag=started_flag, logger=logger,
+        coro=timers.run(
+            settings=settings)))
+
+    # Trigger the batch timers by their schedule, each for all matching objects at once.
+    if registry._ticking.get_all_handlers():
+        tasks.append(aiotasks.create_guarded_task(
+            name="batch timers", flag=started_flag, logger=logger,
+            coro=ticking.ticker(
+                registry=registry,
+                settings=settings,
+                tickers=tickers,
+                indices=indexers.indices,
+                memo=memo,
+                operator_paused=operator_paused)))
+
     # Kill all the daemons gracefully when the operator exits (so that they are not "hung").
     tasks.append(aiotasks.create_guarded_task(
         name="daemon killer", flag=started_flag, logger=logger,
@@ -335,6 +396,8 @@ async def spawn_tasks(
                 insights=insights,
                 identity=identity,
                 operator_paused=operator_paused,
+                subscriptions=indexers.subscriptions if registry._subscribing.get_all_handlers() else None,
+                shards=shards,
                 processor=functools.partial(processing.process_resource_event,
                                             lifecycle=lifecycle,
                                             registry=registry,
@@ -343,6 +406,9 @@ async def spawn_tasks(
                                             memories=memories,
                                             memobase=memo,
                                             operator_paused=operator_paused,
+                                            timers=timers,
+                                            tickers=tickers,
+                                            shards=shards,
                                             event_queue=event_queue))))
 
     # Ensure that all guarded tasks got control for a moment to enter the guard.
@@ -352,8 +418,8 @@ async def spawn_tasks(
     if threading.current_thread() is threading.main_thread():
         # Handle NotImplementedError when ran on Windows since asyncio only supports Unix signals
         try:
-            loop.add_signal_handler(signal.SIGINT, signal_flag.set_result, signal.SIGINT)
-            loop.add_signal_handler(signal.SIGTERM, signal_flag.set_result, signal.SIGTERM)
+            loop.add_signal_handler(signal.SIGINT, _set_signal, signal_flag, signal.SIGINT)
+            loop.add_signal_handler(signal.SIGTERM, _set_signal, signal_flag, signal.SIGTERM)
         except NotImplementedError:
             logger.warning("OS signals are ignored: can't add signal handler in Windows.")
 
@@ -363,6 +429,12 @@ async def spawn_tasks(
     return tasks
 
 
+def _set_signal(signal_flag: aiotasks.Future, signum: signal.Signals) -> None:
+    # The operator processes get both the terminal's Ctrl+C and the supervisor's SIGTERM.
+    if not signal_flag.done():
+        signal_flag.set_result(signum)
+
+
 async def run_tasks(
         root_tasks: Collection[aiotasks.Task],
         *,
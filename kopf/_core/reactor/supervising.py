@@ -0,0 +1,176 @@
+"""
+Supervising several operator processes in one pod (``kopf run --processes=N``).
+
+Every operator process runs the same operator with all its handlers,
+in its own event loop on its own CPU core. The processes split the objects
+among themselves via the sharding hooks (see :mod:`kopf._core.engines.sharding`):
+every process watches and indexes all the objects, but handles only its own.
+
+The supervising process starts (forks) the operator processes after
+the operator's modules are loaded, serves the merged liveness endpoint,
+and forwards the termination signals to the operator processes.
+
+If any of the operator processes exits (e.g. fails), all other processes
+are stopped too, and the supervisor exits with the exit code of the failed
+process: the pod is then restarted by Kubernetes as a whole --- the same as
+if there were only one operator process.
+"""
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.process
+import signal
+import socket
+from collections.abc import Callable, Collection, Mapping
+from typing import Any
+
+from kopf._core.engines import probing
+
+logger = logging.getLogger(__name__)
+
+# The operator process's target: called with the process index and its own liveness endpoint.
+ProcessTarget = Callable[[int, str | None], None]
+
+# The termination signals, which are forwarded to the processes.
+SIGNALS = frozenset({signal.SIGINT, signal.SIGTERM})
+
+
+def supervise(
+        *,
+        processes: int,
+        target: ProcessTarget,
+        liveness_endpoint: str | None = None,
+) -> int:
+    """
+    Start the operator processes and supervise them until they all exit.
+
+    Returns the exit code of the first failed process, or 0 if none has failed.
+    """
+    context = multiprocessing.get_context('fork')
+    endpoints = {
+        str(idx): f'http://{probing.LOCALHOST}:{get_free_port()}/healthz'
+        for idx in range(processes)
+    } if liveness_endpoint else {}
+    children = [
+        context.Process(
+            name=f'kopf-{idx}',
+            target=_run_process,
+            args=(target, idx, endpoints.get(str(idx))),
+        )
+        for idx in range(processes)
+    ]
+
+    # The signals are postponed until handled: not to die while forking and leave the orphans.
+    # The mask is per-thread, so the signals delivered to other threads (if any) are remembered.
+    logger.info(f"Starting {processes} operator processes.")
+    received: list[signal.Signals] = []
+    handlers = {signum: signal.getsignal(signum) for signum in SIGNALS}
+    for signum in SIGNALS:
+        signal.signal(signum, lambda signum, _: received.append(signal.Signals(signum)))
+    signal.pthread_sigmask(signal.SIG_BLOCK, SIGNALS)
+    try:
+        for child in children:
+            child.start()
+
+        return asyncio.run(_supervise(
+            children=children,
+            endpoints=endpoints,
+            liveness_endpoint=liveness_endpoint,
+            received=received,
+        ))
+    finally:
+        for signum, handler in handlers.items():
+            if handler is not None:  # i.e. not installed from Python
+                signal.signal(signum, handler)
+
+
+async def _supervise(
+        *,
+        children: Collection[multiprocessing.process.BaseProcess],
+        endpoints: Mapping[str, str],
+        liveness_endpoint: str | None,
+        received: Collection[signal.Signals] = (),
+) -> int:
+    loop = asyncio.get_running_loop()
+    signalled: asyncio.Future[signal.Signals] = loop.create_future()
+    for signum in SIGNALS:
+        loop.add_signal_handler(signum, _set_signal, signalled, signum)
+    for signum in received:
+        _set_signal(signalled, signum)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+
+    reporter: asyncio.Task[None] | None = None
+    reporter_ready = asyncio.Event()
+    if liveness_endpoint:
+        reporter = asyncio.create_task(probing.health_aggregator(
+            liveness_endpoint,
+            endpoints=endpoints,
+            ready_flag=reporter_ready,
+        ), name="health aggregator")
+
+    exits = {asyncio.create_task(_wait_for_exit(child), name=f"{child.name} waiter"): child
+             for child in children}
+    terminated: set[multiprocessing.process.BaseProcess] = set()
+    try:
+        waited: list[asyncio.Future[Any]] = [signalled, *exits]
+        await asyncio.wait(waited, return_when=asyncio.FIRST_COMPLETED)
+        exited = [child for task, child in exits.items() if task.done()]
+
+        # Stop all the remaining processes, each with its own graceful exiting.
+        if signalled.done():
+            logger.info(f"Signal {signalled.result().name!s} is received. Operator is stopping.")
+        for child in exited:
+            logger.warning(f"Operator process {child.name} has exited with {child.exitcode}. "
+                           f"Stopping other processes.")
+        for child in children:
+            if child.is_alive():
+                child.terminate()
+                terminated.add(child)
+        await asyncio.wait(exits)
+
+    finally:
+        if reporter is not None:
+            # The server cancelled while starting would leak its socket, so let it start first.
+            started = asyncio.create_task(reporter_ready.wait())
+            await asyncio.wait([reporter, started], return_when=asyncio.FIRST_COMPLETED)
+            started.cancel()
+            reporter.cancel()
+            await asyncio.wait([reporter, started])
+
+    # The processes that exited on their own are the reason; others were stopped by us.
+    # The processes stopped before they could handle the signal (e.g. still starting) are fine too.
+    exitcodes = [
+        0 if child in terminated and child.exitcode == -signal.SIGTERM else child.exitcode or 0
+        for child in (exited or children)
+    ]
+    return next((code if code > 0 else 128 - code for code in exitcodes if code), 0)
+
+
+def _run_process(target: ProcessTarget, idx: int, endpoint: str | None) -> None:
+    for signum in SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+    target(idx, endpoint)
+
+
+async def _wait_for_exit(child: multiprocessing.process.BaseProcess) -> None:
+    loop = asyncio.get_running_loop()
+    exited = asyncio.Event()
+    loop.add_reader(child.sentinel, exited.set)
+    try:
+        await exited.wait()
+    finally:
+        loop.remove_reader(child.sentinel)
+    child.join()
+
+
+def _set_signal(future: asyncio.Future[signal.Signals], signum: signal.Signals) -> None:
+    if not future.done():
+        future.set_result(signum)
+
+
+def get_free_port() -> int:
+    """ Find a free TCP port for the internal liveness endpoints of the processes. """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((probing.LOCALHOST, 0))
+        return int(sock.getsockname()[1])
@@ -1,16 +1,48 @@
 import asyncio
 import contextlib
+import enum
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+
+
+class LoopType(enum.Enum):
+    """ Event loop types, as specified on CLI. """
+    AUTO = 'auto'  # uvloop if installed, asyncio otherwise
+    ASYNCIO = 'asyncio'
+    UVLOOP = 'uvloop'
+
+
+def get_loop_factory(loop_type: LoopType = LoopType.AUTO) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Get the factory of new event loops of the requested type, if not the default.
+
+    ``None`` means the default event loop of asyncio (as per its policy).
+    If ``uvloop`` is requested explicitly but not installed, it fails.
+    """
+    if loop_type == LoopType.ASYNCIO:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        if loop_type == LoopType.UVLOOP:
+            raise ImportError("uvloop is requested but not installed. Use: pip install kopf[uvloop]")
+        return None
+    else:
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+        return loop_factory
 
 
 @contextlib.contextmanager
-def proper_loop(suggested_loop: asyncio.AbstractEventLoop | None = None) -> Iterator[asyncio.AbstractEventLoop | None]:
+def proper_loop(
+        suggested_loop: asyncio.AbstractEventLoop | None = None,
+        *,
+        loop_type: LoopType = LoopType.AUTO,
+) -> Iterator[asyncio.AbstractEventLoop | None]:
     """
     Ensure that we have the proper loop, either suggested or properly managed.
 
     A "properly managed" loop is the one we own and therefore close.
-    If ``uvloop`` is installed, it is used.
+    If ``uvloop`` is installed, it is used (unless asyncio is requested).
     Otherwise, the event loop policy remains unaffected.
 
     This loop manager is usually used in CLI only, not deeper than that;
@@ -20,39 +52,23 @@ def proper_loop(suggested_loop: asyncio.AbstractEventLoop | None = None) -> Iter
     # However, the asyncio.Runner was introduced in Python 3.11, so we can use the logic from there.
     if suggested_loop is not None:
         yield suggested_loop
+        return
 
-    elif sys.version_info >= (3, 11):  # optional in 3.11-3.13, mandatory in >=3.14
-        # Use uvloop if available by injecting it as the selected loop.
-        try:
-            import uvloop
-        except ImportError:
-            pass
-        else:
-            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
-                yield runner.get_loop()
-                return
-
+    loop_factory = get_loop_factory(loop_type)
+    if loop_factory is None:
         # Use the default loop/runner in place, do not inject anything.
         yield None
 
-    # For Python<=3.10, use the event-loop-policy-based injection.
-    else:
-        original_policy = asyncio.get_event_loop_policy()
-        if suggested_loop is None:  # the pure CLI use, not a KopfRunner or other code
-            try:
-                import uvloop
-            except ImportError:
-                pass
-            else:
-                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    elif sys.version_info >= (3, 11):  # optional in 3.11-3.13, mandatory in >=3.14
+        # Use the custom loop (e.g. uvloop) by injecting it as the selected loop.
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            yield runner.get_loop()
 
+    # For Python<=3.10, there are no runners, so we create & close the loop ourselves.
+    else:
+        loop = loop_factory()
         try:
-            yield None
-
+            yield loop
         finally:
-            try:
-                import uvloop
-            except ImportError:
-                pass
-            else:
-                asyncio.set_event_loop_policy(original_policy)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
@@ -1,7 +1,9 @@
 import asyncio
 import dataclasses
 import functools
+import multiprocessing
 import os
+import sys
 from collections.abc import Callable, Collection
 from typing import Any
 
@@ -14,7 +16,7 @@ from kopf._cogs.structs import credentials, references
 from kopf._core.actions import loggers
 from kopf._core.engines import peering
 from kopf._core.intents import registries
-from kopf._core.reactor import running
+from kopf._core.reactor import running, supervising
 from kopf._kits import loops
 
 
@@ -68,6 +70,9 @@ def main(__controls: CLIControls) -> None:
 @click.option('-L', '--liveness', 'liveness_endpoint', type=str)
 @click.option('-P', '--peering', 'peering_name', type=str, envvar='KOPF_RUN_PEERING')
 @click.option('-p', '--priority', type=int)
+@click.option('--processes', type=click.IntRange(min=1), default=1)
+@click.option('--loop', 'loop_type', type=click.Choice(loops.LoopType, case_sensitive=False),
+              default='auto', envvar='KOPF_RUN_LOOP')
 @click.option('-m', '--module', 'modules', multiple=True)
 @click.argument('paths', nargs=-1)
 @click.make_pass_decorator(CLIControls, ensure=True)
@@ -82,6 +87,8 @@ def run(
         namespaces: Collection[references.NamespacePattern],
         clusterwide: bool,
         liveness_endpoint: str | None,
+        processes: int = 1,
+        loop_type: loops.LoopType = loops.LoopType.AUTO,
 ) -> None:
     """ Start an operator process and handle all the requests. """
     priority = 666 if dev else priority
@@ -89,27 +96,67 @@ def run(
         namespaces = tuple(namespaces) + (os.environ.get('KOPF_RUN_NAMESPACE', ''),)
     if namespaces and clusterwide:
         raise click.UsageError("Either --namespace or --all-namespaces can be used, not both.")
+    if processes > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        raise click.UsageError("Several --processes require the fork start method (POSIX only).")
+    if processes > 1 and (__controls.loop or __controls.stop_flag or __controls.ready_flag):
+        raise click.UsageError("Several --processes cannot be used in the embedded mode.")
+    try:
+        loops.get_loop_factory(loop_type)  # fail early, before loading the operator's modules
+    except ImportError as e:
+        raise click.UsageError(str(e))
     if __controls.registry is not None:
         registries.set_default_registry(__controls.registry)
     loaders.preload(
         paths=paths,
         modules=modules,
     )
-    with loops.proper_loop(suggested_loop=__controls.loop) as actual_loop:
-        return running.run(
-            standalone=standalone,
-            namespaces=namespaces,
-            clusterwide=clusterwide,
-            priority=priority,
-            peering_name=peering_name,
-            liveness_endpoint=liveness_endpoint,
-            registry=__controls.registry,
-            settings=__controls.settings,
-            stop_flag=__controls.stop_flag,
-            ready_flag=__controls.ready_flag,
-            vault=__controls.vault,
-            loop=actual_loop,
-        )
+    if processes == 1:
+        with loops.proper_loop(suggested_loop=__controls.loop, loop_type=loop_type) as actual_loop:
+            return running.run(
+                standalone=standalone,
+                namespaces=namespaces,
+                clusterwide=clusterwide,
+                priority=priority,
+                peering_name=peering_name,
+                liveness_endpoint=liveness_endpoint,
+                registry=__controls.registry,
+                settings=__controls.settings,
+                stop_flag=__controls.stop_flag,
+                ready_flag=__controls.ready_flag,
+                vault=__controls.vault,
+                loop=actual_loop,
+            )
+
+    # All processes are one operator for the peers, so they must share the identity.
+    # Only the 1st process sends the keep-alives for them (see the orchestration).
+    identity = peering.detect_own_id(manual=False)
+
+    def run_process(process_index: int, process_endpoint: str | None) -> None:
+        settings = __controls.settings or configuration.OperatorSettings()
+        settings.process.processes = processes
+        settings.process.process_index = process_index
+        with loops.proper_loop(loop_type=loop_type) as actual_loop:
+            running.run(
+                standalone=standalone,
+                namespaces=namespaces,
+                clusterwide=clusterwide,
+                priority=priority,
+                peering_name=peering_name,
+                liveness_endpoint=process_endpoint,
+                registry=__controls.registry,
+                settings=settings,
+                identity=identity,
+                vault=__controls.vault,
+                loop=actual_loop,
+            )
+
+    exitcode = supervising.supervise(
+        processes=processes,
+        target=run_process,
+        liveness_endpoint=liveness_endpoint,
+    )
+    if exitcode:
+        sys.exit(exitcode)
 
 
 @main.command()
@@ -16,7 +16,7 @@ from collections.abc import Callable, Collection
 # TODO: add cluster=True support (different API methods)
 from typing import Any
 
-from kopf._cogs.structs import dicts, references, reviews
+from kopf._cogs.structs import dicts, ids, references, reviews
 from kopf._core.actions import execution
 from kopf._core.intents import callbacks, causes, filters, handlers, registries
 from kopf._core.reactor import subhandling
@@ -28,6 +28,7 @@ ChangingDecorator = Callable[[callbacks.ChangingFn], callbacks.ChangingFn]
 WebhookDecorator = Callable[[callbacks.WebhookFn], callbacks.WebhookFn]
 DaemonDecorator = Callable[[callbacks.DaemonFn], callbacks.DaemonFn]
 TimerDecorator = Callable[[callbacks.TimerFn], callbacks.TimerFn]
+TickingDecorator = Callable[[callbacks.TickingFn], callbacks.TickingFn]
 
 
 def startup(  # lgtm[py/similar-function]
@@ -608,6 +609,58 @@ def index(  # lgtm[py/similar-function]
     return decorator
 
 
+def subscribe(  # lgtm[py/similar-function]
+        # Resource type specification:
+        arg1: str | references.Marker | Callable[[references.Resource], bool] | None = None,
+        arg2: str | references.Marker | None = None,
+        arg3: str | references.Marker | None = None,
+        /,
+        *,
+        index: str,
+        group: str | None = None,
+        version: str | None = None,
+        kind: str | None = None,
+        plural: str | None = None,
+        singular: str | None = None,
+        shortcut: str | None = None,
+        category: str | None = None,
+        # Handler's behaviour specification:
+        id: str | None = None,
+        param: Any | None = None,
+        # Resource object specification:
+        labels: filters.MetaFilter | None = None,
+        annotations: filters.MetaFilter | None = None,
+        when: callbacks.WhenFilterFn | None = None,
+        field: dicts.FieldSpec | None = None,
+        value: filters.ValueFilter | None = None,
+        # Operator specification:
+        registry: registries.OperatorRegistry | None = None,
+) -> IndexingDecorator:
+    """ ``@kopf.subscribe()`` handler for the index keys the objects depend on. """
+    def decorator(  # lgtm[py/similar-function]
+            fn: callbacks.IndexingFn,
+    ) -> callbacks.IndexingFn:
+        _warn_conflicting_values(field, value)
+        _verify_filters(labels, annotations)
+        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_field = dicts.parse_field(field) or None  # to not store tuple() as a no-field case.
+        real_id = registries.generate_id(fn=fn, id=id)
+        selector = references.Selector(
+            arg1, arg2, arg3,
+            group=group, version=version,
+            kind=kind, plural=plural, singular=singular, shortcut=shortcut, category=category,
+        )
+        handler = handlers.SubscribingHandler(
+            fn=fn, id=real_id, param=param, index=ids.HandlerId(index),
+            errors=None, timeout=None, retries=None, backoff=None,
+            selector=selector, labels=labels, annotations=annotations, when=when,
+            field=real_field, value=value,
+        )
+        real_registry._subscribing.append(handler)
+        return fn
+    return decorator
+
+
 def event(  # lgtm[py/similar-function]
         # Resource type specification:
         arg1: str | references.Marker | Callable[[references.Resource], bool] | None = None,
@@ -681,6 +734,7 @@ def daemon(  # lgtm[py/similar-function]
         retries: int | None = None,
         backoff: float | None = None,
         initial_delay: float | callbacks.DelayFn | None = None,
+        initial_delay_spread: float | None = None,
         cancellation_backoff: float | None = None,
         cancellation_timeout: float | None = None,
         cancellation_polling: float | None = None,
@@ -713,6 +767,7 @@ def daemon(  # lgtm[py/similar-function]
             selector=selector, labels=labels, annotations=annotations, when=when,
             field=real_field, value=value,
             initial_delay=initial_delay, requires_finalizer=True,
+            initial_delay_spread=initial_delay_spread,
             cancellation_backoff=cancellation_backoff,
             cancellation_timeout=cancellation_timeout,
             cancellation_polling=cancellation_polling,
@@ -745,8 +800,10 @@ def timer(  # lgtm[py/similar-function]
         backoff: float | None = None,
         interval: float | None = None,
         initial_delay: float | callbacks.DelayFn | None = None,
+        initial_delay_spread: float | None = None,
         sharp: bool | None = None,
         idle: float | None = None,
+        jitter: float | None = None,
         # Resource object specification:
         labels: filters.MetaFilter | None = None,
         annotations: filters.MetaFilter | None = None,
@@ -776,13 +833,72 @@ def timer(  # lgtm[py/similar-function]
             selector=selector, labels=labels, annotations=annotations, when=when,
             field=real_field, value=value,
             initial_delay=initial_delay, requires_finalizer=True,
-            sharp=sharp, idle=idle, interval=interval,
+            initial_delay_spread=initial_delay_spread,
+            sharp=sharp, idle=idle, interval=interval, jitter=jitter,
         )
         real_registry._spawning.append(handler)
         return fn
     return decorator
 
 
+def tick(  # lgtm[py/similar-function]
+        # Resource type specification:
+        arg1: str | references.Marker | Callable[[references.Resource], bool] | None = None,
+        arg2: str | references.Marker | None = None,
+        arg3: str | references.Marker | None = None,
+        /,
+        *,
+        interval: float,
+        group: str | None = None,
+        version: str | None = None,
+        kind: str | None = None,
+        plural: str | None = None,
+        singular: str | None = None,
+        shortcut: str | None = None,
+        category: str | None = None,
+        # Handler's behaviour specification:
+        id: str | None = None,
+        param: Any | None = None,
+        errors: execution.ErrorsMode | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        backoff: float | None = None,
+        initial_delay: float | None = None,
+        # Resource object specification:
+        labels: filters.MetaFilter | None = None,
+        annotations: filters.MetaFilter | None = None,
+        when: callbacks.WhenFilterFn | None = None,
+        field: dicts.FieldSpec | None = None,
+        value: filters.ValueFilter | None = None,
+        # Operator specification:
+        registry: registries.OperatorRegistry | None = None,
+) -> TickingDecorator:
+    """ ``@kopf.tick()`` handler for the batch timers of all matching objects. """
+    def decorator(  # lgtm[py/similar-function]
+            fn: callbacks.TickingFn,
+    ) -> callbacks.TickingFn:
+        _warn_conflicting_values(field, value)
+        _verify_filters(labels, annotations)
+        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_field = dicts.parse_field(field) or None  # to not store tuple() as a no-field case.
+        real_id = registries.generate_id(fn=fn, id=id, suffix=".".join(real_field or []))
+        selector = references.Selector(
+            arg1, arg2, arg3,
+            group=group, version=version,
+            kind=kind, plural=plural, singular=singular, shortcut=shortcut, category=category,
+        )
+        handler = handlers.TickingHandler(
+            fn=fn, id=real_id, param=param,
+            errors=errors, timeout=timeout, retries=retries, backoff=backoff,
+            selector=selector, labels=labels, annotations=annotations, when=when,
+            field=real_field, value=value,
+            interval=interval, initial_delay=initial_delay,
+        )
+        real_registry._ticking.append(handler)
+        return fn
+    return decorator
+
+
 def subhandler(  # lgtm[py/similar-function]
         *,
         # Handler's behaviour specification:
@@ -4,8 +4,9 @@ import textwrap
 import aiohttp.web
 import pytest
 
-from kopf._cogs.clients.api import delete, get, patch, post, request, stream
+from kopf._cogs.clients.api import Lane, delete, get, patch, post, request, stream
 from kopf._cogs.clients.errors import APIError
+from kopf._cogs.structs.telemetry import OperatorMetrics, metrics_var
 
 pytestmark = pytest.mark.usefixtures('fake_vault')
 
@@ -205,3 +206,97 @@ async def test_stopper_in_streams(
 
     assert items == expected_items
     assert times == expected_times
+
+
+@pytest.mark.parametrize('fn, method', [
+    (get, 'get'),
+    (post, 'post'),
+    (patch, 'patch'),
+    (delete, 'delete'),
+])
+async def test_requests_are_rate_limited(kmock, fn, method, settings, logger, looptime):
+    kmock[method, '/url'] << {}
+    settings.networking.qps = 2
+    settings.networking.burst = 3
+    for _ in range(7):
+        await fn('/url', settings=settings, logger=logger)
+    assert len(kmock) == 7
+    assert looptime == 2  # 3 in a burst, then 4 at 2/s
+
+
+async def test_critical_requests_skip_the_bulk_ones(kmock, settings, logger, looptime):
+    kmock['post', '/bulk'] << {}
+    kmock['patch', '/critical'] << {}
+    settings.networking.qps = 1
+    settings.networking.burst = 1
+    await post('/bulk', lane=Lane.BULK, settings=settings, logger=logger)  # drain the bucket
+    bulk = [asyncio.create_task(post('/bulk', lane=Lane.BULK, settings=settings, logger=logger))
+            for _ in range(10)]
+    await asyncio.sleep(0)
+
+    await patch('/critical', lane=Lane.CRITICAL, settings=settings, logger=logger)
+    assert looptime == 1  # not 11
+
+    for task in bulk:
+        task.cancel()
+    await asyncio.wait(bulk)
+
+
+async def test_retry_after_pauses_all_requests_if_adaptive(kmock, settings, logger, looptime):
+    kmock['get', '/busy'] << 429 << kmock.headers({'Retry-After': '10'}) << {}
+    kmock['get', '/other'] << {}
+    settings.networking.max_concurrency = 10
+    settings.networking.error_backoffs = None
+    with pytest.raises(APIError):
+        await get('/busy', settings=settings, logger=logger)
+    await get('/other', settings=settings, logger=logger)
+    assert looptime == 10
+
+
+async def test_retry_after_pauses_only_its_request_if_not_adaptive(
+        kmock, settings, logger, looptime):
+    kmock['get', '/busy'] << 429 << kmock.headers({'Retry-After': '10'}) << {}
+    kmock['get', '/other'] << {}
+    settings.networking.error_backoffs = None
+    with pytest.raises(APIError):
+        await get('/busy', settings=settings, logger=logger)
+    await get('/other', settings=settings, logger=logger)
+    assert looptime == 0
+
+
+@pytest.mark.parametrize('status', [429, 500, 503])
+async def test_overloads_halve_the_concurrency_in_metrics(kmock, settings, logger, status):
+    kmock['get', '/busy'] << status << {}
+    kmock['get', '/other'] << {}
+    settings.networking.max_concurrency = 8
+    settings.networking.error_backoffs = None
+    metrics = OperatorMetrics()
+    token = metrics_var.set(metrics)
+    try:
+        await get('/other', settings=settings, logger=logger)
+        assert metrics.api_concurrency == 8
+        assert metrics.api_overloads == 0
+
+        with pytest.raises(APIError):
+            await get('/busy', settings=settings, logger=logger)
+        assert metrics.api_concurrency == 4
+        assert metrics.api_overloads == 1
+    finally:
+        metrics_var.reset(token)
+
+
+async def test_slow_responses_count_as_overloads(kmock, settings, logger, looptime):
+    kmock['get', '/slow'] << (lambda: asyncio.sleep(3)) << {}
+    kmock['get', '/fast'] << {}
+    settings.networking.max_concurrency = 8
+    settings.networking.latency_threshold = 2
+    metrics = OperatorMetrics()
+    token = metrics_var.set(metrics)
+    try:
+        await get('/fast', settings=settings, logger=logger)
+        assert metrics.api_concurrency == 8
+        await request('get', '/slow', settings=settings, logger=logger)
+        assert metrics.api_concurrency == 4
+        assert metrics.api_overloads == 1
+    finally:
+        metrics_var.reset(token)
@@ -134,3 +134,67 @@ def test_patch_clear_clears_dict_and_fns():
     assert dict(patch) == {}
     assert list(patch.fns) == []
     assert not patch
+
+
+# === Patch.merge ===
+
+
+def test_patch_merge_overrides_and_extends_dicts():
+    patch = Patch({'spec': {'x': 'a', 'y': 'b'}, 'status': {'z': 'c'}})
+    patch.merge(Patch({'spec': {'x': 'A', 'n': None}, 'metadata': {'labels': {'l': 'v'}}}))
+    assert dict(patch) == {
+        'spec': {'x': 'A', 'y': 'b', 'n': None},
+        'status': {'z': 'c'},
+        'metadata': {'labels': {'l': 'v'}},
+    }
+
+
+def test_patch_merge_overrides_non_dicts_with_dicts_and_vice_versa():
+    patch = Patch({'spec': {'x': 'a', 'y': {'k': 'v'}}})
+    patch.merge(Patch({'spec': {'x': {'k': 'v'}, 'y': None}}))
+    assert dict(patch) == {'spec': {'x': {'k': 'v'}, 'y': None}}
+
+
+def test_patch_merge_appends_fns():
+    fn1 = lambda body: None
+    fn2 = lambda body: None
+    patch = Patch(fns=[fn1])
+    patch.merge(Patch(fns=[fn2]))
+    assert patch.fns == [fn1, fn2]
+
+
+def test_patch_merge_does_not_modify_the_other_patch():
+    other = Patch({'spec': {'x': {'k': 'v'}}})
+    patch = Patch({'spec': {'x': {'a': 'b'}}})
+    patch.merge(other)
+    patch['spec']['x']['k'] = 'changed'
+    assert dict(other) == {'spec': {'x': {'k': 'v'}}}
+
+
+# === Patch.fork ===
+
+
+def test_patch_fork_sees_the_changes_but_not_the_fns():
+    fn = lambda body: None
+    patch = Patch({'spec': {'x': 'a'}}, fns=[fn])
+    fork = patch.fork()
+    assert dict(fork) == {'spec': {'x': 'a'}}
+    assert fork.fns == []
+
+
+def test_patch_fork_does_not_modify_the_original_patch():
+    patch = Patch({'spec': {'x': 'a'}})
+    fork = patch.fork()
+    fork.spec['x'] = 'b'
+    assert dict(patch) == {'spec': {'x': 'a'}}
+
+
+def test_patch_fork_merges_only_its_own_changes():
+    patch = Patch({'spec': {'x': 'a', 'y': 'b'}})
+    fork1 = patch.fork()
+    fork2 = patch.fork()
+    fork1.spec['x'] = 'A'
+    fork2.spec['z'] = 'C'
+    patch.merge(fork1)
+    patch.merge(fork2)
+    assert dict(patch) == {'spec': {'x': 'A', 'y': 'b', 'z': 'C'}}
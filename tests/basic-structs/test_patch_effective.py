@@ -0,0 +1,79 @@
+import pytest
+
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.patches import Patch
+
+
+def _fn(body):
+    pass
+
+
+def test_patch_as_is_when_no_body():
+    patch = Patch({'spec': {'x': 'y'}, 'status': None}, fns=[_fn])
+    effective = patch.as_effective_patch()
+    assert isinstance(effective, Patch)
+    assert effective == {'spec': {'x': 'y'}, 'status': None}
+    assert effective.fns == [_fn]
+
+
+def test_body_argument_overrides_original():
+    patch = Patch({'spec': {'x': 'y'}}, body=Body({'spec': {'x': 'y'}}))
+    effective = patch.as_effective_patch({'spec': {'x': 'z'}})
+    assert effective == {'spec': {'x': 'y'}}
+
+
+def test_original_and_fns_are_kept():
+    body = Body({'spec': {'x': 'y'}})
+    patch = Patch({'spec': {'x': 'y'}}, body=body, fns=[_fn])
+    effective = patch.as_effective_patch()
+    assert effective == {}
+    assert effective.fns == [_fn]
+    assert effective._original is body
+    assert effective  # because of fns
+
+
+def test_source_patch_is_not_modified():
+    patch = Patch({'spec': {'x': 'y', 'a': 'b'}}, body=Body({'spec': {'x': 'y'}}))
+    patch.as_effective_patch()
+    assert patch == {'spec': {'x': 'y', 'a': 'b'}}
+
+
+@pytest.mark.parametrize('changes, body', [
+    pytest.param({'status': {'phase': 'ok'}}, {'status': {'phase': 'ok', 'x': 1}}, id='same-scalar'),
+    pytest.param({'spec': {'items': [1, 2]}}, {'spec': {'items': [1, 2]}}, id='same-list'),
+    pytest.param({'spec': {'x': {'y': 'z'}}}, {'spec': {'x': {'y': 'z'}}}, id='same-nested'),
+    pytest.param({'spec': {'x': None}}, {'spec': {}}, id='absent-removal'),
+    pytest.param({'spec': {'x': None}}, {}, id='absent-parent-removal'),
+    pytest.param({'spec': {}}, {'spec': {'x': 'y'}}, id='empty-dict-into-dict'),
+    pytest.param({'metadata': {'annotations': {'a': None}}}, {'metadata': {}}, id='annotations'),
+])
+def test_noop_changes_are_excluded(changes, body):
+    patch = Patch(changes, body=Body(body))
+    effective = patch.as_effective_patch()
+    assert effective == {}
+    assert not effective
+
+
+@pytest.mark.parametrize('changes, body', [
+    pytest.param({'status': {'phase': 'ok'}}, {'status': {'phase': 'no'}}, id='other-scalar'),
+    pytest.param({'status': {'phase': 'ok'}}, {'status': {}}, id='absent-scalar'),
+    pytest.param({'status': {'phase': None}}, {'status': {'phase': None}}, id='present-removal'),
+    pytest.param({'spec': {'items': [1]}}, {'spec': {'items': [1, 2]}}, id='other-list'),
+    pytest.param({'spec': {'x': {}}}, {'spec': {}}, id='absent-empty-dict'),
+    pytest.param({'spec': {'x': {'y': 'z'}}}, {'spec': {'x': 'string'}}, id='dict-over-scalar'),
+    pytest.param({'spec': {'x': 'y'}}, {'spec': None}, id='dict-over-null'),
+])
+def test_actual_changes_are_kept(changes, body):
+    patch = Patch(changes, body=Body(body))
+    effective = patch.as_effective_patch()
+    assert effective == changes
+
+
+def test_mixed_changes_are_reduced():
+    body = {'spec': {'x': 'y'}, 'status': {'phase': 'ok', 'message': 'hello'}}
+    patch = Patch({
+        'spec': {'x': 'y', 'absent': None},
+        'status': {'phase': 'ok', 'message': 'bye', 'extra': None},
+    }, body=Body(body))
+    effective = patch.as_effective_patch()
+    assert effective == {'status': {'message': 'bye'}}
@@ -0,0 +1,76 @@
+import functools
+
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.finalizers import allow_deletion, block_deletion
+from kopf._cogs.structs.patches import Patch
+
+
+def test_none_when_no_body():
+    patch = Patch(fns=[functools.partial(block_deletion, finalizer='fin')])
+    merge = patch.as_merge_patch()
+    assert merge is None
+
+
+def test_body_argument_overrides_original():
+    patch = Patch(body=Body({'metadata': {'finalizers': ['fin']}}))
+    patch.fns.append(functools.partial(block_deletion, finalizer='fin'))
+    merge = patch.as_merge_patch({'metadata': {}})
+    assert merge == {'metadata': {'finalizers': ['fin']}}
+
+
+def test_dict_changes_only():
+    patch = Patch({'spec': {'x': 'y'}, 'status': None}, body=Body({'status': {}}))
+    merge = patch.as_merge_patch()
+    assert merge == {'spec': {'x': 'y'}, 'status': None}
+
+
+def test_finalizer_addition():
+    body = {'metadata': {'finalizers': ['other']}}
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(body))
+    patch.fns.append(functools.partial(block_deletion, finalizer='fin'))
+    merge = patch.as_merge_patch()
+    assert merge == {'spec': {'x': 'y'}, 'metadata': {'finalizers': ['other', 'fin']}}
+
+
+def test_finalizer_removal_of_the_last_one():
+    body = {'metadata': {'finalizers': ['fin'], 'name': 'n'}}
+    patch = Patch(body=Body(body))
+    patch.fns.append(functools.partial(allow_deletion, finalizer='fin'))
+    merge = patch.as_merge_patch()
+    assert merge == {'metadata': {'finalizers': None}}
+
+
+def test_transformations_override_dict_changes():
+    patch = Patch({'status': {'x': 'y', 'a': 'b'}}, body=Body({}))
+    patch.fns.append(lambda body: body['status'].update(x='z'))
+    merge = patch.as_merge_patch()
+    assert merge == {'status': {'x': 'z', 'a': 'b'}}
+
+
+def test_original_body_is_not_modified():
+    body = {'metadata': {'finalizers': ['other']}}
+    patch = Patch(body=Body(body))
+    patch.fns.append(functools.partial(block_deletion, finalizer='fin'))
+    patch.as_merge_patch()
+    assert body == {'metadata': {'finalizers': ['other']}}
+
+
+def test_none_when_nulls_are_set():
+    patch = Patch(body=Body({'spec': {}}))
+    patch.fns.append(lambda body: body['spec'].update(x=None))
+    merge = patch.as_merge_patch()
+    assert merge is None
+
+
+def test_none_when_empty_dicts_are_set():
+    patch = Patch(body=Body({'spec': {}}))
+    patch.fns.append(lambda body: body['spec'].update(x={}))
+    merge = patch.as_merge_patch()
+    assert merge is None
+
+
+def test_none_when_the_parent_is_removed_by_the_dict_changes():
+    patch = Patch({'spec': None}, body=Body({'spec': {'x': 'y'}}))
+    patch.fns.append(lambda body: body.setdefault('spec', {}).update(z='z'))
+    merge = patch.as_merge_patch()
+    assert merge is None
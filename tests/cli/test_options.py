@@ -57,3 +57,58 @@ def test_options_passed_to_realrun(invoke, options, envvars, kwarg, value, prelo
     assert result.exit_code == 0
     assert real_run.called
     assert real_run.call_args.kwargs[kwarg] == value
+
+
+@pytest.mark.parametrize('options', [['--processes=0'], ['--processes=-1']])
+def test_processes_must_be_positive(invoke, options, preload, real_run):
+    result = invoke(['run'] + options)
+    assert result.exit_code == 2
+    assert not real_run.called
+
+
+def test_single_process_runs_without_supervisor(invoke, mocker, preload, real_run):
+    supervise = mocker.patch('kopf._core.reactor.supervising.supervise')
+    result = invoke(['run', '--processes=1'])
+    assert result.exit_code == 0
+    assert real_run.called
+    assert not supervise.called
+
+
+@pytest.mark.parametrize('exitcode', [0, 1, 143])
+def test_several_processes_run_under_supervisor(invoke, mocker, preload, real_run, exitcode):
+    supervise = mocker.patch('kopf._core.reactor.supervising.supervise', return_value=exitcode)
+    result = invoke(['run', '--processes=3', '--liveness=http://:8080/healthz'])
+    assert result.exit_code == exitcode
+    assert not real_run.called
+    assert supervise.call_count == 1
+    assert supervise.call_args.kwargs['processes'] == 3
+    assert supervise.call_args.kwargs['liveness_endpoint'] == 'http://:8080/healthz'
+
+    # Simulate the forked process: it must run the operator as one of the processes.
+    target = supervise.call_args.kwargs['target']
+    target(1, 'http://localhost:12345/healthz')
+    assert real_run.call_count == 1
+    assert real_run.call_args.kwargs['liveness_endpoint'] == 'http://localhost:12345/healthz'
+    assert real_run.call_args.kwargs['identity']
+    assert real_run.call_args.kwargs['settings'].process.processes == 3
+    assert real_run.call_args.kwargs['settings'].process.process_index == 1
+
+
+@pytest.mark.parametrize('options, envvars', [
+    (['--loop=asyncio'], {}),
+    (['--loop=ASYNCIO'], {}),
+    ([], {'KOPF_RUN_LOOP': 'asyncio'}),
+])
+def test_asyncio_loop_is_not_injected(invoke, options, envvars, preload, real_run):
+    result = invoke(['run'] + options, env=envvars)
+    assert result.exit_code == 0
+    assert real_run.call_args.kwargs['loop'] is None
+
+
+def test_absent_uvloop_fails_early(invoke, mocker, preload, real_run):
+    mocker.patch.dict('sys.modules', {'uvloop': None})
+    result = invoke(['run', '--loop=uvloop'])
+    assert result.exit_code == 2
+    assert "uvloop is requested but not installed" in result.output
+    assert not preload.called
+    assert not real_run.called
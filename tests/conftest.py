@@ -24,6 +24,7 @@ from kopf._core.reactor.inventory import ResourceMemories
 
 def pytest_configure(config):
     config.addinivalue_line('markers', "e2e: end-to-end tests with real operators.")
+    config.addinivalue_line('markers', "benchmark: slow comparisons of timings, not of behaviour.")
 
     # Unexpected warnings should fail the tests. Use `-Wignore` to explicitly disable it.
     config.addinivalue_line('filterwarnings', 'error')
@@ -48,6 +49,7 @@ def pytest_configure(config):
 def pytest_addoption(parser):
     parser.addoption("--only-e2e", action="store_true", help="Execute end-to-end tests only.")
     parser.addoption("--with-e2e", action="store_true", help="Include end-to-end tests.")
+    parser.addoption("--with-benchmarks", action="store_true", help="Include benchmarks.")
 
 
 # This logic is not applied if pytest is started explicitly on ./examples/.
@@ -74,6 +76,14 @@ def pytest_collection_modifyitems(config, items):
         for item in e2e:
             item.add_marker(mark_skip)
 
+    # Benchmarks only report the timings and assert nothing. Skip them by default.
+    mark_skip = pytest.mark.skip(reason="Benchmarks are not enabled. "
+                                        "Use --with-benchmarks to enable.")
+    if not config.getoption('--with-benchmarks'):
+        for item in items:
+            if item.get_closest_marker('benchmark'):
+                item.add_marker(mark_skip)
+
     # Minify the test-plan if only e2e are requested (all other should be skipped).
     if config.getoption('--only-e2e'):
         items[:] = e2e
@@ -10,8 +10,9 @@ import kopf
 from kopf._cogs.aiokits.aiotoggles import ToggleSet
 from kopf._cogs.structs.bodies import RawBody
 from kopf._cogs.structs.ephemera import Memo
-from kopf._core.engines.daemons import daemon_killer
+from kopf._core.engines.daemons import TimerEngine, daemon_killer
 from kopf._core.engines.indexing import OperatorIndexers
+from kopf._core.engines.sharding import Shards
 from kopf._core.reactor.processing import process_resource_event
 
 
@@ -42,8 +43,27 @@ async def dummy(simulate_cycle):
         await dummy.wait_for_daemon_done()
 
 
+@pytest.fixture(params=['per-task', 'engine'])
+async def timers(request, settings):
+    """
+    Run the timers either with their own tasks or with the operator-wide engine.
+
+    Either way, the timers must behave the same.
+    """
+    if request.param == 'per-task':
+        yield None
+    else:
+        timers = TimerEngine()
+        task = asyncio.create_task(timers.run(settings=settings))
+        yield timers
+
+        with contextlib.suppress(asyncio.CancelledError):
+            task.cancel()
+            await task
+
+
 @pytest.fixture()
-def simulate_cycle(k8s_mocked, registry, settings, resource, memories, mocker):
+def simulate_cycle(k8s_mocked, registry, settings, resource, memories, mocker, timers):
     """
     Simulate K8s behaviour locally in memory (some meaningful approximation).
     """
@@ -60,6 +80,7 @@ def simulate_cycle(k8s_mocked, registry, settings, resource, memories, mocker):
             *,
             stream_pressure: asyncio.Event | None = None,
             operator_paused: ToggleSet | None = None,
+            shards: Shards | None = None,
     ) -> None:
         mocker.resetall()
 
@@ -75,6 +96,8 @@ def simulate_cycle(k8s_mocked, registry, settings, resource, memories, mocker):
             event_queue=asyncio.Queue(),
             stream_pressure=stream_pressure,
             operator_paused=operator_paused,
+            timers=timers,
+            shards=shards,
             no_throttling=True,
         )
 
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+import kopf
+from kopf._core.engines import daemons
+from kopf._core.engines.daemons import _get_digest
+
+
+async def test_hibernated_daemon_has_no_task(
+        resource, dummy, memories, simulate_cycle, looptime):
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        raise kopf.Hibernation("zzz")
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+
+    memory = next(iter(memories.iter_all_daemon_memories()))
+    assert dummy.mock.call_count == 1
+    assert set(memory.running_daemons) == {'fn'}
+    assert set(memory.hibernated_daemons) == {'fn'}
+    assert not isinstance(memory.running_daemons['fn'].task, asyncio.Task)
+    assert not any(task.get_name() == 'runner of fn' for task in asyncio.all_tasks())
+
+
+async def test_hibernated_daemon_is_resumed_after_the_delay(
+        resource, dummy, simulate_cycle, looptime):
+    calls = []
+
+    @kopf.daemon(*resource, id='fn', initial_delay=3)
+    async def fn(**kwargs):
+        calls.append(float(looptime))
+        dummy.mock(**kwargs)
+        raise kopf.Hibernation(delay=10)
+
+    await simulate_cycle({})
+    await asyncio.sleep(30)
+
+    assert calls == [3, 13, 23]  # the initial delay is not repeated on resuming
+
+
+async def test_hibernated_daemon_is_resumed_when_the_essence_changes(
+        resource, dummy, simulate_cycle, looptime):
+    calls = []
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(spec, **kwargs):
+        calls.append(dict(spec))
+        dummy.mock(**kwargs)
+        raise kopf.Hibernation()
+
+    event_object = {'spec': {'x': 1}}
+    await simulate_cycle(event_object)
+    await asyncio.sleep(1)
+    assert calls == [{'x': 1}]
+
+    event_object['spec'] = {'x': 2}
+    await simulate_cycle(event_object)
+    await asyncio.sleep(1)
+    assert calls == [{'x': 1}, {'x': 2}]
+
+
+async def test_hibernated_daemon_sleeps_through_the_status_changes(
+        resource, dummy, simulate_cycle, looptime):
+    calls = []
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(**kwargs):
+        calls.append(float(looptime))
+        dummy.mock(**kwargs)
+        raise kopf.Hibernation()
+
+    event_object = {'spec': {'x': 1}}
+    await simulate_cycle(event_object)
+    await asyncio.sleep(1)
+
+    event_object['status'] = {'y': 2}
+    await simulate_cycle(event_object)
+    await asyncio.sleep(1)
+    assert calls == [0]
+
+
+async def test_results_and_patches_are_applied_before_hibernating(
+        resource, dummy, k8s_mocked, simulate_cycle, looptime):
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(patch, **kwargs):
+        dummy.mock(**kwargs)
+        patch.status['x'] = 'y'
+        raise kopf.Hibernation()
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+
+    payloads = [call.kwargs['payload'] for call in k8s_mocked.patch.call_args_list]
+    assert dummy.mock.call_count == 1
+    assert {'status': {'x': 'y'}} in payloads
+
+
+async def test_hibernated_daemon_is_stopped_instantly(
+        resource, memories, simulate_cycle, looptime):
+    calls = []
+
+    @kopf.daemon(*resource, id='fn', cancellation_backoff=30)
+    async def fn(stopped, **_):
+        calls.append(stopped)
+        raise kopf.Hibernation(delay=100)
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+
+    memory = next(iter(memories.iter_all_daemon_memories()))
+    assert looptime == 1
+    assert not memory.running_daemons
+    assert not memory.hibernated_daemons
+    assert calls[0].reason == calls[0].reason.RESOURCE_DELETED | calls[0].reason.DONE
+
+    await asyncio.sleep(200)
+    assert len(calls) == 1  # not resumed by the deadline
+
+
+async def test_sync_daemon_is_hibernated(resource, memories, simulate_cycle):
+    calls = []
+
+    @kopf.daemon(*resource, id='fn')
+    def fn(**_):
+        calls.append(None)
+        raise kopf.Hibernation(delay=100)
+
+    await simulate_cycle({})
+    memory = next(iter(memories.iter_all_daemon_memories()))
+    while not memory.hibernated_daemons:
+        await asyncio.sleep(0.1)
+
+    assert len(calls) == 1
+    assert not any(task.get_name() == 'runner of fn' for task in asyncio.all_tasks())
+
+    # The sync stoppers cannot be awaited by the dummy's teardown, so stop the daemon explicitly.
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+
+
+@pytest.mark.parametrize('body1, body2, same', [
+    pytest.param({'spec': {'x': 1}}, {'spec': {'x': 1}}, True, id='same'),
+    pytest.param({'spec': {'x': 1}}, {'spec': {'x': 1}, 'status': {'y': 2}}, True, id='status'),
+    pytest.param({'spec': {'x': 1}}, {'spec': {'x': 1}, 'metadata': {'resourceVersion': '9'}},
+                 True, id='system-fields'),
+    pytest.param({'spec': {'x': 1}}, {'spec': {'x': 2}}, False, id='spec'),
+    pytest.param({'spec': {'x': 1}}, {'spec': {'x': 1}, 'metadata': {'labels': {'a': 'b'}}},
+                 False, id='labels'),
+])
+def test_digest_reflects_only_the_essence(settings, body1, body2, same):
+    digest1 = _get_digest(settings, kopf.Body(body1))
+    digest2 = _get_digest(settings, kopf.Body(body2))
+    assert (digest1 == digest2) == same
+
+
+async def test_digest_is_calculated_once_per_event(
+        resource, dummy, memories, simulate_cycle, looptime, mocker):
+
+    @kopf.daemon(*resource, id='fn1')
+    @kopf.daemon(*resource, id='fn2')
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        raise kopf.Hibernation()
+
+    await simulate_cycle({'spec': {'x': 1}})
+    await asyncio.sleep(1)
+    memory = next(iter(memories.iter_all_daemon_memories()))
+    assert set(memory.hibernated_daemons) == {'fn1', 'fn2'}
+
+    spy = mocker.spy(daemons, '_get_digest')
+    await simulate_cycle({'spec': {'x': 1}})
+    assert spy.call_count == 1
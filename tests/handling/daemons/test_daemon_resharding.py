@@ -0,0 +1,110 @@
+import asyncio
+
+import kopf
+from kopf._cogs.structs.ephemera import Memo
+from kopf._core.engines import daemons
+from kopf._core.engines.indexing import OperatorIndexers
+from kopf._core.engines.sharding import Shards
+from kopf._core.intents.stoppers import DaemonStoppingReason
+from kopf._core.reactor.inventory import ResourceMemories
+from kopf._core.reactor.processing import process_resource_event
+
+
+async def test_daemon_is_not_spawned_for_objects_of_other_members(
+        settings, resource, dummy, simulate_cycle, looptime):
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='me', settings=settings)
+    await shards.update(None, ['other1'])  # it owns the object with no uid
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+
+    await simulate_cycle({}, shards=shards)
+    await asyncio.sleep(1)
+    assert not dummy.mock.called
+
+
+async def test_running_daemon_is_stopped_when_handed_over(
+        settings, resource, dummy, simulate_cycle, looptime):
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='me', settings=settings)
+    executed = asyncio.Event()
+
+    @kopf.daemon(*resource, id='fn')
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        executed.set()
+        await kwargs['stopped'].wait()
+
+    await simulate_cycle({}, shards=shards)
+    await executed.wait()
+    assert dummy.mock.call_count == 1
+
+    await shards.update(None, ['other1'])  # it owns the object with no uid
+    await simulate_cycle({}, shards=shards)
+    await dummy.wait_for_daemon_done()
+
+    assert looptime == 0
+    stopped = dummy.mock.call_args.kwargs['stopped']
+    assert DaemonStoppingReason.OPERATOR_RESHARDING in stopped.reason
+
+
+async def test_handed_over_object_is_not_patched_and_is_handled_by_the_new_owner(
+        settings, registry, resource, dummy, simulate_cycle, k8s_mocked, looptime):
+    settings.peering.sharding = 'uid'
+    old_shards = Shards(identity='me', settings=settings)
+    new_shards = Shards(identity='other1', settings=settings)
+    new_memories = ResourceMemories()
+    resumed = []
+
+    @kopf.on.resume(*resource, id='resume_fn')
+    async def resume_fn(**_):
+        resumed.append(None)
+
+    @kopf.daemon(*resource, id='fn', cancellation_backoff=5)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        await kwargs['stopped'].wait()
+        await asyncio.sleep(2)  # exits slowly, so the old owner re-checks it
+
+    # An object that has been handled before, so that the new owner resumes it.
+    event_object = {'metadata': {
+        'finalizers': [settings.persistence.finalizer],
+        'annotations': {'kopf.zalando.org/last-handled-configuration': '{}\n'},
+    }}
+    await simulate_cycle(event_object, shards=old_shards)
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 1
+
+    # The old owner stops its daemon, but does not touch the object for the new owner.
+    await old_shards.update(None, ['other1'])  # it owns the object with no uid
+    await new_shards.update(None, ['me'])
+    await simulate_cycle(event_object, shards=old_shards)
+    await dummy.wait_for_daemon_done()
+    assert not k8s_mocked.patch.called
+    assert looptime == 6  # re-checked locally on the cancellation backoff, not on a touch-patch
+
+    # The new owner handles the object as a newly listed one.
+    await process_resource_event(
+        lifecycle=kopf.lifecycles.all_at_once,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        memories=new_memories,
+        memobase=Memo(),
+        indexers=OperatorIndexers(),
+        raw_event={'type': None, 'object': event_object},
+        event_queue=asyncio.Queue(),
+        shards=new_shards,
+        no_throttling=True,
+    )
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 2
+    assert len(resumed) == 1
+
+    # Stop the new owner's daemon; the old owner's one is stopped by the fixture's teardown.
+    memory = next(iter(new_memories.iter_all_memories()))
+    await daemons.stop_daemons(settings=settings, daemons=memory.daemons_memory.running_daemons)
+    await asyncio.sleep(2)
+    assert not memory.daemons_memory.running_daemons
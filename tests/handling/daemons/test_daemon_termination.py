@@ -226,11 +226,12 @@ async def test_daemon_exits_instantly_on_cancellation_with_backoff(
     await simulate_cycle(event_object)
 
     assert looptime == 1.23  # i.e. no additional sleeps happened
-    assert k8s_mocked.patch.call_count == 2  # the 1st merge-patch is the dummy removal, ignore
-    assert k8s_mocked.patch.call_args_list[1].kwargs['payload'] == [
-        {'op': 'test', 'path': '/metadata/resourceVersion', 'value': '1234567890'},
-        {'op': 'remove', 'path': '/metadata/finalizers'},
-    ]
+    assert k8s_mocked.patch.call_count == 1  # the finalizer is folded into the dummy removal
+    assert k8s_mocked.patch.call_args_list[0].kwargs['payload']['metadata'] == {
+        'annotations': {'kopf.zalando.org/touch-dummy': None},
+        'resourceVersion': '1234567890',
+        'finalizers': None,
+    }
 
     # Cleanup.
     await dummy.wait_for_daemon_done()
@@ -288,11 +289,12 @@ async def test_daemon_exits_slowly_on_cancellation_with_backoff(
     await dummy.wait_for_daemon_done()
 
     assert looptime == 1.23 + 4.56  # i.e. not additional sleeps happened
-    assert k8s_mocked.patch.call_count == 2  # the 1st merge-patch is the dummy removal, ignore
-    assert k8s_mocked.patch.call_args_list[1].kwargs['payload'] == [
-        {'op': 'test', 'path': '/metadata/resourceVersion', 'value': '1234567890'},
-        {'op': 'remove', 'path': '/metadata/finalizers'},
-    ]
+    assert k8s_mocked.patch.call_count == 1  # the finalizer is folded into the dummy removal
+    assert k8s_mocked.patch.call_args_list[0].kwargs['payload']['metadata'] == {
+        'annotations': {'kopf.zalando.org/touch-dummy': None},
+        'resourceVersion': '1234567890',
+        'finalizers': None,
+    }
 
 
 async def test_daemon_is_abandoned_due_to_cancellation_timeout_reached(
@@ -338,11 +340,12 @@ async def test_daemon_is_abandoned_due_to_cancellation_timeout_reached(
         await simulate_cycle(event_object)
 
     assert looptime == 1000 + 4.56
-    assert k8s_mocked.patch.call_count == 2  # the 1st merge-patch is the dummy removal, ignore
-    assert k8s_mocked.patch.call_args_list[1].kwargs['payload'] == [
-        {'op': 'test', 'path': '/metadata/resourceVersion', 'value': '1234567890'},
-        {'op': 'remove', 'path': '/metadata/finalizers'},
-    ]
+    assert k8s_mocked.patch.call_count == 1  # the finalizer is folded into the dummy removal
+    assert k8s_mocked.patch.call_args_list[0].kwargs['payload']['metadata'] == {
+        'annotations': {'kopf.zalando.org/touch-dummy': None},
+        'resourceVersion': '1234567890',
+        'finalizers': None,
+    }
     assert_logs(["Daemon 'fn' did not exit in time. Leaving it orphaned."])
 
     # Cleanup.
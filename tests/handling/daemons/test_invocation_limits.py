@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import kopf
+from kopf._core.engines.daemons import InvocationLimiters, _get_sync_limit, limiters_var
+
+
+@pytest.fixture()
+def limiters():  # must be sync-def
+    limiters = InvocationLimiters()
+    token = limiters_var.set(limiters)
+    try:
+        yield limiters
+    finally:
+        limiters_var.reset(token)
+
+
+@pytest.fixture()
+def timers(limiters, timers):
+    # The operator-wide timer engine must see the limiters, so they are set before it is started.
+    return timers
+
+
+async def test_timers_beyond_the_limit_wait_for_a_slot(
+        settings, resource, dummy, limiters, timers, simulate_cycle, looptime):
+    settings.background.max_concurrent_invocations = 1
+    started: dict[str, float] = {}
+
+    @kopf.timer(*resource, id='fn1', interval=100)
+    async def fn1(**kwargs):
+        started['fn1'] = float(looptime)
+        dummy.mock(**kwargs)
+        await asyncio.sleep(5)
+
+    @kopf.timer(*resource, id='fn2', interval=100)
+    async def fn2(**kwargs):
+        started['fn2'] = float(looptime)
+        dummy.mock(**kwargs)
+        await asyncio.sleep(5)
+
+    await simulate_cycle({})
+    await asyncio.sleep(12)
+
+    assert sorted(started.values()) == [0, 5]
+    assert limiters.invocations.running == 0
+    assert limiters.invocations.waiting == 0
+
+
+async def test_daemons_occupy_their_slots_while_running(
+        settings, resource, dummy, limiters, timers, simulate_cycle, looptime):
+    settings.background.max_concurrent_invocations = 1
+    started: dict[str, float] = {}
+
+    @kopf.daemon(*resource, id='fn1')
+    async def fn1(stopped, **kwargs):
+        started['fn1'] = float(looptime)
+        dummy.mock(stopped=stopped, **kwargs)
+        await stopped.wait(10)
+
+    @kopf.daemon(*resource, id='fn2')
+    async def fn2(stopped, **kwargs):
+        started['fn2'] = float(looptime)
+        dummy.mock(stopped=stopped, **kwargs)
+        await stopped.wait(10)
+
+    await simulate_cycle({})
+    await asyncio.sleep(5)
+
+    assert list(started.values()) == [0]
+    assert limiters.invocations.running == 1
+    assert limiters.invocations.waiting == 1
+
+    await asyncio.sleep(10)
+    assert sorted(started.values()) == [0, 10]
+
+
+async def test_waiting_invocations_exit_when_stopped(
+        settings, resource, dummy, limiters, timers, simulate_cycle, looptime):
+    settings.background.max_concurrent_invocations = 1
+
+    @kopf.timer(*resource, id='fn1', interval=100)
+    @kopf.timer(*resource, id='fn2', interval=100)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        await asyncio.sleep(10)  # ignores the stopper
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 1
+    assert limiters.invocations.waiting == 1
+
+    # The deletion waits until the running timer exits; the waiting one is never invoked.
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+    assert dummy.mock.call_count == 1
+    assert limiters.invocations.running == 0
+    assert limiters.invocations.waiting == 0
+
+
+async def test_sync_timers_leave_the_reserved_workers_free(
+        settings, resource, limiters, timers, simulate_cycle):
+    settings.execution.max_workers = 3
+    settings.background.reserved_workers = 2
+    lock = threading.Lock()
+    running: list[int] = [0]
+    overlaps: list[int] = []
+
+    @kopf.timer(*resource, id='fn1', interval=100)
+    @kopf.timer(*resource, id='fn2', interval=100)
+    def fn(**kwargs):
+        with lock:
+            running[0] += 1
+            overlaps.append(running[0])
+        time.sleep(0.1)
+        with lock:
+            running[0] -= 1
+
+    await simulate_cycle({})
+    while len(overlaps) < 2 or limiters.sync_invocations.running:
+        await asyncio.sleep(0.1)
+
+    # The sync stoppers cannot be awaited by the dummy's teardown, so stop the timers explicitly.
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+    await asyncio.sleep(0.1)
+
+    assert overlaps == [1, 1]
+
+
+@pytest.mark.parametrize('max_workers, reserved_workers, expected', [
+    (None, None, None),
+    (5, None, None),
+    (5, 0, 5),
+    (5, 2, 3),
+    (5, 5, 1),
+    (5, 9, 1),
+])
+def test_sync_limit_is_derived_from_the_executor(settings, max_workers, reserved_workers, expected):
+    if max_workers is not None:
+        settings.execution.max_workers = max_workers
+    else:
+        settings.execution.executor = object()  # no known size
+    settings.background.reserved_workers = reserved_workers
+    assert _get_sync_limit(settings) == expected
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+import kopf
+
+pytestmark = pytest.mark.parametrize('timers', ['engine'], indirect=True)
+
+
+@pytest.fixture()
+def settings(settings):
+    # The limit is read when the engine starts, so it is set before the tests.
+    settings.background.max_concurrent_timers = 1
+    return settings
+
+
+def _runner_tasks():
+    return [task for task in asyncio.all_tasks() if task.get_name().startswith('runner of ')]
+
+
+async def test_waiting_timers_have_no_tasks(
+        resource, dummy, timers, k8s_mocked, simulate_cycle, looptime):
+
+    @kopf.timer(*resource, id='fn', interval=1.0)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+
+    await simulate_cycle({})
+    await asyncio.sleep(2.5)
+
+    assert dummy.mock.call_count == 3
+    assert not _runner_tasks()
+    assert not [task for task in asyncio.all_tasks() if task.get_name() == 'timer of fn']
+    assert len(timers) == 1
+
+
+async def test_idle_timers_exit_instantly_when_stopped(
+        resource, dummy, timers, k8s_mocked, simulate_cycle, looptime, memories):
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 1
+
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+    await dummy.wait_for_daemon_done()
+    assert looptime == 1
+    assert all(not memory.daemons_memory.running_daemons for memory in memories.iter_all_memories())
+
+
+async def test_running_timers_exit_after_the_invocation(
+        resource, dummy, timers, k8s_mocked, simulate_cycle, looptime):
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        await asyncio.sleep(5)
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 1
+
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+    await dummy.wait_for_daemon_done()
+    assert dummy.mock.call_count == 1
+    assert not dummy.mock.call_args.kwargs['stopped'].reason & kopf.DaemonStoppingReason.DAEMON_CANCELLED
+
+
+async def test_concurrent_invocations_are_limited(
+        resource, namespace, dummy, timers, k8s_mocked, simulate_cycle, looptime):
+    started = []
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(name, **kwargs):
+        dummy.mock(**kwargs)
+        started.append((name, asyncio.get_running_loop().time()))
+        await asyncio.sleep(3)
+
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name1', 'uid': 'uid1'}})
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name2', 'uid': 'uid2'}})
+    await asyncio.sleep(10)
+
+    assert [name for name, _ in started] == ['name1', 'name2']
+    assert [time for _, time in started] == [0, 3]
+
+    # Stop both timers, not only the last one (as the `dummy` fixture does).
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name1', 'uid': 'uid1', 'deletionTimestamp': '...'}})
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name2', 'uid': 'uid2', 'deletionTimestamp': '...'}})
+
+
+async def test_waiting_invocations_do_not_block_the_engine(
+        resource, namespace, dummy, timers, k8s_mocked, simulate_cycle, looptime, memories):
+    started = []
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(name, **kwargs):
+        dummy.mock(**kwargs)
+        started.append(name)
+        await asyncio.sleep(10)
+
+    # The 2nd timer waits for the slot; the 3rd one is still triggered & waits too.
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name1', 'uid': 'uid1'}})
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name2', 'uid': 'uid2'}})
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name3', 'uid': 'uid3'}})
+    await asyncio.sleep(1)
+    assert started == ['name1']
+    assert len(timers) == 0
+
+    # The waiting timers exit instantly, without being invoked.
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name2', 'uid': 'uid2', 'deletionTimestamp': '...'}})
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name3', 'uid': 'uid3', 'deletionTimestamp': '...'}})
+    await asyncio.sleep(1)
+    assert started == ['name1']
+    assert looptime == 2
+
+    await simulate_cycle({'metadata': {'namespace': namespace, 'name': 'name1', 'uid': 'uid1', 'deletionTimestamp': '...'}})
+
+
+async def test_stopped_timers_leave_no_entries_in_the_heap(
+        resource, dummy, timers, k8s_mocked, simulate_cycle, looptime):
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+
+    await simulate_cycle({})
+    await asyncio.sleep(1)
+    assert dummy.mock.call_count == 1
+    assert len(timers) == 1
+
+    await simulate_cycle({'metadata': {'deletionTimestamp': '...'}})
+    await dummy.wait_for_daemon_done()
+    assert len(timers) == 0
@@ -50,12 +50,10 @@ async def test_timer_patching_with_merge_and_fns(
     await asyncio.sleep(0.5)  # give it a half-cycle to patch after the last line of the handler
 
     payloads = [call.kwargs['payload'] for call in k8s_mocked.patch.call_args_list]
-    assert len(payloads) == 2
-    assert payloads[0] == {'status': {'merge-patch': 'hello'}}
-    assert payloads[1] == [
-        {'op': 'test', 'path': '/metadata/resourceVersion', 'value': '123'},
-        {'op': 'add', 'path': '/status', 'value': {'json-patch': 'hello'}},
-    ]
+    assert len(payloads) == 1  # the fns are folded into the merge-patch
+    assert payloads[0] == {  # unguarded: no lists are overwritten
+        'status': {'merge-patch': 'hello', 'json-patch': 'hello'},
+    }
 
 
 async def test_timer_fns_cleared_between_iterations(
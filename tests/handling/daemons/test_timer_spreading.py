@@ -0,0 +1,119 @@
+import asyncio
+import zlib
+
+import pytest
+
+import kopf
+
+
+def _phase(seed: str) -> float:
+    return zlib.crc32(seed.encode()) / 2**32
+
+
+async def test_timer_initial_delay_spread(
+        resource, dummy, assert_logs, k8s_mocked, simulate_cycle, looptime):
+    trigger = asyncio.Condition()
+
+    @kopf.timer(*resource, id='fn', initial_delay=5.0, initial_delay_spread=10.0, interval=1.0)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        async with trigger:
+            trigger.notify_all()
+
+    await simulate_cycle({'metadata': {'uid': 'uid1'}})
+    async with trigger:
+        await trigger.wait()
+
+    time = float(looptime)
+
+    # Stop the timer of this specific object (the `dummy` fixture stops an object with no uid).
+    await simulate_cycle({'metadata': {'uid': 'uid1', 'deletionTimestamp': '...'}})
+
+    assert 5 <= time < 15
+    assert time == pytest.approx(5 + 10 * _phase('uid1/fn'))
+
+
+async def test_timer_initial_delay_spread_differs_per_object(
+        resource, dummy, assert_logs, k8s_mocked, simulate_cycle, looptime):
+    trigger = asyncio.Condition()
+    called = []
+
+    @kopf.timer(*resource, id='fn', initial_delay_spread=10.0)
+    async def fn(uid, **kwargs):
+        dummy.mock(**kwargs)
+        called.append((uid, asyncio.get_running_loop().time()))
+        async with trigger:
+            trigger.notify_all()
+
+    await simulate_cycle({'metadata': {'uid': 'uid1'}})
+    await simulate_cycle({'metadata': {'uid': 'uid2'}})
+    async with trigger:
+        await trigger.wait_for(lambda: len(called) >= 2)
+
+    times = dict(called)
+    assert times['uid1'] == pytest.approx(10 * _phase('uid1/fn'))
+    assert times['uid2'] == pytest.approx(10 * _phase('uid2/fn'))
+    assert times['uid1'] != times['uid2']
+
+    # Stop both timers, not only the last one (as the `dummy` fixture does).
+    await simulate_cycle({'metadata': {'uid': 'uid1', 'deletionTimestamp': '...'}})
+    await simulate_cycle({'metadata': {'uid': 'uid2', 'deletionTimestamp': '...'}})
+
+
+@pytest.mark.parametrize('sharp', [False, True])
+async def test_timer_jitter(
+        resource, dummy, assert_logs, k8s_mocked, simulate_cycle, looptime, mocker, sharp):
+    uniform = mocker.patch('random.uniform', side_effect=lambda a, b: b)
+    trigger = asyncio.Condition()
+
+    @kopf.timer(*resource, id='fn', interval=1.0, jitter=0.5, sharp=sharp)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        async with trigger:
+            trigger.notify_all()
+
+    await simulate_cycle({})
+    async with trigger:
+        await trigger.wait_for(lambda: dummy.mock.call_count >= 3)
+
+    assert looptime == 3
+    assert uniform.call_args_list[0] == ((0, 0.5),)
+
+
+async def test_daemon_initial_delay_spread(
+        resource, dummy, assert_logs, k8s_mocked, simulate_cycle, looptime):
+
+    called = []
+
+    @kopf.daemon(*resource, id='fn', initial_delay_spread=10.0)
+    async def fn(**kwargs):
+        dummy.mock(**kwargs)
+        called.append(asyncio.get_running_loop().time())
+
+    await simulate_cycle({'metadata': {'uid': 'uid1'}})
+    await asyncio.sleep(20)
+
+    assert called == [pytest.approx(10 * _phase('uid1/fn'))]
+
+
+@pytest.mark.parametrize('timers', ['engine'], indirect=True)
+async def test_timer_rate_is_limited_operator_wide(
+        resource, namespace, settings, dummy, timers, k8s_mocked, simulate_cycle, looptime):
+    settings.background.max_timer_rate = 2
+    called = []
+
+    @kopf.timer(*resource, id='fn', interval=100)
+    async def fn(name, **kwargs):
+        dummy.mock(**kwargs)
+        called.append((name, asyncio.get_running_loop().time()))
+
+    for i in range(3):
+        await simulate_cycle({'metadata': {'namespace': namespace, 'name': f'name{i}', 'uid': f'uid{i}'}})
+    await asyncio.sleep(10)
+
+    assert [time for _, time in called] == [0, 0.5, 1.0]
+
+    # Stop all timers, not only the last one (as the `dummy` fixture does).
+    for i in range(3):
+        await simulate_cycle({'metadata': {'namespace': namespace, 'name': f'name{i}', 'uid': f'uid{i}',
+                                           'deletionTimestamp': '...'}})
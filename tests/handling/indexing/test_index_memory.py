@@ -0,0 +1,84 @@
+"""
+Memory benchmarks of the indices: the bytes of overhead per indexed object.
+
+The indexed values are small ints (cached by Python, so taking no memory),
+so that only the structures of the indices and their keys are measured.
+The bodies are re-created for every object, as the watch-events do.
+
+The limits are set with a margin above the measured values, but well below
+the memory usage of the previous non-compact implementation (in brackets).
+If the limits are exceeded, it is a regression in the memory efficiency.
+"""
+import gc
+import tracemalloc
+
+import pytest
+
+from kopf._cogs.structs.bodies import Body
+from kopf._core.engines.indexing import COUNTED_SIZE, Index, OperatorIndexer, Store
+
+COUNT = 2000
+
+
+def _measure(indexers, make_result):
+    uids = [f'{i:08d}-0000-0000-0000-000000000000' for i in range(COUNT)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for i, uid in enumerate(uids):
+            body = Body({'metadata': {'namespace': f'ns{i % 10}', 'name': f'name-{i}', 'uid': uid}})
+            key = indexers.make_key(body)
+            indexers['index_fn'].replace(key, make_result(body))
+        del body, key
+        gc.collect()
+        return (tracemalloc.get_traced_memory()[0] - baseline) / COUNT
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('make_result, limit', [
+    pytest.param(lambda body: {(body.metadata.namespace, body.metadata.name): 0}, 850,
+                 id='unique-keys'),  # measured ~630 bytes (~1060 before)
+    pytest.param(lambda body: {body.metadata.namespace: 0}, 400,
+                 id='shared-keys'),  # measured ~310 bytes (~470 before)
+])
+def test_bytes_per_indexed_object(indexers, index, make_result, limit):
+    indexers['index_fn'] = OperatorIndexer()
+    size = _measure(indexers, make_result)
+    assert size < limit
+
+
+def test_stores_and_indices_have_no_dicts():
+    assert not hasattr(Store(), '__dict__')
+    assert not hasattr(Index(), '__dict__')
+
+
+def test_keys_are_interned(indexers):
+    body1 = Body({'metadata': {'namespace': ''.join(['ns', '1']), 'name': ''.join(['n', '1'])}})
+    body2 = Body({'metadata': {'namespace': ''.join(['ns', '1']), 'name': ''.join(['n', '1'])}})
+    key1 = indexers.make_key(body1)
+    key2 = indexers.make_key(body2)
+    assert key1[0] is key2[0]
+    assert key1[1] is key2[1]
+
+
+def test_small_stores_are_counted_by_scanning():
+    store = Store()
+    for i in range(COUNTED_SIZE):
+        store._replace(('ns', f'name{i}', f'uid{i}'), i % 2)
+    assert store.count(0) == COUNTED_SIZE // 2
+    assert store.count(1) == COUNTED_SIZE // 2
+    assert store.count(2) == 0
+
+
+def test_large_stores_keep_counting_after_shrinking():
+    store = Store()
+    for i in range(COUNTED_SIZE * 2):
+        store._replace(('ns', f'name{i}', f'uid{i}'), i % 2)
+    for i in range(COUNTED_SIZE * 2 - 1):
+        store._discard(('ns', f'name{i}', f'uid{i}'))
+    assert store.count(0) == 0
+    assert store.count(1) == 1
+    assert 1 in store
+    assert 0 not in store
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+import kopf
+from kopf._cogs.aiokits.aiotoggles import ToggleSet
+from kopf._cogs.structs.ephemera import Memo
+from kopf._core.actions.lifecycles import all_at_once
+from kopf._core.reactor.inventory import ResourceMemories
+from kopf._core.reactor.processing import process_resource_event
+
+
+@pytest.fixture()
+def memories():
+    return ResourceMemories()
+
+
+@pytest.fixture()
+def results():
+    return []
+
+
+@pytest.fixture()
+def counters():
+    return []
+
+
+@pytest.fixture(autouse=True)
+def _lean_processing(settings):
+    settings.indexing.lean_processing = True
+
+
+@pytest.fixture(autouse=True)
+def index_fn(resource, indexers, results, counters):
+    @kopf.index(*resource, id='index_fn')
+    def index_fn(name, memo, **_):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        memo.counter = memo.get('counter', 0) + 1
+        counters.append(memo.counter)
+        return {name: result}
+    indexers.ensure([kopf.get_default_registry()._indexing.get_all_handlers()[0]])
+    return index_fn
+
+
+async def _process(*, resource, settings, indexers, memories, event_type='ADDED',
+                   resource_indexed=None, operator_indexed=None):
+    await process_resource_event(
+        lifecycle=all_at_once,
+        registry=kopf.get_default_registry(),
+        settings=settings,
+        resource=resource,
+        indexers=indexers,
+        memories=memories,
+        memobase=Memo(),
+        raw_event={'type': event_type, 'object': {'metadata': {'name': 'name1', 'uid': 'uid1'}}},
+        event_queue=asyncio.Queue(),
+        resource_indexed=resource_indexed,
+        operator_indexed=operator_indexed,
+    )
+
+
+async def test_index_only_resources_are_indexed_without_memories(
+        resource, settings, indexers, memories, results, k8s_mocked):
+    results.extend([123])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert set(indexers.indices['index_fn']['name1']) == {123}
+    assert not list(memories.iter_all_memories())
+    assert not indexers.memories
+    assert not k8s_mocked.patch.called
+
+
+async def test_index_only_resources_are_discarded_on_deletion(
+        resource, settings, indexers, memories, results, k8s_mocked):
+    results.extend([123])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories,
+                   event_type='DELETED')
+    assert not indexers.indices['index_fn']
+    assert not list(memories.iter_all_memories())
+
+
+async def test_failures_are_remembered_until_succeeded(
+        resource, settings, indexers, memories, results, k8s_mocked):
+    results.extend([kopf.TemporaryError("boo!", delay=0), 456])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert not indexers.indices['index_fn']
+    assert set(indexers.memories) == {(None, 'name1', 'uid1')}
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert set(indexers.indices['index_fn']['name1']) == {456}
+    assert not indexers.memories
+
+
+async def test_readiness_is_not_awaited(
+        resource, settings, indexers, memories, results, k8s_mocked, looptime):
+    results.extend([123])
+    operator_indexed = ToggleSet(all)
+    resource_indexed = await operator_indexed.make_toggle()
+    await operator_indexed.make_toggle(name='other resources')
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories,
+                   resource_indexed=resource_indexed, operator_indexed=operator_indexed)
+    assert resource_indexed not in operator_indexed
+    assert looptime == 0
+
+
+async def test_memos_are_not_persisted(
+        resource, settings, indexers, memories, results, counters, k8s_mocked):
+    results.extend([1, 2])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert set(indexers.indices['index_fn']['name1']) == {2}
+    assert counters == [1, 1]
+
+
+async def test_regular_processing_when_disabled(
+        resource, settings, indexers, memories, results, counters, k8s_mocked):
+    settings.indexing.lean_processing = False
+    results.extend([1, 2])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert set(indexers.indices['index_fn']['name1']) == {2}
+    assert list(memories.iter_all_memories())
+    assert counters == [1, 2]
+
+
+async def test_regular_processing_with_other_handlers(
+        resource, settings, indexers, memories, results, k8s_mocked):
+
+    @kopf.on.event(*resource, id='event_fn')
+    def event_fn(**_):
+        pass
+
+    results.extend([123])
+    await _process(resource=resource, settings=settings, indexers=indexers, memories=memories)
+    assert set(indexers.indices['index_fn']['name1']) == {123}
+    assert list(memories.iter_all_memories())
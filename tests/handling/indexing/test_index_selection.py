@@ -0,0 +1,149 @@
+import pytest
+
+from kopf._core.engines.indexing import Index, Store
+
+KEY1 = ('ns1', 'name1', 'uid1')
+KEY2 = ('ns1', 'name2', 'uid2')
+KEY3 = ('ns2', 'name3', 'uid3')
+
+
+@pytest.fixture()
+def store():
+    return Store()
+
+
+@pytest.fixture()
+def tuple_index():
+    index = Index()
+    index._replace(KEY1, {('ns1', 'app1'): 'a', ('ns1', 'app2'): 'b'})
+    index._replace(KEY2, {('ns1', 'app1'): 'c', ('ns10', 'app1'): 'd'})
+    index._replace(KEY3, {('ns2', 'app1'): 'e'})
+    return index
+
+
+def test_store_membership_of_hashable_values(store):
+    store._replace(KEY1, 'a')
+    store._replace(KEY2, 'a')
+    store._replace(KEY3, 'b')
+    assert 'a' in store
+    assert 'b' in store
+    assert 'c' not in store
+    assert store.count('a') == 2
+    assert store.count('b') == 1
+    assert store.count('c') == 0
+
+
+def test_store_membership_of_unhashable_values(store):
+    store._replace(KEY1, {'x': 'y'})
+    store._replace(KEY2, {'x': 'y'})
+    store._replace(KEY3, 'b')
+    assert {'x': 'y'} in store
+    assert {'x': 'z'} not in store
+    assert 'b' in store
+    assert store.count({'x': 'y'}) == 2
+    assert store.count('b') == 1
+
+
+def test_store_counts_follow_replacements(store):
+    store._replace(KEY1, 'a')
+    store._replace(KEY2, 'a')
+    store._replace(KEY1, 'b')
+    assert store.count('a') == 1
+    assert store.count('b') == 1
+    store._replace(KEY2, {'x': 'y'})
+    assert 'a' not in store
+    assert {'x': 'y'} in store
+
+
+def test_store_counts_follow_discards(store):
+    store._replace(KEY1, 'a')
+    store._replace(KEY2, {'x': 'y'})
+    store._discard(KEY1)
+    store._discard(KEY2)
+    store._discard(KEY3)  # absent
+    assert 'a' not in store
+    assert {'x': 'y'} not in store
+    assert not store
+
+
+def test_index_counts_all_values(tuple_index):
+    assert len(tuple_index) == 4
+    assert tuple_index.count() == 5
+
+
+def test_index_counts_follow_discards(tuple_index):
+    tuple_index._discard(KEY2)
+    assert len(tuple_index) == 3
+    assert tuple_index.count() == 3
+    tuple_index._replace(KEY1, {('ns1', 'app1'): 'z'})
+    assert len(tuple_index) == 2
+    assert tuple_index.count() == 2
+
+
+def test_selection_by_tuple_prefix(tuple_index):
+    selected = dict(tuple_index.select(prefix=('ns1',)))
+    assert set(selected) == {('ns1', 'app1'), ('ns1', 'app2')}
+    assert set(selected['ns1', 'app1']) == {'a', 'c'}
+    assert tuple_index.count(prefix=('ns1',)) == 3
+    assert tuple_index.count(prefix=('ns1', 'app1')) == 2
+    assert tuple_index.count(prefix=('ns3',)) == 0
+
+
+def test_selection_by_range(tuple_index):
+    selected = dict(tuple_index.select(start=('ns10',), stop=('ns2', 'app1')))
+    assert set(selected) == {('ns10', 'app1')}
+    assert set(dict(tuple_index.select(start=('ns10',)))) == {('ns10', 'app1'), ('ns2', 'app1')}
+    assert set(dict(tuple_index.select(stop=('ns10',)))) == {('ns1', 'app1'), ('ns1', 'app2')}
+
+
+def test_selection_by_string_prefix():
+    index = Index()
+    index._replace(KEY1, {'app-1': 'a', 'app-2': 'b', 'other': 'c'})
+    assert set(dict(index.select(prefix='app-'))) == {'app-1', 'app-2'}
+    assert index.count(prefix='app-') == 2
+
+
+def test_selection_follows_new_keys(tuple_index):
+    assert tuple_index.count(prefix=('ns3',)) == 0
+    tuple_index._replace(('ns3', 'name4', 'uid4'), {('ns3', 'app1'): 'f'})
+    assert tuple_index.count(prefix=('ns3',)) == 1
+
+
+def test_selection_with_incomparable_keys():
+    index = Index()
+    index._replace(KEY1, {(None, 'app1'): 'a', ('ns1', 'app1'): 'b', 'ns1': 'c', None: 'd'})
+    assert set(dict(index.select(prefix=('ns1',)))) == {('ns1', 'app1')}
+    assert set(dict(index.select(prefix=(None,)))) == {(None, 'app1')}
+    assert set(dict(index.select(prefix='ns'))) == {'ns1'}
+    assert set(dict(index.select(start='a'))) == {'ns1'}
+
+
+def test_selection_with_incomparable_criteria(tuple_index):
+    assert set(dict(tuple_index.select(prefix='ns1'))) == set()
+    assert set(dict(tuple_index.select(start='ns1'))) == set()
+
+
+def test_selection_follows_removed_keys(tuple_index):
+    assert tuple_index.count(prefix=('ns1',)) == 3
+    tuple_index._discard(KEY1)
+    assert set(dict(tuple_index.select(prefix=('ns1',)))) == {('ns1', 'app1')}
+    assert tuple_index.count(prefix=('ns1',)) == 1
+
+
+def test_sorted_keys_are_kept_up_to_date_without_resorting(tuple_index):
+    assert tuple_index.count(prefix=('ns3',)) == 0
+    sorted_keys = tuple_index._Index__sorted
+    tuple_index._replace(('ns3', 'name4', 'uid4'), {('ns3', 'app1'): 'f'})
+    tuple_index._discard(KEY3)
+    assert tuple_index._Index__sorted is sorted_keys
+    assert sorted_keys == [('ns1', 'app1'), ('ns1', 'app2'), ('ns10', 'app1'), ('ns3', 'app1')]
+
+
+def test_selection_recovers_when_incomparable_keys_are_removed(tuple_index):
+    assert tuple_index.count(prefix=('ns1',)) == 3
+    tuple_index._replace(('ns3', 'name4', 'uid4'), {None: 'f'})
+    assert tuple_index.count(prefix=('ns1',)) == 3  # by scanning
+    assert tuple_index._Index__sorted is None
+    tuple_index._discard(('ns3', 'name4', 'uid4'))
+    assert tuple_index.count(prefix=('ns1',)) == 3  # by bisecting again
+    assert tuple_index._Index__sorted is not None
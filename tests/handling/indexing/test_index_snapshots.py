@@ -0,0 +1,219 @@
+import asyncio
+import pickle
+
+import pytest
+
+from kopf._cogs.aiokits.aiotoggles import Toggle, ToggleSet
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.ephemera import Memo
+from kopf._core.actions.execution import Outcome
+from kopf._core.actions.lifecycles import all_at_once
+from kopf._core.engines.indexing import OperatorIndexer, OperatorIndexers, get_fingerprint, \
+                                        snapshotter
+from kopf._core.reactor.inventory import ResourceMemories
+from kopf._core.reactor.processing import process_resource_event
+
+
+def _body(namespace, name, version):
+    return Body({'metadata': {'namespace': namespace, 'name': name, 'uid': f'uid-{name}',
+                              'resourceVersion': version}})
+
+
+def _restored_indexers(indexers, namespace):
+    # Index an object in other indexers of the same structure, and restore it into these ones.
+    source = OperatorIndexers()
+    source['index_fn'] = OperatorIndexer()
+    source.replace(_body(namespace, 'name1', '100'), {'index_fn': Outcome(final=True, result=123)})
+    assert indexers.load(pickle.loads(pickle.dumps(source.dump())))
+
+
+async def _process(*, resource, settings, registry, indexers, body, operator_indexed=None):
+    await process_resource_event(
+        lifecycle=all_at_once,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        indexers=indexers,
+        memories=ResourceMemories(),
+        memobase=Memo(),
+        raw_event={'type': None, 'object': dict(body)},
+        event_queue=asyncio.Queue(),
+        resource_indexed=Toggle(),  # used! only to enable indexing.
+        operator_indexed=operator_indexed,
+    )
+
+
+def test_versions_are_remembered_on_success(indexers, index, namespace):
+    body = _body(namespace, 'name1', '100')
+    indexers.replace(body, {'index_fn': Outcome(final=True, result=123)})
+    assert indexers.versions == {indexers.make_key(body): '100'}
+
+
+def test_versions_are_forgotten_on_failures(indexers, index, namespace):
+    body = _body(namespace, 'name1', '100')
+    indexers.replace(body, {'index_fn': Outcome(final=True, result=123)})
+    indexers.replace(body, {'index_fn': Outcome(final=True, exception=Exception())})
+    assert indexers.versions == {}
+
+
+def test_versions_are_forgotten_on_deletion(indexers, index, namespace):
+    body = _body(namespace, 'name1', '100')
+    indexers.replace(body, {'index_fn': Outcome(final=True, result=123)})
+    indexers.discard(body)
+    assert indexers.versions == {}
+
+
+def test_snapshot_is_restored(indexers, index, namespace):
+    _restored_indexers(indexers, namespace)
+    key = indexers.make_key(_body(namespace, 'name1', '100'))
+    assert set(index) == {None}
+    assert set(index[None]) == {123}
+    assert indexers.versions == {key: '100'}
+    assert indexers.restored == {key: '100'}
+
+
+def test_snapshot_of_other_handlers_is_ignored(indexers, index, namespace):
+    source = OperatorIndexers()
+    source['other_fn'] = OperatorIndexer()
+    source.replace(_body(namespace, 'name1', '100'), {'other_fn': Outcome(final=True, result=1)})
+    assert not indexers.load(source.dump())
+    assert not index
+    assert not indexers.restored
+
+
+def test_snapshot_of_other_format_is_ignored(indexers, index, namespace):
+    assert not indexers.load({'format': -1, 'versions': {}, 'indices': {'index_fn': {}}})
+
+
+def test_snapshot_of_other_handler_code_is_ignored(indexers, namespace):
+    indexers['index_fn'] = OperatorIndexer(fingerprint='new-code')
+    source = OperatorIndexers()
+    source['index_fn'] = OperatorIndexer(fingerprint='old-code')
+    source.replace(_body(namespace, 'name1', '100'), {'index_fn': Outcome(final=True, result=1)})
+    assert not indexers.load(source.dump())
+    assert not indexers['index_fn'].index
+    assert not indexers.restored
+
+
+def test_snapshot_of_other_operator_fingerprint_is_ignored(indexers, index, namespace):
+    source = OperatorIndexers()
+    source['index_fn'] = OperatorIndexer()
+    source.replace(_body(namespace, 'name1', '100'), {'index_fn': Outcome(final=True, result=1)})
+    assert not indexers.load(source.dump(fingerprint='v1'), fingerprint='v2')
+    assert not index
+    assert indexers.load(source.dump(fingerprint='v2'), fingerprint='v2')
+    assert index
+
+
+def test_fingerprints_follow_the_code_only():
+    def fn1(body, **_):
+        return body.get('spec', {}).get('x')
+
+    def fn2(body, **_):
+        return body.get('spec', {}).get('x')
+
+    def fn3(body, **_):
+        return body.get('spec', {}).get('y')
+
+    assert get_fingerprint(fn1) is not None
+    assert get_fingerprint(fn1) == get_fingerprint(fn2)
+    assert get_fingerprint(fn1) != get_fingerprint(fn3)
+    assert get_fingerprint(object()) is None
+
+
+def test_unchanged_object_is_verified(indexers, index, namespace):
+    _restored_indexers(indexers, namespace)
+    assert indexers.verify(_body(namespace, 'name1', '100'))
+    assert not indexers.restored
+    assert set(index[None]) == {123}
+
+
+def test_changed_object_is_not_verified(indexers, index, namespace):
+    _restored_indexers(indexers, namespace)
+    assert not indexers.verify(_body(namespace, 'name1', '200'))
+    assert not indexers.restored
+
+
+def test_unseen_objects_are_purged(indexers, index, namespace):
+    _restored_indexers(indexers, namespace)
+    indexers.purge()
+    assert not index
+    assert not indexers.versions
+    assert not indexers.restored
+
+
+async def test_unchanged_object_is_not_reindexed(
+        resource, namespace, settings, registry, indexers, index, handlers):
+    _restored_indexers(indexers, namespace)
+    handlers.index_mock.return_value = 456
+    await _process(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                   body=_body(namespace, 'name1', '100'))
+    assert not handlers.index_mock.called
+    assert set(index[None]) == {123}
+
+
+async def test_changed_object_is_reindexed(
+        resource, namespace, settings, registry, indexers, index, handlers):
+    _restored_indexers(indexers, namespace)
+    handlers.index_mock.return_value = 456
+    await _process(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                   body=_body(namespace, 'name1', '200'))
+    assert handlers.index_mock.called
+    assert set(index[None]) == {456}
+
+
+async def test_unseen_objects_are_purged_on_readiness(
+        resource, namespace, settings, registry, indexers, index, handlers):
+    _restored_indexers(indexers, namespace)
+    handlers.index_mock.return_value = 456
+    await _process(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                   body=_body(namespace, 'name2', '200'), operator_indexed=ToggleSet(all))
+    assert set(index[None]) == {456}
+    assert not indexers.restored
+
+
+async def test_snapshotter_does_nothing_if_not_configured(settings, indexers, tmp_path):
+    settings.indexing.snapshot_path = None
+    await snapshotter(indexers=indexers, settings=settings)
+    assert not list(tmp_path.iterdir())
+
+
+async def test_snapshotter_restores_and_writes(settings, indexers, index, namespace, tmp_path):
+    path = tmp_path / 'snapshot.pickle'
+    source = OperatorIndexers()
+    source['index_fn'] = OperatorIndexer()
+    source.replace(_body(namespace, 'name1', '100'), {'index_fn': Outcome(final=True, result=123)})
+    path.write_bytes(pickle.dumps(source.dump()))
+
+    settings.indexing.snapshot_path = str(path)
+    settings.indexing.snapshot_interval = 10
+    task = asyncio.create_task(snapshotter(indexers=indexers, settings=settings))
+    await asyncio.sleep(1)
+    assert set(index[None]) == {123}
+
+    indexers.replace(_body(namespace, 'name2', '200'), {'index_fn': Outcome(final=True, result=456)})
+    await asyncio.sleep(10)
+    snapshot = pickle.loads(path.read_bytes())
+    assert set(snapshot['versions'].values()) == {'100', '200'}
+
+    indexers.discard(_body(namespace, 'name2', '200'))
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    snapshot = pickle.loads(path.read_bytes())
+    assert set(snapshot['versions'].values()) == {'100'}
+
+
+@pytest.mark.parametrize('content', [b'', b'garbage', pickle.dumps(['not', 'a', 'mapping'])])
+async def test_snapshotter_ignores_broken_files(
+        settings, indexers, index, tmp_path, content):
+    path = tmp_path / 'snapshot.pickle'
+    path.write_bytes(content)
+    settings.indexing.snapshot_path = str(path)
+    task = asyncio.create_task(snapshotter(indexers=indexers, settings=settings))
+    await asyncio.sleep(1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not index
+    assert pickle.loads(path.read_bytes())['versions'] == {}
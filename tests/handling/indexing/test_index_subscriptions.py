@@ -0,0 +1,187 @@
+import asyncio
+import logging
+
+import pytest
+
+import kopf
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.ephemera import Memo
+from kopf._core.actions.execution import Outcome
+from kopf._core.engines.indexing import OperatorSubscriptions, subscribe_resource
+
+
+def _body(namespace, name):
+    return Body({'metadata': {'namespace': namespace, 'name': name, 'uid': f'uid-{name}'}})
+
+
+@pytest.fixture()
+def queue(resource, indexers):
+    queue = asyncio.Queue()
+    indexers.subscriptions.queues[resource, None] = queue
+    return queue
+
+
+def _replayed(queue):
+    names = []
+    while not queue.empty():
+        raw_event = queue.get_nowait()
+        assert raw_event['type'] is None
+        names.append(raw_event['object']['metadata']['name'])
+    return names
+
+
+async def _subscribe(*, resource, settings, registry, indexers, body, event_type=None):
+    await subscribe_resource(
+        registry=registry,
+        indexers=indexers,
+        settings=settings,
+        resource=resource,
+        raw_event={'type': event_type, 'object': dict(body)},
+        logger=logging.getLogger('kopf.test.fake.logger'),
+        memo=Memo(),
+        body=body,
+    )
+
+
+def test_subscriptions_are_empty_initially():
+    subscriptions = OperatorSubscriptions()
+    assert not subscriptions
+    assert len(subscriptions) == 0
+
+
+def test_subscribed_objects_are_replayed_on_changes(resource, indexers, index, queue, namespace):
+    body = _body(namespace, 'name1')
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource, raw_body=dict(body),
+                                   subkeys={('index_fn', None)})
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    assert _replayed(queue) == ['name1']
+
+
+def test_subscribed_objects_are_replayed_on_discards(resource, indexers, index, queue, namespace):
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body(namespace, 'name1')),
+                                   subkeys={('index_fn', None)})
+    indexers.discard(_body(namespace, 'name2'))
+    assert _replayed(queue) == ['name1']
+
+
+def test_unchanged_values_are_not_replayed(resource, indexers, index, queue, namespace):
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body(namespace, 'name1')),
+                                   subkeys={('index_fn', None)})
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    assert _replayed(queue) == []
+
+
+def test_other_keys_are_not_replayed(resource, indexers, index, queue, namespace):
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body(namespace, 'name1')),
+                                   subkeys={('index_fn', 'other-key')})
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    assert _replayed(queue) == []
+
+
+def test_objects_are_replayed_once_for_many_keys(resource, indexers, index, queue, namespace):
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body(namespace, 'name1')),
+                                   subkeys={('index_fn', 'a'), ('index_fn', 'b')})
+    indexers.replace(_body(namespace, 'name2'),
+                     {'index_fn': Outcome(final=True, result={'a': 1, 'b': 2})})
+    assert _replayed(queue) == ['name1']
+
+
+def test_unsubscribed_objects_are_not_replayed(resource, indexers, index, queue, namespace):
+    indexers.subscriptions.replace(('ns', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body(namespace, 'name1')),
+                                   subkeys={('index_fn', None)})
+    indexers.subscriptions.discard(('ns', 'name1', 'uid1'))
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    assert _replayed(queue) == []
+    assert not indexers.subscriptions
+
+
+def test_namespaced_queues_are_preferred(resource, indexers, index, queue, namespace):
+    namespaced_queue = asyncio.Queue()
+    indexers.subscriptions.queues[resource, 'ns1'] = namespaced_queue
+    indexers.subscriptions.replace(('ns1', 'name1', 'uid1'), resource=resource,
+                                   raw_body=dict(_body('ns1', 'name1')),
+                                   subkeys={('index_fn', None)})
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result=123)})
+    assert _replayed(queue) == []
+    assert _replayed(namespaced_queue) == ['name1']
+
+
+@pytest.mark.parametrize('result, expected', [
+    pytest.param(None, set(), id='none'),
+    pytest.param('key1', {'key1'}, id='single'),
+    pytest.param(('ns1', 'key1'), {('ns1', 'key1')}, id='tuple'),
+    pytest.param(['key1', 'key2'], {'key1', 'key2'}, id='list'),
+    pytest.param({'key1', 'key2'}, {'key1', 'key2'}, id='set'),
+    pytest.param(['key1', None], {'key1'}, id='list-with-none'),
+])
+async def test_subscription_results_as_keys(
+        resource, namespace, settings, registry, indexers, index, queue, result, expected):
+
+    @kopf.subscribe(*resource, index='index_fn')
+    def subscribe_fn(**_):
+        return result
+
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=_body(namespace, 'name1'))
+    assert len(indexers.subscriptions) == (1 if expected else 0)
+    for key in expected:
+        indexers.replace(_body(namespace, 'name2'),
+                         {'index_fn': Outcome(final=True, result={key: 123})})
+        assert _replayed(queue) == ['name1']
+        indexers.discard(_body(namespace, 'name2'))
+        assert _replayed(queue) == ['name1']
+
+
+async def test_failed_subscriptions_are_ignored(
+        resource, namespace, settings, registry, indexers, index, queue, caplog):
+    caplog.set_level(logging.DEBUG)
+
+    @kopf.subscribe(*resource, index='index_fn')
+    def subscribe_fn(**_):
+        raise Exception("boo!")
+
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=_body(namespace, 'name1'))
+    assert not indexers.subscriptions
+    assert "boo!" in caplog.text
+
+
+async def test_deleted_objects_are_unsubscribed(
+        resource, namespace, settings, registry, indexers, index, queue):
+
+    @kopf.subscribe(*resource, index='index_fn')
+    def subscribe_fn(**_):
+        return 'key1'
+
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=_body(namespace, 'name1'))
+    assert indexers.subscriptions
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=_body(namespace, 'name1'), event_type='DELETED')
+    assert not indexers.subscriptions
+
+
+async def test_resubscriptions_replace_the_keys(
+        resource, namespace, settings, registry, indexers, index, queue):
+    results = ['key1', 'key2']
+
+    @kopf.subscribe(*resource, index='index_fn')
+    def subscribe_fn(**_):
+        return results.pop(0)
+
+    body = _body(namespace, 'name1')
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=body)
+    await _subscribe(resource=resource, settings=settings, registry=registry, indexers=indexers,
+                     body=body)
+    indexers.replace(_body(namespace, 'name2'), {'index_fn': Outcome(final=True, result={'key1': 1})})
+    assert _replayed(queue) == []
+    indexers.replace(_body(namespace, 'name3'), {'index_fn': Outcome(final=True, result={'key2': 2})})
+    assert _replayed(queue) == ['name1']
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import logging
+
+import pytest
+
+import kopf
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.ephemera import Memo
+from kopf._cogs.structs.patches import Patch
+from kopf._core.actions.execution import execute_handlers_concurrently
+from kopf._core.actions.progression import State
+from kopf._core.engines.indexing import OperatorIndexers
+from kopf._core.intents.causes import ChangingCause, Reason
+from kopf._core.reactor.inventory import ResourceMemories
+from kopf._core.reactor.processing import process_resource_event
+
+
+@pytest.fixture(autouse=True)
+def _finalizer_justified(registry, resource):
+    # The finalizer is always added by `cause_mock`; justify it to prevent its removal cycle.
+    @kopf.on.delete(*resource, id='del')
+    async def _del(**_):
+        pass
+
+
+def _get_progress(payload, handler_id):
+    return json.loads(payload['metadata']['annotations'][f'kopf.zalando.org/{handler_id}'])
+
+
+async def _process(*, registry, settings, resource, lifecycle):
+    await process_resource_event(
+        lifecycle=lifecycle,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        indexers=OperatorIndexers(),
+        memories=ResourceMemories(),
+        memobase=Memo(),
+        raw_event={'type': 'ADDED', 'object': {}},
+        event_queue=asyncio.Queue(),
+    )
+
+
+@pytest.mark.parametrize('limit, expected_time', [
+    pytest.param(None, 1, id='unlimited'),
+    pytest.param(5, 1, id='above'),
+    pytest.param(2, 3, id='below'),
+    pytest.param(1, 5, id='sequential'),
+])
+async def test_handlers_are_executed_concurrently(
+        registry, settings, resource, cause_mock, k8s_mocked, looptime,
+        limit, expected_time):
+    cause_mock.reason = Reason.CREATE
+    settings.execution.max_concurrent_handlers = limit
+
+    finished = []
+    for i in range(5):
+        @kopf.on.create(*resource, id=f'fn{i}')
+        async def fn(handler_id=f'fn{i}', **_):
+            await asyncio.sleep(1)
+            finished.append(handler_id)
+
+    await _process(registry=registry, settings=settings, resource=resource,
+                   lifecycle=kopf.lifecycles.concurrent)
+
+    assert looptime == expected_time
+    assert sorted(finished) == ['fn0', 'fn1', 'fn2', 'fn3', 'fn4']
+    assert k8s_mocked.patch.call_count == 1
+
+
+async def test_handlers_are_executed_sequentially_with_other_lifecycles(
+        registry, settings, resource, cause_mock, k8s_mocked, looptime):
+    cause_mock.reason = Reason.CREATE
+
+    for i in range(5):
+        @kopf.on.create(*resource, id=f'fn{i}')
+        async def fn(**_):
+            await asyncio.sleep(1)
+
+    await _process(registry=registry, settings=settings, resource=resource,
+                   lifecycle=kopf.lifecycles.all_at_once)
+
+    assert looptime == 5
+
+
+async def test_patches_are_merged_in_the_order_of_handlers(
+        registry, settings, resource, cause_mock, k8s_mocked, looptime):
+    cause_mock.reason = Reason.CREATE
+
+    @kopf.on.create(*resource, id='slow')
+    async def slow(patch, **_):
+        await asyncio.sleep(2)
+        patch.spec['field'] = 'slow'
+        patch.spec['slow'] = True
+
+    @kopf.on.create(*resource, id='fast')
+    async def fast(patch, **_):
+        await asyncio.sleep(1)
+        patch.spec['field'] = 'fast'
+        patch.spec['fast'] = True
+
+    await _process(registry=registry, settings=settings, resource=resource,
+                   lifecycle=kopf.lifecycles.concurrent)
+
+    assert looptime == 2
+    assert k8s_mocked.patch.call_count == 1
+    payload = k8s_mocked.patch.call_args_list[0].kwargs['payload']
+    assert payload['spec'] == {'field': 'fast', 'slow': True, 'fast': True}
+
+
+async def test_handlers_see_the_earlier_patch_and_do_not_revert_each_other(
+        registry, settings, resource, looptime):
+    seen = {}
+
+    @kopf.on.create(*resource, id='first')
+    async def first(patch, **_):
+        seen['first'] = patch.spec.get('field')
+        await asyncio.sleep(1)
+        patch.spec['field'] = 'first'
+
+    @kopf.on.create(*resource, id='second')
+    async def second(patch, **_):
+        seen['second'] = patch.spec.get('field')
+        await asyncio.sleep(2)
+        patch.spec['field'] = 'second'
+
+    @kopf.on.create(*resource, id='third')
+    async def third(patch, **_):
+        seen['third'] = patch.spec.get('field')
+        patch.spec['other'] = 'third'
+
+    handlers = registry._changing.get_all_handlers()
+    shared_patch = Patch({'spec': {'field': 'shared', 'kept': True}})
+    cause = ChangingCause(
+        logger=logging.getLogger('kopf.test.fake.logger'),
+        indices=OperatorIndexers().indices,
+        resource=resource,
+        patch=shared_patch,
+        memo=Memo(),
+        body=Body({}),
+        initial=False,
+        reason=Reason.CREATE,
+    )
+    await execute_handlers_concurrently(
+        settings=settings,
+        handlers=[h for h in handlers if h.id in {'first', 'second', 'third'}],
+        cause=cause,
+        state=State.from_scratch().with_handlers(handlers),
+    )
+
+    assert looptime == 2
+    assert seen == {'first': 'shared', 'second': 'shared', 'third': 'shared'}
+    assert dict(shared_patch) == {'spec': {'field': 'second', 'kept': True, 'other': 'third'}}
+
+
+async def test_outcomes_are_stored_per_handler(
+        registry, settings, resource, cause_mock, k8s_mocked, looptime):
+    cause_mock.reason = Reason.CREATE
+
+    @kopf.on.create(*resource, id='good')
+    async def good(**_):
+        return 'hello'
+
+    @kopf.on.create(*resource, id='bad')
+    async def bad(**_):
+        raise kopf.TemporaryError("oops", delay=10)
+
+    await _process(registry=registry, settings=settings, resource=resource,
+                   lifecycle=kopf.lifecycles.concurrent)
+
+    assert k8s_mocked.patch.call_count == 1
+    payload = k8s_mocked.patch.call_args_list[0].kwargs['payload']
+    assert _get_progress(payload, 'good')['success']
+    assert not _get_progress(payload, 'bad')['success']
+    assert _get_progress(payload, 'bad')['retries'] == 1
+    assert payload['status']['good'] == 'hello'
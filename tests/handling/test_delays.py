@@ -8,8 +8,11 @@ import pytest
 import kopf
 from kopf._cogs.configs.progress import ProgressRecord
 from kopf._cogs.structs.ephemera import Memo
-from kopf._core.actions.application import WAITING_KEEPALIVE_INTERVAL
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.patches import Patch
+from kopf._core.actions.application import WAITING_KEEPALIVE_INTERVAL, apply
 from kopf._core.actions.execution import TemporaryError
+from kopf._core.actions.loggers import LocalObjectLogger
 from kopf._core.actions.progression import HandlerState
 from kopf._core.engines.indexing import OperatorIndexers
 from kopf._core.intents.causes import HANDLER_REASONS, Reason
@@ -120,3 +123,25 @@ async def test_delayed_handlers_sleep(
     assert_logs([
         r"Sleeping for ([\d\.]+|[\d\.]+ \(capped [\d\.]+\)) seconds",
     ])
+
+
+async def test_noop_patches_do_not_skip_the_sleep(
+        settings, resource, namespace, assert_logs, k8s_mocked, looptime):
+    # The same values are not sent, so no watch-event will come to interrupt the sleep.
+    body = Body({'metadata': {'name': 'name1', 'namespace': namespace}, 'status': {'x': 1}})
+    patch = Patch({'status': {'x': 1}}, body=body)
+    applied, _, _ = await apply(
+        settings=settings,
+        resource=resource,
+        body=body,
+        patch=patch,
+        delays=[123],
+        logger=LocalObjectLogger(body=body, settings=settings),
+    )
+
+    assert not applied
+    assert looptime == 123
+    assert k8s_mocked.patch.call_count == 1
+    patch = k8s_mocked.patch.call_args_list[0].kwargs['payload']
+    assert 'kopf.zalando.org/touch-dummy' in patch['metadata']['annotations']
+    assert_logs([r"Sleeping for 123 seconds"], prohibited=["Sleeping was skipped"])
@@ -104,6 +104,48 @@ async def test_retry_error_delays_handler(
     ])
 
 
+# The extrahandlers are needed to prevent the cycle ending and status purging.
+@pytest.mark.parametrize('cause_type', HANDLER_REASONS)
+async def test_hibernation_silently_delays_handler(
+        registry, settings, handlers, extrahandlers, resource, cause_mock, cause_type,
+        assert_logs, k8s_mocked, looptime):
+    name1 = f'{cause_type}_fn'
+
+    event_type = None if cause_type == Reason.RESUME else 'irrelevant'
+    cause_mock.reason = cause_type
+    handlers.create_mock.side_effect = kopf.Hibernation("zzz", delay=123)
+    handlers.update_mock.side_effect = kopf.Hibernation("zzz", delay=123)
+    handlers.delete_mock.side_effect = kopf.Hibernation("zzz", delay=123)
+    handlers.resume_mock.side_effect = kopf.Hibernation("zzz", delay=123)
+
+    await process_resource_event(
+        lifecycle=kopf.lifecycles.one_by_one,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        indexers=OperatorIndexers(),
+        memories=ResourceMemories(),
+        memobase=Memo(),
+        raw_event={'type': event_type, 'object': {}},
+        event_queue=asyncio.Queue(),
+    )
+
+    assert looptime == 0
+    assert k8s_mocked.patch.called
+
+    patch = k8s_mocked.patch.call_args_list[0].kwargs['payload']
+    progress = json.loads(patch['metadata']['annotations'][f"kopf.zalando.org/{name1}"])
+    assert progress['failure'] is False
+    assert progress['success'] is False
+    assert progress['delayed']
+
+    assert_logs([
+        "Handler .+ hibernates: zzz",
+    ], prohibited=[
+        "failed temporarily",
+    ])
+
+
 # The extrahandlers are needed to prevent the cycle ending and status purging.
 @freezegun.freeze_time('2020-12-31T00:00:00')
 @pytest.mark.parametrize('backoff_setting, expected_delayed, expected_log_seconds', [
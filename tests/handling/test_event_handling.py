@@ -3,6 +3,7 @@ import asyncio
 import pytest
 
 import kopf
+from kopf._cogs.aiokits.aiotoggles import ToggleSet
 from kopf._cogs.structs.ephemera import Memo
 from kopf._core.engines.indexing import OperatorIndexers
 from kopf._core.intents.causes import ALL_REASONS
@@ -72,3 +73,33 @@ async def test_errors_are_ignored(
         "Handler 'event_fn2' is invoked.",
         "Handler 'event_fn2' succeeded.",
     ])
+
+
+@pytest.mark.parametrize('standby, paused, handled', [
+    pytest.param(False, False, True, id='active'),
+    pytest.param(False, True, True, id='paused-but-sneaked-in'),
+    pytest.param(True, False, True, id='standby-active'),
+    pytest.param(True, True, False, id='standby-paused'),
+])
+async def test_handlers_skipped_in_paused_standby(
+        registry, settings, handlers, resource, k8s_mocked, standby, paused, handled):
+    settings.peering.standby = standby
+    operator_paused = ToggleSet(any)
+    await operator_paused.make_toggle(paused)
+
+    await process_resource_event(
+        lifecycle=kopf.lifecycles.all_at_once,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        indexers=OperatorIndexers(),
+        memories=ResourceMemories(),
+        memobase=Memo(),
+        raw_event={'type': 'ADDED', 'object': {'metadata': {'uid': 'uid1'}}},
+        event_queue=asyncio.Queue(),
+        operator_paused=operator_paused,
+    )
+
+    assert handlers.index_mock.call_count == 1  # always kept warm
+    assert handlers.event_mock.call_count == (1 if handled else 0)
+    assert k8s_mocked.patch.called == handled
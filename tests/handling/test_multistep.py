@@ -129,9 +129,8 @@ async def test_2nd_step_finishes_the_handlers(caplog,
 
     # Finalizers could be removed for resources being deleted on the 2nd step.
     # The logic can vary though: either by deletionTimestamp, or by reason==DELETE.
+    # The removal is folded into the same merge-patch, guarded by the resource version.
     if deletion_ts and deletion_ts['deletionTimestamp']:
-        patch2 = k8s_mocked.patch.call_args_list[1].kwargs['payload']
-        assert patch2 == [
-            {'op': 'test', 'path': '/metadata/resourceVersion', 'value': '1234567890'},
-            {'op': 'remove', 'path': '/metadata/finalizers'},
-        ]
+        assert k8s_mocked.patch.call_count == 1
+        assert patch1['metadata']['finalizers'] is None
+        assert patch1['metadata']['resourceVersion'] == '1234567890'
@@ -0,0 +1,303 @@
+import asyncio
+import contextlib
+import logging
+
+import pytest
+
+import kopf
+from kopf._cogs.clients.errors import APIForbiddenError
+from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.ephemera import Memo
+from kopf._core.engines.indexing import OperatorIndexers
+from kopf._core.engines.ticking import MAX_CONCURRENT_DELIVERIES, OperatorTickers, \
+                                       tick_resource, ticker
+from kopf._core.intents.handlers import TickingHandler
+from kopf._core.reactor.processing import process_resource_event
+
+
+def _raw_body(namespace, name, **meta):
+    return {'metadata': {'namespace': namespace, 'name': name, 'uid': f'uid-{name}', **meta},
+            'spec': {'x': name}}
+
+
+def _tick(*, resource, registry, tickers, raw_body, event_type=None):
+    tick_resource(
+        registry=registry,
+        tickers=tickers,
+        resource=resource,
+        raw_event={'type': event_type, 'object': raw_body},
+        indices=OperatorIndexers().indices,
+        logger=logging.getLogger('kopf.test.fake.logger'),
+        memo=Memo(),
+        body=Body(raw_body),
+    )
+
+
+@pytest.fixture()
+def tickers():
+    return OperatorTickers()
+
+
+@pytest.fixture()
+async def run_ticker(settings, registry, tickers):
+    tasks = []
+
+    def run():
+        tasks.append(asyncio.create_task(ticker(
+            registry=registry,
+            settings=settings,
+            tickers=tickers,
+            indices=OperatorIndexers().indices,
+            memo=Memo(),
+        )))
+
+    yield run
+
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def test_decorator_registers_a_ticking_handler(resource, registry):
+
+    @kopf.tick(*resource, id='fn', interval=10, initial_delay=5, labels={'a': 'b'})
+    def fn(**_):
+        pass
+
+    handlers = registry._ticking.get_all_handlers()
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], TickingHandler)
+    assert handlers[0].fn is fn
+    assert handlers[0].id == 'fn'
+    assert handlers[0].interval == 10
+    assert handlers[0].initial_delay == 5
+    assert handlers[0].labels == {'a': 'b'}
+    assert str(handlers[0]) == "Batch timer 'fn'"
+
+
+def test_matching_objects_are_remembered(resource, registry, tickers, namespace):
+
+    @kopf.tick(*resource, id='fn', interval=10, labels={'a': 'b'})
+    def fn(**_):
+        pass
+
+    raw_body1 = _raw_body(namespace, 'name1', labels={'a': 'b'})
+    raw_body2 = _raw_body(namespace, 'name2', labels={'a': 'x'})
+    _tick(resource=resource, registry=registry, tickers=tickers, raw_body=raw_body1)
+    _tick(resource=resource, registry=registry, tickers=tickers, raw_body=raw_body2)
+    assert list(tickers['fn'].values()) == [raw_body1]
+
+
+def test_mismatching_objects_are_forgotten(resource, registry, tickers, namespace):
+
+    @kopf.tick(*resource, id='fn', interval=10, labels={'a': 'b'})
+    def fn(**_):
+        pass
+
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1', labels={'a': 'b'}))
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1', labels={'a': 'x'}))
+    assert not tickers['fn']
+
+
+@pytest.mark.parametrize('event_type, meta', [
+    pytest.param('DELETED', {}, id='deleted'),
+    pytest.param('MODIFIED', {'deletionTimestamp': '...'}, id='marked'),
+])
+def test_deleted_objects_are_forgotten(resource, registry, tickers, namespace, event_type, meta):
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    def fn(**_):
+        pass
+
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1'))
+    _tick(resource=resource, registry=registry, tickers=tickers, event_type=event_type,
+          raw_body=_raw_body(namespace, 'name1', **meta))
+    assert not tickers['fn']
+
+
+async def test_objects_are_remembered_by_processing(
+        resource, registry, settings, memories, tickers, k8s_mocked, namespace):
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    def fn(**_):
+        pass
+
+    raw_body = _raw_body(namespace, 'name1')
+    await process_resource_event(
+        lifecycle=kopf.lifecycles.all_at_once,
+        registry=registry,
+        settings=settings,
+        resource=resource,
+        indexers=OperatorIndexers(),
+        memories=memories,
+        memobase=Memo(),
+        raw_event={'type': 'ADDED', 'object': raw_body},
+        event_queue=asyncio.Queue(),
+        tickers=tickers,
+    )
+    assert list(tickers['fn'].values()) == [raw_body]
+
+
+async def test_all_objects_are_passed_at_once_every_interval(
+        resource, registry, tickers, run_ticker, namespace, looptime):
+    calls = []
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    async def fn(bodies, patches, **_):
+        calls.append((float(looptime), sorted(body.metadata.name for body in bodies), set(patches)))
+
+    for name in ['name1', 'name2']:
+        _tick(resource=resource, registry=registry, tickers=tickers,
+              raw_body=_raw_body(namespace, name))
+
+    run_ticker()
+    await asyncio.sleep(25)
+    assert calls == [
+        (10, ['name1', 'name2'], {'uid-name1', 'uid-name2'}),
+        (20, ['name1', 'name2'], {'uid-name1', 'uid-name2'}),
+    ]
+
+
+async def test_initial_delay_postpones_the_first_invocation(
+        resource, registry, tickers, run_ticker, namespace, looptime):
+    calls = []
+
+    @kopf.tick(*resource, id='fn', interval=10, initial_delay=3)
+    async def fn(**_):
+        calls.append(float(looptime))
+
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1'))
+
+    run_ticker()
+    await asyncio.sleep(25)
+    assert calls == [13, 23]
+
+
+async def test_no_invocations_without_objects(resource, registry, tickers, run_ticker, looptime):
+    calls = []
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    async def fn(**_):
+        calls.append(float(looptime))
+
+    run_ticker()
+    await asyncio.sleep(25)
+    assert not calls
+
+
+async def test_results_and_patches_are_applied_per_object(
+        resource, registry, tickers, run_ticker, namespace, k8s_mocked):
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    async def fn(patches, **_):
+        patches['uid-name2'].spec['y'] = 'z'
+        return {'uid-name1': 'result1'}
+
+    for name in ['name1', 'name2', 'name3']:
+        _tick(resource=resource, registry=registry, tickers=tickers,
+              raw_body=_raw_body(namespace, name))
+
+    run_ticker()
+    await asyncio.sleep(15)
+
+    payloads = {call.kwargs['url'].rsplit('/', 1)[-1]: call.kwargs['payload']
+                for call in k8s_mocked.patch.call_args_list}
+    assert payloads == {
+        'name1': {'status': {'fn': 'result1'}},
+        'name2': {'spec': {'y': 'z'}},
+    }
+
+
+async def test_patching_failures_are_isolated_per_object(
+        resource, registry, tickers, run_ticker, namespace, k8s_mocked, assert_logs, looptime):
+    calls = []
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    async def fn(**_):
+        calls.append(float(looptime))
+        return {'uid-name1': 'result1', 'uid-name2': 'result2'}
+
+    async def patch(*, url, **_):
+        if url.endswith('/name1'):
+            raise APIForbiddenError({}, status=403, headers={})
+        return {}
+
+    k8s_mocked.patch.side_effect = patch
+    for name in ['name1', 'name2']:
+        _tick(resource=resource, registry=registry, tickers=tickers,
+              raw_body=_raw_body(namespace, name))
+
+    run_ticker()
+    await asyncio.sleep(15)
+
+    urls = [call.kwargs['url'].rsplit('/', 1)[-1] for call in k8s_mocked.patch.call_args_list]
+    assert sorted(urls) == ['name1', 'name2']
+    assert calls == [10]  # not re-invoked as failed
+    assert_logs([r"Batch timer 'fn' could not patch the object"],
+                prohibited=[r"failed unexpectedly"])
+
+
+async def test_patching_is_limited_in_concurrency(
+        resource, registry, tickers, run_ticker, namespace, k8s_mocked, looptime):
+    running = []
+    peaks = []
+
+    @kopf.tick(*resource, id='fn', interval=100)
+    async def fn(**_):
+        return {f'uid-name{i}': 'result' for i in range(25)}
+
+    async def patch(**_):
+        running.append(None)
+        peaks.append(len(running))
+        await asyncio.sleep(1)
+        running.pop()
+        return {}
+
+    k8s_mocked.patch.side_effect = patch
+    for i in range(25):
+        _tick(resource=resource, registry=registry, tickers=tickers,
+              raw_body=_raw_body(namespace, f'name{i}'))
+
+    run_ticker()
+    await asyncio.sleep(150)
+    assert len(peaks) == 25
+    assert max(peaks) == MAX_CONCURRENT_DELIVERIES
+
+
+async def test_non_mapping_results_are_ignored(
+        resource, registry, tickers, run_ticker, namespace, k8s_mocked, assert_logs):
+
+    @kopf.tick(*resource, id='fn', interval=10)
+    async def fn(**_):
+        return 'unexpected'
+
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1'))
+
+    run_ticker()
+    await asyncio.sleep(15)
+    assert not k8s_mocked.patch.called
+    assert_logs([r"Batch timer 'fn' returned a non-mapping result"])
+
+
+async def test_errors_are_retried_with_backoff(
+        resource, registry, tickers, run_ticker, namespace, looptime):
+    calls = []
+
+    @kopf.tick(*resource, id='fn', interval=100, backoff=3)
+    async def fn(retry, **_):
+        calls.append((float(looptime), retry))
+        if retry < 2:
+            raise Exception("boo!")
+
+    _tick(resource=resource, registry=registry, tickers=tickers,
+          raw_body=_raw_body(namespace, 'name1'))
+
+    run_ticker()
+    await asyncio.sleep(150)
+    assert calls == [(100, 0), (103, 1), (106, 2)]
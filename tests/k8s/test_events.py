@@ -1,6 +1,8 @@
 import pytest
 
-from kopf._cogs.clients.events import post_event
+from kopf._cogs.clients import api
+from kopf._cogs.clients.api import Lane
+from kopf._cogs.clients.events import post_event, update_event
 from kopf._cogs.structs.bodies import build_object_reference
 from kopf._cogs.structs.references import Resource
 
@@ -165,3 +167,86 @@ async def test_headers_are_not_leaked(kmock, settings, logger, assert_logs, stat
         "RequestInfo",
         "headers=",
     ])
+
+
+async def test_posted_event_is_returned(kmock, settings, logger):
+    kmock['post v1/events', kmock.namespace('ns')] << {'metadata': {'name': 'ev1', 'namespace': 'ns'}}
+
+    obj = {'apiVersion': 'group/version',
+           'kind': 'kind',
+           'metadata': {'namespace': 'ns',
+                        'name': 'name',
+                        'uid': 'uid'}}
+    ref = build_object_reference(obj)
+    posted = await post_event(
+        ref=ref,
+        type='type',
+        reason='reason',
+        message='message',
+        resource=EVENTS,
+        settings=settings,
+        logger=logger,
+    )
+
+    assert posted == {'metadata': {'name': 'ev1', 'namespace': 'ns'}}
+    assert kmock[-1].data['count'] == 1
+
+
+async def test_updating(kmock, settings, logger):
+    kmock.objects[EVENTS, 'ns', 'ev1'] = {'count': 4}
+
+    updated = await update_event(
+        name='ev1',
+        namespace='ns',
+        count=5,
+        resource=EVENTS,
+        settings=settings,
+        logger=logger,
+    )
+
+    assert updated is True
+    assert len(kmock) == 1
+    assert kmock[-1].method == 'PATCH'
+    assert kmock[-1].data['count'] == 5
+    assert kmock[-1].data['lastTimestamp']
+
+
+async def test_updating_absent_events(kmock, settings, logger):
+    updated = await update_event(
+        name='ev1',
+        namespace='ns',
+        count=5,
+        resource=EVENTS,
+        settings=settings,
+        logger=logger,
+    )
+
+    assert updated is False
+
+
+async def test_updating_errors_logged_but_suppressed(kmock, settings, logger, assert_logs):
+    kmock.objects[EVENTS, 'ns', 'ev1'] = {'count': 4}
+    kmock['patch', EVENTS, kmock.namespace('ns'), kmock.name('ev1')] << 555
+
+    updated = await update_event(
+        name='ev1',
+        namespace='ns',
+        count=5,
+        resource=EVENTS,
+        settings=settings,
+        logger=logger,
+    )
+
+    assert updated is True
+    assert_logs(["Failed to update an event."])
+
+
+async def test_events_are_posted_in_the_bulk_lane(kmock, mocker, settings, logger):
+    kmock['post v1/events', kmock.namespace('ns')] << {}
+    request = mocker.spy(api, 'request')
+    obj = {'apiVersion': 'group/version', 'kind': 'kind',
+           'metadata': {'namespace': 'ns', 'name': 'name', 'uid': 'uid'}}
+    await post_event(ref=build_object_reference(obj), type='type', reason='reason',
+                     message='message', resource=EVENTS, settings=settings, logger=logger)
+    assert request.call_count == 1
+    assert request.call_args.kwargs['lane'] == Lane.BULK
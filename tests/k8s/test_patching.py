@@ -1,13 +1,17 @@
 """
 We test these aspects:
 
-- If we skip the irrelevant patches: empty or not applicable (for status).
+- If we skip the irrelevant patches: empty, no-op, or not applicable (for status).
 - If the status patches are executed separately if it is a subresource.
 - If the patches are formed properly (ops-wise, content-changing).
 - If the patches contain the "test" op with the proper `resourceVersion`.
   - Of the latest preceding patch, if any.
   - Of the original body if no patches precede it.
 - If we react properly to the HTTP 422 failures of the "test" op.
+- If the transformations are folded into the merge-patches when it saves API calls,
+  and if we fall back to the separate patches on HTTP 409 conflicts of the folded ones.
+- If the finalizer is applied server-side when configured so,
+  and if we fall back to the JSON-patches if the finalizer is not removed.
 
 We have 0-4 patches:
 
@@ -35,14 +39,19 @@ Additionally, every of these patches can catch HTTP API errors
 (of which HTTP 404 is handled gracefully, while others escalate).
 """
 import dataclasses
+import functools
 
 import pytest
 
+from kopf._cogs.clients import api
+from kopf._cogs.clients.api import Lane
 from kopf._cogs.clients.errors import APIError
 from kopf._cogs.clients.patching import patch_obj
 from kopf._cogs.structs.bodies import Body
+from kopf._cogs.structs.finalizers import allow_deletion, block_deletion
 from kopf._cogs.structs.patches import Patch
 from kopf._cogs.structs.references import Resource
+from kopf._cogs.structs.telemetry import OperatorMetrics, metrics_var
 
 # The key difference is the `resourceVersion` — we check that the proper one is used.
 # The empty status is present to ensure predictable json-patch diffs with one field only.
@@ -55,7 +64,8 @@ STATUS_JSONP_RESPONSE = {'metadata': {'resourceVersion': 'rv-status-jsonp'}, 'st
 @pytest.fixture()
 def resource():
     # We do not care about namespaced/cluster-wide here, only on the subresource presence.
-    return Resource('kopf.dev', 'v1', 'kopfexamples', subresources=frozenset({'status'}))
+    return Resource('kopf.dev', 'v1', 'kopfexamples', kind='KopfExample',
+                    subresources=frozenset({'status'}))
 
 
 @pytest.fixture(autouse=True)
@@ -116,6 +126,49 @@ async def test_empty_or_noop_patch_makes_no_api_calls(
     ])
 
 
+async def test_noop_merge_patch_makes_no_api_calls(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'spec': {'x': 'y'}, 'status': {}}
+    patch = Patch({'spec': {'x': 'y', 'z': None}, 'status': {'z': None}}, body=Body(original_body))
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+
+    assert result is None
+    assert remaining is None
+    assert len(kmock) == 0
+
+    assert_logs([
+        "Patching was skipped: all the changes are already in the object.",
+    ], prohibited=[
+        "Merge-patching the resource with",
+        "Merge-patching the status with",
+    ])
+
+
+async def test_noop_parts_of_merge_patch_are_not_sent(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'spec': {'x': 'y'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y', 'a': 'b'}, 'status': {'z': None}}, body=Body(original_body))
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+
+    assert result == OBJECT_MERGE_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 1
+    assert kmock[0].data == {'spec': {'a': 'b'}}
+
+    assert_logs([
+        "Merge-patching the resource with",
+    ], prohibited=[
+        "Merge-patching the status with",
+    ])
+
+
 async def test_object_merge_alone(caplog,
         kmock, settings, resource, namespace, logger, assert_logs):
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
@@ -215,6 +268,7 @@ async def test_object_jsonp_alone(
 
 async def test_object_jsonp_after_object_merge(
         kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource(None), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
     kmock.objects[resource, namespace, 'name1'] = original_body
     patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer])
@@ -224,15 +278,18 @@ async def test_object_jsonp_after_object_merge(
     )
     assert result == OBJECT_JSONP_RESPONSE
     assert remaining is None
-    assert len(kmock) == 2
-    assert kmock[0].subresource is None
+    assert len(kmock) == 3
+    assert kmock[0].subresource is None  # the folded one, failed
     assert kmock[1].subresource is None
-    assert kmock[0].data == {'spec': {'x': 'y'}}
-    assert kmock[1].data == [
+    assert kmock[2].subresource is None
+    assert kmock[1].data == {'spec': {'x': 'y'}}
+    assert kmock[2].data == [
         {'op': 'test', 'path': '/metadata/resourceVersion', 'value': 'rv-object-merge'},
         {'op': 'add', 'path': '/metadata/finalizers', 'value': ['fin']},
     ]
     assert_logs([
+        "Merge-patching the resource with",
+        "Could not apply the folded patch",
         "Merge-patching the resource with",
         "JSON-patching the resource with",
     ], prohibited=[
@@ -325,6 +382,7 @@ async def test_status_jsonp_after_object_merge(
 
 async def test_status_jsonp_after_status_merge(
         kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource('status'), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
     kmock.objects[resource, namespace, 'name1'] = original_body
     patch = Patch({'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_status_field])
@@ -334,15 +392,18 @@ async def test_status_jsonp_after_status_merge(
     )
     assert result == STATUS_JSONP_RESPONSE
     assert remaining is None
-    assert len(kmock) == 2
-    assert kmock[0].subresource == 'status'
+    assert len(kmock) == 3
+    assert kmock[0].subresource == 'status'  # the folded one, failed
     assert kmock[1].subresource == 'status'
-    assert kmock[0].data == {'status': {'x': 'y'}}
-    assert kmock[1].data == [
+    assert kmock[2].subresource == 'status'
+    assert kmock[1].data == {'status': {'x': 'y'}}
+    assert kmock[2].data == [
         {'op': 'test', 'path': '/metadata/resourceVersion', 'value': 'rv-status-merge'},
         {'op': 'add', 'path': '/status/count', 'value': 1},
     ]
     assert_logs([
+        "Merge-patching the status with",
+        "Could not apply the folded patch",
         "Merge-patching the status with",
         "JSON-patching the status with",
     ], prohibited=[
@@ -385,6 +446,7 @@ async def test_status_jsonp_after_object_jsonp(
 # Not of direct interest (already tested implicitly), but worth checking the worst case: 4x patches.
 async def test_all_four_patches(
         kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource(None), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
     kmock.objects[resource, namespace, 'name1'] = original_body
     patch = Patch({'spec': {'x': 'y'}, 'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer, _add_status_field])
@@ -394,22 +456,25 @@ async def test_all_four_patches(
     )
     assert result == STATUS_JSONP_RESPONSE
     assert remaining is None
-    assert len(kmock) == 4
-    assert kmock[0].subresource is None  # merge-patch
-    assert kmock[1].subresource == 'status'  # merge-patch
-    assert kmock[2].subresource is None  # json-patch
-    assert kmock[3].subresource == 'status'  # json-patch
-    assert kmock[0].data == {'spec': {'x': 'y'}}
-    assert kmock[1].data == {'status': {'x': 'y'}}
-    assert kmock[2].data == [
+    assert len(kmock) == 5
+    assert kmock[0].subresource is None  # folded merge-patch, failed
+    assert kmock[1].subresource is None  # merge-patch
+    assert kmock[2].subresource == 'status'  # merge-patch
+    assert kmock[3].subresource is None  # json-patch
+    assert kmock[4].subresource == 'status'  # json-patch
+    assert kmock[1].data == {'spec': {'x': 'y'}}
+    assert kmock[2].data == {'status': {'x': 'y'}}
+    assert kmock[3].data == [
         {'op': 'test', 'path': '/metadata/resourceVersion', 'value': 'rv-status-merge'},
         {'op': 'add', 'path': '/metadata/finalizers', 'value': ['fin']},
     ]
-    assert kmock[3].data == [
+    assert kmock[4].data == [
         {'op': 'test', 'path': '/metadata/resourceVersion', 'value': 'rv-object-jsonp'},
         {'op': 'add', 'path': '/status/count', 'value': 1},
     ]
     assert_logs([
+        "Merge-patching the resource with",
+        "Could not apply the folded patch",
         "Merge-patching the resource with",
         "Merge-patching the status with",
         "JSON-patching the resource with",
@@ -417,6 +482,330 @@ async def test_all_four_patches(
     ])
 
 
+#
+# Test folding of the transformations into the merge-patches of the same targets.
+#
+async def test_object_jsonp_folded_into_object_merge(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == OBJECT_MERGE_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 1
+    assert kmock[0].subresource is None
+    assert kmock[0].data == {
+        'spec': {'x': 'y'},
+        'metadata': {'finalizers': ['fin'], 'resourceVersion': 'rv0'},
+    }
+    assert_logs([
+        "Merge-patching the resource with",
+    ], prohibited=[
+        "Merge-patching the status with",
+        "JSON-patching the resource with",
+        "JSON-patching the status with",
+    ])
+
+
+async def test_status_jsonp_folded_into_status_merge(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_status_field])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == STATUS_MERGE_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 1
+    assert kmock[0].subresource == 'status'
+    assert kmock[0].data == {'status': {'x': 'y', 'count': 1}}  # unguarded: scalars only
+    assert_logs([
+        "Merge-patching the status with",
+    ], prohibited=[
+        "Merge-patching the resource with",
+        "JSON-patching the resource with",
+        "JSON-patching the status with",
+    ])
+
+
+async def test_all_four_patches_folded_into_two(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y'}, 'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer, _add_status_field])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == STATUS_MERGE_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 2
+    assert kmock[0].subresource is None
+    assert kmock[1].subresource == 'status'
+    assert kmock[0].data == {
+        'spec': {'x': 'y'},
+        'metadata': {'finalizers': ['fin'], 'resourceVersion': 'rv0'},
+    }
+    assert kmock[1].data == {
+        'status': {'x': 'y', 'count': 1},
+        'metadata': {'resourceVersion': 'rv-object-merge'},  # of the preceding patch
+    }
+    assert_logs([
+        "Merge-patching the resource with",
+        "Merge-patching the status with",
+    ], prohibited=[
+        "JSON-patching the resource with",
+        "JSON-patching the status with",
+    ])
+
+
+async def test_folded_conflict_falls_back_with_extra_api_calls(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource(None), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
+    metrics = OperatorMetrics()
+    metrics_var.set(metrics)
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == OBJECT_JSONP_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 3  # 1 folded & failed + 1 merge-patch + 1 JSON-patch
+    assert metrics.patch_requests == 3
+    assert metrics.patch_requests_per_cycle == {3: 1}
+    assert kmock[0].data['metadata']['resourceVersion'] == 'rv0'
+    assert 'resourceVersion' not in kmock[1].data.get('metadata', {})
+    assert_logs([
+        "Merge-patching the resource with",
+        "Could not apply the folded patch",
+        "Merge-patching the resource with",
+        "JSON-patching the resource with",
+    ])
+
+
+async def test_no_folding_without_resource_version(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    original_body = {'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == OBJECT_JSONP_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 2
+    assert kmock[0].data == {'spec': {'x': 'y'}}
+    assert_logs([
+        "Merge-patching the resource with",
+        "JSON-patching the resource with",
+    ])
+
+
+async def test_no_folding_of_unrepresentable_transformations(
+        kmock, settings, resource, namespace, logger, assert_logs):
+
+    def _set_null(body):
+        body.setdefault('spec', {})['z'] = None
+
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=[_set_null])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == OBJECT_JSONP_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 2
+    assert kmock[0].data == {'spec': {'x': 'y'}}
+    assert_logs([
+        "Merge-patching the resource with",
+        "JSON-patching the resource with",
+    ])
+
+
+@pytest.mark.parametrize('patch_dict, fns, exp_histogram, exp_skips', [
+    pytest.param({}, [], {}, 0, id='nothing'),
+    pytest.param({'spec': {'x': 'y'}}, [], {1: 1}, 0, id='merge'),
+    pytest.param({'spec': {'x': 'y'}}, [_add_finalizer], {1: 1}, 0, id='folded'),
+    pytest.param({'status': {'x': 'y'}}, [_add_finalizer], {2: 1}, 0, id='separate'),
+    pytest.param({'status': {'x': None}}, [], {}, 1, id='noop-merge'),
+    pytest.param({'status': {'x': None}}, [_noop], {}, 1, id='noop-fns'),
+])
+async def test_api_calls_are_measured(
+        kmock, settings, resource, namespace, logger, patch_dict, fns, exp_histogram, exp_skips):
+    metrics = OperatorMetrics()
+    metrics_var.set(metrics)
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch(patch_dict, body=Body(original_body), fns=fns)
+    await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert metrics.patch_requests_per_cycle == exp_histogram
+    assert metrics.patch_requests == len(kmock)
+    assert metrics.patch_cycles == (1 if len(kmock) else 0)
+    assert metrics.patch_skips == exp_skips
+
+
+#
+# Test the server-side apply of the finalizer (the other fields are merge- & JSON-patched as usual).
+#
+@pytest.fixture()
+def apply_strategy(settings):
+    settings.persistence.patch_strategy = 'apply'
+    settings.persistence.finalizer = 'fin'
+
+
+@pytest.mark.usefixtures('apply_strategy')
+async def test_finalizer_addition_applied_server_side(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    kmock['patch', {'Content-Type': 'application/apply-patch+yaml'}] << {
+        'metadata': {'resourceVersion': 'rv-apply', 'finalizers': ['other', 'fin']},
+    }
+    original_body = {'metadata': {'resourceVersion': 'rv0', 'finalizers': ['other']}, 'status': {}}
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body),
+                  fns=[functools.partial(block_deletion, finalizer='fin')])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == {'metadata': {'resourceVersion': 'rv-apply', 'finalizers': ['other', 'fin']}}
+    assert remaining is None
+    assert len(kmock) == 2
+    assert kmock[0].data == {'spec': {'x': 'y'}}
+    assert kmock[1].subresource is None
+    assert kmock[1].params == {'fieldManager': 'fin', 'force': 'true'}
+    assert kmock[1].data['apiVersion'] == 'kopf.dev/v1'
+    assert kmock[1].data['kind'] == 'KopfExample'
+    assert kmock[1].data['metadata']['name'] == 'name1'
+    assert kmock[1].data['metadata']['finalizers'] == ['fin']
+    assert_logs([
+        "Merge-patching the resource with",
+        "Applying the finalizer server-side with",
+    ], prohibited=[
+        "JSON-patching the resource with",
+    ])
+
+
+@pytest.mark.usefixtures('apply_strategy')
+async def test_finalizer_removal_applied_server_side(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    kmock['patch', {'Content-Type': 'application/apply-patch+yaml'}] << {
+        'metadata': {'resourceVersion': 'rv-apply', 'finalizers': ['other']},
+    }
+    original_body = {'metadata': {'resourceVersion': 'rv0', 'finalizers': ['other', 'fin']}}
+    patch = Patch(body=Body(original_body), fns=[functools.partial(allow_deletion, finalizer='fin')])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == {'metadata': {'resourceVersion': 'rv-apply', 'finalizers': ['other']}}
+    assert remaining is None
+    assert len(kmock) == 1
+    assert kmock[0].data['metadata']['finalizers'] == []
+    assert_logs([
+        "Applying the finalizer server-side with",
+    ], prohibited=[
+        "Merge-patching the resource with",
+        "JSON-patching the resource with",
+    ])
+
+
+@pytest.mark.usefixtures('apply_strategy')
+async def test_finalizer_removal_falls_back_to_jsonp_if_co_owned(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    applied_body = {'metadata': {'resourceVersion': 'rv-apply', 'finalizers': ['fin']}}
+    kmock['patch', {'Content-Type': 'application/apply-patch+yaml'}] << (
+        lambda: kmock.objects.__setitem__((resource, namespace, 'name1'), applied_body) or applied_body
+    )
+    original_body = {'metadata': {'resourceVersion': 'rv0', 'finalizers': ['fin']}}
+    patch = Patch(body=Body(original_body), fns=[functools.partial(allow_deletion, finalizer='fin')])
+    result, remaining = await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert result == OBJECT_JSONP_RESPONSE
+    assert remaining is None
+    assert len(kmock) == 2
+    assert kmock[1].data == [
+        {'op': 'test', 'path': '/metadata/resourceVersion', 'value': 'rv-apply'},
+        {'op': 'remove', 'path': '/metadata/finalizers'},
+    ]
+    assert_logs([
+        "Applying the finalizer server-side with",
+        "JSON-patching the resource with",
+    ])
+
+
+@pytest.mark.usefixtures('apply_strategy')
+async def test_custom_field_manager_is_used(
+        kmock, settings, resource, namespace, logger):
+    settings.persistence.field_manager = 'my-operator'
+    kmock['patch', {'Content-Type': 'application/apply-patch+yaml'}] << {
+        'metadata': {'finalizers': ['fin']},
+    }
+    original_body = {'metadata': {'resourceVersion': 'rv0'}}
+    patch = Patch(body=Body(original_body), fns=[functools.partial(block_deletion, finalizer='fin')])
+    await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert len(kmock) == 1
+    assert kmock[0].params == {'fieldManager': 'my-operator', 'force': 'true'}
+
+
+@pytest.mark.usefixtures('apply_strategy')
+async def test_no_server_side_apply_without_kind(
+        kmock, settings, resource, namespace, logger, assert_logs):
+    resource = dataclasses.replace(resource, kind=None)
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch(body=Body(original_body), fns=[functools.partial(block_deletion, finalizer='fin')])
+    await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert len(kmock) == 1
+    assert kmock[0].headers['Content-Type'] == 'application/json-patch+json'
+
+
+@pytest.mark.usefixtures('apply_strategy')
+@pytest.mark.parametrize('fns', [
+    pytest.param([functools.partial(block_deletion, finalizer='foreign')], id='foreign-finalizer'),
+    pytest.param([_add_status_field], id='other-fields'),
+    pytest.param([functools.partial(block_deletion, finalizer='fin'), _add_status_field], id='mixed'),
+])
+async def test_other_transformations_are_not_applied_server_side(
+        kmock, settings, resource, namespace, logger, assert_logs, fns):
+    resource = dataclasses.replace(resource, subresources=frozenset())
+    original_body = {'metadata': {'resourceVersion': 'rv0', 'finalizers': ['other']}, 'status': {}}
+    kmock.objects[resource, namespace, 'name1'] = original_body
+    patch = Patch(body=Body(original_body), fns=fns)
+    await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert len(kmock) == 1
+    assert kmock[0].headers['Content-Type'] == 'application/json-patch+json'
+    assert_logs([
+        "JSON-patching the resource with",
+    ], prohibited=[
+        "Applying the finalizer server-side with",
+    ])
+
+
 #
 # Test status as a direct field (not a subresource): must not make extra API patches.
 #
@@ -478,6 +867,7 @@ async def test_no_subresource_skips_status_jsonp(
 #
 async def test_422_in_object_jsonp_returns_the_remaining_patch(
         kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource(None), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
     kmock[kmock.subresource(None), {'Content-Type': 'application/json-patch+json'}] ** 1 << 422
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
     patch = Patch({'spec': {'x': 'y'}, 'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer, _add_status_field])
@@ -490,11 +880,14 @@ async def test_422_in_object_jsonp_returns_the_remaining_patch(
     assert remaining._original is None  # do not carry the body through cycles
     assert list(remaining.fns) == [_add_finalizer, _add_status_field]
     assert dict(remaining) == {}
-    assert len(kmock) == 3
-    assert kmock[0].subresource is None  # merge-patch
-    assert kmock[1].subresource == 'status'  # merge-patch
-    assert kmock[2].subresource is None  # json-patch
+    assert len(kmock) == 4
+    assert kmock[0].subresource is None  # folded merge-patch, failed
+    assert kmock[1].subresource is None  # merge-patch
+    assert kmock[2].subresource == 'status'  # merge-patch
+    assert kmock[3].subresource is None  # json-patch
     assert_logs([
+        "Merge-patching the resource with",
+        "Could not apply the folded patch",
         "Merge-patching the resource with",
         "Merge-patching the status with",
         "JSON-patching the resource with",
@@ -506,6 +899,7 @@ async def test_422_in_object_jsonp_returns_the_remaining_patch(
 
 async def test_422_in_status_jsonp_returns_the_remaining_patch(
         kmock, settings, resource, namespace, logger, assert_logs):
+    kmock[kmock.subresource(None), {'Content-Type': 'application/merge-patch+json'}][:1] ** 1 << 409
     kmock[kmock.subresource('status'), {'Content-Type': 'application/json-patch+json'}] ** 1 << 422
     original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
     patch = Patch({'spec': {'x': 'y'}, 'status': {'x': 'y'}}, body=Body(original_body), fns=[_add_finalizer, _add_status_field])
@@ -518,12 +912,15 @@ async def test_422_in_status_jsonp_returns_the_remaining_patch(
     assert remaining._original is None  # do not carry the body through cycles
     assert list(remaining.fns) == [_add_finalizer, _add_status_field]
     assert dict(remaining) == {}
-    assert len(kmock) == 4
-    assert kmock[0].subresource is None  # merge-patch
-    assert kmock[1].subresource == 'status'  # merge-patch
-    assert kmock[2].subresource is None  # json-patch
-    assert kmock[3].subresource == 'status'  # json-patch
+    assert len(kmock) == 5
+    assert kmock[0].subresource is None  # folded merge-patch, failed
+    assert kmock[1].subresource is None  # merge-patch
+    assert kmock[2].subresource == 'status'  # merge-patch
+    assert kmock[3].subresource is None  # json-patch
+    assert kmock[4].subresource == 'status'  # json-patch
     assert_logs([
+        "Merge-patching the resource with",
+        "Could not apply the folded patch",
         "Merge-patching the resource with",
         "Merge-patching the status with",
         "JSON-patching the resource with",
@@ -578,3 +975,20 @@ async def test_api_errors_raised(
         )
     assert len(kmock) == exp_api_count
     assert e.value.status == status
+
+
+@pytest.mark.parametrize('fns, lane', [
+    pytest.param([], Lane.REGULAR, id='merge-patch'),
+    pytest.param([_add_finalizer], Lane.CRITICAL, id='finalizers'),
+])
+async def test_finalizers_are_patched_in_the_critical_lane(
+        mocker, settings, resource, namespace, logger, fns, lane):
+    request = mocker.spy(api, 'request')
+    original_body = {'metadata': {'resourceVersion': 'rv0'}, 'status': {}}
+    patch = Patch({'spec': {'x': 'y'}}, body=Body(original_body), fns=fns)
+    await patch_obj(
+        logger=logger, settings=settings, resource=resource,
+        namespace=namespace, name='name1', patch=patch,
+    )
+    assert request.call_count >= 1
+    assert {call.kwargs['lane'] for call in request.call_args_list} == {lane}
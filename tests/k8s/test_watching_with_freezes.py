@@ -72,3 +72,26 @@ async def test_pausing_waits_until_resumed(
         r"Pausing the watch-stream for",
         r"Resuming the watch-stream for",
     ])
+
+
+async def test_waiter_is_done_when_relisting_is_notified(
+        resource, namespace, looptime):
+    operator_paused = ToggleSet(any)
+    await operator_paused.make_toggle(False)
+    relisting = asyncio.Condition()
+
+    async def delayed_notification(delay: float):
+        await asyncio.sleep(delay)
+        async with relisting:
+            relisting.notify_all()
+
+    asyncio.create_task(delayed_notification(1.23))
+    async with streaming_block(
+        resource=resource,
+        namespace=namespace,
+        operator_paused=operator_paused,
+        relisting=relisting,
+    ) as operator_pause_waiter:
+        await operator_pause_waiter
+
+    assert looptime == 1.23
@@ -1,7 +1,7 @@
 import pytest
 
 import kopf
-from kopf._core.actions.execution import Outcome
+from kopf._core.actions.execution import ConcurrentHandlers, Outcome
 from kopf._core.actions.progression import State
 
 
@@ -11,6 +11,7 @@ from kopf._core.actions.progression import State
     kopf.lifecycles.randomized,
     kopf.lifecycles.shuffled,
     kopf.lifecycles.asap,
+    kopf.lifecycles.concurrent,
 ])
 async def test_with_empty_input(lifecycle):
     state = State.from_scratch()
@@ -38,6 +39,22 @@ def test_all_at_once_respects_order():
     assert list(selected) == handlers
 
 
+def test_concurrent_respects_order():
+    handler1 = object()
+    handler2 = object()
+    handler3 = object()
+
+    handlers = [handler1, handler2, handler3]
+    selected = kopf.lifecycles.concurrent(handlers)
+    assert isinstance(selected, ConcurrentHandlers)
+    assert list(selected) == handlers
+
+    handlers = [handler3, handler2, handler1]
+    selected = kopf.lifecycles.concurrent(handlers)
+    assert isinstance(selected, ConcurrentHandlers)
+    assert list(selected) == handlers
+
+
 def test_one_by_one_respects_order():
     handler1 = object()
     handler2 = object()
@@ -17,6 +17,7 @@ from kopf._core.intents.causes import ChangingCause, Reason
     kopf.lifecycles.randomized,
     kopf.lifecycles.shuffled,
     kopf.lifecycles.asap,
+    kopf.lifecycles.concurrent,
 ])
 async def test_protocol_invocation(lifecycle, resource):
     """
@@ -96,6 +96,33 @@ async def test_new_resources_and_namespaces_spawn_new_tasks(
     assert set(ensemble.conflicts_found) == {peer1, peer2}
 
 
+async def test_only_the_first_process_sends_the_keepalives(
+        settings, ensemble: Ensemble, insights: Insights, peering_resource):
+    settings.peering.namespaced = peering_resource.namespaced
+    settings.process.processes = 2
+    settings.process.process_index = 1
+
+    r1 = Resource(group='group1', version='version1', plural='plural1', namespaced=True)
+    insights.watched_resources.add(r1)
+    insights.namespaces.add('ns1')
+    r1ns1 = EnsembleKey(resource=r1, namespace='ns1')
+    peerns = peering_resource.namespaced
+    peer1 = EnsembleKey(resource=peering_resource, namespace='ns1' if peerns else None)
+
+    await adjust_tasks(
+        processor=processor,
+        identity=Identity('...'),
+        settings=settings,
+        insights=insights,
+        ensemble=ensemble,
+    )
+
+    assert set(ensemble.watcher_tasks) == {r1ns1}
+    assert set(ensemble.peering_tasks) == {peer1}
+    assert set(ensemble.conflicts_found) == {peer1}
+    assert not ensemble.pinging_tasks
+
+
 async def test_gone_resources_and_namespaces_stop_running_tasks(
         settings, ensemble: Ensemble, insights: Insights, peering_resource):
     settings.peering.namespaced = peering_resource.namespaced
@@ -252,3 +279,53 @@ async def test_unpaused_with_mandatory_peering_and_existing_peering_resource(
 
     assert ensemble.peering_missing.is_off()
     assert ensemble.operator_paused.is_off()
+
+
+@pytest.mark.parametrize('clusterwide', [False, True])
+async def test_lease_peering_tasks_for_served_namespaces(
+        mocker, settings, ensemble: Ensemble, insights: Insights, clusterwide):
+    mocker.patch('kopf._cogs.clients.api.get_default_namespace', return_value='operator-ns')
+    leases = Resource('coordination.k8s.io', 'v1', 'leases', namespaced=True)
+    await insights.backbone.fill(resources=[leases])
+    settings.peering.backend = 'leases'
+    settings.peering.clusterwide = clusterwide
+    insights.namespaces.add('ns1')
+    insights.namespaces.add('ns2')
+
+    await adjust_tasks(
+        processor=processor,
+        identity=Identity('...'),
+        settings=settings,
+        insights=insights,
+        ensemble=ensemble,
+    )
+
+    if clusterwide:
+        keys = {EnsembleKey(resource=leases, namespace=None)}
+    else:
+        keys = {EnsembleKey(resource=leases, namespace='ns1'),
+                EnsembleKey(resource=leases, namespace='ns2')}
+    assert set(ensemble.peering_tasks) == keys
+    assert set(ensemble.pinging_tasks) == keys
+    assert set(ensemble.conflicts_found) == keys
+
+
+async def test_cluster_peering_reports_the_served_namespaces(
+        mocker, settings, ensemble: Ensemble, insights: Insights, cluster_peering_resource):
+    touch = mocker.patch('kopf._core.engines.peering.touch', return_value=None)
+    settings.peering.clusterwide = True
+    insights.namespaces.add('ns1')
+    insights.namespaces.add('ns2')
+
+    await adjust_tasks(
+        processor=processor,
+        identity=Identity('...'),
+        settings=settings,
+        insights=insights,
+        ensemble=ensemble,
+    )
+
+    key = EnsembleKey(resource=cluster_peering_resource, namespace=None)
+    assert set(ensemble.peering_tasks) == {key}
+    assert touch.call_args.kwargs['namespace'] is None
+    assert touch.call_args.kwargs['namespaces'] is insights.namespaces  # live, not a copy
@@ -363,3 +363,42 @@ async def test_resumes_immediately_on_expiration_of_blocking_peers(
     assert looptime == 9.876544
     assert k8s_mocked.patch.called
     assert_logs(prohibited=["patching"])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_other_processes_do_not_touch_on_expiration_of_blocking_peers(
+        k8s_mocked, settings, looptime, peering_resource, peering_namespace):
+
+    event = bodies.RawEvent(
+        type='ADDED',  # irrelevant
+        object={
+            'metadata': {'name': 'name', 'namespace': peering_namespace},  # for matching
+            'status': {
+                'higher-prio': {
+                    'priority': 101,
+                    'lifetime': 10,
+                    'lastseen': '2020-12-31T23:59:59'
+                },
+            },
+        })
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    settings.process.processes = 2
+    settings.process.process_index = 1
+
+    conflicts_found = aiotoggles.Toggle(True)
+    stream_pressure = asyncio.Event()
+
+    await process_peering_event(
+        raw_event=event,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        autoclean=False,
+        namespace=peering_namespace,
+        resource=peering_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert looptime == 9.876544
+    assert not k8s_mocked.patch.called
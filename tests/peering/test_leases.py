@@ -0,0 +1,314 @@
+import asyncio
+
+import freezegun
+import pytest
+
+from kopf._cogs.aiokits import aiotoggles
+from kopf._cogs.clients.api import Lane
+from kopf._cogs.clients.errors import APIConflictError, APINotFoundError
+from kopf._cogs.structs import bodies
+from kopf._cogs.structs.references import LEASES, Resource
+from kopf._core.engines.peering import clean_leases, get_lease_name, guess_selectors, \
+                                       locate, process_lease_event, renew_lease
+
+
+@pytest.fixture()
+def lease_resource():
+    return Resource('coordination.k8s.io', 'v1', 'leases', namespaced=True)
+
+
+def _lease(name, identity, *, priority=0, lifetime=10, renewed='2020-12-31T23:59:59.000000Z',
+           resource_version='1', peering='default'):
+    return {
+        'metadata': {
+            'name': name,
+            'namespace': 'ns',
+            'resourceVersion': resource_version,
+            'labels': {'kopf.dev/peering': peering},
+            'annotations': {'kopf.dev/priority': str(priority)},
+        },
+        'spec': {
+            'holderIdentity': identity,
+            'leaseDurationSeconds': lifetime,
+            'renewTime': renewed,
+        },
+    }
+
+
+def test_lease_names_are_valid_and_stable(settings):
+    name1 = get_lease_name(settings=settings, identity='user@host/20201231235959/abc')
+    name2 = get_lease_name(settings=settings, identity='user@host/20201231235959/abc')
+    name3 = get_lease_name(settings=settings, identity='user@host/20201231235959/xyz')
+    assert name1 == name2 != name3
+    assert name1.startswith('default.')
+    assert '@' not in name1 and '/' not in name1
+
+
+def test_leases_are_selected_for_the_leases_backend(settings):
+    settings.peering.backend = 'leases'
+    assert list(guess_selectors(settings=settings)) == [LEASES]
+
+
+@pytest.mark.parametrize('clusterwide, namespace, expected', [
+    (False, 'ns', 'ns'),
+    (True, None, 'operator-ns'),
+])
+async def test_leases_location(mocker, settings, lease_resource, clusterwide, namespace, expected):
+    mocker.patch('kopf._cogs.clients.api.get_default_namespace', return_value='operator-ns')
+    settings.peering.clusterwide = clusterwide
+    location = await locate(settings=settings, resource=lease_resource, namespace=namespace)
+    assert location == expected
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_is_renewed_with_the_known_resource_version(
+        k8s_mocked, settings, lease_resource):
+    settings.peering.priority = 100
+    settings.peering.lifetime = 33
+    k8s_mocked.patch.return_value = {'metadata': {'resourceVersion': '6'}}
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lease={'metadata': {'resourceVersion': '5'}})
+
+    assert lease == {'metadata': {'resourceVersion': '6'}}
+    assert k8s_mocked.patch.call_count == 1
+    assert not k8s_mocked.post.called
+    assert k8s_mocked.patch.call_args.kwargs['lane'] == Lane.CRITICAL
+    assert k8s_mocked.patch.call_args.kwargs['url'].endswith(
+        f'/namespaces/ns/leases/{get_lease_name(settings=settings, identity="id")}')
+    assert k8s_mocked.patch.call_args.kwargs['payload'] == {
+        'metadata': {
+            'resourceVersion': '5',
+            'labels': {'kopf.dev/peering': 'default'},
+            'annotations': {'kopf.dev/priority': '100', 'kopf.dev/namespaces': None},
+        },
+        'spec': {
+            'holderIdentity': 'id',
+            'leaseDurationSeconds': 33,
+            'renewTime': '2020-12-31T23:59:59.123456Z',
+        },
+    }
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+@pytest.mark.parametrize('holder, renewed', [
+    pytest.param('id', '2020-12-31T23:59:59.000000Z', id='ours'),
+    pytest.param('other', '2020-12-31T23:59:00.000000Z', id='expired'),
+])
+async def test_lease_is_taken_over_on_conflicts_if_ours_or_expired(
+        k8s_mocked, settings, lease_resource, holder, renewed):
+    k8s_mocked.get.return_value = _lease('n', holder, renewed=renewed, resource_version='7')
+    k8s_mocked.patch.side_effect = [APIConflictError({}, status=409, headers={}), {'spec': {}}]
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lease={'metadata': {'resourceVersion': '5'}})
+
+    assert lease == {'spec': {}}
+    assert k8s_mocked.get.call_count == 1
+    assert k8s_mocked.patch.call_count == 2
+    payload1 = k8s_mocked.patch.call_args_list[0].kwargs['payload']
+    payload2 = k8s_mocked.patch.call_args_list[1].kwargs['payload']
+    assert payload1['metadata']['resourceVersion'] == '5'
+    assert payload2['metadata']['resourceVersion'] == '7'
+    assert payload2['spec']['holderIdentity'] == 'id'
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_is_not_taken_over_on_conflicts_if_held_by_others(
+        k8s_mocked, settings, lease_resource, assert_logs):
+    fresh = _lease('n', 'other', renewed='2020-12-31T23:59:59.000000Z', resource_version='7')
+    k8s_mocked.get.return_value = fresh
+    k8s_mocked.patch.side_effect = [APIConflictError({}, status=409, headers={})]
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lease={'metadata': {'resourceVersion': '5'}})
+
+    assert lease == fresh  # to retry with its fresh version on the next cycle
+    assert k8s_mocked.get.call_count == 1
+    assert k8s_mocked.patch.call_count == 1
+    assert not k8s_mocked.post.called
+    assert_logs([r"The lease .* is held by 'other'. Retrying later."])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_is_not_taken_over_on_repeated_conflicts(
+        k8s_mocked, settings, lease_resource):
+    fresh = _lease('n', 'id', renewed='2020-12-31T23:59:59.000000Z', resource_version='7')
+    k8s_mocked.get.return_value = fresh
+    k8s_mocked.patch.side_effect = [APIConflictError({}, status=409, headers={}),
+                                    APIConflictError({}, status=409, headers={})]
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lease={'metadata': {'resourceVersion': '5'}})
+
+    assert lease == fresh
+    assert k8s_mocked.patch.call_count == 2
+    assert all('resourceVersion' in call.kwargs['payload']['metadata']
+               for call in k8s_mocked.patch.call_args_list)
+
+
+async def test_lease_is_acquired_when_gone_on_conflicts(k8s_mocked, settings, lease_resource):
+    k8s_mocked.get.side_effect = APINotFoundError({}, status=404, headers={})
+    k8s_mocked.patch.side_effect = [APIConflictError({}, status=409, headers={})]
+    k8s_mocked.post.return_value = {'spec': {}}
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lease={'metadata': {'resourceVersion': '5'}})
+
+    assert lease == {'spec': {}}
+    assert k8s_mocked.patch.call_count == 1
+    assert k8s_mocked.post.call_count == 1
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_is_acquired_when_absent(k8s_mocked, settings, lease_resource):
+    k8s_mocked.patch.side_effect = APINotFoundError({}, status=404, headers={})
+    k8s_mocked.post.return_value = {'spec': {}}
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns')
+
+    assert lease == {'spec': {}}
+    assert k8s_mocked.post.call_count == 1
+    assert k8s_mocked.post.call_args.kwargs['url'].endswith('/namespaces/ns/leases')
+    payload = k8s_mocked.post.call_args.kwargs['payload']
+    assert payload['kind'] == 'Lease'
+    assert payload['apiVersion'] == 'coordination.k8s.io/v1'
+    assert payload['metadata']['name'] == get_lease_name(settings=settings, identity='id')
+    assert payload['metadata']['namespace'] == 'ns'
+    assert payload['spec']['holderIdentity'] == 'id'
+    assert payload['spec']['acquireTime'] == '2020-12-31T23:59:59.123456Z'
+    assert payload['spec']['renewTime'] == '2020-12-31T23:59:59.123456Z'
+
+
+async def test_lease_is_released_with_zero_lifetime(k8s_mocked, settings, lease_resource):
+    k8s_mocked.delete.side_effect = APINotFoundError({}, status=404, headers={})
+
+    lease = await renew_lease(identity='id', settings=settings, resource=lease_resource,
+                              namespace='ns', lifetime=0)
+
+    assert lease is None
+    assert k8s_mocked.delete.call_count == 1
+    assert not k8s_mocked.patch.called
+    assert not k8s_mocked.post.called
+
+
+async def test_expired_leases_are_deleted_unless_renewed(k8s_mocked, settings, lease_resource):
+    k8s_mocked.delete.side_effect = [APIConflictError({}, status=409, headers={}), {}]
+
+    await clean_leases(settings=settings, resource=lease_resource, namespace='ns',
+                       leases=[_lease('lease1', 'id1', resource_version='7'),
+                               _lease('lease2', 'id2', resource_version='8')])
+
+    assert k8s_mocked.delete.call_count == 2
+    assert k8s_mocked.delete.call_args_list[0].kwargs['url'].endswith('/namespaces/ns/leases/lease1')
+    assert k8s_mocked.delete.call_args_list[0].kwargs['payload'] == {
+        'preconditions': {'resourceVersion': '7'},
+    }
+    assert k8s_mocked.delete.call_args_list[1].kwargs['payload'] == {
+        'preconditions': {'resourceVersion': '8'},
+    }
+
+
+async def test_other_leases_are_ignored(k8s_mocked, settings, lease_resource, looptime):
+    leases = {}
+    conflicts_found = aiotoggles.Toggle(False)
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='ADDED', object=_lease('x', 'other', peering='other')),
+        leases=leases,
+        conflicts_found=conflicts_found,
+        namespace='ns',
+        resource=lease_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert not leases
+    assert conflicts_found.is_off()
+    assert looptime == 0
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_higher_priority_leases_pause_and_resume_when_gone(
+        k8s_mocked, assert_logs, settings, lease_resource, looptime):
+    settings.peering.priority = 100
+    leases = {}
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    lease = _lease('lease1', 'higher-prio', priority=101)
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='ADDED', object=lease),
+        leases=leases,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        autoclean=False,
+        namespace='ns',
+        resource=lease_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert set(leases) == {'lease1'}
+
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='DELETED', object=lease),
+        leases=leases,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        autoclean=False,
+        namespace='ns',
+        resource=lease_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_off()
+    assert not leases
+    assert_logs([
+        "Pausing operations in favour of",
+        "Resuming operations after the pause",
+    ])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_same_priority_leases_pause_all_operators(
+        k8s_mocked, assert_logs, settings, lease_resource, looptime):
+    settings.peering.priority = 100
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='ADDED', object=_lease('lease1', 'same-prio', priority=100)),
+        leases={'lease0': _lease('lease0', 'id', priority=100)},
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        autoclean=False,
+        namespace='ns',
+        resource=lease_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert_logs(["Possibly conflicting operators", "Pausing all operators, including self"])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_expired_leases_are_cleaned_and_ignored(
+        k8s_mocked, settings, lease_resource, looptime):
+    conflicts_found = aiotoggles.Toggle(True)
+    expired = _lease('lease1', 'higher-prio', priority=101, renewed='2020-12-31T23:00:00.000000Z')
+
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='MODIFIED', object=expired),
+        leases={},
+        conflicts_found=conflicts_found,
+        namespace='ns',
+        resource=lease_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_off()
+    assert k8s_mocked.delete.call_count == 1
+    assert k8s_mocked.delete.call_args.kwargs['url'].endswith('/namespaces/ns/leases/lease1')
+    assert looptime == 0
@@ -104,3 +104,21 @@ async def test_logs_are_logged_when_absent(
     assert_logs([
         r"Keep-alive in 'name0' (in 'ns'|cluster-wide): not found",
     ], prohibited=["patching"])
+
+
+@pytest.mark.parametrize('namespaces, expected', [
+    pytest.param({'ns2', 'ns1'}, ['ns1', 'ns2'], id='specific'),
+    pytest.param({None}, ..., id='clusterwide'),
+    pytest.param(None, ..., id='unknown'),
+])
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_touching_a_peer_reports_the_served_namespaces(
+        kmock, settings, peering_resource, peering_namespace, namespaces, expected):
+    settings.peering.name = 'name0'
+    kmock.objects[peering_resource, peering_namespace, 'name0'] = {}
+
+    await touch(identity='id1', resource=peering_resource, settings=settings,
+                namespace=peering_namespace, namespaces=namespaces)
+
+    patch = kmock[0].data
+    assert patch['status']['id1'].get('namespaces', ...) == expected
@@ -2,6 +2,7 @@ import datetime
 
 import freezegun
 import iso8601
+import pytest
 
 from kopf._core.engines.peering import Peer
 
@@ -81,3 +82,31 @@ def test_creation_as_dead():
     assert peer.lastseen == iso8601.parse_date('2020-12-31T23:59:49.123456')
     assert peer.deadline == iso8601.parse_date('2020-12-31T23:59:59.123456')
     assert peer.is_dead is True
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+def test_namespaces_unspecified():
+    peer = Peer(identity='id')
+    assert peer.namespaces is None
+    assert 'namespaces' not in peer.as_dict()
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+def test_namespaces_specified():
+    peer = Peer(identity='id', namespaces=['ns2', 'ns1'])
+    assert peer.namespaces == {'ns1', 'ns2'}
+    assert peer.as_dict()['namespaces'] == ['ns1', 'ns2']
+
+
+@pytest.mark.parametrize('peer_namespaces, namespaces, expected', [
+    pytest.param(None, None, True, id='all-vs-all'),
+    pytest.param(None, ['ns1'], True, id='all-vs-specific'),
+    pytest.param(['ns1'], None, True, id='specific-vs-all'),
+    pytest.param(['ns1'], [None], True, id='specific-vs-clusterwide'),
+    pytest.param(['ns1', 'ns2'], ['ns2', 'ns3'], True, id='overlapping'),
+    pytest.param(['ns1', 'ns2'], ['ns3', 'ns4'], False, id='disjoint'),
+    pytest.param([], ['ns1'], False, id='empty'),
+])
+def test_serving_namespaces(peer_namespaces, namespaces, expected):
+    peer = Peer(identity='id', namespaces=peer_namespaces)
+    assert peer.serves(namespaces) is expected
@@ -0,0 +1,151 @@
+import asyncio
+
+import freezegun
+import pytest
+
+from kopf._cogs.aiokits import aiotoggles
+from kopf._cogs.structs import bodies
+from kopf._cogs.structs.references import Resource
+from kopf._core.engines.peering import process_lease_event, process_peering_event, renew_lease
+from kopf._core.engines.sharding import Shards
+
+
+def _event(peers):
+    return bodies.RawEvent(
+        type='ADDED',  # irrelevant
+        object={
+            'metadata': {'name': 'name'},  # for matching
+            'status': {
+                identity: dict(priority=priority, lifetime=10, lastseen='2020-12-31T23:59:59',
+                               **({} if namespaces is None else {'namespaces': namespaces}))
+                for identity, priority, namespaces in peers
+            },
+        })
+
+
+@pytest.mark.parametrize('peer_namespaces', [
+    pytest.param(None, id='clusterwide'),
+    pytest.param(['ns2', 'ns3'], id='overlapping'),
+])
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_higher_priority_peers_of_the_same_namespaces_pause(
+        k8s_mocked, assert_logs, settings, looptime, peer_namespaces):
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    await process_peering_event(
+        raw_event=_event([('higher-prio', 101, peer_namespaces)]),
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        namespaces={'ns1', 'ns2'},
+        autoclean=False,
+        namespace=None,
+        resource=Resource('kopf.dev', 'v1', 'clusterkopfpeerings', namespaced=False),
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert_logs(["Pausing operations in favour of"])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_higher_priority_peers_of_other_namespaces_are_ignored(
+        k8s_mocked, assert_logs, settings, looptime):
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    conflicts_found = aiotoggles.Toggle(True)
+
+    await process_peering_event(
+        raw_event=_event([('higher-prio', 101, ['ns3']), ('same-prio', 100, ['ns4'])]),
+        conflicts_found=conflicts_found,
+        namespaces={'ns1', 'ns2'},
+        autoclean=False,
+        namespace=None,
+        resource=Resource('kopf.dev', 'v1', 'clusterkopfpeerings', namespaced=False),
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_off()
+    assert looptime == 0
+    assert_logs(["Resuming operations after the pause"], prohibited=[
+        "Pausing operations in favour of",
+        "Possibly conflicting operators",
+    ])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_members_are_split_per_served_namespace(
+        k8s_mocked, settings, looptime):
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    settings.peering.clusterwide = True
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='id', settings=settings)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    await process_peering_event(
+        raw_event=_event([('peer1', 100, ['ns1']), ('peer2', 100, ['ns2']), ('peer3', 100, None)]),
+        stream_pressure=stream_pressure,
+        shards=shards,
+        namespaces={'ns1', 'ns2', 'ns3'},
+        autoclean=False,
+        namespace=None,
+        resource=Resource('kopf.dev', 'v1', 'clusterkopfpeerings', namespaced=False),
+        identity='id',
+        settings=settings,
+    )
+    assert shards.members == {
+        None: {'id', 'peer1', 'peer2', 'peer3'},
+        'ns1': {'id', 'peer1', 'peer3'},
+        'ns2': {'id', 'peer2', 'peer3'},
+        'ns3': {'id', 'peer3'},
+    }
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_reports_the_served_namespaces(k8s_mocked, settings):
+    resource = Resource('coordination.k8s.io', 'v1', 'leases', namespaced=True)
+    k8s_mocked.patch.return_value = {}
+
+    await renew_lease(identity='id', settings=settings, resource=resource, namespace='ns',
+                      namespaces={'ns2', 'ns1'}, lease={'metadata': {'resourceVersion': '1'}})
+
+    annotations = k8s_mocked.patch.call_args.kwargs['payload']['metadata']['annotations']
+    assert annotations['kopf.dev/namespaces'] == 'ns1,ns2'
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_lease_namespaces_are_parsed(k8s_mocked, settings, looptime):
+    resource = Resource('coordination.k8s.io', 'v1', 'leases', namespaced=True)
+    settings.peering.priority = 100
+    conflicts_found = aiotoggles.Toggle(False)
+    lease = {
+        'metadata': {
+            'name': 'lease1',
+            'labels': {'kopf.dev/peering': 'default'},
+            'annotations': {'kopf.dev/priority': '101', 'kopf.dev/namespaces': 'ns3,ns4'},
+        },
+        'spec': {
+            'holderIdentity': 'higher-prio',
+            'leaseDurationSeconds': 10,
+            'renewTime': '2020-12-31T23:59:59.000000Z',
+        },
+    }
+
+    await process_lease_event(
+        raw_event=bodies.RawEvent(type='ADDED', object=lease),
+        leases={},
+        conflicts_found=conflicts_found,
+        namespaces={'ns1', 'ns2'},
+        autoclean=False,
+        namespace='ns',
+        resource=resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_off()
+    assert looptime == 0
@@ -0,0 +1,282 @@
+import asyncio
+import collections
+
+import freezegun
+import pytest
+
+from kopf._cogs.aiokits import aiotoggles
+from kopf._cogs.structs import bodies
+from kopf._core.engines.peering import process_peering_event
+from kopf._core.engines.sharding import Shards, get_owner
+
+
+def _body(namespace, uid):
+    return bodies.Body({'metadata': {'namespace': namespace, 'uid': uid}})
+
+
+def test_owner_is_the_same_regardless_of_the_members_order():
+    keys = [f'uid{i}' for i in range(100)]
+    owners1 = [get_owner(key, ['a', 'b', 'c']) for key in keys]
+    owners2 = [get_owner(key, ['c', 'a', 'b']) for key in keys]
+    assert owners1 == owners2
+
+
+def test_objects_are_distributed_among_all_members():
+    counts = collections.Counter(get_owner(f'uid{i}', ['a', 'b', 'c']) for i in range(300))
+    assert set(counts) == {'a', 'b', 'c'}
+    assert min(counts.values()) > 50
+
+
+def test_only_the_objects_of_a_leaving_member_are_redistributed():
+    keys = [f'uid{i}' for i in range(100)]
+    owners1 = {key: get_owner(key, ['a', 'b', 'c']) for key in keys}
+    owners2 = {key: get_owner(key, ['a', 'b']) for key in keys}
+    moved = {key for key in keys if owners1[key] != owners2[key]}
+    assert moved == {key for key in keys if owners1[key] == 'c'}
+
+
+async def test_all_objects_are_owned_without_members(settings):
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='me', settings=settings)
+    assert all(shards.owns(_body('ns', f'uid{i}')) for i in range(100))
+
+
+@pytest.mark.parametrize('sharding', ['uid', 'namespace'])
+async def test_objects_are_owned_by_one_member_only(settings, sharding):
+    settings.peering.sharding = sharding
+    shards1 = Shards(identity='a', settings=settings)
+    shards2 = Shards(identity='b', settings=settings)
+    await shards1.update(None, ['b'])
+    await shards2.update(None, ['a'])
+    for i in range(100):
+        body = _body(f'ns{i % 7}', f'uid{i}')
+        assert shards1.owns(body) != shards2.owns(body)
+
+
+async def test_objects_of_one_namespace_are_owned_together(settings):
+    settings.peering.sharding = 'namespace'
+    shards = Shards(identity='a', settings=settings)
+    await shards.update(None, ['b', 'c'])
+    for namespace in ['ns1', 'ns2', 'ns3']:
+        owned = {shards.owns(_body(namespace, f'uid{i}')) for i in range(20)}
+        assert len(owned) == 1
+
+
+async def test_members_are_used_per_namespace_if_known(settings):
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='me', settings=settings)
+    await shards.update('ns1', ['other1'])
+    assert all(shards.owns(_body('ns2', f'uid{i}')) is shards.owns(_body('ns1', f'uid{i}'))
+               for i in range(20))
+    await shards.update('ns2', [])
+    assert all(shards.owns(_body('ns2', f'uid{i}')) for i in range(20))
+
+
+async def test_relisting_is_notified_only_on_changes(settings):
+    settings.peering.sharding = 'uid'
+    shards = Shards(identity='me', settings=settings)
+    notified = []
+
+    async def waiter():
+        async with shards.changed:
+            while True:
+                await shards.changed.wait()
+                notified.append(dict(shards.members))
+
+    task = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    await shards.update(None, ['other1'])
+    await asyncio.sleep(0)
+    await shards.update(None, ['other1'])
+    await asyncio.sleep(0)
+    await shards.update(None, [])
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert notified == [{None: {'me', 'other1'}}, {None: {'me'}}]
+
+
+async def test_relisting_is_not_notified_when_unsharded(settings):
+    shards = Shards(identity='me', settings=settings)
+    notified = []
+
+    async def waiter():
+        async with shards.changed:
+            await shards.changed.wait()
+            notified.append(dict(shards.members))
+
+    task = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    await shards.update(None, ['other1'])
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert notified == []
+    assert shards.members == {None: {'me', 'other1'}}
+    assert all(shards.owns(_body('ns', f'uid{i}')) for i in range(100))
+
+
+@pytest.mark.parametrize('sharding', [None, 'uid', 'namespace'])
+async def test_objects_are_owned_by_one_process_only(settings, sharding):
+    settings.peering.sharding = sharding
+    settings.process.processes = 3
+    owners = collections.Counter()
+    for i in range(300):
+        body = _body(f'ns{i % 30}', f'uid{i}')
+        owned_by = []
+        for process_index in range(3):
+            settings.process.process_index = process_index
+            if Shards(identity='me', settings=settings).owns(body):
+                owned_by.append(process_index)
+        assert len(owned_by) == 1
+        owners[owned_by[0]] += 1
+    assert set(owners) == {0, 1, 2}
+
+
+async def test_objects_are_split_among_processes_within_the_member(settings):
+    settings.peering.sharding = 'uid'
+    settings.process.processes = 2
+    member_a = [Shards(identity='a', settings=settings) for _ in range(2)]
+    member_b = [Shards(identity='b', settings=settings) for _ in range(2)]
+    for shards in member_a:
+        await shards.update(None, ['b'])
+    for shards in member_b:
+        await shards.update(None, ['a'])
+
+    for i in range(100):
+        body = _body('ns', f'uid{i}')
+        owned = 0
+        for process_index in range(2):
+            settings.process.process_index = process_index
+            owned += member_a[process_index].owns(body) + member_b[process_index].owns(body)
+        assert owned == 1
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_same_priority_peers_are_members_when_sharded(
+        k8s_mocked, assert_logs, settings, looptime,
+        peering_resource, peering_namespace):
+
+    event = bodies.RawEvent(
+        type='ADDED',  # irrelevant
+        object={
+            'metadata': {'name': 'name', 'namespace': peering_namespace},  # for matching
+            'status': {
+                'same-prio': {
+                    'priority': 100,
+                    'lifetime': 10,
+                    'lastseen': '2020-12-31T23:59:59'
+                },
+            },
+        })
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    settings.peering.sharding = 'uid'
+
+    shards = Shards(identity='id', settings=settings)
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.call_later(1.23, stream_pressure.set)
+
+    await process_peering_event(
+        raw_event=event,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        shards=shards,
+        autoclean=False,
+        namespace=peering_namespace,
+        resource=peering_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_off()
+    assert shards.members == {peering_namespace: {'id', 'same-prio'}}
+    assert looptime == 1.23
+    assert_logs(["Re-sharding .* among 2 members: id, same-prio"], prohibited=[
+        "Possibly conflicting operators",
+        "Pausing all operators, including self",
+        "Pausing operations in favour of",
+    ])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_higher_priority_peers_pause_the_members_when_sharded(
+        k8s_mocked, assert_logs, settings, looptime,
+        peering_resource, peering_namespace):
+
+    event = bodies.RawEvent(
+        type='ADDED',  # irrelevant
+        object={
+            'metadata': {'name': 'name', 'namespace': peering_namespace},  # for matching
+            'status': {
+                'higher-prio': {
+                    'priority': 101,
+                    'lifetime': 10,
+                    'lastseen': '2020-12-31T23:59:59'
+                },
+            },
+        })
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+    settings.peering.sharding = 'uid'
+
+    shards = Shards(identity='id', settings=settings)
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    await process_peering_event(
+        raw_event=event,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        shards=shards,
+        autoclean=False,
+        namespace=peering_namespace,
+        resource=peering_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert shards.members == {peering_namespace: {'id'}}
+    assert_logs(["Pausing operations in favour of"])
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_same_priority_peers_conflict_when_unsharded(
+        k8s_mocked, assert_logs, settings, looptime,
+        peering_resource, peering_namespace):
+
+    event = bodies.RawEvent(
+        type='ADDED',  # irrelevant
+        object={
+            'metadata': {'name': 'name', 'namespace': peering_namespace},  # for matching
+            'status': {
+                'same-prio': {
+                    'priority': 100,
+                    'lifetime': 10,
+                    'lastseen': '2020-12-31T23:59:59'
+                },
+            },
+        })
+    settings.peering.name = 'name'
+    settings.peering.priority = 100
+
+    shards = Shards(identity='id', settings=settings)
+    conflicts_found = aiotoggles.Toggle(False)
+    stream_pressure = asyncio.Event()
+    stream_pressure.set()
+
+    await process_peering_event(
+        raw_event=event,
+        conflicts_found=conflicts_found,
+        stream_pressure=stream_pressure,
+        shards=shards,
+        autoclean=False,
+        namespace=peering_namespace,
+        resource=peering_resource,
+        identity='id',
+        settings=settings,
+    )
+    assert conflicts_found.is_on()
+    assert_logs(["Pausing all operators, including self"], prohibited=["Re-sharding"])
@@ -5,7 +5,9 @@ import pytest
 
 from kopf import event, exception, info, warn
 from kopf._cogs.structs.references import Backbone, Resource
-from kopf._core.engines.posting import K8sEvent, event_queue_loop_var, event_queue_var, poster
+from kopf._cogs.structs.telemetry import OperatorMetrics, metrics_var
+from kopf._core.engines.posting import K8sEvent, K8sEventQueue, K8sEventRecorder, \
+                                       event_queue_loop_var, event_queue_var, poster
 
 OBJ1 = {'apiVersion': 'group1/version1', 'kind': 'Kind1',
         'metadata': {'uid': 'uid1', 'name': 'name1', 'namespace': 'ns1'}}
@@ -115,3 +117,243 @@ async def test_via_shortcut(settings, mocker, event_fn, event_type, min_levelno,
     assert event1.type == event_type
     assert event1.reason == 'reason1'
     assert event1.message == 'message1'
+
+
+@pytest.fixture()
+def recorded(mocker):
+    posted = {'metadata': {'name': 'ev1', 'namespace': 'ns1'}}
+    post = mocker.patch('kopf._cogs.clients.events.post_event', return_value=posted)
+    update = mocker.patch('kopf._cogs.clients.events.update_event', return_value=True)
+    return post, update
+
+
+async def test_repeated_events_are_aggregated(settings, recorded, looptime):
+    post, update = recorded
+    settings.posting.aggregation_window = 600
+    recorder = K8sEventRecorder()
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    for _ in range(3):
+        await recorder.record(event1, resource=EVENTS, settings=settings)
+
+    assert post.call_count == 1
+    assert update.call_count == 2
+    assert [call.kwargs['count'] for call in update.call_args_list] == [2, 3]
+    assert update.call_args_list[0].kwargs['name'] == 'ev1'
+    assert update.call_args_list[0].kwargs['namespace'] == 'ns1'
+
+
+@pytest.mark.parametrize('event2', [
+    pytest.param(K8sEvent(type='type2', reason='reason1', message='message1', ref=REF1), id='type'),
+    pytest.param(K8sEvent(type='type1', reason='reason2', message='message1', ref=REF1), id='reason'),
+    pytest.param(K8sEvent(type='type1', reason='reason1', message='message2', ref=REF1), id='message'),
+    pytest.param(K8sEvent(type='type1', reason='reason1', message='message1', ref=REF2), id='object'),
+])
+async def test_distinct_events_are_not_aggregated(settings, recorded, event2):
+    post, update = recorded
+    recorder = K8sEventRecorder()
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+    await recorder.record(event2, resource=EVENTS, settings=settings)
+
+    assert post.call_count == 2
+    assert update.call_count == 0
+
+
+async def test_events_beyond_the_window_are_posted_anew(settings, recorded, looptime):
+    post, update = recorded
+    settings.posting.aggregation_window = 10
+    recorder = K8sEventRecorder()
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+    await asyncio.sleep(5)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+    await asyncio.sleep(5)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+
+    assert post.call_count == 2
+    assert update.call_count == 1
+
+
+async def test_aggregation_can_be_disabled(settings, recorded):
+    post, update = recorded
+    settings.posting.aggregation_window = None
+    recorder = K8sEventRecorder()
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+
+    assert post.call_count == 2
+    assert update.call_count == 0
+
+
+async def test_expired_events_are_posted_anew(settings, recorded):
+    post, update = recorded
+    settings.posting.aggregation_window = 600
+    update.return_value = False
+    recorder = K8sEventRecorder()
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+    await recorder.record(event1, resource=EVENTS, settings=settings)
+
+    assert post.call_count == 2
+    assert update.call_count == 1
+
+
+async def test_spamming_objects_are_throttled(settings, recorded, looptime):
+    post, update = recorded
+    settings.posting.spam_burst = 3
+    settings.posting.spam_rate = 0.1
+    recorder = K8sEventRecorder()
+    for i in range(5):
+        await recorder.record(K8sEvent(type='type1', reason='reason1', message=f'msg{i}', ref=REF1),
+                              resource=EVENTS, settings=settings)
+    await recorder.record(K8sEvent(type='type1', reason='reason1', message='other', ref=REF2),
+                          resource=EVENTS, settings=settings)
+    assert post.call_count == 4  # 3 for the 1st object, 1 for the 2nd one
+
+    await asyncio.sleep(10)  # restores 1 event
+    for i in range(5):
+        await recorder.record(K8sEvent(type='type1', reason='reason1', message=f'new{i}', ref=REF1),
+                              resource=EVENTS, settings=settings)
+    assert post.call_count == 5
+
+
+async def test_spam_filter_can_be_disabled(settings, recorded):
+    post, update = recorded
+    settings.posting.spam_burst = None
+    recorder = K8sEventRecorder()
+    for i in range(100):
+        await recorder.record(K8sEvent(type='type1', reason='reason1', message=f'msg{i}', ref=REF1),
+                              resource=EVENTS, settings=settings)
+    assert post.call_count == 100
+
+
+def _event(type: str, message: str, ref=REF1) -> K8sEvent:
+    return K8sEvent(type=type, reason='reason', message=message, ref=ref)
+
+
+async def test_queue_is_unlimited_if_configured(settings):
+    settings.posting.queue_limit = None
+    queue = K8sEventQueue(settings=settings)
+    for i in range(100):
+        queue.put_nowait(_event('Normal', f'msg{i}'))
+    assert queue.qsize() == 100
+
+
+async def test_queue_drops_the_oldest_events(settings):
+    metrics = OperatorMetrics()
+    settings.posting.queue_limit = 2
+    settings.posting.drop_policy = 'oldest'
+    queue = K8sEventQueue(settings=settings, metrics=metrics)
+    queue.put_nowait(_event('Error', 'msg1'))
+    queue.put_nowait(_event('Normal', 'msg2'))
+    queue.put_nowait(_event('Normal', 'msg3'))
+
+    assert [queue.get_nowait().message for _ in range(queue.qsize())] == ['msg2', 'msg3']
+    assert metrics.events_dropped == 1
+
+
+async def test_queue_drops_the_lowest_severity_events(settings):
+    metrics = OperatorMetrics()
+    settings.posting.queue_limit = 3
+    settings.posting.drop_policy = 'severity'
+    queue = K8sEventQueue(settings=settings, metrics=metrics)
+    queue.put_nowait(_event('Warning', 'msg1'))
+    queue.put_nowait(_event('Normal', 'msg2'))
+    queue.put_nowait(_event('Normal', 'msg3'))
+    queue.put_nowait(_event('Error', 'msg4'))  # drops msg2
+    queue.put_nowait(_event('Debug', 'msg5'))  # dropped itself
+
+    assert [queue.get_nowait().message for _ in range(queue.qsize())] == ['msg1', 'msg3', 'msg4']
+    assert metrics.events_dropped == 2
+
+
+async def test_queue_warns_once_when_the_dropping_starts(settings, caplog):
+    settings.posting.queue_limit = 1
+    queue = K8sEventQueue(settings=settings)
+    queue.put_nowait(_event('Normal', 'msg1'))
+    queue.put_nowait(_event('Normal', 'msg2'))
+    queue.put_nowait(_event('Normal', 'msg3'))
+    assert len([r for r in caplog.records if 'events are dropped' in r.message]) == 1
+
+    queue.get_nowait()  # the queue has room again, so the next overflow is warned anew.
+    queue.put_nowait(_event('Normal', 'msg4'))
+    queue.put_nowait(_event('Normal', 'msg5'))
+    assert len([r for r in caplog.records if 'events are dropped' in r.message]) == 2
+
+
+async def test_queue_can_be_joined_despite_the_dropped_events(settings):
+    settings.posting.queue_limit = 1
+    queue = K8sEventQueue(settings=settings)
+    queue.put_nowait(_event('Normal', 'msg1'))
+    queue.put_nowait(_event('Normal', 'msg2'))
+    queue.get_nowait()
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), timeout=1)
+
+
+async def test_workers_post_concurrently(mocker, settings, looptime):
+    settings.posting.workers = 3
+
+    async def post_event(**_):
+        await asyncio.sleep(10)
+    post = mocker.patch('kopf._cogs.clients.events.post_event', side_effect=post_event)
+
+    event_queue = asyncio.Queue()
+    for ref in [REF1, REF2, {**REF1, 'uid': 'uid3', 'name': 'name3'}]:
+        event_queue.put_nowait(_event('Normal', 'msg', ref=ref))
+
+    backbone = Backbone()
+    await backbone.fill(resources=[EVENTS])
+    task = asyncio.create_task(poster(event_queue=event_queue, backbone=backbone, settings=settings))
+    await asyncio.sleep(15)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert post.call_count == 3
+    assert looptime == 15
+
+
+async def test_same_object_events_are_recorded_sequentially(settings, recorded):
+    post, update = recorded
+    settings.posting.aggregation_window = 600
+
+    async def post_event(**_):
+        await asyncio.sleep(10)
+        return {'metadata': {'name': 'ev1', 'namespace': 'ns1'}}
+    post.side_effect = post_event
+
+    recorder = K8sEventRecorder()
+    event1 = _event('Normal', 'msg1')
+    await asyncio.gather(*[recorder.record(event1, resource=EVENTS, settings=settings)
+                           for _ in range(3)])
+
+    assert post.call_count == 1
+    assert update.call_count == 2
+
+
+async def test_default_namespace_is_resolved_once(mocker, settings, recorded):
+    post, update = recorded
+    get_ns = mocker.patch('kopf._cogs.clients.api.get_default_namespace', return_value='ns0')
+    ref = {'apiVersion': 'group1/version1', 'kind': 'Kind1', 'uid': 'uid1', 'name': 'name1'}
+
+    recorder = K8sEventRecorder()
+    await recorder.record(_event('Normal', 'msg1', ref=ref), resource=EVENTS, settings=settings)
+    await recorder.record(_event('Normal', 'msg2', ref=ref), resource=EVENTS, settings=settings)
+
+    assert get_ns.call_count == 1
+    assert [call.kwargs['default_namespace'] for call in post.call_args_list] == ['ns0', 'ns0']
+
+
+async def test_throttled_events_are_counted(settings, recorded):
+    metrics = OperatorMetrics()
+    token = metrics_var.set(metrics)
+    try:
+        settings.posting.spam_burst = 1
+        recorder = K8sEventRecorder()
+        await recorder.record(_event('Normal', 'msg1'), resource=EVENTS, settings=settings)
+        await recorder.record(_event('Normal', 'msg2'), resource=EVENTS, settings=settings)
+    finally:
+        metrics_var.reset(token)
+    assert metrics.events_throttled == 1
@@ -0,0 +1,225 @@
+import asyncio
+
+import pytest
+
+from kopf._cogs.aiokits.aiolimits import AdaptiveLimiter, FairLimiter
+
+
+async def test_acquiring_without_limits_is_instant(looptime):
+    limiter = FairLimiter()
+    results = [await limiter.acquire('a') for _ in range(5)]
+    assert results == [True] * 5
+    assert limiter.running == 5
+    assert limiter.waiting == 0
+    assert looptime == 0
+
+
+async def test_releasing_decreases_the_running_count():
+    limiter = FairLimiter()
+    await limiter.acquire('a')
+    await limiter.acquire('b')
+    limiter.release('a')
+    assert limiter.running == 1
+    limiter.release('b')
+    assert limiter.running == 0
+
+
+async def test_overall_limit_makes_the_excessive_acquirers_wait():
+    limiter = FairLimiter()
+    await limiter.acquire('a', limit=1)
+    task = asyncio.create_task(limiter.acquire('b', limit=1))
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert limiter.running == 1
+    assert limiter.waiting == 1
+
+    limiter.release('a')
+    assert await task is True
+    assert limiter.running == 1
+    assert limiter.waiting == 0
+
+
+async def test_per_key_limit_does_not_block_other_keys():
+    limiter = FairLimiter()
+    await limiter.acquire('a', per_key_limit=1)
+    task_a = asyncio.create_task(limiter.acquire('a', per_key_limit=1))
+    task_b = asyncio.create_task(limiter.acquire('b', per_key_limit=1))
+    await asyncio.sleep(0)
+    assert not task_a.done()
+    assert task_b.done()
+    assert limiter.running == 2
+
+    limiter.release('a')
+    assert await task_a is True
+    assert limiter.running == 2
+
+
+async def test_keys_are_served_in_turns_and_fifo_within_the_keys():
+    limiter = FairLimiter()
+    await limiter.acquire('blocker', limit=1)
+
+    served: list[str] = []
+
+    async def acquire(key: str, name: str) -> None:
+        await limiter.acquire(key, limit=1)
+        served.append(name)
+        await asyncio.sleep(0)
+        limiter.release(key)
+
+    tasks = [asyncio.create_task(acquire('big', f'big{i}')) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(acquire('small', 'small0'))]
+    await asyncio.sleep(0)
+
+    limiter.release('blocker')
+    await asyncio.gather(*tasks)
+
+    assert served == ['big0', 'small0', 'big1', 'big2']
+
+
+async def test_wakeup_interrupts_the_waiting_without_acquiring():
+    limiter = FairLimiter()
+    await limiter.acquire('a', limit=1)
+    wakeup = asyncio.Event()
+    task = asyncio.create_task(limiter.acquire('b', limit=1, wakeup=wakeup))
+    await asyncio.sleep(0)
+    wakeup.set()
+    assert await task is False
+    assert limiter.running == 1
+    assert limiter.waiting == 0
+
+    limiter.release('a')
+    assert limiter.running == 0
+
+
+async def test_cancelled_waiters_do_not_occupy_the_slots():
+    limiter = FairLimiter()
+    await limiter.acquire('a', limit=1)
+    task = asyncio.create_task(limiter.acquire('b', limit=1))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.waiting == 0
+
+    limiter.release('a')
+    assert limiter.running == 0
+
+
+async def test_waiters_granted_and_cancelled_at_once_release_their_slots():
+    limiter = FairLimiter()
+    await limiter.acquire('a', limit=1)
+    task = asyncio.create_task(limiter.acquire('b', limit=1))
+    await asyncio.sleep(0)
+    limiter.release('a')  # grants the slot to the waiter, which did not wake up yet
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.running == 0
+
+
+async def test_adaptive_limiter_is_disabled_without_the_limit(looptime):
+    limiter = AdaptiveLimiter()
+    results = [await limiter.acquire(limit=None) for _ in range(5)]
+    assert results == [None] * 5
+    assert limiter.limit is None
+    assert limiter.running == 0
+    assert looptime == 0
+
+
+async def test_adaptive_limiter_starts_at_the_maximum(looptime):
+    limiter = AdaptiveLimiter()
+    results = [await limiter.acquire(limit=3) for _ in range(3)]
+    assert results == [0, 0, 0]
+    assert limiter.limit == 3
+    assert limiter.running == 3
+
+    task = asyncio.create_task(limiter.acquire(limit=3))
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+
+    limiter.release()
+    await task
+    assert limiter.running == 3
+    assert limiter.waiting == 0
+
+
+async def test_adaptive_limiter_halves_on_overload_and_respects_the_floor():
+    limiter = AdaptiveLimiter()
+    await limiter.acquire(limit=10, floor=3)
+    limiter.overload(limit=10, floor=3)
+    assert limiter.limit == 5
+    limiter.overload(limit=10, floor=3)
+    assert limiter.limit == 3  # not 2
+    limiter.overload(limit=10, floor=3)
+    assert limiter.limit == 3
+
+
+async def test_adaptive_limiter_halves_only_once_for_simultaneous_overloads(looptime):
+    limiter = AdaptiveLimiter()
+    acquired = [await limiter.acquire(limit=16) for _ in range(4)]
+    await asyncio.sleep(1)
+    for time in acquired:
+        limiter.release()
+        limiter.overload(limit=16, acquired=time)
+    assert limiter.limit == 8
+
+    time = await limiter.acquire(limit=16)
+    limiter.release()
+    limiter.overload(limit=16, acquired=time)
+    assert limiter.limit == 4  # acquired after the previous decrease
+
+
+async def test_adaptive_limiter_grows_by_one_per_the_whole_limit_of_successes():
+    limiter = AdaptiveLimiter()
+    await limiter.acquire(limit=10)
+    limiter.release()
+    limiter.overload(limit=10)
+    assert limiter.limit == 5
+    for _ in range(4):
+        limiter.succeed(limit=10)
+    assert limiter.limit == 5
+    for _ in range(2):
+        limiter.succeed(limit=10)
+    assert limiter.limit == 6  # i.e. roughly one per the whole limit
+    for _ in range(100):
+        limiter.succeed(limit=10)
+    assert limiter.limit == 10  # not above the maximum
+
+
+async def test_adaptive_limiter_pauses_all_acquirers_on_retry_after(looptime):
+    limiter = AdaptiveLimiter()
+    await limiter.acquire(limit=10)
+    limiter.release()
+    limiter.overload(limit=10, retry_after=5)
+    await asyncio.gather(*[limiter.acquire(limit=10) for _ in range(3)])
+    assert looptime == 5
+    assert limiter.running == 3
+
+
+async def test_adaptive_limiter_releases_its_waiters_when_disabled(looptime):
+    limiter = AdaptiveLimiter()
+    await limiter.acquire(limit=1)
+    task = asyncio.create_task(limiter.acquire(limit=1))
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+
+    await limiter.acquire(limit=None)
+    await task
+    assert limiter.waiting == 0
+    assert looptime == 0
+
+
+async def test_adaptive_limiter_cancelled_waiters_do_not_occupy_the_slots():
+    limiter = AdaptiveLimiter()
+    await limiter.acquire(limit=1)
+    task1 = asyncio.create_task(limiter.acquire(limit=1))
+    task2 = asyncio.create_task(limiter.acquire(limit=1))
+    await asyncio.sleep(0)
+    task1.cancel()
+    await asyncio.wait([task1])
+
+    limiter.release()
+    await task2
+    assert limiter.running == 1
+    assert limiter.waiting == 0
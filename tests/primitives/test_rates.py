@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from kopf._cogs.aiokits.aiorates import RateLimiter
+
+
+@pytest.mark.parametrize('rate', [None, 0])
+async def test_acquiring_without_rate_is_instant(looptime, rate):
+    limiter = RateLimiter()
+    for _ in range(100):
+        await limiter.acquire(rate=rate)
+    assert limiter.waiting == 0
+    assert looptime == 0
+
+
+async def test_burst_is_instant(looptime):
+    limiter = RateLimiter()
+    for _ in range(5):
+        await limiter.acquire(rate=1, burst=5)
+    assert looptime == 0
+
+
+async def test_excessive_acquirers_wait_for_the_rate(looptime):
+    limiter = RateLimiter()
+    for _ in range(12):
+        await limiter.acquire(rate=2, burst=2)
+    assert looptime == 5  # 2 instantly, then 10 at 2/s
+
+
+async def test_unused_rate_accumulates_up_to_the_burst(looptime):
+    limiter = RateLimiter()
+    await limiter.acquire(rate=1, burst=3)
+    await asyncio.sleep(100)
+    for _ in range(4):
+        await limiter.acquire(rate=1, burst=3)
+    assert looptime == 101  # 3 instantly (not 100), then 1 more in 1s
+
+
+async def test_higher_lanes_are_served_first_and_fifo_within_lanes(looptime):
+    limiter = RateLimiter()
+    await limiter.acquire(rate=1, burst=1)  # drain the bucket
+
+    order = []
+
+    async def acquire(lane: int, name: str) -> None:
+        await limiter.acquire(lane, rate=1, burst=1)
+        order.append(name)
+
+    tasks = [asyncio.create_task(acquire(lane, name)) for lane, name in [
+        (0, 'bulk1'), (0, 'bulk2'), (1, 'regular1'), (2, 'critical1'), (1, 'regular2'),
+    ]]
+    await asyncio.sleep(0)
+    assert limiter.waiting == 5
+
+    await asyncio.wait(tasks)
+    assert order == ['critical1', 'regular1', 'regular2', 'bulk1', 'bulk2']
+    assert looptime == 5
+
+
+async def test_higher_lanes_skip_the_backlog_of_lower_lanes(looptime):
+    limiter = RateLimiter()
+    await limiter.acquire(rate=1, burst=1)  # drain the bucket
+    backlog = [asyncio.create_task(limiter.acquire(0, rate=1, burst=1)) for _ in range(10)]
+    await asyncio.sleep(0)
+
+    await limiter.acquire(2, rate=1, burst=1)
+    assert looptime == 1  # not 11
+    assert limiter.waiting == 10
+
+    for task in backlog:
+        task.cancel()
+    await asyncio.wait(backlog)
+
+
+async def test_cancelled_waiters_do_not_consume_the_rate(looptime):
+    limiter = RateLimiter()
+    await limiter.acquire(rate=1, burst=1)  # drain the bucket
+    task1 = asyncio.create_task(limiter.acquire(rate=1, burst=1))
+    task2 = asyncio.create_task(limiter.acquire(rate=1, burst=1))
+    await asyncio.sleep(0)
+    task1.cancel()
+    await asyncio.wait([task1])
+
+    await task2
+    assert looptime == 1
+    assert limiter.waiting == 0
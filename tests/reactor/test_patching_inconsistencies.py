@@ -139,7 +139,7 @@ async def test_resource_version_on_deletion_workaround(
 
     body = Body({'metadata': {'namespace': namespace, 'name': 'name1'}})
     logger = LocalObjectLogger(body=body, settings=settings)
-    rv, _ = await patch_and_check(
+    _, rv, _ = await patch_and_check(
         settings=settings,
         resource=resource,
         body=body,
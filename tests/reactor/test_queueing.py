@@ -21,6 +21,7 @@ import weakref
 
 import pytest
 
+from kopf._cogs.aiokits import aiotoggles
 from kopf._core.reactor.queueing import EOS, ObjectUid, Stream, watcher, worker
 
 
@@ -223,3 +224,67 @@ async def test_stream_pressure_maintained_until_the_queue_is_empty(settings, res
 
 
 # TODO: also add tests for the depletion of the workers pools on cancellation (+timing)
+
+
+@pytest.mark.usefixtures('watcher_limited')
+async def test_replays_are_multiplexed_into_workers(
+        worker_mock, looptime, resource, processor, settings, kmock):
+    kmock.resources[resource] = {}
+    kmock['watch', resource] << (
+        {'type': 'ADDED', 'object': {'metadata': {'uid': 'uid1'}}},
+    ) << {'type': 'ERROR', 'object': {'code': 410}}
+
+    replays = asyncio.Queue()
+    replays.put_nowait({'type': None, 'object': {'metadata': {'uid': 'uid2'}}})
+    await watcher(
+        namespace=None,
+        resource=resource,
+        settings=settings,
+        processor=processor,
+        replays=replays,
+    )
+
+    assert replays.empty()
+    assert worker_mock.call_count == 2
+    keys = {kwargs['key'] for args, kwargs in worker_mock.call_args_list}
+    assert keys == {(resource, 'uid1'), (resource, 'uid2')}
+
+
+
+async def test_standby_streams_while_paused_and_reprocesses_on_resuming(
+        looptime, resource, processor, settings, kmock):
+    settings.peering.standby = True
+    kmock.resources[resource] = {}
+    kmock['watch', resource] << (
+        {'type': 'ADDED', 'object': {'metadata': {'uid': 'uid1'}, 'spec': 1}},
+        {'type': 'ADDED', 'object': {'metadata': {'uid': 'uid2'}}},
+        {'type': 'MODIFIED', 'object': {'metadata': {'uid': 'uid1'}, 'spec': 2}},
+        {'type': 'DELETED', 'object': {'metadata': {'uid': 'uid2'}}},
+        lambda: asyncio.sleep(99),  # keep the stream open, as if no new events
+    )
+
+    operator_paused = aiotoggles.ToggleSet(any)
+    conflicts_found = await operator_paused.make_toggle(True)
+    task = asyncio.create_task(watcher(
+        namespace=None,
+        resource=resource,
+        settings=settings,
+        processor=processor,
+        operator_paused=operator_paused,
+    ))
+    try:
+        await asyncio.sleep(1)
+        assert processor.call_count == 4  # not blocked by the pause
+
+        processor.reset_mock()
+        await conflicts_found.turn_to(False)
+        await asyncio.sleep(1)
+        assert processor.call_count == 1
+        assert processor.call_args.kwargs['raw_event'] == {
+            'type': None,
+            'object': {'metadata': {'uid': 'uid1'}, 'spec': 2},
+        }
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from kopf._core.reactor.supervising import supervise
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="forking is POSIX-only")
+
+
+def test_all_processes_are_started_with_their_indices(tmp_path):
+    def target(idx: int, endpoint: str | None) -> None:
+        (tmp_path / str(idx)).touch()
+
+    exitcode = supervise(processes=3, target=target)
+    assert exitcode == 0
+    assert set() < {path.name for path in tmp_path.iterdir()} <= {'0', '1', '2'}
+
+
+def test_exit_code_of_the_failed_process_is_propagated():
+    def target(idx: int, endpoint: str | None) -> None:
+        if idx == 1:
+            sys.exit(3)
+        time.sleep(60)
+
+    started = time.monotonic()
+    exitcode = supervise(processes=3, target=target)
+    assert exitcode == 3
+    assert time.monotonic() - started < 30  # others were stopped, not waited for
+
+
+def test_killed_process_exits_as_shells_do():
+    def target(idx: int, endpoint: str | None) -> None:
+        if idx == 0:
+            os.kill(os.getpid(), signal.SIGKILL)
+        time.sleep(60)
+
+    exitcode = supervise(processes=2, target=target)
+    assert exitcode == 128 + signal.SIGKILL
+
+
+def test_signals_are_forwarded_to_all_processes():
+    ready = multiprocessing.get_context('fork').Barrier(2)
+
+    def target(idx: int, endpoint: str | None) -> None:
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # graceful exit
+        ready.wait()  # all processes are able to exit gracefully
+        if idx == 0:
+            os.kill(os.getppid(), signal.SIGTERM)
+        time.sleep(60)
+
+    started = time.monotonic()
+    exitcode = supervise(processes=2, target=target)
+    assert exitcode == 0
+    assert time.monotonic() - started < 30
+
+
+def test_processes_stopped_while_starting_are_not_failures():
+    def target(idx: int, endpoint: str | None) -> None:
+        if idx == 0:
+            os.kill(os.getppid(), signal.SIGTERM)
+        time.sleep(60)  # no signal handling yet, as if still starting
+
+    started = time.monotonic()
+    exitcode = supervise(processes=2, target=target)
+    assert exitcode == 0
+    assert time.monotonic() - started < 30
+
+
+def test_early_signals_do_not_kill_the_multithreaded_supervisor():
+    def target(idx: int, endpoint: str | None) -> None:
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # graceful exit
+        if idx == 0:
+            os.kill(os.getppid(), signal.SIGTERM)
+        time.sleep(60)
+
+    # Another thread does not block the signals, so it gets them while the main thread blocks them.
+    stopped = threading.Event()
+    thread = threading.Thread(target=stopped.wait)
+    thread.start()
+    try:
+        exitcode = supervise(processes=2, target=target)
+    finally:
+        stopped.set()
+        thread.join()
+    assert exitcode == 0
+
+
+def test_liveness_endpoints_are_distinct_per_process(unused_tcp_port):
+    def target(idx: int, endpoint: str | None) -> None:
+        assert endpoint is not None
+        assert endpoint.startswith('http://localhost:')
+        assert endpoint.endswith('/healthz')
+        time.sleep(60) if idx == 0 else sys.exit(0)
+
+    exitcode = supervise(processes=2, target=target, liveness_endpoint=f'http://:{unused_tcp_port}/healthz')
+    assert exitcode == 0
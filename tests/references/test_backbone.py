@@ -3,7 +3,7 @@ import asyncio
 import pytest
 
 from kopf._cogs.structs.references import CLUSTER_PEERINGS_K, CLUSTER_PEERINGS_Z, CRDS, EVENTS, \
-                                          NAMESPACED_PEERINGS_K, NAMESPACED_PEERINGS_Z, \
+                                          LEASES, NAMESPACED_PEERINGS_K, NAMESPACED_PEERINGS_Z, \
                                           NAMESPACES, Backbone, Resource, Selector
 
 
@@ -11,6 +11,7 @@ from kopf._cogs.structs.references import CLUSTER_PEERINGS_K, CLUSTER_PEERINGS_Z
     CRDS, EVENTS, NAMESPACES,
     CLUSTER_PEERINGS_K, NAMESPACED_PEERINGS_K,
     CLUSTER_PEERINGS_Z, NAMESPACED_PEERINGS_Z,
+    LEASES,
 ])
 def test_empty_backbone(selector: Selector):
     backbone = Backbone()
@@ -30,6 +31,7 @@ def test_empty_backbone(selector: Selector):
     (NAMESPACED_PEERINGS_K, Resource('kopf.dev', 'v1', 'kopfpeerings')),
     (CLUSTER_PEERINGS_Z, Resource('zalando.org', 'v1', 'clusterkopfpeerings')),
     (NAMESPACED_PEERINGS_Z, Resource('zalando.org', 'v1', 'kopfpeerings')),
+    (LEASES, Resource('coordination.k8s.io', 'v1', 'leases')),
 ])
 async def test_refill_populates_the_resources(selector: Selector, resource: Resource):
     backbone = Backbone()
@@ -0,0 +1,107 @@
+import kopf
+from kopf._cogs.structs.references import Resource
+from kopf._core.intents import registries
+from kopf._core.intents.causes import Reason
+from kopf._core.intents.registries import OperatorRegistry
+
+RESOURCE1 = Resource('kopf.dev', 'v1', 'kopfexamples')
+RESOURCE2 = Resource('kopf.dev', 'v1', 'kopfothers')
+
+
+def some_fn(**_):
+    pass
+
+
+def test_plan_is_empty_with_no_handlers():
+    registry = OperatorRegistry()
+    plan = registry._changing.get_plan(RESOURCE1)
+    assert not plan.handlers
+    assert not plan.extra_fields
+    assert not plan.finalizing
+
+
+def test_plan_is_filtered_by_resource():
+    registry = OperatorRegistry()
+    kopf.on.create('kopfexamples', id='fn1', registry=registry)(some_fn)
+    kopf.on.create('kopfothers', id='fn2', registry=registry)(some_fn)
+    kopf.on.create(kopf.EVERYTHING, id='fn3', registry=registry)(some_fn)
+
+    plan1 = registry._changing.get_plan(RESOURCE1)
+    plan2 = registry._changing.get_plan(RESOURCE2)
+    assert [handler.id for handler in plan1.handlers] == ['fn1', 'fn3']
+    assert [handler.id for handler in plan2.handlers] == ['fn2', 'fn3']
+
+
+def test_plan_is_cached():
+    registry = OperatorRegistry()
+    kopf.on.create('kopfexamples', registry=registry)(some_fn)
+    plan1 = registry._changing.get_plan(RESOURCE1)
+    plan2 = registry._changing.get_plan(RESOURCE1)
+    assert plan1 is plan2
+
+
+def test_plan_is_invalidated_on_registration():
+    registry = OperatorRegistry()
+    kopf.on.create('kopfexamples', id='fn1', registry=registry)(some_fn)
+    plan1 = registry._changing.get_plan(RESOURCE1)
+    kopf.on.update('kopfexamples', id='fn2', registry=registry)(some_fn)
+    plan2 = registry._changing.get_plan(RESOURCE1)
+    assert plan1 is not plan2
+    assert [handler.id for handler in plan2.handlers] == ['fn1', 'fn2']
+
+
+def test_plan_contains_the_union_of_extra_fields():
+    registry = OperatorRegistry()
+    kopf.on.update('kopfexamples', id='fn1', field='spec.a', registry=registry)(some_fn)
+    kopf.on.update('kopfexamples', id='fn2', field='spec.b', registry=registry)(some_fn)
+    kopf.on.update('kopfexamples', id='fn3', field='spec.a', registry=registry)(some_fn)
+    kopf.on.update('kopfothers', id='fn4', field='spec.c', registry=registry)(some_fn)
+    kopf.on.update('kopfexamples', id='fn5', registry=registry)(some_fn)
+    plan = registry._changing.get_plan(RESOURCE1)
+    assert plan.extra_fields == {('spec', 'a'), ('spec', 'b')}
+
+
+def test_plan_contains_the_finalizing_handlers():
+    registry = OperatorRegistry()
+    kopf.on.create('kopfexamples', id='fn1', registry=registry)(some_fn)
+    kopf.on.delete('kopfexamples', id='fn2', registry=registry)(some_fn)
+    kopf.on.delete('kopfexamples', id='fn3', optional=True, registry=registry)(some_fn)
+    plan = registry._changing.get_plan(RESOURCE1)
+    assert [handler.id for handler in plan.finalizing] == ['fn2']
+
+
+def test_planned_handlers_are_not_rechecked_for_resources(mocker, cause_factory):
+    registry = OperatorRegistry()
+    kopf.on.update('kopfexamples', id='fn1', registry=registry)(some_fn)
+    kopf.on.delete('kopfexamples', id='fn2', registry=registry)(some_fn)
+    cause = cause_factory(resource=RESOURCE1, reason=Reason.UPDATE)
+    registry._changing.get_plan(RESOURCE1)  # compiled once, checks the resources once.
+    spy = mocker.spy(registries, '_matches_resource')
+    handlers = registry._changing.get_handlers(cause)
+    prematched = registry._changing.prematch(cause)
+    requires_finalizer = registry._changing.requires_finalizer(cause)
+    assert [handler.id for handler in handlers] == ['fn1']
+    assert prematched
+    assert requires_finalizer
+    assert spy.call_count == 0
+
+
+def test_reason_handlers_are_filtered_and_cached():
+    registry = OperatorRegistry()
+    kopf.on.create('kopfexamples', id='fn1', registry=registry)(some_fn)
+    kopf.on.update('kopfexamples', id='fn2', registry=registry)(some_fn)
+    kopf.on.field('kopfexamples', field='spec.x', id='fn3', registry=registry)(some_fn)
+    handlers1 = registry._changing.get_reason_handlers(RESOURCE1, Reason.UPDATE)
+    handlers2 = registry._changing.get_reason_handlers(RESOURCE1, Reason.UPDATE)
+    assert [handler.id for handler in handlers1] == ['fn2', 'fn3/spec.x']
+    assert handlers1 is handlers2
+
+
+def test_reason_handlers_are_invalidated_on_registration():
+    registry = OperatorRegistry()
+    kopf.on.update('kopfexamples', id='fn1', registry=registry)(some_fn)
+    handlers1 = registry._changing.get_reason_handlers(RESOURCE1, Reason.UPDATE)
+    kopf.on.update('kopfexamples', id='fn2', registry=registry)(some_fn)
+    handlers2 = registry._changing.get_reason_handlers(RESOURCE1, Reason.UPDATE)
+    assert [handler.id for handler in handlers1] == ['fn1']
+    assert [handler.id for handler in handlers2] == ['fn1', 'fn2']
@@ -36,7 +36,7 @@ def handler_factory(registry, selector):
             errors=None, timeout=None, retries=None, backoff=None,
             selector=selector, annotations=None, labels=None, when=None,
             field=None, value=None,
-            requires_finalizer=None, initial_delay=None,
+            requires_finalizer=None, initial_delay=None, initial_delay_spread=None,
         ), **kwargs))
         registry._spawning.append(handler)
         return handler
@@ -0,0 +1,172 @@
+"""
+The operator in the custom event loops, such as uvloop.
+
+Only the public API of the event loops is used by the framework, which uvloop
+also implements. Yet, the places that depend on the loop's internals are
+checked explicitly in every loop: shielding of the sync handlers' futures
+(``asyncio.shield`` in ``invocation.invoke``) and the cross-thread k8s-event
+posting (``loop.call_soon_threadsafe`` in ``posting.enqueue``).
+
+The benchmarks compare uvloop against asyncio on the same workload:
+the sync handlers in the executor, and the k8s-events from the threads.
+They are skipped by default; run them with ``pytest --with-benchmarks -m benchmark``.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from kopf._cogs.structs import bodies
+from kopf._core.actions.invocation import invoke
+from kopf._core.engines import posting
+from kopf._core.reactor.running import run
+from kopf._kits.loops import LoopType, get_loop_factory
+
+COUNT = 1000
+REF = bodies.ObjectReference(apiVersion='v1', kind='Pod', namespace='ns', name='name', uid='uid')
+
+
+def _asyncio_factory():
+    return asyncio.new_event_loop()
+
+
+def _uvloop_factory():
+    uvloop = pytest.importorskip('uvloop')
+    return uvloop.new_event_loop()
+
+
+LOOP_FACTORIES = {'asyncio': _asyncio_factory, 'uvloop': _uvloop_factory}
+
+
+@pytest.fixture(params=list(LOOP_FACTORIES.values()), ids=list(LOOP_FACTORIES))
+def loop_factory(request):
+    request.param().close()  # skip early if the loop is not installed
+    return request.param
+
+
+async def _invoke_sync_fns(count):
+    results = await asyncio.gather(*[invoke(lambda **_: 123) for _ in range(count)])
+    assert results == [123] * count
+
+
+async def _post_from_threads(count):
+    queue = asyncio.Queue()
+    posting.event_queue_loop_var.set(asyncio.get_running_loop())
+    posting.event_queue_var.set(queue)
+
+    def post():
+        for _ in range(count):
+            posting.enqueue(ref=REF, type='Normal', reason='Reason', message='message')
+
+    thread = threading.Thread(target=contextvars.copy_context().run, args=(post,))
+    thread.start()
+    for _ in range(count):
+        await asyncio.wait_for(queue.get(), timeout=5)
+    thread.join()
+
+
+def _measure(loop_factory, coro_fn):
+    loop = loop_factory()
+    try:
+        started = time.perf_counter()
+        loop.run_until_complete(coro_fn(COUNT))
+        return time.perf_counter() - started
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def test_run_uses_the_loop_factory(mocker):
+    loops = []
+
+    async def operator(**_):
+        loops.append(asyncio.get_running_loop())
+
+    def factory():
+        made_loops.append(asyncio.new_event_loop())
+        return made_loops[-1]
+
+    made_loops = []
+    mocker.patch('kopf._core.reactor.running.operator', operator)
+    run(loop_factory=factory)
+    assert len(made_loops) == 1
+    assert loops == made_loops
+    assert made_loops[0].is_closed()
+
+
+def test_run_rejects_both_the_loop_and_the_loop_factory():
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(TypeError, match=r"Either the loop or the loop factory"):
+            run(loop=loop, loop_factory=asyncio.new_event_loop)
+    finally:
+        loop.close()
+
+
+def test_asyncio_loop_type_uses_no_factory():
+    assert get_loop_factory(LoopType.ASYNCIO) is None
+
+
+def test_uvloop_loop_type_fails_if_absent(mocker):
+    mocker.patch.dict('sys.modules', {'uvloop': None})
+    with pytest.raises(ImportError, match=r"uvloop is requested but not installed"):
+        get_loop_factory(LoopType.UVLOOP)
+    assert get_loop_factory(LoopType.AUTO) is None
+
+
+def test_shielded_sync_handlers(loop_factory):
+    _measure(loop_factory, _invoke_sync_fns)
+
+
+def test_cancelled_sync_handlers_complete_before_cancelling(loop_factory):
+    started = threading.Event()
+    released = threading.Event()
+    finished = threading.Event()
+
+    def fn(**_):
+        started.set()
+        released.wait(timeout=5)
+        finished.set()
+
+    async def main():
+        task = asyncio.create_task(invoke(fn))
+        await asyncio.to_thread(started.wait, timeout=5)
+        task.cancel()
+        await asyncio.sleep(0.1)
+        assert not task.done()  # the shield holds the task until the thread exits
+        released.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert finished.is_set()
+
+    loop = loop_factory()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def test_threadsafe_event_posting(loop_factory):
+    _measure(loop_factory, _post_from_threads)
+
+
+@pytest.mark.benchmark
+def test_benchmark_of_the_loops(capsys):
+    workloads = {'sync handlers': _invoke_sync_fns, 'threadsafe posting': _post_from_threads}
+    lines = [f"{'':<20}" + "".join(f"{name:>12}" for name in LOOP_FACTORIES)]
+    for workload_name, coro_fn in workloads.items():
+        line = f"{workload_name:<20}"
+        for loop_factory in LOOP_FACTORIES.values():
+            try:
+                durations = [_measure(loop_factory, coro_fn) for _ in range(5)]
+            except pytest.skip.Exception:
+                line += f"{'n/a':>12}"
+            else:
+                line += f"{min(durations):>11.3f}s"
+        lines.append(line)
+    with capsys.disabled():
+        print(f"\n\nThe best of 5 runs with {COUNT} operations each:")
+        print("\n".join(lines))
@@ -131,6 +131,8 @@ async def test_always_present_tasks(registry, settings):
         "stop-flag checker",
         "ultimate termination",
         "startup/cleanup activities",
+        "index snapshotter",
+        "timer engine",
         "daemon killer",
         "poster of events",
         "admission insights chain",
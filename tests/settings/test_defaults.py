@@ -7,7 +7,15 @@ import kopf
 
 async def test_declared_public_interface_and_promised_defaults():
     settings = kopf.OperatorSettings()
+    assert settings.process.processes == 1
+    assert settings.process.process_index == 0
     assert settings.posting.level == logging.INFO
+    assert settings.posting.aggregation_window is None
+    assert settings.posting.spam_burst is None
+    assert settings.posting.spam_rate == 1 / 300
+    assert settings.posting.workers == 4
+    assert settings.posting.queue_limit is None
+    assert settings.posting.drop_policy == 'oldest'
     assert settings.peering.name == "default"
     assert settings.peering.stealth == False
     assert settings.peering.priority == 0
@@ -16,6 +24,9 @@ async def test_declared_public_interface_and_promised_defaults():
     assert settings.peering.standalone == False
     assert settings.peering.namespaced == True
     assert settings.peering.clusterwide == False
+    assert settings.peering.backend == "peerings"
+    assert settings.peering.sharding is None
+    assert settings.peering.standby == False
     assert settings.watching.reconnect_backoff == 0.1
     assert settings.watching.connect_timeout is None
     assert settings.watching.server_timeout is None
@@ -24,6 +35,9 @@ async def test_declared_public_interface_and_promised_defaults():
     assert settings.queueing.idle_timeout == 5.0
     assert settings.queueing.exit_timeout == 2.0
     assert settings.queueing.error_delays == (1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610)
+    assert settings.indexing.snapshot_path is None
+    assert settings.indexing.snapshot_interval == 60
+    assert settings.indexing.lean_processing == False
     assert settings.scanning.disabled == False
     assert settings.admission.server is None
     assert settings.admission.managed is None
@@ -33,7 +47,17 @@ async def test_declared_public_interface_and_promised_defaults():
     assert settings.networking.request_timeout == 5 * 60
     assert settings.networking.connect_timeout is None
     assert settings.networking.trust_env == False
+    assert settings.networking.qps is None
+    assert settings.networking.burst == 10
+    assert settings.networking.max_concurrency is None
+    assert settings.networking.min_concurrency == 1
+    assert settings.networking.latency_threshold is None
     assert settings.persistence.consistency_timeout == 5.0
+    assert settings.background.max_concurrent_timers is None
+    assert settings.background.max_timer_rate is None
+    assert settings.background.max_concurrent_invocations is None
+    assert settings.background.max_concurrent_invocations_per_handler is None
+    assert settings.background.reserved_workers is None
 
 
 async def test_peering_namespaced_is_modified_by_clusterwide():
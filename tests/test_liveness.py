@@ -5,7 +5,7 @@ import pytest
 
 from kopf._cogs.structs.ephemera import Memo
 from kopf._core.engines.indexing import OperatorIndexers
-from kopf._core.engines.probing import health_reporter
+from kopf._core.engines.probing import health_aggregator, health_reporter
 from kopf._core.intents.causes import Activity
 from kopf._core.intents.handlers import ActivityHandler
 from kopf._core.intents.registries import OperatorRegistry
@@ -100,3 +100,63 @@ async def test_liveness_data_is_cached(liveness_url, liveness_registry):
             data = await response.json()
             assert isinstance(data, dict)
             assert data == {'id1': {'counter': 1}}  # not 2!
+
+
+@pytest.fixture()
+async def aggregator_url_factory(unused_tcp_port_factory):
+    servers = []
+
+    async def factory(endpoints):
+        ready_flag = asyncio.Event()
+        port = unused_tcp_port_factory()
+        server = asyncio.create_task(
+            health_aggregator(
+                endpoint=f'http://:{port}/xyz',
+                endpoints=endpoints,
+                ready_flag=ready_flag,
+            )
+        )
+        servers.append(server)
+        await asyncio.wait_for(ready_flag.wait(), timeout=1)
+        return f'http://localhost:{port}/xyz'
+
+    try:
+        yield factory
+    finally:
+        for server in servers:
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass  # cancellations are expected at this point
+
+
+async def test_aggregated_liveness_of_healthy_processes(
+        liveness_url, liveness_registry, aggregator_url_factory):
+
+    def fn1(**kwargs):
+        return {'x': 100}
+
+    liveness_registry._activities.append(ActivityHandler(
+        fn=fn1, id='id1', activity=Activity.PROBE,
+        param=None, errors=None, timeout=None, retries=None, backoff=None,
+    ))
+
+    aggregator_url = await aggregator_url_factory({'0': liveness_url, '1': liveness_url})
+    async with aiohttp.ClientSession() as session:
+        async with session.get(aggregator_url) as response:
+            data = await response.json()
+            assert response.status == 200
+            assert data == {'0': {'id1': {'x': 100}}, '1': {'id1': {'x': 100}}}
+
+
+async def test_aggregated_liveness_of_failed_processes(
+        liveness_url, aggregator_url_factory, unused_tcp_port_factory):
+    dead_url = f'http://localhost:{unused_tcp_port_factory()}/xyz'
+    aggregator_url = await aggregator_url_factory({'0': liveness_url, '1': dead_url})
+    async with aiohttp.ClientSession() as session:
+        async with session.get(aggregator_url) as response:
+            data = await response.json()
+            assert response.status == 500
+            assert data['0'] == {}
+            assert set(data['1']) == {'error'}